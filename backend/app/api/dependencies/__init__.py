@@ -1 +1,27 @@
-from .dependencies import get_current_user, get_user_repository
\ No newline at end of file
+from .dependencies import (
+  get_current_user,
+  get_user_repository,
+  get_auth_session_repository,
+  get_blog_repository,
+  get_blog_view_repository,
+  oauth2_scheme,
+  get_rate_limiter,
+  get_view_counter,
+  get_trending_tracker,
+  get_markdown_renderer,
+  get_feed_cache,
+  get_blog_stream_hub,
+  get_job_queue,
+  get_user_content_purger,
+  get_image_processor,
+  get_image_storage,
+  get_uploaded_image,
+  get_if_match_version,
+  require_if_match_version,
+  version_etag,
+  get_client_ip,
+  limit_login,
+  limit_refresh,
+  limit_register,
+  limit_writes
+)
@@ -1,9 +1,38 @@
-from fastapi import Depends
+import os
+import tempfile
+from fastapi import Depends, Form, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
+from typing import AsyncGenerator, Optional
 from app.auth import AuthService
+from app.config import config
+from app.database import sharding
 from app.database.db import get_db
-from app.repositories import UserRepository
-from src.application.repositories import IUserRepository
+from app.database.sharding import ShardSessions
+from app.feeds import FeedCache, BlogStreamHub
+from app.rate_limiting import RateLimiter
+from app.repositories import (
+  UserRepository,
+  AuthSessionRepository,
+  BlogRepository,
+  BlogViewRepository,
+  ShardedBlogRepository,
+  ShardedBlogViewRepository
+)
+from src.application.repositories import (
+  IUserRepository,
+  IAuthSessionRepository,
+  IBlogRepository,
+  IBlogViewRepository
+)
+from src.application.services import (
+  IViewCounter,
+  ITrendingTracker,
+  IMarkdownRenderer,
+  IImageProcessor,
+  IImageStorage,
+  IJobQueue,
+  IUserContentPurger
+)
 from src.domain.entities import UserEntity
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/v1/auth/login")
@@ -13,8 +42,158 @@ def get_user_repository(
 ) -> IUserRepository:
   return UserRepository(session)
 
+def get_auth_session_repository(
+  session = Depends(get_db),
+) -> IAuthSessionRepository:
+  return AuthSessionRepository(session)
+
+async def get_shard_sessions() -> AsyncGenerator[Optional[ShardSessions], None]:
+  if sharding.shard_router is None:
+    yield None
+    return
+  async with sharding.shard_router.sessions() as shard_sessions:
+    yield shard_sessions
+
+def get_blog_repository(
+  session = Depends(get_db),
+  shard_sessions: Optional[ShardSessions] = Depends(get_shard_sessions),
+) -> IBlogRepository:
+  return ShardedBlogRepository(shard_sessions) if shard_sessions else BlogRepository(session)
+
+def get_blog_view_repository(
+  session = Depends(get_db),
+  shard_sessions: Optional[ShardSessions] = Depends(get_shard_sessions),
+) -> IBlogViewRepository:
+  return ShardedBlogViewRepository(shard_sessions) if shard_sessions else BlogViewRepository(session)
+
 async def get_current_user(
   user_repo: IUserRepository = Depends(get_user_repository),
+  auth_session_repo: IAuthSessionRepository = Depends(get_auth_session_repository),
   token: str = Depends(oauth2_scheme),
 ) -> UserEntity:
-  return await AuthService.get_current_user(user_repo, token)
\ No newline at end of file
+  return await AuthService.get_current_user(user_repo, auth_session_repo, token)
+
+def get_rate_limiter(request: Request) -> RateLimiter:
+  return request.app.state.rate_limiter
+
+def get_view_counter(request: Request) -> IViewCounter:
+  return request.app.state.view_counter
+
+def get_trending_tracker(request: Request) -> ITrendingTracker:
+  return request.app.state.trending_tracker
+
+def get_markdown_renderer(request: Request) -> IMarkdownRenderer:
+  return request.app.state.markdown_renderer
+
+def get_feed_cache(request: Request) -> FeedCache:
+  return request.app.state.feed_cache
+
+def get_blog_stream_hub(request: Request) -> BlogStreamHub:
+  return request.app.state.blog_stream_hub
+
+def get_job_queue(request: Request) -> IJobQueue:
+  return request.app.state.job_runner
+
+def get_user_content_purger(request: Request) -> IUserContentPurger:
+  return request.app.state.user_content_purger
+
+def get_image_processor(request: Request) -> IImageProcessor:
+  return request.app.state.image_processor
+
+def get_image_storage(request: Request) -> IImageStorage:
+  return request.app.state.image_storage
+
+async def get_uploaded_image(request: Request) -> AsyncGenerator[str, None]:
+  """Streams a raw image request body into a temporary file and yields its path."""
+  if not request.headers.get("content-type", "").startswith("image/"):
+    raise HTTPException(
+      status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+      detail="The request body must be an image."
+    )
+
+  too_large = HTTPException(
+    status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+    detail=f"Images may not exceed {config.IMAGE_UPLOAD_MAX_BYTES} bytes."
+  )
+  content_length = request.headers.get("content-length")
+  if content_length and content_length.isdigit() and int(content_length) > config.IMAGE_UPLOAD_MAX_BYTES:
+    raise too_large
+
+  with tempfile.TemporaryDirectory(prefix="upload-") as directory:
+    path = os.path.join(directory, "original")
+    received = 0
+    with open(path, "wb") as file:
+      async for chunk in request.stream():
+        received += len(chunk)
+        if received > config.IMAGE_UPLOAD_MAX_BYTES:
+          raise too_large
+        file.write(chunk)
+
+    if received == 0:
+      raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="The request body is empty.")
+
+    yield path
+
+def version_etag(version: int) -> str:
+  return f'"{version}"'
+
+def get_if_match_version(request: Request) -> Optional[int]:
+  """Reads the version a client expects to update from a strong `If-Match` entity tag."""
+  if_match = request.headers.get("if-match")
+  if if_match is None or if_match.strip() == "*":
+    return None
+
+  # Weak tags never match If-Match, and nothing but a version was ever served as an ETag
+  for candidate in if_match.split(","):
+    tag = candidate.strip()
+    if tag.startswith('"') and tag.endswith('"') and tag[1:-1].isdigit():
+      return int(tag[1:-1])
+
+  raise HTTPException(
+    status_code=status.HTTP_412_PRECONDITION_FAILED,
+    detail="The If-Match header does not match any version of this resource."
+  )
+
+def require_if_match_version(version: Optional[int] = Depends(get_if_match_version)) -> int:
+  """Like `get_if_match_version`, for requests that only make sense against a known version."""
+  if version is None:
+    raise HTTPException(
+      status_code=status.HTTP_428_PRECONDITION_REQUIRED,
+      detail="This request needs an If-Match header with the version it applies to."
+    )
+  return version
+
+def get_client_ip(request: Request) -> str:
+  return request.client.host if request.client else "unknown"
+
+# Rate limit dependencies never touch the database, so declaring them in the
+# route `dependencies` makes rejected requests return before a session is opened.
+async def limit_login(
+  request: Request,
+  username: Optional[str] = Form(None),
+  rate_limiter: RateLimiter = Depends(get_rate_limiter),
+) -> None:
+  await rate_limiter.hit(config.RATE_LIMIT_LOGIN_PER_IP, f"login:ip:{get_client_ip(request)}")
+  if username:
+    await rate_limiter.hit(
+      config.RATE_LIMIT_LOGIN_PER_USERNAME,
+      f"login:username:{username.strip().lower()}"
+    )
+
+async def limit_refresh(
+  request: Request,
+  rate_limiter: RateLimiter = Depends(get_rate_limiter),
+) -> None:
+  await rate_limiter.hit(config.RATE_LIMIT_REFRESH_PER_IP, f"refresh:ip:{get_client_ip(request)}")
+
+async def limit_register(
+  request: Request,
+  rate_limiter: RateLimiter = Depends(get_rate_limiter),
+) -> None:
+  await rate_limiter.hit(config.RATE_LIMIT_REGISTER_PER_IP, f"register:ip:{get_client_ip(request)}")
+
+async def limit_writes(
+  request: Request,
+  rate_limiter: RateLimiter = Depends(get_rate_limiter),
+) -> None:
+  await rate_limiter.hit(config.RATE_LIMIT_WRITE_PER_IP, f"write:ip:{get_client_ip(request)}")
@@ -9,3 +9,13 @@ def register_routes(app: FastAPI):
 
   from .user_endpoint import router as user_router
   app.include_router(prefix="/v1", router=user_router)
+
+  from .feed_endpoint import router as feed_router, public_router as public_feed_router
+  app.include_router(prefix="/v1", router=feed_router)
+  app.include_router(router=public_feed_router)
+
+  from .timeline_endpoint import router as timeline_router
+  app.include_router(prefix="/v1", router=timeline_router)
+
+  from .jwks_endpoint import public_router as jwks_router
+  app.include_router(router=jwks_router)
@@ -8,10 +8,10 @@ from fastapi import (
 )
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.api.dependencies import get_current_user
+from app.api.dependencies import get_current_user, oauth2_scheme, limit_login, limit_refresh
 from app.auth import AuthService, AuthResponse
 from app.database.db import get_db
-from app.repositories import UserRepository
+from app.repositories import UserRepository, AuthSessionRepository
 from app.services import PasswordHasher, UuidGenerator
 from src.application.dto import UserResponseDTO
 from src.domain.entities import UserEntity
@@ -21,6 +21,7 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 
 @router.post(
   "/login",
+  dependencies=[Depends(limit_login)],
   status_code=status.HTTP_200_OK,
   response_model=AuthResponse,
   response_model_exclude_none=True,
@@ -31,6 +32,9 @@ router = APIRouter(prefix="/auth", tags=["auth"])
     status.HTTP_401_UNAUTHORIZED: {
       "description": "Invalid username or password",
     },
+    status.HTTP_429_TOO_MANY_REQUESTS: {
+      "description": "Too many login attempts",
+    },
     status.HTTP_500_INTERNAL_SERVER_ERROR: {
       "description": "Internal server error",
     },
@@ -38,6 +42,7 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 )
 @router.post(
   "/login/",
+  dependencies=[Depends(limit_login)],
   include_in_schema=False
 )
 async def login(
@@ -53,6 +58,7 @@ async def login(
     session=session,
     id_generator=id_generator,
     user_repo=user_repo,
+    auth_session_repo=AuthSessionRepository(session),
     password_hasher=password_hasher,
     username=form_data.username,
     password=form_data.password,
@@ -89,6 +95,7 @@ async def get_authenticated_user(
 
 @router.post(
   "/refresh",
+  dependencies=[Depends(limit_refresh)],
   status_code=status.HTTP_200_OK,
   response_model=AuthResponse,
   response_model_exclude_none=True,
@@ -106,6 +113,7 @@ async def get_authenticated_user(
 )
 @router.post(
   "/refresh/",
+  dependencies=[Depends(limit_refresh)],
   include_in_schema=False
 )
 async def refresh_token(
@@ -128,6 +136,7 @@ async def refresh_token(
     session=session,
     id_generator=id_generator,
     user_repo=user_repo,
+    auth_session_repo=AuthSessionRepository(session),
     token=token,
   )
   return auth_response
@@ -154,13 +163,13 @@ async def refresh_token(
 async def logout(
   request: Request,
   session=Depends(get_db), 
-  current_user: UserEntity = Depends(get_current_user)
+  current_user: UserEntity = Depends(get_current_user),
+  token: str = Depends(oauth2_scheme)
 ):
-  user_repo = UserRepository(session)
   result = await AuthService.logout_user(
     session=session,
-    user_repo=user_repo,
-    user_id=current_user.id,
+    auth_session_repo=AuthSessionRepository(session),
+    token=token,
   )
   if result:
     return Response(content="Successful logout", status_code=status.HTTP_200_OK)
@@ -1,25 +1,66 @@
 import logging
-from fastapi import APIRouter, Request, Depends, status
-from fastapi.responses import JSONResponse
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Request, Response, Depends, Header, Query, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession 
 
-from ..dependencies import get_current_user 
+from ..dependencies import (
+  get_current_user,
+  get_blog_repository,
+  get_blog_view_repository,
+  get_view_counter,
+  get_trending_tracker,
+  get_blog_stream_hub,
+  get_markdown_renderer,
+  get_image_processor,
+  get_image_storage,
+  get_uploaded_image,
+  get_job_queue,
+  get_if_match_version,
+  require_if_match_version,
+  version_etag,
+  limit_writes
+)
+from app.config import config
 from app.database.db import get_db
 from app.database.unit_of_work import get_uow
-from app.repositories import BlogRepository
+from app.feeds import BlogStreamHub, BlogStreamSubscription
+from app.repositories import RelatedBlogRepository, BlogRevisionRepository
 from app.services import UuidGenerator
 from src.application.dto import (
   CreateBlogDTO, 
   UpdateBlogDTO,
+  PatchBlogDTO,
   BlogResponseDTO,
+  BlogPatchResponseDTO,
+  TrendingBlogDTO,
+  BlogRevisionDTO,
+  BlogRevisionContentDTO,
   PaginationDTO,
-  PaginationResponseDTO
+  BlogPaginationDTO,
+  BlogSearchDTO,
+  PaginationResponseDTO,
+  BlogSearchResponseDTO
+)
+from src.application.repositories import IBlogRepository, IBlogViewRepository
+from src.application.services import (
+  IViewCounter,
+  ITrendingTracker,
+  IMarkdownRenderer,
+  IImageProcessor,
+  IImageStorage,
+  IJobQueue
 )
 from src.application.use_cases.blogs import (
   CreateBlogUseCase,
   GetBlogUseCase,
   UpdateBlogUseCase,
-  DeleteBlogUseCase
+  PatchBlogUseCase,
+  DeleteBlogUseCase,
+  UploadHeroImageUseCase,
+  GetRelatedBlogsUseCase,
+  GetTrendingBlogsUseCase,
+  GetBlogRevisionsUseCase
 )
 from src.domain.entities import UserEntity
 
@@ -30,8 +71,16 @@ router = APIRouter(
   tags=["blogs"]
 )
 
+IMAGE_REQUEST_BODY = {
+  "requestBody": {
+    "required": True,
+    "content": {"image/*": {"schema": {"type": "string", "format": "binary"}}}
+  }
+}
+
 @router.post(
   "/",
+  dependencies=[Depends(limit_writes)],
   status_code=status.HTTP_201_CREATED,
   response_model=BlogResponseDTO,
   response_model_exclude_none=True,
@@ -44,14 +93,16 @@ router = APIRouter(
 async def create_blog(
   request: Request,
   blog_data: CreateBlogDTO,
-  session: AsyncSession = Depends(get_db)
+  session: AsyncSession = Depends(get_db),
+  markdown_renderer: IMarkdownRenderer = Depends(get_markdown_renderer)
 ):
   logger.info(f"Creating blog with title: {blog_data.title} for author_id: {blog_data.author_id}")
   uuid_generator = UuidGenerator()
   unit_of_work = get_uow(session)
   use_case = CreateBlogUseCase(
     unit_of_work=unit_of_work,
-    id_generator=uuid_generator
+    id_generator=uuid_generator,
+    markdown_renderer=markdown_renderer
   )
   blog = await use_case.execute(blog_data)
   logger.info(f"Blog created with id: {blog.id}")
@@ -60,7 +111,7 @@ async def create_blog(
 @router.get(
   "/",
   status_code=status.HTTP_200_OK,
-  response_model=PaginationResponseDTO[BlogResponseDTO],
+  response_model=BlogSearchResponseDTO[BlogResponseDTO],
   response_model_exclude_none=True,
   responses={
     200: {"description": "Blogs retrieved successfully."},
@@ -70,16 +121,71 @@ async def create_blog(
 )
 async def list_blogs(
   request: Request,
-  pagination: PaginationDTO = Depends(),
-  session: AsyncSession = Depends(get_db)
+  pagination: Annotated[BlogSearchDTO, Query()],
+  blog_repository: IBlogRepository = Depends(get_blog_repository),
+  view_repository: IBlogViewRepository = Depends(get_blog_view_repository),
+  view_counter: IViewCounter = Depends(get_view_counter)
 ):
   logger.info(f"Listing blogs with pagination: skip: {pagination.skip}, limit: {pagination.limit}")
-  blog_repository = BlogRepository(session)
-  use_case = GetBlogUseCase(blog_repository)
-  result = await use_case.get_all_blogs(pagination)
+  use_case = GetBlogUseCase(blog_repository, view_repository, view_counter)
+  result = await use_case.search_blogs(pagination)
   logger.info(f"Number of blogs retrieved: {len(result.items)}")
   return result
 
+@router.get(
+  "/stream",
+  response_class=StreamingResponse,
+  responses={
+    200: {"description": "Server-sent events of created, updated and deleted blogs.", "content": {"text/event-stream": {}}},
+    503: {"description": "Too many open streams, retry later."}
+  }
+)
+async def stream_blogs(
+  request: Request,
+  last_event_id: Optional[str] = Header(None),
+  hub: BlogStreamHub = Depends(get_blog_stream_hub)
+):
+  subscription = hub.subscribe(last_event_id)
+  if subscription is None:
+    logger.warning(f"Rejected blog stream: {hub.subscriber_count} streams open.")
+    return JSONResponse(
+      status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+      content={"detail": "Too many open blog streams."},
+      headers={"Retry-After": str(config.BLOG_STREAM_RETRY_MILLISECONDS // 1000)}
+    )
+
+  async def events(subscription: BlogStreamSubscription):
+    try:
+      async for chunk in subscription.stream(config.BLOG_STREAM_HEARTBEAT_SECONDS, config.BLOG_STREAM_RETRY_MILLISECONDS):
+        yield chunk
+    finally:
+      # Runs when the client disconnects and the response is cancelled
+      hub.unsubscribe(subscription)
+
+  return StreamingResponse(
+    events(subscription),
+    media_type="text/event-stream",
+    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+  )
+
+@router.get(
+  "/trending",
+  status_code=status.HTTP_200_OK,
+  response_model=List[TrendingBlogDTO],
+  response_model_exclude_none=True,
+  responses={
+    200: {"description": "Trending blogs retrieved successfully."},
+    500: {"description": "Internal Server Error."}
+  }
+)
+async def get_trending_blogs(
+  request: Request,
+  limit: int = Query(10, ge=1, le=50),
+  trending_tracker: ITrendingTracker = Depends(get_trending_tracker)
+):
+  # Served from the snapshot in memory, the database is never queried here
+  return GetTrendingBlogsUseCase(trending_tracker).execute(limit)
+
 @router.get(
   "/{blog_id}",
   status_code=status.HTTP_200_OK,
@@ -97,13 +203,16 @@ async def list_blogs(
 )
 async def get_blog(
   request: Request,
+  response: Response,
   blog_id: str,
-  session: AsyncSession = Depends(get_db)
+  blog_repository: IBlogRepository = Depends(get_blog_repository),
+  view_repository: IBlogViewRepository = Depends(get_blog_view_repository),
+  view_counter: IViewCounter = Depends(get_view_counter),
+  trending_tracker: ITrendingTracker = Depends(get_trending_tracker)
 ):
   logger.info(f"Fetching blog with id: {blog_id}")
-  blog_repository = BlogRepository(session)
-  use_case = GetBlogUseCase(blog_repository)
-  blog = await use_case.get_by_id(blog_id)
+  use_case = GetBlogUseCase(blog_repository, view_repository, view_counter, trending_tracker)
+  blog = await use_case.view_by_id(blog_id)
   if blog is None:
     logger.warning(f"Blog with id: {blog_id} not found.")
     return JSONResponse(
@@ -111,8 +220,94 @@ async def get_blog(
       content={"detail": f"Blog with id '{blog_id}' not found."}
     )
   logger.info(f"Blog fetched: {blog.title} (id: {blog.id})")
+  response.headers["ETag"] = version_etag(blog.version)
   return blog
 
+@router.get(
+  "/{blog_id}/related",
+  status_code=status.HTTP_200_OK,
+  response_model=List[BlogResponseDTO],
+  response_model_exclude_none=True,
+  responses={
+    200: {"description": "Related blogs retrieved successfully."},
+    404: {"description": "Blog not found."},
+    500: {"description": "Internal Server Error."}
+  }
+)
+async def get_related_blogs(
+  request: Request,
+  blog_id: str,
+  limit: int = Query(5, ge=1, le=20),
+  session: AsyncSession = Depends(get_db),
+  blog_repository: IBlogRepository = Depends(get_blog_repository)
+):
+  logger.info(f"Fetching blogs related to blog id: {blog_id}")
+  use_case = GetRelatedBlogsUseCase(blog_repository, RelatedBlogRepository(session))
+  blogs = await use_case.execute(blog_id, limit)
+  if blogs is None:
+    logger.warning(f"Blog with id: {blog_id} not found.")
+    return JSONResponse(
+      status_code=status.HTTP_404_NOT_FOUND,
+      content={"detail": f"Blog with id '{blog_id}' not found."}
+    )
+  return blogs
+
+@router.get(
+  "/{blog_id}/revisions",
+  status_code=status.HTTP_200_OK,
+  response_model=PaginationResponseDTO[BlogRevisionDTO],
+  responses={
+    200: {"description": "Blog revisions retrieved successfully."},
+    404: {"description": "Blog not found."},
+    500: {"description": "Internal Server Error."}
+  }
+)
+async def list_blog_revisions(
+  request: Request,
+  blog_id: str,
+  pagination: PaginationDTO = Depends(),
+  session: AsyncSession = Depends(get_db),
+  blog_repository: IBlogRepository = Depends(get_blog_repository)
+):
+  logger.info(f"Listing revisions of blog id: {blog_id}")
+  use_case = GetBlogRevisionsUseCase(blog_repository, BlogRevisionRepository(session))
+  result = await use_case.list_revisions(blog_id, pagination)
+  if result is None:
+    logger.warning(f"Blog with id: {blog_id} not found.")
+    return JSONResponse(
+      status_code=status.HTTP_404_NOT_FOUND,
+      content={"detail": f"Blog with id '{blog_id}' not found."}
+    )
+  return result
+
+@router.get(
+  "/{blog_id}/revisions/{version}",
+  status_code=status.HTTP_200_OK,
+  response_model=BlogRevisionContentDTO,
+  responses={
+    200: {"description": "Blog revision retrieved successfully."},
+    404: {"description": "Blog revision not found."},
+    500: {"description": "Internal Server Error."}
+  }
+)
+async def get_blog_revision(
+  request: Request,
+  blog_id: str,
+  version: int,
+  session: AsyncSession = Depends(get_db),
+  blog_repository: IBlogRepository = Depends(get_blog_repository)
+):
+  logger.info(f"Fetching revision {version} of blog id: {blog_id}")
+  use_case = GetBlogRevisionsUseCase(blog_repository, BlogRevisionRepository(session))
+  revision = await use_case.get_revision(blog_id, version)
+  if revision is None:
+    logger.warning(f"Revision {version} of blog with id: {blog_id} not found.")
+    return JSONResponse(
+      status_code=status.HTTP_404_NOT_FOUND,
+      content={"detail": f"Revision {version} of blog with id '{blog_id}' not found."}
+    )
+  return revision
+
 @router.get(
   "/author/{author_id}",
   status_code=status.HTTP_200_OK,
@@ -131,18 +326,20 @@ async def get_blog(
 async def get_blogs_by_author(
   request: Request,
   author_id: str,
-  pagination: PaginationDTO = Depends(),
-  session: AsyncSession = Depends(get_db)
+  pagination: BlogPaginationDTO = Depends(),
+  blog_repository: IBlogRepository = Depends(get_blog_repository),
+  view_repository: IBlogViewRepository = Depends(get_blog_view_repository),
+  view_counter: IViewCounter = Depends(get_view_counter)
 ):
   logger.info(f"Fetching blogs for author_id: {author_id} with pagination: skip: {pagination.skip}, limit: {pagination.limit}")
-  blog_repository = BlogRepository(session)
-  use_case = GetBlogUseCase(blog_repository)
+  use_case = GetBlogUseCase(blog_repository, view_repository, view_counter)
   result = await use_case.get_all_blogs_by_author(author_id, pagination)
   logger.info(f"Number of blogs fetched for author_id '{author_id}': {len(result.items)}")
   return result
 
 @router.put(
   "/{blog_id}",
+  dependencies=[Depends(limit_writes)],
   status_code=status.HTTP_200_OK,
   response_model=BlogResponseDTO,
   response_model_exclude_none=True,
@@ -150,33 +347,119 @@ async def get_blogs_by_author(
     200: {"description": "Blog updated successfully."},
     400: {"description": "Bad Request."},
     404: {"description": "Blog not found."},
+    409: {"description": "Blog was modified concurrently."},
+    412: {"description": "Blog does not match the If-Match version."},
     500: {"description": "Internal Server Error."}
   }
 )
 @router.put(
   "/{blog_id}/",
+  dependencies=[Depends(limit_writes)],
   include_in_schema=False
 )
 async def update_blog(
   request: Request,
+  response: Response,
   blog_id: str,
   blog_data: UpdateBlogDTO,
   session: AsyncSession = Depends(get_db),
-  current_user: UserEntity = Depends(get_current_user)
+  current_user: UserEntity = Depends(get_current_user),
+  markdown_renderer: IMarkdownRenderer = Depends(get_markdown_renderer),
+  expected_version: Optional[int] = Depends(get_if_match_version)
 ):
   logger.info(f"Updating blog with id: {blog_id}")
   unit_of_work = get_uow(session)
-  use_case = UpdateBlogUseCase(unit_of_work)
+  use_case = UpdateBlogUseCase(unit_of_work, markdown_renderer)
   updated_blog = await use_case.execute(
     current_user,
     blog_id,
-    blog_data
+    blog_data,
+    expected_version
   )
   logger.info(f"Blog updated: {updated_blog.title} (id: {updated_blog.id})")
+  response.headers["ETag"] = version_etag(updated_blog.version)
+  return updated_blog
+
+@router.patch(
+  "/{blog_id}",
+  dependencies=[Depends(limit_writes)],
+  status_code=status.HTTP_200_OK,
+  response_model=BlogPatchResponseDTO,
+  responses={
+    200: {"description": "Blog content patched successfully."},
+    400: {"description": "Bad Request, or the patched content does not match the content hash."},
+    404: {"description": "Blog not found."},
+    409: {"description": "Blog was modified concurrently."},
+    412: {"description": "Blog does not match the If-Match version."},
+    428: {"description": "The If-Match header is missing."},
+    500: {"description": "Internal Server Error."}
+  }
+)
+@router.patch(
+  "/{blog_id}/",
+  dependencies=[Depends(limit_writes)],
+  include_in_schema=False
+)
+async def patch_blog(
+  request: Request,
+  response: Response,
+  blog_id: str,
+  patch_data: PatchBlogDTO,
+  session: AsyncSession = Depends(get_db),
+  current_user: UserEntity = Depends(get_current_user),
+  markdown_renderer: IMarkdownRenderer = Depends(get_markdown_renderer),
+  expected_version: int = Depends(require_if_match_version)
+):
+  logger.info(f"Patching blog with id: {blog_id} at version {expected_version} with {len(patch_data.operations)} operations")
+  unit_of_work = get_uow(session)
+  use_case = PatchBlogUseCase(unit_of_work, markdown_renderer)
+  patched_blog = await use_case.execute(current_user, blog_id, patch_data, expected_version)
+  logger.info(f"Blog patched: id: {patched_blog.id}, version: {patched_blog.version}")
+  response.headers["ETag"] = version_etag(patched_blog.version)
+  return patched_blog
+
+@router.put(
+  "/{blog_id}/hero-image",
+  dependencies=[Depends(limit_writes)],
+  status_code=status.HTTP_200_OK,
+  response_model=BlogResponseDTO,
+  response_model_exclude_none=True,
+  openapi_extra=IMAGE_REQUEST_BODY,
+  responses={
+    200: {"description": "Hero image uploaded successfully."},
+    400: {"description": "Bad Request."},
+    404: {"description": "Blog not found."},
+    413: {"description": "Image too large."},
+    415: {"description": "Unsupported Media Type."},
+    500: {"description": "Internal Server Error."}
+  }
+)
+async def upload_hero_image(
+  request: Request,
+  blog_id: str,
+  session: AsyncSession = Depends(get_db),
+  current_user: UserEntity = Depends(get_current_user),
+  source_path: str = Depends(get_uploaded_image),
+  image_processor: IImageProcessor = Depends(get_image_processor),
+  image_storage: IImageStorage = Depends(get_image_storage),
+  job_queue: IJobQueue = Depends(get_job_queue)
+):
+  logger.info(f"Uploading hero image for blog with id: {blog_id}")
+  unit_of_work = get_uow(session)
+  use_case = UploadHeroImageUseCase(
+    unit_of_work=unit_of_work,
+    image_processor=image_processor,
+    image_storage=image_storage,
+    id_generator=UuidGenerator(),
+    job_queue=job_queue
+  )
+  updated_blog = await use_case.execute(current_user, blog_id, source_path)
+  logger.info(f"Hero image uploaded for blog with id: {blog_id}")
   return updated_blog
 
 @router.delete(
   "/{blog_id}",
+  dependencies=[Depends(limit_writes)],
   status_code=status.HTTP_204_NO_CONTENT,
   responses={
     204: {"description": "Blog deleted successfully."},
@@ -186,6 +469,7 @@ async def update_blog(
 )
 @router.delete(
   "/{blog_id}/",
+  dependencies=[Depends(limit_writes)],
   include_in_schema=False
 )
 async def delete_blog(
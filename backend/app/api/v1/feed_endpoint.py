@@ -0,0 +1,137 @@
+import logging
+from fastapi import APIRouter, Request, Response, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_feed_cache, get_blog_repository
+from app.config import config
+from app.database.db import get_db
+from app.feeds import (
+  CachedDocument,
+  FeedCache,
+  GLOBAL_FEED_KEY,
+  SITEMAP_KEY,
+  author_feed_key,
+  render_rss_feed,
+  render_sitemap
+)
+from app.repositories import UserRepository
+from src.application.repositories import IBlogRepository
+from src.domain.exceptions import NotFoundException
+
+logger = logging.getLogger(__name__)
+
+# Served at the site root, where feed readers and crawlers look for them
+public_router = APIRouter(tags=["feeds"])
+
+router = APIRouter(
+  prefix="/blogs",
+  tags=["feeds"]
+)
+
+RSS_MEDIA_TYPE = "application/rss+xml"
+XML_MEDIA_TYPE = "application/xml"
+
+def _matches_etag(request: Request, etag: str) -> bool:
+  if_none_match = request.headers.get("if-none-match")
+  if not if_none_match:
+    return False
+  candidates = [candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")]
+  return "*" in candidates or etag in candidates
+
+def _feed_url(request: Request, route_name: str, **path_params: str) -> str:
+  # The cached body is shared by every reader, so no part of it may come from the client's Host or query
+  return f"{config.SITE_URL.rstrip('/')}{request.app.url_path_for(route_name, **path_params)}"
+
+def _document_response(request: Request, document: CachedDocument, media_type: str) -> Response:
+  headers = {
+    "ETag": document.etag,
+    "Cache-Control": f"public, max-age={config.FEED_CACHE_MAX_AGE_SECONDS}",
+  }
+  if _matches_etag(request, document.etag):
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+  return Response(content=document.body, media_type=media_type, headers=headers)
+
+@public_router.get(
+  "/feed.xml",
+  response_class=Response,
+  responses={
+    200: {"description": "RSS feed of the latest blogs.", "content": {RSS_MEDIA_TYPE: {}}},
+    304: {"description": "Feed not modified."},
+  }
+)
+async def get_feed(
+  request: Request,
+  blog_repository: IBlogRepository = Depends(get_blog_repository),
+  feed_cache: FeedCache = Depends(get_feed_cache)
+):
+  async def render() -> bytes:
+    logger.info("Rendering global feed.")
+    return await render_rss_feed(
+      title=config.APP_NAME,
+      site_url=config.SITE_URL,
+      feed_url=_feed_url(request, "get_feed"),
+      description=f"Latest blogs on {config.APP_NAME}",
+      blogs=blog_repository.stream_blogs(limit=config.FEED_ITEM_LIMIT)
+    )
+
+  document, cached = await feed_cache.get_or_render(GLOBAL_FEED_KEY, render)
+  logger.info(f"Serving global feed (cached: {cached})")
+  return _document_response(request, document, RSS_MEDIA_TYPE)
+
+@public_router.get(
+  "/sitemap.xml",
+  response_class=Response,
+  responses={
+    200: {"description": "Sitemap of every blog.", "content": {XML_MEDIA_TYPE: {}}},
+    304: {"description": "Sitemap not modified."},
+  }
+)
+async def get_sitemap(
+  request: Request,
+  blog_repository: IBlogRepository = Depends(get_blog_repository),
+  feed_cache: FeedCache = Depends(get_feed_cache)
+):
+  async def render() -> bytes:
+    logger.info("Rendering sitemap.")
+    return await render_sitemap(
+      site_url=config.SITE_URL,
+      blogs=blog_repository.stream_blog_updates(limit=config.SITEMAP_URL_LIMIT)
+    )
+
+  document, cached = await feed_cache.get_or_render(SITEMAP_KEY, render)
+  logger.info(f"Serving sitemap (cached: {cached})")
+  return _document_response(request, document, XML_MEDIA_TYPE)
+
+@router.get(
+  "/author/{author_id}/feed.xml",
+  response_class=Response,
+  responses={
+    200: {"description": "RSS feed of the latest blogs of an author.", "content": {RSS_MEDIA_TYPE: {}}},
+    304: {"description": "Feed not modified."},
+    404: {"description": "Author not found."},
+  }
+)
+async def get_author_feed(
+  request: Request,
+  author_id: str,
+  session: AsyncSession = Depends(get_db),
+  blog_repository: IBlogRepository = Depends(get_blog_repository),
+  feed_cache: FeedCache = Depends(get_feed_cache)
+):
+  async def render() -> bytes:
+    logger.info(f"Rendering feed for author_id: {author_id}")
+    author = await UserRepository(session).get_user_by_id(author_id)
+    if not author:
+      raise NotFoundException("User", f"user_id: {author_id}")
+
+    return await render_rss_feed(
+      title=f"{author.first_name} {author.last_name} on {config.APP_NAME}",
+      site_url=config.SITE_URL,
+      feed_url=_feed_url(request, "get_author_feed", author_id=author_id),
+      description=f"Latest blogs by {author.username}",
+      blogs=blog_repository.stream_blogs(author_id=author_id, limit=config.FEED_ITEM_LIMIT)
+    )
+
+  document, cached = await feed_cache.get_or_render(author_feed_key(author_id), render)
+  logger.info(f"Serving feed for author_id: {author_id} (cached: {cached})")
+  return _document_response(request, document, RSS_MEDIA_TYPE)
@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Request, Response, status
+
+from app.auth import TokenService
+from app.config import config
+
+# Served at the well-known location where token verifiers look for it
+public_router = APIRouter(tags=["auth"])
+
+@public_router.get(
+  "/.well-known/jwks.json",
+  status_code=status.HTTP_200_OK,
+  response_class=Response,
+  responses={
+    status.HTTP_200_OK: {
+      "description": "Public keys that verify tokens issued by this service",
+      "content": {"application/jwk-set+json": {}}
+    },
+    status.HTTP_304_NOT_MODIFIED: {
+      "description": "The key set has not changed",
+    },
+  }
+)
+async def get_jwks(request: Request):
+  key_ring = TokenService.get_key_ring()
+  headers = {
+    "ETag": key_ring.jwks_etag,
+    "Cache-Control": f"public, max-age={config.JWKS_MAX_AGE_SECONDS}",
+  }
+  if request.headers.get("if-none-match") == key_ring.jwks_etag:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+  return Response(
+    content=key_ring.jwks_document,
+    media_type="application/jwk-set+json",
+    headers=headers
+  )
@@ -0,0 +1,50 @@
+import logging
+from typing import Annotated
+from fastapi import APIRouter, Request, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_current_user, get_blog_repository
+from app.config import config
+from app.database.db import get_db
+from app.repositories import FollowRepository, TimelineRepository
+from src.application.dto import BlogResponseDTO, CursorPaginationDTO, CursorPaginationResponseDTO
+from src.application.repositories import IBlogRepository
+from src.application.use_cases.blogs import GetFeedUseCase
+from src.domain.entities import UserEntity
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+  prefix="/feed",
+  tags=["feed"]
+)
+
+@router.get(
+  "",
+  status_code=status.HTTP_200_OK,
+  response_model=CursorPaginationResponseDTO[BlogResponseDTO],
+  response_model_exclude_none=True,
+  responses={
+    200: {"description": "Page of the home feed of the current user."},
+    400: {"description": "Invalid cursor."},
+    401: {"description": "Unauthorized."},
+    500: {"description": "Internal Server Error."}
+  }
+)
+async def get_home_feed(
+  request: Request,
+  pagination: Annotated[CursorPaginationDTO, Query()],
+  session: AsyncSession = Depends(get_db),
+  blog_repository: IBlogRepository = Depends(get_blog_repository),
+  active_user: UserEntity = Depends(get_current_user)
+):
+  logger.info(f"Fetching home feed of user ID: {active_user.id}")
+  use_case = GetFeedUseCase(
+    follow_repository=FollowRepository(session),
+    timeline_repository=TimelineRepository(session),
+    blog_repository=blog_repository,
+    celebrity_threshold=config.FEED_CELEBRITY_FOLLOWER_THRESHOLD
+  )
+  result = await use_case.execute(active_user.id, pagination)
+  logger.info(f"Number of feed blogs fetched: {len(result.items)}")
+  return result
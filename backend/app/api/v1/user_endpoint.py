@@ -1,28 +1,49 @@
 import logging
-from fastapi import APIRouter, Request, Depends, status
+from typing import Optional
+from fastapi import APIRouter, Request, Response, Depends, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession 
 
-from app.api.dependencies import get_current_user
+from app.api.dependencies import (
+  get_current_user,
+  get_image_processor,
+  get_image_storage,
+  get_uploaded_image,
+  get_job_queue,
+  get_user_content_purger,
+  get_if_match_version,
+  version_etag,
+  limit_register,
+  limit_writes
+)
 from app.database.db import get_db
 from app.database.unit_of_work import get_uow
-from app.repositories import UserRepository
+from app.config import config
+from app.repositories import UserRepository, AuthorStatsRepository, FollowRepository
 from app.services import PasswordHasher, UuidGenerator
 from src.application.dto import (
   CreateUserDTO, 
   UpdateUserDTO,
   ChangePasswordDTO,
   UserResponseDTO,
+  AuthorStatsDTO,
   PaginationDTO,
-  PaginationResponseDTO
+  PaginationResponseDTO,
+  UserDeletionDTO
 )
 from src.application.use_cases.users import (
   CreateUserUseCase, 
   GetUserUseCase,
   UpdateUserUseCase,
   ChangePasswordUseCase,
-  DeleteUserUseCase
+  DeleteUserUseCase,
+  GetAuthorStatsUseCase,
+  GetUserDeletionUseCase,
+  UploadAvatarUseCase,
+  FollowUserUseCase,
+  GetFollowsUseCase
 )
+from src.application.services import IImageProcessor, IImageStorage, IJobQueue, IUserContentPurger
 from src.domain.entities import UserEntity
 
 logger = logging.getLogger(__name__)
@@ -32,8 +53,16 @@ router = APIRouter(
   tags=["users"]
 )
 
+IMAGE_REQUEST_BODY = {
+  "requestBody": {
+    "required": True,
+    "content": {"image/*": {"schema": {"type": "string", "format": "binary"}}}
+  }
+}
+
 @router.post(
   "/register", 
+  dependencies=[Depends(limit_register)],
   status_code=status.HTTP_201_CREATED,
   response_model=UserResponseDTO,
   response_model_exclude_none=True,
@@ -41,11 +70,13 @@ router = APIRouter(
     201: {"description": "User successfully registered."},
     400: {"description": "Bad Request."},
     409: {"description": "Conflict. User already exists."},
+    429: {"description": "Too Many Requests."},
     500: {"description": "Internal Server Error."}
   }
 )
 @router.post(
   "/register/",
+  dependencies=[Depends(limit_register)],
   include_in_schema=False
 )
 async def register_user(
@@ -105,6 +136,7 @@ async def get_users(
 )
 async def get_user(
   request: Request,
+  response: Response,
   user_id: str,
   session: AsyncSession = Depends(get_db),
 ):
@@ -121,6 +153,149 @@ async def get_user(
     )
 
   logger.info(f"User fetched: {result.username}")
+  response.headers["ETag"] = version_etag(result.version)
+  return result
+
+@router.get(
+  "/{user_id}/stats",
+  status_code=status.HTTP_200_OK,
+  response_model=AuthorStatsDTO,
+  responses={
+    200: {"description": "Author statistics found."},
+    404: {"description": "User not found."},
+    500: {"description": "Internal Server Error."}
+  }
+)
+@router.get(
+  "/{user_id}/stats/",
+  include_in_schema=False
+)
+async def get_author_stats(
+  request: Request,
+  user_id: str,
+  session: AsyncSession = Depends(get_db),
+):
+  logger.info(f"Fetching author stats for user ID: {user_id}")
+  use_case = GetAuthorStatsUseCase(
+    user_repository=UserRepository(session),
+    author_stats_repository=AuthorStatsRepository(session)
+  )
+  result = await use_case.execute(user_id)
+
+  if result is None:
+    logger.warning(f"User with ID '{user_id}' not found.")
+    return JSONResponse(
+      status_code=status.HTTP_404_NOT_FOUND,
+      content={"detail": f"User with ID '{user_id}' not found."}
+    )
+
+  logger.info(f"Author stats fetched for user ID: {user_id}, post_count: {result.post_count}")
+  return result
+
+@router.put(
+  "/{user_id}/follow",
+  dependencies=[Depends(limit_writes)],
+  status_code=status.HTTP_204_NO_CONTENT,
+  responses={
+    204: {"description": "User followed."},
+    400: {"description": "Users cannot follow themselves."},
+    401: {"description": "Unauthorized."},
+    404: {"description": "User not found."},
+    500: {"description": "Internal Server Error."}
+  }
+)
+async def follow_user(
+  request: Request,
+  user_id: str,
+  session: AsyncSession = Depends(get_db),
+  active_user: UserEntity = Depends(get_current_user)
+):
+  logger.info(f"User {active_user.id} following user ID: {user_id}")
+  use_case = FollowUserUseCase(
+    unit_of_work=get_uow(session),
+    celebrity_threshold=config.FEED_CELEBRITY_FOLLOWER_THRESHOLD,
+    timeline_length=config.TIMELINE_MAX_LENGTH,
+    backfill_size=config.TIMELINE_BACKFILL_SIZE
+  )
+  await use_case.follow(active_user, user_id)
+  return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+@router.delete(
+  "/{user_id}/follow",
+  dependencies=[Depends(limit_writes)],
+  status_code=status.HTTP_204_NO_CONTENT,
+  responses={
+    204: {"description": "User unfollowed."},
+    401: {"description": "Unauthorized."},
+    404: {"description": "User not found."},
+    500: {"description": "Internal Server Error."}
+  }
+)
+async def unfollow_user(
+  request: Request,
+  user_id: str,
+  session: AsyncSession = Depends(get_db),
+  active_user: UserEntity = Depends(get_current_user)
+):
+  logger.info(f"User {active_user.id} unfollowing user ID: {user_id}")
+  use_case = FollowUserUseCase(unit_of_work=get_uow(session))
+  await use_case.unfollow(active_user, user_id)
+  return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+@router.get(
+  "/{user_id}/followers",
+  status_code=status.HTTP_200_OK,
+  response_model=PaginationResponseDTO[UserResponseDTO],
+  response_model_exclude_none=True,
+  responses={
+    200: {"description": "Followers of the user, most recent first."},
+    404: {"description": "User not found."},
+    500: {"description": "Internal Server Error."}
+  }
+)
+async def get_followers(
+  request: Request,
+  user_id: str,
+  pagination: PaginationDTO = Depends(),
+  session: AsyncSession = Depends(get_db),
+):
+  use_case = GetFollowsUseCase(UserRepository(session), FollowRepository(session))
+  result = await use_case.get_followers(user_id, pagination)
+
+  if result is None:
+    logger.warning(f"User with ID '{user_id}' not found.")
+    return JSONResponse(
+      status_code=status.HTTP_404_NOT_FOUND,
+      content={"detail": f"User with ID '{user_id}' not found."}
+    )
+  return result
+
+@router.get(
+  "/{user_id}/following",
+  status_code=status.HTTP_200_OK,
+  response_model=PaginationResponseDTO[UserResponseDTO],
+  response_model_exclude_none=True,
+  responses={
+    200: {"description": "Users followed by the user, most recent first."},
+    404: {"description": "User not found."},
+    500: {"description": "Internal Server Error."}
+  }
+)
+async def get_following(
+  request: Request,
+  user_id: str,
+  pagination: PaginationDTO = Depends(),
+  session: AsyncSession = Depends(get_db),
+):
+  use_case = GetFollowsUseCase(UserRepository(session), FollowRepository(session))
+  result = await use_case.get_following(user_id, pagination)
+
+  if result is None:
+    logger.warning(f"User with ID '{user_id}' not found.")
+    return JSONResponse(
+      status_code=status.HTTP_404_NOT_FOUND,
+      content={"detail": f"User with ID '{user_id}' not found."}
+    )
   return result
 
 @router.get(
@@ -158,6 +333,7 @@ async def get_user_by_username(
 
 @router.put(
   "/{user_id}",
+  dependencies=[Depends(limit_writes)],
   status_code=status.HTTP_200_OK,
   response_model=UserResponseDTO,
   response_model_exclude_none=True,
@@ -165,19 +341,24 @@ async def get_user_by_username(
     200: {"description": "User updated successfully."},
     400: {"description": "Bad Request."},
     404: {"description": "User not found."},
+    409: {"description": "User was modified concurrently."},
+    412: {"description": "User does not match the If-Match version."},
     500: {"description": "Internal Server Error."}
   }
 )
 @router.put(
   "/{user_id}/",
+  dependencies=[Depends(limit_writes)],
   include_in_schema=False
 ) 
 async def update_user(
   request: Request,
+  response: Response,
   user_id: str,
   user_data: UpdateUserDTO,
   session: AsyncSession = Depends(get_db),
-  active_user: UserEntity = Depends(get_current_user)
+  active_user: UserEntity = Depends(get_current_user),
+  expected_version: Optional[int] = Depends(get_if_match_version)
 ):
   logger.info(f"Updating user with ID: {user_id}")
   unit_of_work = get_uow(session)
@@ -185,13 +366,59 @@ async def update_user(
   result = await use_case.execute(
     active_user=active_user, 
     user_id=user_id, 
-    data=user_data
+    data=user_data,
+    expected_version=expected_version
   )
   logger.info(f"User updated: {result.username}")
+  response.headers["ETag"] = version_etag(result.version)
+  return result
+
+@router.put(
+  "/{user_id}/avatar",
+  dependencies=[Depends(limit_writes)],
+  status_code=status.HTTP_200_OK,
+  response_model=UserResponseDTO,
+  response_model_exclude_none=True,
+  openapi_extra=IMAGE_REQUEST_BODY,
+  responses={
+    200: {"description": "Avatar uploaded successfully."},
+    400: {"description": "Bad Request."},
+    404: {"description": "User not found."},
+    413: {"description": "Image too large."},
+    415: {"description": "Unsupported Media Type."},
+    500: {"description": "Internal Server Error."}
+  }
+)
+async def upload_avatar(
+  request: Request,
+  user_id: str,
+  session: AsyncSession = Depends(get_db),
+  active_user: UserEntity = Depends(get_current_user),
+  source_path: str = Depends(get_uploaded_image),
+  image_processor: IImageProcessor = Depends(get_image_processor),
+  image_storage: IImageStorage = Depends(get_image_storage),
+  job_queue: IJobQueue = Depends(get_job_queue)
+):
+  logger.info(f"Uploading avatar for user with ID: {user_id}")
+  unit_of_work = get_uow(session)
+  use_case = UploadAvatarUseCase(
+    unit_of_work=unit_of_work,
+    image_processor=image_processor,
+    image_storage=image_storage,
+    id_generator=UuidGenerator(),
+    job_queue=job_queue
+  )
+  result = await use_case.execute(
+    active_user=active_user,
+    user_id=user_id,
+    source_path=source_path
+  )
+  logger.info(f"Avatar uploaded for user ID: {user_id}")
   return result
 
 @router.put(
   "/change-password/{user_id}",
+  dependencies=[Depends(limit_writes)],
   status_code=status.HTTP_200_OK,
   response_model=UserResponseDTO,
   response_model_exclude_none=True,
@@ -204,6 +431,7 @@ async def update_user(
 )
 @router.put(
   "/change-password/{user_id}/",
+  dependencies=[Depends(limit_writes)],
   include_in_schema=False
 )
 async def change_user_password(
@@ -230,28 +458,53 @@ async def change_user_password(
 
 @router.delete(
   "/{user_id}",
-  status_code=status.HTTP_204_NO_CONTENT,
+  dependencies=[Depends(limit_writes)],
+  status_code=status.HTTP_202_ACCEPTED,
+  response_model=UserDeletionDTO,
   responses={
-    204: {"description": "User deleted successfully."},
+    202: {"description": "User deletion accepted, its progress is served at the Location header."},
     404: {"description": "User not found."},
     500: {"description": "Internal Server Error."}
   }
 )
 @router.delete(
   "/{user_id}/",
+  dependencies=[Depends(limit_writes)],
   include_in_schema=False
 )
 async def delete_user(
   request: Request,
+  response: Response,
   user_id: str,
   session: AsyncSession = Depends(get_db),
-  active_user: UserEntity = Depends(get_current_user)
+  active_user: UserEntity = Depends(get_current_user),
+  content_purger: IUserContentPurger = Depends(get_user_content_purger),
+  job_queue: IJobQueue = Depends(get_job_queue)
 ):
   logger.info(f"Deleting user with ID: {user_id}")
   unit_of_work = get_uow(session)
-  use_case = DeleteUserUseCase(unit_of_work)
-  await use_case.execute(
+  use_case = DeleteUserUseCase(unit_of_work, UuidGenerator(), content_purger, job_queue)
+  result = await use_case.execute(
     active_user=active_user, 
     user_id=user_id
   )
-  logger.info(f"User deleted with ID: {user_id}")
\ No newline at end of file
+  response.headers["Location"] = str(request.url_for("get_user_deletion", deletion_id=result.id))
+  logger.info(f"User deletion {result.id} {result.status} for user ID: {user_id}")
+  return result
+
+@router.get(
+  "/deletions/{deletion_id}",
+  status_code=status.HTTP_200_OK,
+  response_model=UserDeletionDTO,
+  responses={
+    200: {"description": "Progress of the user deletion."},
+    404: {"description": "User deletion not found."},
+    500: {"description": "Internal Server Error."}
+  }
+)
+async def get_user_deletion(
+  deletion_id: str,
+  session: AsyncSession = Depends(get_db),
+):
+  use_case = GetUserDeletionUseCase(get_uow(session))
+  return await use_case.execute(deletion_id)
@@ -1,3 +1,6 @@
 from .auth_model import Token, TokenData, TokenType, AuthResponse
 from .auth_service import AuthService
-from .token_service import TokenService
\ No newline at end of file
+from .token_service import TokenService, token_cache
+from .key_ring import KeyRing, SigningKey, create_key_ring
+from .token_cache import TokenVerificationCache
+from .session_cleanup import purge_expired_sessions
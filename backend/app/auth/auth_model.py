@@ -1,5 +1,6 @@
 from enum import Enum
 from pydantic import BaseModel
+from typing import Optional
 
 from src.application.dto import BasicUserDTO
 
@@ -10,6 +11,7 @@ class TokenType(Enum):
 class TokenData(BaseModel):
   user_id: str 
   token_id: str
+  session_id: Optional[str] = None
 
 class Token(BaseModel):
   token: str
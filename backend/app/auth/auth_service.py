@@ -1,22 +1,41 @@
 import logging
+from datetime import datetime, timedelta, timezone
 from sqlalchemy.ext.asyncio import AsyncSession 
 
 from .auth_model import AuthResponse, TokenData, TokenType
 from .token_service import TokenService
 
+from app.config import config
 from src.application.dto import BasicUserDTO
-from src.application.repositories import IUserRepository
+from src.application.repositories import IUserRepository, IAuthSessionRepository
 from src.application.services import IPasswordHasher, IIdGenerator
-from src.domain.entities import UserEntity
+from src.domain.entities import UserEntity, AuthSessionEntity
 from src.domain.exceptions import UnauthorizedException
 
 logger = logging.getLogger(__name__)
 class AuthService:
+  @staticmethod
+  def _issue_tokens(user_id: str, session_id: str, access_token_id: str, refresh_token_id: str):
+    access_token = TokenService.create_token(
+      TokenData(user_id=user_id, token_id=access_token_id, session_id=session_id),
+      TokenType.ACCESS
+    )
+    refresh_token = TokenService.create_token(
+      TokenData(user_id=user_id, token_id=refresh_token_id, session_id=session_id),
+      TokenType.REFRESH
+    )
+    return access_token, refresh_token
+
+  @staticmethod
+  def _session_expiry() -> datetime:
+    return datetime.now(timezone.utc) + timedelta(days=config.DEFAULT_REFRESH_TOKEN_EXPIRE_DAYS)
+
   @staticmethod
   async def authenticate_user(
     session: AsyncSession,
     id_generator: IIdGenerator,
     user_repo: IUserRepository,
+    auth_session_repo: IAuthSessionRepository,
     password_hasher: IPasswordHasher,
     username: str,
     password: str,
@@ -30,45 +49,54 @@ class AuthService:
     ):
       raise UnauthorizedException("Invalid username or password")
     
-    access_token_id = id_generator.generate()
-    access_token_data = TokenData(user_id=user.id, token_id=access_token_id)
-    access_token = TokenService.create_token(access_token_data, TokenType.ACCESS)
+    # Every login opens its own session, so a user can stay signed in on several devices
+    auth_session = AuthSessionEntity(
+      id=id_generator.generate(),
+      user_id=user.id,
+      access_token_id=id_generator.generate(),
+      refresh_token_id=id_generator.generate(),
+      expires_at=AuthService._session_expiry()
+    )
+    access_token, refresh_token = AuthService._issue_tokens(
+      user.id,
+      auth_session.id,
+      auth_session.access_token_id,
+      auth_session.refresh_token_id
+    )
 
-    refresh_token_id = id_generator.generate()
-    refresh_token_data = TokenData(user_id=user.id, token_id=refresh_token_id)
-    refresh_token = TokenService.create_token(refresh_token_data, TokenType.REFRESH)
+    await auth_session_repo.create_session(auth_session)
+    await session.commit()
 
-    result = AuthResponse(
+    logger.info(f"Authentication successful for username: {username}, user_id: {user.id}")
+    return AuthResponse(
       access_token=access_token.token,
       refresh_token=refresh_token.token,
       user=BasicUserDTO.model_validate(user.to_dict())
     )
-
-    user.access_token_id = access_token_id
-    user.refresh_token_id = refresh_token_id
-    user = await user_repo.update_user(user_id=user.id, user=user)
-    await session.commit()
-
-    logger.info(f"Authentication successful for username: {username}, user_id: {user.id}")
-    return result
   
   @staticmethod
   async def get_current_user(
     user_repo: IUserRepository,
+    auth_session_repo: IAuthSessionRepository,
     token: str,
   ) -> UserEntity:
     logger.info(f"Getting current user from token.")
     token_data = TokenService.verify_token(token)
 
+    auth_session = await auth_session_repo.get_session(token_data.session_id) if token_data.session_id else None
+    if (
+      not auth_session
+      or auth_session.user_id != token_data.user_id
+      or auth_session.access_token_id != token_data.token_id
+      or auth_session.is_expired()
+    ):
+      logger.warning(f"Access token does not match an active session for user_id: {token_data.user_id}")
+      raise UnauthorizedException("Invalid access token")
+
     user = await user_repo.get_user_by_id(token_data.user_id)
-    token_id = token_data.token_id
 
     if not user:
       raise UnauthorizedException("User not found")
-    
-    if user.access_token_id != token_id:
-      logger.warning(f"Access token mismatch for user_id: {user.id}")
-      raise UnauthorizedException("Invalid access token")
 
     logger.info(f"Current user retrieved successfully for username: {user.username}, user_id: {user.id}")
     return user
@@ -78,36 +106,48 @@ class AuthService:
     session: AsyncSession,
     id_generator: IIdGenerator,
     user_repo: IUserRepository,
+    auth_session_repo: IAuthSessionRepository,
     token: str,
   ) -> AuthResponse:
     logger.info(f"Refreshing access token.")
     token_data = TokenService.verify_token(token)
 
+    if not token_data.session_id:
+      raise UnauthorizedException("Invalid refresh token")
+
     user = await user_repo.get_user_by_id(token_data.user_id)
-    token_id = token_data.token_id
 
     if not user:
       logger.warning(f"Token refresh failed: User not found for user_id: {token_data.user_id}")
       raise UnauthorizedException("User not found")
 
-    if user.refresh_token_id != token_id:
-      logger.warning(f"Refresh token mismatch for user_id: {user.id}")
-      raise UnauthorizedException("Invalid refresh token")
-
-    logger.info(f"Refreshing access token for user_id: {user.id}")
-
     new_access_token_id = id_generator.generate()
-    new_access_token_data = TokenData(user_id=user.id, token_id=new_access_token_id)
-    new_access_token = TokenService.create_token(new_access_token_data, TokenType.ACCESS)
-
     new_refresh_token_id = id_generator.generate()
-    new_refresh_token_data = TokenData(user_id=user.id, token_id=new_refresh_token_id)
-    new_refresh_token = TokenService.create_token(new_refresh_token_data, TokenType.REFRESH)
+    rotated = await auth_session_repo.rotate_tokens(
+      token_data.session_id,
+      token_data.token_id,
+      new_access_token_id,
+      new_refresh_token_id,
+      AuthService._session_expiry()
+    )
+
+    if not rotated:
+      # A refresh token that was already used may have been stolen: end the whole session
+      logger.warning(f"Refresh token reuse or unknown session for user_id: {user.id}")
+      await auth_session_repo.delete_session(token_data.session_id)
+      await session.commit()
+      TokenService.forget_token(token)
+      raise UnauthorizedException("Invalid refresh token")
 
-    user.access_token_id = new_access_token_id
-    user.refresh_token_id = new_refresh_token_id
-    user = await user_repo.update_user(user_id=user.id, user=user)
     await session.commit()
+    TokenService.forget_token(token)
+
+    new_access_token, new_refresh_token = AuthService._issue_tokens(
+      user.id,
+      token_data.session_id,
+      new_access_token_id,
+      new_refresh_token_id
+    )
 
     logger.info(f"Access token refreshed successfully for user_id: {user.id}")
     return AuthResponse(
@@ -119,20 +159,18 @@ class AuthService:
   @staticmethod
   async def logout_user(
     session: AsyncSession,
-    user_repo: IUserRepository,
-    user_id: str,
+    auth_session_repo: IAuthSessionRepository,
+    token: str,
   ) -> bool:
-    logger.info(f"Logging out user with user_id: {user_id}")
-    user = await user_repo.get_user_by_id(user_id)
-    if not user:
-      logger.warning(f"Logout failed: User not found for user_id: {user_id}")
-      raise UnauthorizedException("User not found")
-    
-    user.access_token_id = None
-    user.refresh_token_id = None
+    token_data = TokenService.verify_token(token)
+    logger.info(f"Logging out user with user_id: {token_data.user_id}")
+
+    if not token_data.session_id or not await auth_session_repo.delete_session(token_data.session_id):
+      logger.warning(f"Logout failed: no active session for user_id: {token_data.user_id}")
+      raise UnauthorizedException("Invalid access token")
 
-    user = await user_repo.update_user(user_id=user.id, user=user)
     await session.commit()
+    TokenService.forget_token(token)
 
-    logger.info(f"User logged out successfully for user_id: {user.id}")
-    return True
\ No newline at end of file
+    logger.info(f"User logged out successfully for user_id: {token_data.user_id}")
+    return True
@@ -0,0 +1,111 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+try:
+  from cryptography.hazmat.primitives import serialization
+  from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+  from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+except ImportError:
+  serialization = None
+
+@dataclass(frozen=True)
+class SigningKey:
+  kid: str
+  algorithm: str
+  public_key: Any
+  private_key: Optional[Any] = None
+
+  def to_jwk(self) -> Dict[str, Any]:
+    if self.algorithm == "EdDSA":
+      jwk = OKPAlgorithm.to_jwk(self.public_key, as_dict=True)
+    else:
+      jwk = RSAAlgorithm.to_jwk(self.public_key, as_dict=True)
+    return {**jwk, "kid": self.kid, "alg": self.algorithm, "use": "sig"}
+
+class KeyRing:
+  """
+  Asymmetric keys used to sign and verify tokens, addressed by their `kid`.
+
+  Tokens are signed with the active key only, while every key in the ring
+  keeps verifying and stays published in the JWKS. To rotate, add the new key
+  next to the current one, wait for cached JWKS documents to expire, make the
+  new key active, and keep the old one as verification-only until the tokens
+  it signed have expired.
+  """
+  def __init__(self, keys: List[SigningKey], active_kid: Optional[str] = None):
+    self._keys = {key.kid: key for key in keys}
+    # A private key nobody signs with would silently leave tokens signed with the shared secret
+    if active_kid is None and any(key.private_key is not None for key in keys):
+      raise ValueError("Private signing keys are configured but none is active, set JWT_ACTIVE_KEY_ID.")
+    if active_kid is not None and (active_kid not in self._keys or self._keys[active_kid].private_key is None):
+      raise ValueError(f"The active signing key '{active_kid}' has no private key in the key ring.")
+
+    self.active_kid = active_kid
+    self.jwks_document = json.dumps(
+      {"keys": [key.to_jwk() for key in keys]},
+      separators=(",", ":")
+    ).encode("utf-8")
+    self.jwks_etag = f'"{hashlib.sha256(self.jwks_document).hexdigest()[:32]}"'
+
+  @property
+  def signing_key(self) -> Optional[SigningKey]:
+    return self._keys[self.active_kid] if self.active_kid else None
+
+  def get(self, kid: str) -> Optional[SigningKey]:
+    return self._keys.get(kid)
+
+  def __len__(self) -> int:
+    return len(self._keys)
+
+def _read_pem(value: str) -> bytes:
+  if value.lstrip().startswith("-----BEGIN"):
+    return value.encode("utf-8")
+  with open(value, "rb") as file:
+    return file.read()
+
+def _algorithm_for(public_key: Any) -> str:
+  if isinstance(public_key, rsa.RSAPublicKey):
+    return "RS256"
+  if isinstance(public_key, ed25519.Ed25519PublicKey):
+    return "EdDSA"
+  raise ValueError(f"Unsupported signing key type: {type(public_key).__name__}")
+
+def create_key_ring(
+  private_keys: Dict[str, str],
+  public_keys: Dict[str, str],
+  active_kid: Optional[str] = None
+) -> KeyRing:
+  """
+  Builds a key ring from PEM encoded keys, given either inline or as file paths.
+
+  Args:
+    private_keys (Dict[str, str]): Keys this service may sign with, by kid.
+    public_keys (Dict[str, str]): Verification-only keys, typically retired signing keys, by kid.
+    active_kid (Optional[str]): The kid of the private key new tokens are signed with, required
+      when any private key is given.
+
+  Returns:
+    KeyRing: The loaded key ring.
+
+  Raises:
+    ValueError: If private keys are given without an active one, or the active key is not one of them.
+  """
+  if not private_keys and not public_keys:
+    return KeyRing([])
+  if serialization is None:
+    raise RuntimeError("Asymmetric token signing requires the cryptography package.")
+
+  keys = []
+  for kid, value in private_keys.items():
+    private_key = serialization.load_pem_private_key(_read_pem(value), password=None)
+    public_key = private_key.public_key()
+    keys.append(SigningKey(kid, _algorithm_for(public_key), public_key, private_key))
+  for kid, value in public_keys.items():
+    if kid in private_keys:
+      raise ValueError(f"The key '{kid}' is configured both as a private and a public key.")
+    public_key = serialization.load_pem_public_key(_read_pem(value))
+    keys.append(SigningKey(kid, _algorithm_for(public_key), public_key))
+
+  return KeyRing(keys, active_kid)
@@ -0,0 +1,27 @@
+import logging
+from datetime import datetime, timezone
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories import AuthSessionRepository
+
+logger = logging.getLogger(__name__)
+
+async def purge_expired_sessions(
+  session_factory: Callable[[], AsyncSession],
+  batch_size: int = 1000
+) -> int:
+  purged = 0
+  while True:
+    async with session_factory() as session:
+      deleted = await AuthSessionRepository(session).delete_expired(datetime.now(timezone.utc), batch_size)
+      await session.commit()
+
+    purged += deleted
+    if deleted < batch_size:
+      break
+
+  if purged:
+    logger.info(f"Purged {purged} expired auth sessions.")
+  return purged
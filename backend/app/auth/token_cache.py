@@ -0,0 +1,82 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+from .auth_model import TokenData
+
+class TokenVerificationCache:
+  """
+  Bounded LRU of verified tokens keyed by their SHA-256 digest.
+
+  A token is served from the cache only while its `exp` claim is in the
+  future, the same rule the JWT library applies, so caching never extends the
+  lifetime of a token. The raw token is never stored.
+  """
+  def __init__(
+    self,
+    max_entries: int = 10_000,
+    enabled: bool = True,
+    clock: Callable[[], float] = time.time
+  ):
+    self.max_entries = max_entries
+    self.enabled = enabled
+    self.clock = clock
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+    self._entries: "OrderedDict[bytes, Tuple[TokenData, float]]" = OrderedDict()
+
+  @staticmethod
+  def digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+  def get(self, token: str) -> Optional[TokenData]:
+    if not self.enabled:
+      return None
+
+    key = self.digest(token)
+    entry = self._entries.get(key)
+    if entry is None:
+      self.misses += 1
+      return None
+
+    token_data, expires_at = entry
+    if expires_at <= self.clock():
+      del self._entries[key]
+      self.misses += 1
+      return None
+
+    self._entries.move_to_end(key)
+    self.hits += 1
+    return token_data
+
+  def put(self, token: str, token_data: TokenData, expires_at: float) -> None:
+    if not self.enabled:
+      return
+
+    key = self.digest(token)
+    self._entries[key] = (token_data, expires_at)
+    self._entries.move_to_end(key)
+    while len(self._entries) > self.max_entries:
+      self._entries.popitem(last=False)
+      self.evictions += 1
+
+  def discard(self, token: str) -> None:
+    self._entries.pop(self.digest(token), None)
+
+  def clear(self) -> None:
+    self._entries.clear()
+
+  def stats(self) -> dict:
+    lookups = self.hits + self.misses
+    return {
+      "entries": len(self._entries),
+      "hits": self.hits,
+      "misses": self.misses,
+      "evictions": self.evictions,
+      "hit_rate": self.hits / lookups if lookups else 0.0,
+    }
+
+  def __len__(self) -> int:
+    return len(self._entries)
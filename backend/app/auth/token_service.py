@@ -4,10 +4,23 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from .auth_model import Token, TokenData, TokenType
+from .key_ring import KeyRing, create_key_ring
+from .token_cache import TokenVerificationCache
 from app.config import config
 
 logger = logging.getLogger(__name__)
 
+key_ring = create_key_ring(
+  config.JWT_PRIVATE_KEYS,
+  config.JWT_PUBLIC_KEYS,
+  config.JWT_ACTIVE_KEY_ID
+)
+
+token_cache = TokenVerificationCache(
+  max_entries=config.TOKEN_CACHE_MAX_ENTRIES,
+  enabled=config.TOKEN_CACHE_ENABLED
+)
+
 class TokenService:
   @staticmethod
   def create_token(
@@ -16,7 +29,7 @@ class TokenService:
     expires_delta: Optional[timedelta] = None,
   ) -> Token:
     logger.info(f"Creating {token_type.value} token for user_id: {data.user_id}")
-    to_encode = data.__dict__.copy()
+    to_encode = data.model_dump(exclude_none=True)
     if expires_delta:
       expire = datetime.now(timezone.utc) + expires_delta
     elif token_type == TokenType.REFRESH:
@@ -25,15 +38,38 @@ class TokenService:
       expire = datetime.now(timezone.utc) + timedelta(minutes=config.DEFAULT_ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, config.SECRET_KEY, algorithm=config.ALGORITHM)
+    signing_key = key_ring.signing_key
+    if signing_key:
+      encoded_jwt = jwt.encode(
+        to_encode,
+        signing_key.private_key,
+        algorithm=signing_key.algorithm,
+        headers={"kid": signing_key.kid}
+      )
+    else:
+      encoded_jwt = jwt.encode(to_encode, config.SECRET_KEY, algorithm=config.ALGORITHM)
     logger.info(f"{token_type.value} token created successfully for user_id: {data.user_id}, expires at: {expire.isoformat()}")
     return Token(token=encoded_jwt)
 
   @staticmethod
-  def verify_token(token: str ) -> TokenData:
+  def verify_token(token: str) -> TokenData:
+    cached = token_cache.get(token)
+    if cached is not None:
+      return cached
+
     try:
-      logger.info(f"Verifying token...")
-      payload = jwt.decode(token, config.SECRET_KEY, algorithms=[config.ALGORITHM])
+      kid = jwt.get_unverified_header(token).get("kid")
+      if kid is None:
+        # Once tokens are signed asymmetrically the shared secret must not mint valid tokens anymore
+        if key_ring.signing_key is not None:
+          raise jwt.InvalidTokenError("Token has no signing key id")
+        payload = jwt.decode(token, config.SECRET_KEY, algorithms=[config.ALGORITHM])
+      else:
+        # Only the algorithm of the key named by the token is accepted
+        verification_key = key_ring.get(kid)
+        if verification_key is None:
+          raise jwt.InvalidTokenError(f"Unknown signing key: {kid}")
+        payload = jwt.decode(token, verification_key.public_key, algorithms=[verification_key.algorithm])
 
       user_id = payload.get("user_id")
       token_id = payload.get("token_id")
@@ -42,8 +78,19 @@ class TokenService:
         logger.error("Token payload does not contain user_id or token_id")
         raise jwt.InvalidTokenError("Token payload does not contain user_id or token_id")
 
-      logger.info(f"Token verified successfully for user_id: {user_id}")
-      return TokenData(user_id=user_id, token_id=token_id)
+      logger.debug(f"Token verified for user_id: {user_id}")
+      token_data = TokenData(user_id=user_id, token_id=token_id, session_id=payload.get("session_id"))
+      if "exp" in payload:
+        token_cache.put(token, token_data, float(payload["exp"]))
+      return token_data
     except jwt.PyJWTError as e:
       logger.error(f"Token verification failed: {str(e)}")
-      raise e
\ No newline at end of file
+      raise e
+
+  @staticmethod
+  def get_key_ring() -> KeyRing:
+    return key_ring
+
+  @staticmethod
+  def forget_token(token: str) -> None:
+    token_cache.discard(token)
@@ -1,2 +1,5 @@
 from .user_mapper import user_entity_to_model, user_model_to_entity
-from .blog_mapper import blog_entity_to_model, blog_model_to_entity
\ No newline at end of file
+from .blog_mapper import blog_entity_to_model, blog_model_to_entity
+from .author_stats_mapper import author_stats_model_to_entity
+from .auth_session_mapper import auth_session_entity_to_model, auth_session_model_to_entity
+from .user_deletion_mapper import user_deletion_entity_to_model, user_deletion_model_to_entity
\ No newline at end of file
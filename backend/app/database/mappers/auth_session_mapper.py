@@ -0,0 +1,8 @@
+from app.database.models import AuthSessionModel
+from src.domain.entities import AuthSessionEntity
+
+def auth_session_entity_to_model(auth_session_entity: AuthSessionEntity) -> AuthSessionModel:
+  return AuthSessionModel(**auth_session_entity.to_dict())
+
+def auth_session_model_to_entity(auth_session_model: AuthSessionModel) -> AuthSessionEntity:
+  return AuthSessionEntity(**auth_session_model.to_dict())
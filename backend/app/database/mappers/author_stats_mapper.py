@@ -0,0 +1,5 @@
+from app.database.models import AuthorStatsModel
+from src.domain.entities import AuthorStatsEntity
+
+def author_stats_model_to_entity(author_stats_model: AuthorStatsModel) -> AuthorStatsEntity:
+  return AuthorStatsEntity(**author_stats_model.to_dict())
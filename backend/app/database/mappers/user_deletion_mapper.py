@@ -0,0 +1,8 @@
+from app.database.models import UserDeletionModel
+from src.domain.entities import UserDeletionEntity
+
+def user_deletion_entity_to_model(user_deletion_entity: UserDeletionEntity) -> UserDeletionModel:
+  return UserDeletionModel(**user_deletion_entity.to_dict())
+
+def user_deletion_model_to_entity(user_deletion_model: UserDeletionModel) -> UserDeletionEntity:
+  return UserDeletionEntity(**user_deletion_model.to_dict())
@@ -1,2 +1,17 @@
 from .user_model import UserModel
-from .blog_model import BlogModel
\ No newline at end of file
+from .blog_model import BlogModel
+from .blog_view_model import BlogViewModel
+from .author_stats_model import AuthorStatsModel
+from .outbox_model import OutboxModel
+from .auth_session_model import AuthSessionModel
+from .user_deletion_model import UserDeletionModel
+from .blog_tag_model import BlogTagModel
+from .tag_count_model import TagCountModel
+from .related_blog_model import RelatedBlogModel
+from .trending_score_model import TrendingScoreModel
+from .follow_model import FollowModel
+from .follower_count_model import FollowerCountModel
+from .timeline_entry_model import TimelineEntryModel
+from .blog_revision_model import BlogRevisionModel
+from .related_blog_refresh_model import RelatedBlogRefreshModel
+from .job_lease_model import JobLeaseModel
\ No newline at end of file
@@ -0,0 +1,35 @@
+from app.database.db import Base
+from app.database.types import UUIDString
+
+from datetime import datetime
+from sqlalchemy import String, ForeignKey, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+class AuthSessionModel(Base):
+  __tablename__ = "auth_sessions"
+
+  id: Mapped[str] = mapped_column(UUIDString, primary_key=True)
+  user_id: Mapped[str] = mapped_column(
+    UUIDString,
+    ForeignKey("users.id", ondelete="CASCADE"),
+    nullable=False,
+    index=True
+  )
+  access_token_id: Mapped[str] = mapped_column(String, nullable=False)
+  refresh_token_id: Mapped[str] = mapped_column(String, nullable=False)
+  expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+  created_at: Mapped[datetime] = mapped_column(
+    DateTime(timezone=True),
+    nullable=False,
+    server_default=func.now()
+  )
+
+  def to_dict(self) -> dict:
+    return {
+      "id": self.id,
+      "user_id": self.user_id,
+      "access_token_id": self.access_token_id,
+      "refresh_token_id": self.refresh_token_id,
+      "expires_at": self.expires_at,
+      "created_at": self.created_at,
+    }
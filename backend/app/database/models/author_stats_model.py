@@ -0,0 +1,31 @@
+from app.database.db import Base
+from app.database.types import UUIDString
+
+from datetime import datetime
+from sqlalchemy import Integer, ForeignKey, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+from typing import Optional
+
+class AuthorStatsModel(Base):
+  __tablename__ = "author_stats"
+
+  author_id: Mapped[str] = mapped_column(
+    UUIDString,
+    ForeignKey("users.id", ondelete="CASCADE"),
+    primary_key=True
+  )
+  post_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+  last_posted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+  updated_at: Mapped[datetime] = mapped_column(
+    DateTime(timezone=True),
+    nullable=False,
+    server_default=func.now(),
+    onupdate=func.now()
+  )
+
+  def to_dict(self) -> dict:
+    return {
+      "author_id": self.author_id,
+      "post_count": self.post_count,
+      "last_posted_at": self.last_posted_at,
+    }
@@ -1,18 +1,29 @@
 from app.database.db import Base
+from app.database.types import UUIDString
 
 from datetime import datetime
-from sqlalchemy import String, ForeignKey, DateTime, func
+from sqlalchemy import JSON, Integer, String, DateTime, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 from typing import Optional
 
+# On PostgreSQL the table is range partitioned by month on created_at, with
+# (id, created_at) as its primary key. Mapping id alone keeps lookups by id.
 class BlogModel(Base):
   __tablename__ = "blogs"
+  __table_args__ = (
+    Index("ix_blogs_author_id_created_at", "author_id", "created_at"),
+  )
 
-  id: Mapped[str] = mapped_column(primary_key=True)
+  id: Mapped[str] = mapped_column(UUIDString, primary_key=True)
   title: Mapped[str] = mapped_column(String(100), nullable=False)
   content: Mapped[str] = mapped_column(String, nullable=False)
-  author_id: Mapped[str] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
+  # No foreign key: blogs may live on a shard database that has no users
+  author_id: Mapped[str] = mapped_column(UUIDString, nullable=False, index=True)
   hero_image: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+  hero_image_variants: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+  content_html: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+  # Display copy of the tags, blog_tags is the index that listings filter on
+  tags: Mapped[list] = mapped_column(JSON, nullable=False, default=list, server_default="[]")
   created_at: Mapped[datetime] = mapped_column(
     DateTime(timezone=True),
     nullable=False,
@@ -24,6 +35,10 @@ class BlogModel(Base):
     server_default=func.now(),
     onupdate=func.now()
   )
+  version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
+
+  # Flushes of a stale row fail instead of silently overwriting a concurrent edit
+  __mapper_args__ = {"version_id_col": version}
 
   def to_dict(self) -> dict:
     return {
@@ -32,6 +47,10 @@ class BlogModel(Base):
       "content": self.content,
       "author_id": self.author_id,
       "hero_image": self.hero_image,
+      "hero_image_variants": self.hero_image_variants,
+      "content_html": self.content_html,
+      "tags": self.tags or [],
       "created_at": self.created_at,
       "updated_at": self.updated_at,
+      "version": self.version,
     }
@@ -0,0 +1,30 @@
+from app.database.db import Base
+from app.database.types import UUIDString
+
+from datetime import datetime
+from sqlalchemy import Boolean, Integer, LargeBinary, String, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+class BlogRevisionModel(Base):
+  __tablename__ = "blog_revisions"
+
+  # Not a foreign key: blogs may be partitioned or live on another shard
+  blog_id: Mapped[str] = mapped_column(UUIDString, primary_key=True)
+  version: Mapped[int] = mapped_column(Integer, primary_key=True)
+  title: Mapped[str] = mapped_column(String(100), nullable=False)
+  # Keyframes hold the compressed content, other revisions a compressed delta to the previous version
+  is_keyframe: Mapped[bool] = mapped_column(Boolean, nullable=False)
+  data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+  content_length: Mapped[int] = mapped_column(Integer, nullable=False)
+  created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+  def to_dict(self) -> dict:
+    return {
+      "blog_id": self.blog_id,
+      "version": self.version,
+      "title": self.title,
+      "is_keyframe": self.is_keyframe,
+      "data": self.data,
+      "content_length": self.content_length,
+      "created_at": self.created_at,
+    }
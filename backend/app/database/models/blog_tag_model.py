@@ -0,0 +1,22 @@
+from app.database.db import Base
+from app.database.types import UUIDString
+
+from sqlalchemy import String, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+class BlogTagModel(Base):
+  __tablename__ = "blog_tags"
+  __table_args__ = (
+    # The primary key serves tag filters, this one retagging and deleting a blog
+    Index("ix_blog_tags_blog_id_tag", "blog_id", "tag"),
+  )
+
+  # Not a foreign key for the same reason as blog_views.blog_id
+  tag: Mapped[str] = mapped_column(String(30), primary_key=True)
+  blog_id: Mapped[str] = mapped_column(UUIDString, primary_key=True)
+
+  def to_dict(self) -> dict:
+    return {
+      "tag": self.tag,
+      "blog_id": self.blog_id,
+    }
@@ -0,0 +1,27 @@
+from app.database.db import Base
+from app.database.types import UUIDString
+
+from datetime import datetime
+from sqlalchemy import BigInteger, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+class BlogViewModel(Base):
+  __tablename__ = "blog_views"
+
+  # Not a foreign key: the key of the partitioned blogs table includes created_at,
+  # so counts of deleted blogs are purged by the partition maintenance job instead
+  blog_id: Mapped[str] = mapped_column(UUIDString, primary_key=True)
+  views: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+  updated_at: Mapped[datetime] = mapped_column(
+    DateTime(timezone=True),
+    nullable=False,
+    server_default=func.now(),
+    onupdate=func.now()
+  )
+
+  def to_dict(self) -> dict:
+    return {
+      "blog_id": self.blog_id,
+      "views": self.views,
+      "updated_at": self.updated_at,
+    }
@@ -0,0 +1,32 @@
+from app.database.db import Base
+from app.database.types import UUIDString
+
+from datetime import datetime
+from sqlalchemy import ForeignKey, DateTime, Index, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+class FollowModel(Base):
+  __tablename__ = "follows"
+  __table_args__ = (
+    # The primary key serves who a user follows, this one who follows an author
+    Index("ix_follows_followee_id_follower_id", "followee_id", "follower_id"),
+  )
+
+  follower_id: Mapped[str] = mapped_column(
+    UUIDString,
+    ForeignKey("users.id", ondelete="CASCADE"),
+    primary_key=True
+  )
+  followee_id: Mapped[str] = mapped_column(
+    UUIDString,
+    ForeignKey("users.id", ondelete="CASCADE"),
+    primary_key=True
+  )
+  created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+  def to_dict(self) -> dict:
+    return {
+      "follower_id": self.follower_id,
+      "followee_id": self.followee_id,
+      "created_at": self.created_at,
+    }
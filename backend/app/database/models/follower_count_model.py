@@ -0,0 +1,31 @@
+from app.database.db import Base
+from app.database.types import UUIDString
+
+from datetime import datetime
+from sqlalchemy import Integer, ForeignKey, DateTime, Index, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+class FollowerCountModel(Base):
+  __tablename__ = "follower_counts"
+  __table_args__ = (
+    Index("ix_follower_counts_follower_count", "follower_count"),
+  )
+
+  user_id: Mapped[str] = mapped_column(
+    UUIDString,
+    ForeignKey("users.id", ondelete="CASCADE"),
+    primary_key=True
+  )
+  follower_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+  updated_at: Mapped[datetime] = mapped_column(
+    DateTime(timezone=True),
+    nullable=False,
+    server_default=func.now(),
+    onupdate=func.now()
+  )
+
+  def to_dict(self) -> dict:
+    return {
+      "user_id": self.user_id,
+      "follower_count": self.follower_count,
+    }
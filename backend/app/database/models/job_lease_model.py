@@ -0,0 +1,20 @@
+from app.database.db import Base
+
+from datetime import datetime
+from sqlalchemy import String, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+class JobLeaseModel(Base):
+  __tablename__ = "job_leases"
+
+  # A job that must run on a single worker, held by `owner` until `lease_until`
+  name: Mapped[str] = mapped_column(String(100), primary_key=True)
+  owner: Mapped[str] = mapped_column(String(36), nullable=False)
+  lease_until: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+  def to_dict(self) -> dict:
+    return {
+      "name": self.name,
+      "owner": self.owner,
+      "lease_until": self.lease_until,
+    }
@@ -0,0 +1,40 @@
+from app.database.db import Base
+
+from datetime import datetime
+from sqlalchemy import BigInteger, Integer, String, JSON, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+from typing import Optional
+
+class OutboxModel(Base):
+  __tablename__ = "outbox_events"
+
+  # Autoincrementing so events are dispatched in the order they were committed
+  id: Mapped[int] = mapped_column(
+    BigInteger().with_variant(Integer, "sqlite"),
+    primary_key=True,
+    autoincrement=True
+  )
+  event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+  payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+  attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+  available_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+  last_error: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+  # Dispatched messages stay until every worker had the time to broadcast them
+  dispatched_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True, index=True)
+  created_at: Mapped[datetime] = mapped_column(
+    DateTime(timezone=True),
+    nullable=False,
+    server_default=func.now()
+  )
+
+  def to_dict(self) -> dict:
+    return {
+      "id": self.id,
+      "event_type": self.event_type,
+      "payload": self.payload,
+      "attempts": self.attempts,
+      "available_at": self.available_at,
+      "last_error": self.last_error,
+      "dispatched_at": self.dispatched_at,
+      "created_at": self.created_at,
+    }
@@ -0,0 +1,24 @@
+from app.database.db import Base
+from app.database.types import UUIDString
+
+from sqlalchemy import Float, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+class RelatedBlogModel(Base):
+  __tablename__ = "related_blogs"
+  __table_args__ = (
+    Index("ix_related_blogs_blog_id_score", "blog_id", "score"),
+    Index("ix_related_blogs_related_blog_id", "related_blog_id"),
+  )
+
+  # Not foreign keys: blogs may be partitioned or live on another shard
+  blog_id: Mapped[str] = mapped_column(UUIDString, primary_key=True)
+  related_blog_id: Mapped[str] = mapped_column(UUIDString, primary_key=True)
+  score: Mapped[float] = mapped_column(Float, nullable=False)
+
+  def to_dict(self) -> dict:
+    return {
+      "blog_id": self.blog_id,
+      "related_blog_id": self.related_blog_id,
+      "score": self.score,
+    }
@@ -0,0 +1,23 @@
+from app.database.db import Base
+from app.database.types import UUIDString
+
+from datetime import datetime
+from sqlalchemy import DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+class RelatedBlogRefreshModel(Base):
+  __tablename__ = "related_blog_refreshes"
+
+  # Blogs whose related lists the worker holding the index has yet to refresh
+  blog_id: Mapped[str] = mapped_column(UUIDString, primary_key=True)
+  requested_at: Mapped[datetime] = mapped_column(
+    DateTime(timezone=True),
+    nullable=False,
+    server_default=func.now()
+  )
+
+  def to_dict(self) -> dict:
+    return {
+      "blog_id": self.blog_id,
+      "requested_at": self.requested_at,
+    }
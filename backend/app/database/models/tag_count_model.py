@@ -0,0 +1,26 @@
+from app.database.db import Base
+
+from datetime import datetime
+from sqlalchemy import Integer, String, DateTime, Index, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+class TagCountModel(Base):
+  __tablename__ = "tag_counts"
+  __table_args__ = (
+    Index("ix_tag_counts_blog_count", "blog_count"),
+  )
+
+  tag: Mapped[str] = mapped_column(String(30), primary_key=True)
+  blog_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+  updated_at: Mapped[datetime] = mapped_column(
+    DateTime(timezone=True),
+    nullable=False,
+    server_default=func.now(),
+    onupdate=func.now()
+  )
+
+  def to_dict(self) -> dict:
+    return {
+      "tag": self.tag,
+      "blog_count": self.blog_count,
+    }
@@ -0,0 +1,29 @@
+from app.database.db import Base
+from app.database.types import UUIDString
+
+from datetime import datetime
+from sqlalchemy import DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+class TimelineEntryModel(Base):
+  __tablename__ = "timeline_entries"
+  __table_args__ = (
+    # Pages of a timeline are range scans of this index, newest first
+    Index("ix_timeline_entries_user_id_created_at_blog_id", "user_id", "created_at", "blog_id"),
+    Index("ix_timeline_entries_user_id_author_id", "user_id", "author_id"),
+    Index("ix_timeline_entries_blog_id", "blog_id"),
+  )
+
+  # Not foreign keys: blogs may be partitioned or live on another shard
+  user_id: Mapped[str] = mapped_column(UUIDString, primary_key=True)
+  blog_id: Mapped[str] = mapped_column(UUIDString, primary_key=True)
+  author_id: Mapped[str] = mapped_column(UUIDString, nullable=False)
+  created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+  def to_dict(self) -> dict:
+    return {
+      "user_id": self.user_id,
+      "blog_id": self.blog_id,
+      "author_id": self.author_id,
+      "created_at": self.created_at,
+    }
@@ -0,0 +1,23 @@
+from app.database.db import Base
+from app.database.types import UUIDString
+
+from datetime import datetime
+from sqlalchemy import Float, String, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+class TrendingScoreModel(Base):
+  __tablename__ = "trending_scores"
+
+  # Each worker replaces its own rows, readers sum the rows of every worker
+  worker_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+  blog_id: Mapped[str] = mapped_column(UUIDString, primary_key=True)
+  score: Mapped[float] = mapped_column(Float, nullable=False)
+  decayed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+
+  def to_dict(self) -> dict:
+    return {
+      "worker_id": self.worker_id,
+      "blog_id": self.blog_id,
+      "score": self.score,
+      "decayed_at": self.decayed_at,
+    }
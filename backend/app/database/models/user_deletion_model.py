@@ -0,0 +1,43 @@
+from app.database.db import Base
+from app.database.types import UUIDString
+
+from datetime import datetime
+from sqlalchemy import Integer, String, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+from typing import Optional
+
+class UserDeletionModel(Base):
+  __tablename__ = "user_deletions"
+
+  id: Mapped[str] = mapped_column(UUIDString, primary_key=True)
+  # Not a foreign key: the record outlives the user it deletes
+  user_id: Mapped[str] = mapped_column(UUIDString, nullable=False, index=True)
+  status: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
+  blogs_total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+  blogs_deleted: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+  created_at: Mapped[datetime] = mapped_column(
+    DateTime(timezone=True),
+    nullable=False,
+    server_default=func.now()
+  )
+  updated_at: Mapped[datetime] = mapped_column(
+    DateTime(timezone=True),
+    nullable=False,
+    server_default=func.now()
+  )
+  completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+  # The purge holding the deletion, others leave it alone until the lease expires
+  lease_owner: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)
+  lease_until: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+  def to_dict(self) -> dict:
+    return {
+      "id": self.id,
+      "user_id": self.user_id,
+      "status": self.status,
+      "blogs_total": self.blogs_total,
+      "blogs_deleted": self.blogs_deleted,
+      "created_at": self.created_at,
+      "updated_at": self.updated_at,
+      "completed_at": self.completed_at,
+    }
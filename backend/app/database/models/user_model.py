@@ -1,21 +1,24 @@
 from app.database.db import Base
+from app.database.types import UUIDString
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import String, DateTime, func
+from sqlalchemy import JSON, Integer, String, DateTime, func
 from typing import Optional
 
 class UserModel(Base):
   __tablename__ = 'users'
 
-  id: Mapped[str] = mapped_column(primary_key=True)
+  id: Mapped[str] = mapped_column(UUIDString, primary_key=True)
   first_name: Mapped[str] = mapped_column(String(30), nullable=False)
   last_name: Mapped[str] = mapped_column(String(30), nullable=False)
   username: Mapped[str] = mapped_column(String(20), unique=True, nullable=False, index=True)
   password: Mapped[str] = mapped_column(String(255), nullable=False)
   avatar: Mapped[Optional[str]] = mapped_column(nullable=True)
-  access_token_id: Mapped[Optional[str]] = mapped_column(String(), nullable=True)
-  refresh_token_id: Mapped[Optional[str]] = mapped_column(String(), nullable=True)
+  avatar_variants: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
   created_at: Mapped[str] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
   updated_at: Mapped[str] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+  version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
+
+  __mapper_args__ = {"version_id_col": version}
 
   def to_dict(self) -> dict:
     return {
@@ -25,8 +28,8 @@ class UserModel(Base):
       "username": self.username,
       "password": self.password,
       "avatar": self.avatar,
-      "access_token_id": self.access_token_id,
-      "refresh_token_id": self.refresh_token_id,
+      "avatar_variants": self.avatar_variants,
       "created_at": self.created_at,
-      "updated_at": self.updated_at
+      "updated_at": self.updated_at,
+      "version": self.version
     }
\ No newline at end of file
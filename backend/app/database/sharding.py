@@ -0,0 +1,155 @@
+import asyncio
+import bisect
+import hashlib
+import heapq
+import logging
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import config
+
+logger = logging.getLogger(__name__)
+
+def _hash(key: str) -> int:
+  return int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], "big")
+
+class HashRing:
+  """
+  Consistent-hash ring: each node owns `virtual_nodes` points on a 64-bit
+  circle and a key belongs to the first point at or after its own hash.
+  Adding a node only moves the keys that land on its new points.
+  """
+
+  def __init__(self, nodes: Sequence[str], virtual_nodes: int = 64):
+    if not nodes:
+      raise ValueError("A hash ring needs at least one node.")
+
+    points = sorted(
+      (_hash(f"{node}#{replica}"), node)
+      for node in nodes
+      for replica in range(virtual_nodes)
+    )
+    self._hashes = [point for point, _ in points]
+    self._nodes = [node for _, node in points]
+
+  def get_node(self, key: str) -> str:
+    index = bisect.bisect_left(self._hashes, _hash(key))
+    return self._nodes[index % len(self._nodes)]
+
+class ShardSessions:
+  """The sessions a unit of work opened on blog shards, opened on first use."""
+
+  def __init__(self, router: "ShardRouter"):
+    self.router = router
+    self._sessions: Dict[str, AsyncSession] = {}
+
+  def get(self, shard: str) -> AsyncSession:
+    if shard not in self._sessions:
+      self._sessions[shard] = self.router.session_factories[shard]()
+    return self._sessions[shard]
+
+  def for_key(self, key: str) -> AsyncSession:
+    return self.get(self.router.shard_for(key))
+
+  def all(self) -> List[AsyncSession]:
+    return [self.get(shard) for shard in self.router.shards]
+
+  async def commit(self) -> None:
+    # Shards commit one after the other: a failure leaves earlier shards committed
+    for session in self._sessions.values():
+      await session.commit()
+
+  async def rollback(self) -> None:
+    for session in self._sessions.values():
+      await session.rollback()
+
+  async def close(self) -> None:
+    sessions, self._sessions = self._sessions, {}
+    for session in sessions.values():
+      await session.close()
+
+  async def __aenter__(self) -> "ShardSessions":
+    return self
+
+  async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+    try:
+      if exc_type is None:
+        await self.commit()
+      else:
+        await self.rollback()
+    finally:
+      await self.close()
+
+class ShardRouter:
+  """Maps an author ID to the database holding that author's blogs."""
+
+  def __init__(self, session_factories: Dict[str, Callable[[], AsyncSession]], virtual_nodes: int = 64):
+    self.session_factories = session_factories
+    self.shards = list(session_factories)
+    self.ring = HashRing(self.shards, virtual_nodes)
+
+  def shard_for(self, author_id: str) -> str:
+    return self.ring.get_node(author_id)
+
+  def sessions(self) -> ShardSessions:
+    return ShardSessions(self)
+
+class _Descending:
+  __slots__ = ("value",)
+
+  def __init__(self, value: Any):
+    self.value = value
+
+  def __lt__(self, other: "_Descending") -> bool:
+    return other.value < self.value
+
+async def gather_shards(sessions: ShardSessions, query: Callable[[AsyncSession], Any]) -> List[Any]:
+  """Runs `query` on every shard concurrently, each on its own session."""
+  return await asyncio.gather(*(query(session) for session in sessions.all()))
+
+def merge_sorted(results: List[List[Any]], key: Callable[[Any], Any], reverse: bool = False) -> List[Any]:
+  """K-way merges lists that are each already sorted by `key`."""
+  return list(heapq.merge(*results, key=key, reverse=reverse))
+
+async def merge_sorted_streams(
+  streams: List[AsyncIterator[Any]],
+  key: Callable[[Any], Any],
+  reverse: bool = False,
+  limit: Optional[int] = None
+) -> AsyncIterator[Any]:
+  """K-way merges async iterators that are each already sorted by `key`, holding one item per stream."""
+  wrap = _Descending if reverse else (lambda value: value)
+  heap: List[Tuple[Any, int, Any]] = []
+  for index, stream in enumerate(streams):
+    async for item in stream:
+      heap.append((wrap(key(item)), index, item))
+      break
+  heapq.heapify(heap)
+
+  produced = 0
+  while heap and (limit is None or produced < limit):
+    _, index, item = heapq.heappop(heap)
+    yield item
+    produced += 1
+    async for next_item in streams[index]:
+      heapq.heappush(heap, (wrap(key(next_item)), index, next_item))
+      break
+
+def create_shard_router(shard_urls: Dict[str, str], virtual_nodes: int = 64) -> Optional[ShardRouter]:
+  if not shard_urls:
+    return None
+
+  session_factories = {
+    name: async_sessionmaker(
+      bind=create_async_engine(url, echo=config.DB_ECHO),
+      expire_on_commit=False,
+      class_=AsyncSession
+    )
+    for name, url in shard_urls.items()
+  }
+  logger.info(f"Routing blogs across {len(session_factories)} shards: {', '.join(session_factories)}.")
+  return ShardRouter(session_factories, virtual_nodes)
+
+# Blogs live in the main database unless shards are configured
+shard_router = create_shard_router(config.BLOG_SHARD_URLS, config.BLOG_SHARD_VIRTUAL_NODES)
@@ -0,0 +1,42 @@
+from sqlalchemy import String
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.types import TypeDecorator
+from uuid import UUID
+
+NIL_UUID = "00000000-0000-0000-0000-000000000000"
+
+class UUIDString(TypeDecorator):
+  """
+  An identifier handled as a string in Python, stored as a native 16-byte
+  `uuid` on PostgreSQL and as text on other databases.
+  """
+
+  impl = String
+  cache_ok = True
+
+  def load_dialect_impl(self, dialect):
+    if dialect.name == "postgresql":
+      return dialect.type_descriptor(postgresql.UUID(as_uuid=False))
+    return dialect.type_descriptor(String())
+
+  def process_bind_param(self, value, dialect):
+    if value is None or dialect.name != "postgresql":
+      return value
+    # A malformed id written to a row is a bug, never stored as some other id
+    return str(UUID(str(value)))
+
+  def coerce_compared_value(self, op, value):
+    return _UUIDLookup()
+
+class _UUIDLookup(UUIDString):
+  """The type of ids compared against a `UUIDString` column, like ids from URLs."""
+
+  cache_ok = True
+
+  def process_bind_param(self, value, dialect):
+    try:
+      return super().process_bind_param(value, dialect)
+    except ValueError:
+      # An id that is not a UUID can match no row, so it is compared as the
+      # nil UUID instead of failing the statement
+      return NIL_UUID
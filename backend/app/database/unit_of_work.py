@@ -1,12 +1,50 @@
+from typing import Any, List, Optional
 from src.application.services import IUnitOfWork
-from app.repositories import UserRepository, BlogRepository
+from app.config import config
+from app.database import sharding
+from app.database.sharding import ShardRouter
+from app.events import OutboxSignal, outbox_signal
+from app.repositories import (
+  UserRepository,
+  BlogRepository,
+  ShardedBlogRepository,
+  AuthorStatsRepository,
+  OutboxRepository,
+  AuthSessionRepository,
+  UserDeletionRepository,
+  RelatedBlogRepository,
+  TrendingScoreRepository,
+  FollowRepository,
+  TimelineRepository,
+  BlogRevisionRepository,
+  JobLeaseRepository
+)
 from sqlalchemy.ext.asyncio import AsyncSession 
 
 class UnitOfWork(IUnitOfWork):
-  def __init__(self, session: AsyncSession):
+  def __init__(
+    self,
+    session: AsyncSession,
+    signal: Optional[OutboxSignal] = outbox_signal,
+    shard_router: Optional[ShardRouter] = None
+  ):
     self.session = session
+    self.signal = signal
+    self.events: List[Any] = []
+    # Blogs live on their author's shard when sharding is configured, everything else stays here
+    self.shards = shard_router.sessions() if shard_router else None
     self.users = UserRepository(session)
-    self.blogs = BlogRepository(session)
+    self.blogs = ShardedBlogRepository(self.shards) if self.shards else BlogRepository(session)
+    self.author_stats = AuthorStatsRepository(session)
+    self.outbox = OutboxRepository(session)
+    self.auth_sessions = AuthSessionRepository(session)
+    self.user_deletions = UserDeletionRepository(session)
+    self.related_blogs = RelatedBlogRepository(session)
+    self.trending_scores = TrendingScoreRepository(session)
+    self.follows = FollowRepository(session)
+    self.timelines = TimelineRepository(session)
+    self.blog_revisions = BlogRevisionRepository(session, config.BLOG_REVISION_KEYFRAME_INTERVAL)
+    self.job_leases = JobLeaseRepository(session)
   
   async def __aenter__(self) -> 'IUnitOfWork':
     return self
@@ -14,17 +52,33 @@ class UnitOfWork(IUnitOfWork):
   async def __aexit__(self, *args):
     exc_type, exc_val, exc_tb = args
     if exc_type is not None:
-      await self.session.rollback()
+      await self.rollback()
     else:
-      await self.session.commit()
+      await self.commit()
+    if self.shards:
+      await self.shards.close()
     await self.session.close()
     
   async def commit(self):
+    # Events are written in the same transaction as the change that raised them
+    events, self.events = self.events, []
+    await self.outbox.add_events(events)
+    # Blog changes commit before the events describing them, so no event outlives a failed write
+    if self.shards:
+      await self.shards.commit()
     await self.session.commit()
+    if events and self.signal is not None:
+      self.signal.notify()
   
   async def rollback(self):
+    if self.shards:
+      await self.shards.rollback()
     await self.session.rollback()
+    self.events.clear()
+
+  def add_event(self, event: Any) -> None:
+    self.events.append(event)
     
 # Get unit of work instance
 def get_uow(session: AsyncSession) -> UnitOfWork:
-  return UnitOfWork(session)
+  return UnitOfWork(session, shard_router=sharding.shard_router)
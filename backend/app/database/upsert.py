@@ -0,0 +1,11 @@
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+def upsert(session: AsyncSession, model):
+  """
+  Return the dialect specific INSERT for model, which supports ON CONFLICT clauses.
+  """
+  if session.bind.dialect.name == "sqlite":
+    return sqlite_insert(model)
+  return postgresql_insert(model)
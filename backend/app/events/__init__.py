@@ -0,0 +1,4 @@
+from .event_bus import EventBus
+from .outbox_signal import OutboxSignal, outbox_signal
+from .outbox_dispatcher import OutboxDispatcher
+from .outbox_broadcaster import OutboxBroadcaster
@@ -0,0 +1,44 @@
+import inspect
+import logging
+from typing import Any, Callable, Dict, List, Type
+
+logger = logging.getLogger(__name__)
+
+class EventBus:
+  """
+  In-process publish/subscribe for domain events.
+
+  Events reach the bus after the transaction that produced them committed,
+  either through the outbox dispatcher, once across all workers, or through
+  the outbox broadcaster, once on every worker. Handlers may run more than
+  once for the same event when a dispatch is retried, so they must be
+  idempotent.
+  """
+  def __init__(self):
+    self._handlers: Dict[Type, List[Callable[[Any], Any]]] = {}
+
+  def subscribe(self, event_type: Type, handler: Callable[[Any], Any]) -> None:
+    self._handlers.setdefault(event_type, []).append(handler)
+
+  def unsubscribe(self, event_type: Type, handler: Callable[[Any], Any]) -> None:
+    handlers = self._handlers.get(event_type, [])
+    if handler in handlers:
+      handlers.remove(handler)
+
+  async def publish(self, event: Any, raise_errors: bool = False) -> None:
+    errors = []
+    for event_type, handlers in list(self._handlers.items()):
+      if not isinstance(event, event_type):
+        continue
+
+      for handler in list(handlers):
+        try:
+          result = handler(event)
+          if inspect.isawaitable(result):
+            await result
+        except Exception as e:
+          logger.error(f"Event handler {getattr(handler, '__qualname__', handler)} failed for {type(event).__name__}: {str(e)}")
+          errors.append(e)
+
+    if raise_errors and errors:
+      raise errors[0]
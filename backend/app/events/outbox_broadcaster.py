@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories import OutboxRepository
+from src.domain.events import event_from_dict
+from .event_bus import EventBus
+from .outbox_signal import OutboxSignal, outbox_signal
+
+logger = logging.getLogger(__name__)
+
+class OutboxBroadcaster:
+  """
+  Publishes every outbox message to the broadcast bus of this worker.
+
+  The OutboxDispatcher hands each message to a single worker, which suits
+  handlers that write to the database but not the state each worker keeps in
+  memory, like open blog streams or cached feeds. Every worker instead
+  follows the outbox ids from where it started. An id is taken when its row
+  is inserted rather than when it commits, so an id skipped over may still
+  show up: skipped ids are looked up again for `gap_timeout` seconds.
+  """
+  def __init__(
+    self,
+    session_factory: Callable[[], AsyncSession],
+    event_bus: EventBus,
+    signal: OutboxSignal = outbox_signal,
+    batch_size: int = 100,
+    poll_interval: float = 1.0,
+    gap_timeout: float = 30.0,
+    max_gaps: int = 1000,
+    cursor: Optional[int] = None,
+    clock: Callable[[], float] = time.monotonic
+  ):
+    self.session_factory = session_factory
+    self.event_bus = event_bus
+    self.signal = signal
+    self.batch_size = batch_size
+    self.poll_interval = poll_interval
+    self.gap_timeout = gap_timeout
+    self.max_gaps = max_gaps
+    # The last message id broadcast, the newest one when started by default
+    self.cursor = cursor
+    self.clock = clock
+    self._gaps: Dict[int, float] = {}
+    self._wakeup = asyncio.Event()
+    self._broadcast_lock = asyncio.Lock()
+    self._task: Optional[asyncio.Task] = None
+
+  async def broadcast_pending(self) -> int:
+    broadcast = 0
+    async with self._broadcast_lock:
+      if self.cursor is None:
+        self.cursor = await self._last_id()
+
+      while True:
+        listed = await self._broadcast_batch()
+        broadcast += listed
+        if listed < self.batch_size:
+          break
+
+      expired = self.clock() - self.gap_timeout
+      self._gaps = {message_id: seen_at for message_id, seen_at in self._gaps.items() if seen_at > expired}
+    return broadcast
+
+  async def _broadcast_batch(self) -> int:
+    async with self.session_factory() as session:
+      messages = await OutboxRepository(session).list_messages(self.cursor, self.batch_size, self._gaps)
+
+    for message in messages:
+      if self._gaps.pop(message.id, None) is None:
+        self._skip_to(message.id)
+
+      try:
+        event = event_from_dict(message.event_type, message.payload)
+      except Exception as e:
+        logger.error(f"Cannot broadcast outbox message {message.id} ({message.event_type}): {str(e)}")
+        continue
+      await self.event_bus.publish(event)
+
+    return len(messages)
+
+  def _skip_to(self, message_id: int) -> None:
+    seen_at = self.clock()
+    for missing_id in range(self.cursor + 1, message_id):
+      if len(self._gaps) >= self.max_gaps:
+        logger.warning(f"Too many outbox ids skipped, no longer waiting for ids before {message_id}.")
+        break
+      self._gaps[missing_id] = seen_at
+    self.cursor = message_id
+
+  async def _last_id(self) -> int:
+    async with self.session_factory() as session:
+      return await OutboxRepository(session).get_last_id()
+
+  async def start(self) -> None:
+    if self._task is None:
+      if self.cursor is None:
+        self.cursor = await self._last_id()
+      self.signal.listen(self._wakeup.set)
+      self._task = asyncio.create_task(self._run())
+
+  async def stop(self) -> None:
+    if self._task is not None:
+      self.signal.unlisten(self._wakeup.set)
+      self._task.cancel()
+      try:
+        await self._task
+      except asyncio.CancelledError:
+        pass
+      self._task = None
+
+  async def _run(self) -> None:
+    # Messages of other workers are only found by polling
+    while True:
+      try:
+        await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+      except asyncio.TimeoutError:
+        pass
+      self._wakeup.clear()
+      try:
+        await self.broadcast_pending()
+      except Exception as e:
+        logger.error(f"Outbox broadcast failed: {str(e)}")
@@ -0,0 +1,143 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories import OutboxRepository
+from src.domain.events import event_from_dict
+from .event_bus import EventBus
+from .outbox_signal import OutboxSignal, outbox_signal
+
+logger = logging.getLogger(__name__)
+
+class OutboxDispatcher:
+  """
+  Drains the transactional outbox into the event bus.
+
+  Messages are leased in batches, published once to a single worker, then
+  marked dispatched. A failed message is retried with exponential backoff
+  until it reaches `max_attempts`, after which it stays in the table with its
+  last error for inspection. Dispatched messages are kept `retention_seconds`
+  for the OutboxBroadcaster of every worker, then pruned.
+  """
+  def __init__(
+    self,
+    session_factory: Callable[[], AsyncSession],
+    event_bus: EventBus,
+    signal: OutboxSignal = outbox_signal,
+    batch_size: int = 100,
+    poll_interval: float = 1.0,
+    max_attempts: int = 10,
+    retry_base_delay: float = 1.0,
+    retry_max_delay: float = 300.0,
+    lease_seconds: float = 60.0,
+    retention_seconds: float = 600.0
+  ):
+    self.session_factory = session_factory
+    self.event_bus = event_bus
+    self.signal = signal
+    self.batch_size = batch_size
+    self.poll_interval = poll_interval
+    self.max_attempts = max_attempts
+    self.retry_base_delay = retry_base_delay
+    self.retry_max_delay = retry_max_delay
+    self.lease_seconds = lease_seconds
+    self.retention_seconds = retention_seconds
+    self._wakeup = asyncio.Event()
+    self._dispatch_lock = asyncio.Lock()
+    self._task: Optional[asyncio.Task] = None
+
+  async def dispatch_pending(self) -> int:
+    dispatched = 0
+    async with self._dispatch_lock:
+      while True:
+        claimed = await self._dispatch_batch()
+        dispatched += claimed
+        if claimed < self.batch_size:
+          return dispatched
+
+  async def _dispatch_batch(self) -> int:
+    lease_until = datetime.now(timezone.utc) + timedelta(seconds=self.lease_seconds)
+    async with self.session_factory() as session:
+      messages = await OutboxRepository(session).claim_batch(
+        self.batch_size,
+        self.max_attempts,
+        lease_until
+      )
+      await session.commit()
+
+    if not messages:
+      return 0
+
+    succeeded = []
+    failed = []
+    for message in messages:
+      try:
+        event = event_from_dict(message.event_type, message.payload)
+        await self.event_bus.publish(event, raise_errors=True)
+        succeeded.append(message.id)
+      except Exception as e:
+        failed.append((message, str(e) or type(e).__name__))
+
+    async with self.session_factory() as session:
+      repository = OutboxRepository(session)
+      await repository.complete(succeeded, datetime.now(timezone.utc))
+      for message, error in failed:
+        delay = min(self.retry_base_delay * 2 ** (message.attempts - 1), self.retry_max_delay)
+        await repository.retry_later(
+          message.id,
+          datetime.now(timezone.utc) + timedelta(seconds=delay),
+          error
+        )
+        if message.attempts >= self.max_attempts:
+          logger.error(f"Giving up on outbox message {message.id} ({message.event_type}) after {message.attempts} attempts: {error}")
+      await session.commit()
+
+    logger.info(f"Dispatched {len(succeeded)} outbox messages, {len(failed)} failed.")
+    return len(messages)
+
+  async def prune_dispatched(self) -> int:
+    dispatched_before = datetime.now(timezone.utc) - timedelta(seconds=self.retention_seconds)
+    pruned = 0
+    while True:
+      async with self.session_factory() as session:
+        deleted = await OutboxRepository(session).delete_dispatched(dispatched_before, self.batch_size)
+        await session.commit()
+
+      pruned += deleted
+      if deleted < self.batch_size:
+        break
+
+    if pruned:
+      logger.info(f"Pruned {pruned} dispatched outbox messages.")
+    return pruned
+
+  async def start(self) -> None:
+    if self._task is None:
+      self.signal.listen(self._wakeup.set)
+      self._task = asyncio.create_task(self._run())
+
+  async def stop(self) -> None:
+    if self._task is not None:
+      self.signal.unlisten(self._wakeup.set)
+      self._task.cancel()
+      try:
+        await self._task
+      except asyncio.CancelledError:
+        pass
+      self._task = None
+    await self.dispatch_pending()
+
+  async def _run(self) -> None:
+    while True:
+      try:
+        await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+      except asyncio.TimeoutError:
+        pass
+      self._wakeup.clear()
+      try:
+        await self.dispatch_pending()
+      except Exception as e:
+        logger.error(f"Outbox dispatch failed: {str(e)}")
@@ -0,0 +1,19 @@
+from typing import Callable, List
+
+class OutboxSignal:
+  """Wakes outbox dispatchers up as soon as a transaction wrote new events."""
+  def __init__(self):
+    self._listeners: List[Callable[[], None]] = []
+
+  def listen(self, listener: Callable[[], None]) -> None:
+    self._listeners.append(listener)
+
+  def unlisten(self, listener: Callable[[], None]) -> None:
+    if listener in self._listeners:
+      self._listeners.remove(listener)
+
+  def notify(self) -> None:
+    for listener in list(self._listeners):
+      listener()
+
+outbox_signal = OutboxSignal()
@@ -0,0 +1,4 @@
+from .feed_cache import FeedCache, CachedDocument, GLOBAL_FEED_KEY, SITEMAP_KEY, author_feed_key
+from .feed_renderer import render_rss_feed, render_sitemap
+from .timeline_fanout import TimelineFanout
+from .blog_stream import BlogStreamHub, BlogStreamSubscription
\ No newline at end of file
@@ -0,0 +1,153 @@
+import asyncio
+import json
+import logging
+import uuid
+from collections import OrderedDict, deque
+from typing import AsyncIterator, Deque, Optional, Set, Tuple
+
+from src.domain.events import BlogEvent, BlogCreatedEvent, BlogUpdatedEvent, BlogDeletedEvent
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT = b": keepalive\n\n"
+# Tells a client it missed events and should reload the list instead
+RESYNC = b"event: resync\ndata: {}\n\n"
+
+class _Frame:
+  __slots__ = ("sequence", "event_id", "blog_id", "name", "payload", "data")
+
+  def __init__(self, sequence: int, event_id: str, blog_id: str, name: str, payload: str):
+    self.sequence = sequence
+    self.event_id = event_id
+    self.blog_id = blog_id
+    self.name = name
+    self.payload = payload
+    self.data = f"id: {event_id}\nevent: {name}\ndata: {payload}\n\n".encode()
+
+  def renamed(self, other: "_Frame") -> "_Frame":
+    """This frame's position in the stream carrying the event of `other`."""
+    return _Frame(self.sequence, self.event_id, self.blog_id, other.name, other.payload)
+
+class BlogStreamSubscription:
+  """
+  Events not yet sent to one client, at most `max_pending` blogs of them.
+
+  Events of a blog that is already pending are coalesced into one. A client
+  too slow to keep up with `max_pending` distinct blogs loses its pending
+  events and is told to resync.
+  """
+  def __init__(self, max_pending: int):
+    self.max_pending = max_pending
+    self.closed = False
+    self._pending: "OrderedDict[str, _Frame]" = OrderedDict()
+    self._lagged = False
+    self._wakeup = asyncio.Event()
+
+  def push(self, frame: _Frame) -> None:
+    queued = self._pending.pop(frame.blog_id, None)
+    if queued is not None and queued.name == BlogCreatedEvent.name:
+      # The client never saw the blog: deleted it is nothing, updated it is still new
+      if frame.name == BlogDeletedEvent.name:
+        return
+      # Sent under the newest id, so a reconnecting client does not replay the update
+      frame = frame.renamed(queued) if frame.name == BlogUpdatedEvent.name else frame
+    elif queued is None and len(self._pending) >= self.max_pending:
+      self._pending.clear()
+      self._lagged = True
+
+    # A lagging client reloads the list after this event committed, so it needs no frame
+    if not self._lagged:
+      self._pending[frame.blog_id] = frame
+    self._wakeup.set()
+
+  def resync(self) -> None:
+    self._pending.clear()
+    self._lagged = True
+    self._wakeup.set()
+
+  def close(self) -> None:
+    self.closed = True
+    self._wakeup.set()
+
+  async def stream(self, heartbeat_interval: float = 15.0, retry_milliseconds: int = 5000) -> AsyncIterator[bytes]:
+    yield f"retry: {retry_milliseconds}\n\n".encode()
+    while not self.closed:
+      try:
+        await asyncio.wait_for(self._wakeup.wait(), timeout=heartbeat_interval)
+      except asyncio.TimeoutError:
+        # Keeps proxies from closing an idle connection
+        yield HEARTBEAT
+        continue
+
+      self._wakeup.clear()
+      if self._lagged:
+        self._lagged = False
+        yield RESYNC
+      while self._pending:
+        _, frame = self._pending.popitem(last=False)
+        yield frame.data
+
+class BlogStreamHub:
+  """
+  Broadcasts blog events to every open blog stream of this worker.
+
+  Each event is encoded once and the same bytes are queued to every
+  subscriber, so a subscriber only costs its pending references. The last
+  `replay_size` events are kept for clients that reconnect with a
+  Last-Event-ID, which is only understood by the worker that issued it.
+  """
+  def __init__(self, max_subscribers: int = 10_000, max_pending: int = 100, replay_size: int = 256):
+    self.max_subscribers = max_subscribers
+    self.max_pending = max_pending
+    self._epoch = uuid.uuid4().hex[:8]
+    self._sequence = 0
+    self._recent: Deque[_Frame] = deque(maxlen=replay_size)
+    self._subscriptions: Set[BlogStreamSubscription] = set()
+
+  @property
+  def subscriber_count(self) -> int:
+    return len(self._subscriptions)
+
+  def subscribe(self, last_event_id: Optional[str] = None) -> Optional[BlogStreamSubscription]:
+    if len(self._subscriptions) >= self.max_subscribers:
+      return None
+
+    subscription = BlogStreamSubscription(self.max_pending)
+    if last_event_id:
+      self._replay(subscription, last_event_id)
+    self._subscriptions.add(subscription)
+    return subscription
+
+  def unsubscribe(self, subscription: BlogStreamSubscription) -> None:
+    self._subscriptions.discard(subscription)
+
+  def handle_blog_event(self, event: BlogEvent) -> None:
+    self._sequence += 1
+    data = json.dumps(event.to_dict(), separators=(",", ":"))
+    frame = _Frame(self._sequence, f"{self._epoch}-{self._sequence}", event.blog_id, event.name, data)
+    self._recent.append(frame)
+
+    for subscription in self._subscriptions:
+      subscription.push(frame)
+
+  def close_all(self) -> None:
+    subscriptions, self._subscriptions = self._subscriptions, set()
+    for subscription in subscriptions:
+      subscription.close()
+    logger.info(f"Closed {len(subscriptions)} blog streams.")
+
+  def _replay(self, subscription: BlogStreamSubscription, last_event_id: str) -> None:
+    position = self._parse_event_id(last_event_id)
+    oldest = self._recent[0].sequence if self._recent else self._sequence + 1
+    if position is None or position[0] != self._epoch or position[1] > self._sequence or position[1] + 1 < oldest:
+      subscription.resync()
+      return
+
+    for frame in self._recent:
+      if frame.sequence > position[1]:
+        subscription.push(frame)
+
+  @staticmethod
+  def _parse_event_id(event_id: str) -> Optional[Tuple[str, int]]:
+    epoch, _, sequence = event_id.partition("-")
+    return (epoch, int(sequence)) if sequence.isdigit() else None
@@ -0,0 +1,98 @@
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from src.domain.events import BlogEvent
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_FEED_KEY = "feed"
+SITEMAP_KEY = "sitemap"
+
+def author_feed_key(author_id: str) -> str:
+  return f"feed:author:{author_id}"
+
+class CachedDocument:
+  def __init__(self, body: bytes, rendered_at: float = 0.0):
+    self.body = body
+    self.rendered_at = rendered_at
+    self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+class FeedCache:
+  """
+  Pre-rendered feed documents kept until a blog write invalidates them or
+  they are `max_age_seconds` old.
+
+  Concurrent misses on the same key render the document once, and a render
+  that raced with an invalidation is served but never cached. Every worker
+  receives the invalidations through its outbox broadcaster, the max age
+  bounds how long a worker that missed one serves a stale document.
+  """
+  def __init__(
+    self,
+    max_entries: int = 1024,
+    max_age_seconds: Optional[float] = None,
+    clock: Callable[[], float] = time.monotonic
+  ):
+    self.max_entries = max_entries
+    self.max_age_seconds = max_age_seconds
+    self.clock = clock
+    self._documents: "OrderedDict[str, CachedDocument]" = OrderedDict()
+    self._versions: Dict[str, int] = {}
+    self._locks: Dict[str, asyncio.Lock] = {}
+
+  async def get_or_render(
+    self,
+    key: str,
+    render: Callable[[], Awaitable[bytes]]
+  ) -> Tuple[CachedDocument, bool]:
+    document = self._get(key)
+    if document is not None:
+      return document, True
+
+    lock = self._locks.setdefault(key, asyncio.Lock())
+    async with lock:
+      document = self._get(key)
+      if document is not None:
+        return document, True
+
+      version = self._versions.get(key, 0)
+      document = CachedDocument(await render(), self.clock())
+
+      if self._versions.get(key, 0) == version:
+        self._documents[key] = document
+        while len(self._documents) > self.max_entries:
+          evicted, _ = self._documents.popitem(last=False)
+          self._locks.pop(evicted, None)
+          self._versions.pop(evicted, None)
+
+    return document, False
+
+  def invalidate(self, keys: Iterable[str]) -> None:
+    for key in keys:
+      self._documents.pop(key, None)
+      # Versions only matter to renders in flight, which always hold a lock
+      if key in self._locks:
+        self._versions[key] = self._versions.get(key, 0) + 1
+
+  def clear(self) -> None:
+    self.invalidate(list(self._documents))
+
+  def handle_blog_event(self, event: BlogEvent) -> None:
+    logger.info(f"Invalidating feeds after {event.name} of blog {event.blog_id}")
+    self.invalidate([GLOBAL_FEED_KEY, SITEMAP_KEY, author_feed_key(event.author_id)])
+
+  def _get(self, key: str) -> Optional[CachedDocument]:
+    document = self._documents.get(key)
+    if document is None:
+      return None
+
+    if self.max_age_seconds is not None and self.clock() - document.rendered_at >= self.max_age_seconds:
+      del self._documents[key]
+      return None
+
+    self._documents.move_to_end(key)
+    return document
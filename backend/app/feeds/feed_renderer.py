@@ -0,0 +1,71 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import AsyncIterator, Tuple
+from xml.sax.saxutils import escape
+
+from src.domain.entities import BlogEntity
+
+def _as_utc(value: datetime) -> datetime:
+  # SQLite gives naive datetime → force UTC
+  if value.tzinfo is None:
+    return value.replace(tzinfo=timezone.utc)
+  return value.astimezone(timezone.utc)
+
+def blog_url(site_url: str, blog_id: str) -> str:
+  return f"{site_url.rstrip('/')}/blogs/{blog_id}"
+
+async def render_rss_feed(
+  title: str,
+  site_url: str,
+  feed_url: str,
+  description: str,
+  blogs: AsyncIterator[BlogEntity]
+) -> bytes:
+  parts = [
+    '<?xml version="1.0" encoding="UTF-8"?>\n',
+    '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom"><channel>',
+    f"<title>{escape(title)}</title>",
+    f"<link>{escape(site_url)}</link>",
+    f"<description>{escape(description)}</description>",
+    f'<atom:link href="{escape(feed_url)}" rel="self" type="application/rss+xml"/>',
+  ]
+
+  last_build_date = None
+  async for blog in blogs:
+    published = _as_utc(blog.created_at)
+    last_build_date = last_build_date or published
+    link = blog_url(site_url, blog.id)
+    parts.append(
+      "<item>"
+      f"<title>{escape(blog.title)}</title>"
+      f"<link>{escape(link)}</link>"
+      f'<guid isPermaLink="false">{escape(blog.id)}</guid>'
+      f"<pubDate>{format_datetime(published)}</pubDate>"
+      f"<description>{escape(blog.content_html or blog.content)}</description>"
+      "</item>"
+    )
+
+  if last_build_date:
+    parts.insert(5, f"<lastBuildDate>{format_datetime(last_build_date)}</lastBuildDate>")
+
+  parts.append("</channel></rss>")
+  return "".join(parts).encode("utf-8")
+
+async def render_sitemap(
+  site_url: str,
+  blogs: AsyncIterator[Tuple[str, datetime]]
+) -> bytes:
+  parts = [
+    '<?xml version="1.0" encoding="UTF-8"?>\n',
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
+    f"<url><loc>{escape(site_url)}</loc></url>",
+  ]
+
+  async for blog_id, updated_at in blogs:
+    parts.append(
+      f"<url><loc>{escape(blog_url(site_url, blog_id))}</loc>"
+      f"<lastmod>{_as_utc(updated_at).isoformat()}</lastmod></url>"
+    )
+
+  parts.append("</urlset>")
+  return "".join(parts).encode("utf-8")
@@ -0,0 +1,67 @@
+import logging
+from typing import Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.sharding import ShardRouter
+from app.database.unit_of_work import UnitOfWork
+from src.domain.events import BlogEvent, BlogCreatedEvent, BlogDeletedEvent
+
+logger = logging.getLogger(__name__)
+
+class TimelineFanout:
+  """
+  Pushes new blogs onto the timelines of their author's followers.
+
+  Runs from the outbox after the blog committed. Followers are read in
+  keyset pages of `batch_size` and each page is pushed in its own
+  transaction, so a retried event only repeats idempotent inserts. Authors
+  with `celebrity_threshold` followers or more are skipped: their blogs
+  are read when a feed is served instead of written to every timeline.
+  """
+  def __init__(
+    self,
+    session_factory: Callable[[], AsyncSession],
+    shard_router: Optional[ShardRouter] = None,
+    celebrity_threshold: int = 10_000,
+    timeline_length: int = 800,
+    batch_size: int = 1000
+  ):
+    self.session_factory = session_factory
+    self.shard_router = shard_router
+    self.celebrity_threshold = celebrity_threshold
+    self.timeline_length = timeline_length
+    self.batch_size = batch_size
+
+  async def handle_blog_event(self, event: BlogEvent) -> None:
+    if isinstance(event, BlogDeletedEvent):
+      async with self._unit_of_work() as uow:
+        await uow.timelines.delete_blog(event.blog_id)
+    elif isinstance(event, BlogCreatedEvent):
+      await self.fan_out(event.blog_id, event.author_id)
+
+  async def fan_out(self, blog_id: str, author_id: str) -> int:
+    async with self._unit_of_work() as uow:
+      if await uow.follows.get_follower_count(author_id) >= self.celebrity_threshold:
+        return 0
+      blog = await uow.blogs.get_blog_by_id(blog_id)
+    if blog is None:
+      return 0
+
+    pushed = 0
+    after = None
+    while True:
+      async with self._unit_of_work() as uow:
+        follower_ids = await uow.follows.get_follower_ids(author_id, after, self.batch_size)
+        await uow.timelines.add_blog(follower_ids, blog, self.timeline_length)
+
+      pushed += len(follower_ids)
+      if len(follower_ids) < self.batch_size:
+        break
+      after = follower_ids[-1]
+
+    logger.info(f"Fanned out blog {blog_id} to {pushed} timelines.")
+    return pushed
+
+  def _unit_of_work(self) -> UnitOfWork:
+    return UnitOfWork(self.session_factory(), shard_router=self.shard_router)
@@ -3,6 +3,7 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from .domain_exception_handler import register_domain_exception_handler 
 from .auth_exception_handler import register_auth_exception_handler
+from .rate_limit_exception_handler import register_rate_limit_exception_handler
 import logging
 
 logger = logging.getLogger(__name__)
@@ -28,4 +29,5 @@ def register_handlers(app: FastAPI, logger: logging.Logger = logger):
     )
   
   register_auth_exception_handler(app, logger=logger)
-  register_domain_exception_handler(app, logger=logger)
\ No newline at end of file
+  register_domain_exception_handler(app, logger=logger)
+  register_rate_limit_exception_handler(app, logger=logger)
\ No newline at end of file
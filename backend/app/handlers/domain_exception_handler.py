@@ -6,6 +6,8 @@ from src.domain.exceptions import (
   InvalidDataException,
   UsernameExistsException,
   NotFoundException,
+  ConflictException,
+  PreconditionFailedException,
 )
 
 default_logger = logging.getLogger("uvicorn.error")
@@ -41,4 +43,20 @@ def register_domain_exception_handler(app: FastAPI, logger: logging.Logger = def
     return JSONResponse(
       status_code=status.HTTP_401_UNAUTHORIZED,
       content={"detail": str(exc)}
+    )
+  
+  @app.exception_handler(ConflictException)
+  def handle_conflict_exception(request: Request, exc: ConflictException):
+    logger.error(f"ConflictException: {str(exc)}")
+    return JSONResponse(
+      status_code=status.HTTP_409_CONFLICT,
+      content={"detail": str(exc)}
+    )
+  
+  @app.exception_handler(PreconditionFailedException)
+  def handle_precondition_failed_exception(request: Request, exc: PreconditionFailedException):
+    logger.error(f"PreconditionFailedException: {str(exc)}")
+    return JSONResponse(
+      status_code=status.HTTP_412_PRECONDITION_FAILED,
+      content={"detail": str(exc)}
     )
\ No newline at end of file
@@ -0,0 +1,22 @@
+import logging
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+from app.rate_limiting import RateLimitExceededException
+
+default_logger = logging.getLogger("uvicorn.error")
+
+def register_rate_limit_exception_handler(
+  app: FastAPI,
+  logger: logging.Logger = default_logger
+):
+  @app.exception_handler(RateLimitExceededException)
+  def handle_rate_limit_exceeded_exception(
+    request: Request,
+    exc: RateLimitExceededException
+  ):
+    logger.error(f"RateLimitExceededException: {str(exc)}")
+    return JSONResponse(
+      status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+      content={"detail": str(exc)},
+      headers={"Retry-After": str(exc.retry_after)}
+    )
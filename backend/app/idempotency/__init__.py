@@ -0,0 +1,2 @@
+from .idempotency_store import IdempotencyStore, InMemoryIdempotencyStore, StoredResponse
+from .idempotency_middleware import IdempotencyMiddleware
@@ -0,0 +1,183 @@
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.auth import TokenService
+from .idempotency_store import IdempotencyStore, StoredResponse
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = b"idempotency-key"
+MAX_KEY_LENGTH = 255
+
+# Responses a client is expected to retry are never replayed
+RETRYABLE_STATUSES = {401, 403, 408, 409, 425, 429}
+
+
+class IdempotencyMiddleware:
+  """
+  Replays the stored response of a request carrying an `Idempotency-Key`
+  header instead of executing it again.
+
+  Requests are identified by the authenticated user (or the client address for
+  anonymous requests), the route and the key. A duplicate arriving while the
+  first request is still running waits for it, and reusing a key with a
+  different body is rejected.
+  """
+  def __init__(
+    self,
+    app: ASGIApp,
+    store: IdempotencyStore,
+    methods: Iterable[str] = ("POST",),
+    excluded_path_prefixes: Iterable[str] = (),
+    max_response_bytes: int = 1_048_576,
+    wait_timeout_seconds: float = 30.0
+  ):
+    self.app = app
+    self.store = store
+    self.methods = {method.upper() for method in methods}
+    self.excluded_path_prefixes = tuple(excluded_path_prefixes)
+    self.max_response_bytes = max_response_bytes
+    self.wait_timeout_seconds = wait_timeout_seconds
+    self._in_flight: Dict[str, Tuple[str, asyncio.Future]] = {}
+
+  async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+    if (
+      scope["type"] != "http"
+      or scope["method"] not in self.methods
+      or scope["path"].startswith(self.excluded_path_prefixes)
+    ):
+      await self.app(scope, receive, send)
+      return
+
+    headers = dict(scope["headers"])
+    idempotency_key = headers.get(IDEMPOTENCY_HEADER)
+    if idempotency_key is None:
+      await self.app(scope, receive, send)
+      return
+    if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+      await self._send_error(send, 400, f"The Idempotency-Key header must be 1 to {MAX_KEY_LENGTH} characters long.")
+      return
+
+    body = await self._read_body(receive)
+    fingerprint = hashlib.sha256(body).hexdigest()
+    key = f"{self._principal(scope, headers)}:{scope['method']}:{scope['path']}:{idempotency_key.decode('latin-1')}"
+
+    while True:
+      stored = await self.store.get(key)
+      if stored is not None:
+        if stored.fingerprint != fingerprint:
+          await self._send_error(send, 422, "The Idempotency-Key was already used with a different request body.")
+          return
+        logger.info(f"Replaying stored response for {scope['method']} {scope['path']}")
+        await self._replay(send, stored)
+        return
+
+      in_flight = self._in_flight.get(key)
+      if in_flight is None:
+        break
+      if in_flight[0] != fingerprint:
+        await self._send_error(send, 422, "The Idempotency-Key was already used with a different request body.")
+        return
+      try:
+        await asyncio.wait_for(asyncio.shield(in_flight[1]), self.wait_timeout_seconds)
+      except asyncio.TimeoutError:
+        await self._send_error(send, 409, "A request with this Idempotency-Key is still being processed.")
+        return
+
+    finished = asyncio.get_running_loop().create_future()
+    self._in_flight[key] = (fingerprint, finished)
+    try:
+      response = await self._run(scope, self._replay_body(body, receive), send)
+      if response is not None and response[0] < 500 and response[0] not in RETRYABLE_STATUSES:
+        await self.store.put(key, StoredResponse(fingerprint, *response))
+    finally:
+      del self._in_flight[key]
+      finished.set_result(None)
+
+  def _principal(self, scope: Scope, headers: Dict[bytes, bytes]) -> str:
+    authorization = headers.get(b"authorization", b"").decode("latin-1")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+      try:
+        return f"user:{TokenService.verify_token(token).user_id}"
+      except Exception:
+        pass
+    client = scope.get("client")
+    return f"anonymous:{client[0] if client else 'unknown'}"
+
+  async def _read_body(self, receive: Receive) -> bytes:
+    chunks: List[bytes] = []
+    while True:
+      message = await receive()
+      if message["type"] != "http.request":
+        break
+      chunks.append(message.get("body", b""))
+      if not message.get("more_body", False):
+        break
+    return b"".join(chunks)
+
+  def _replay_body(self, body: bytes, receive: Receive) -> Receive:
+    sent = False
+
+    async def replay_receive() -> Message:
+      nonlocal sent
+      if not sent:
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+      return await receive()
+
+    return replay_receive
+
+  async def _run(
+    self,
+    scope: Scope,
+    receive: Receive,
+    send: Send
+  ) -> Optional[Tuple[int, List[Tuple[bytes, bytes]], bytes]]:
+    status = 0
+    headers: List[Tuple[bytes, bytes]] = []
+    chunks: List[bytes] = []
+    size = 0
+    capturing = True
+
+    async def capture_send(message: Message) -> None:
+      nonlocal status, headers, size, capturing
+      if message["type"] == "http.response.start":
+        status = message["status"]
+        headers = list(message.get("headers", []))
+      elif message["type"] == "http.response.body" and capturing:
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > self.max_response_bytes:
+          capturing = False
+          chunks.clear()
+        else:
+          chunks.append(chunk)
+      await send(message)
+
+    await self.app(scope, receive, capture_send)
+    if not capturing or not status:
+      return None
+    return status, headers, b"".join(chunks)
+
+  async def _replay(self, send: Send, stored: StoredResponse) -> None:
+    await send({
+      "type": "http.response.start",
+      "status": stored.status,
+      "headers": [*stored.headers, (b"idempotent-replayed", b"true")],
+    })
+    await send({"type": "http.response.body", "body": stored.body})
+
+  async def _send_error(self, send: Send, status: int, detail: str) -> None:
+    body = json.dumps({"detail": detail}).encode("utf-8")
+    await send({
+      "type": "http.response.start",
+      "status": status,
+      "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
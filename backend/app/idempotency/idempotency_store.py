@@ -0,0 +1,81 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+  fingerprint: str
+  status: int
+  headers: List[Tuple[bytes, bytes]]
+  body: bytes
+
+
+class IdempotencyStore(ABC):
+  @abstractmethod
+  async def get(self, key: str) -> Optional[StoredResponse]:
+    """Return the response stored under key, if it has not expired.
+
+    Args:
+      key (str): Identifier of the request (principal, route and idempotency key).
+
+    Returns:
+      Optional[StoredResponse]: The stored response or None.
+    """
+    pass
+
+  @abstractmethod
+  async def put(self, key: str, response: StoredResponse) -> None:
+    """Store the response of the first execution of a request.
+
+    Args:
+      key (str): Identifier of the request (principal, route and idempotency key).
+      response (StoredResponse): The response to replay to retries.
+    """
+    pass
+
+  @abstractmethod
+  async def reset(self) -> None:
+    """Drop every stored response."""
+    pass
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+  def __init__(
+    self,
+    ttl_seconds: float = 86400.0,
+    max_keys: int = 10_000,
+    clock: Callable[[], float] = time.monotonic
+  ):
+    self.ttl_seconds = ttl_seconds
+    self.max_keys = max_keys
+    self.clock = clock
+    # key -> (expires at, response), least recently stored first
+    self._responses: "OrderedDict[str, Tuple[float, StoredResponse]]" = OrderedDict()
+
+  async def get(self, key: str) -> Optional[StoredResponse]:
+    entry = self._responses.get(key)
+    if entry is None:
+      return None
+
+    expires_at, response = entry
+    if expires_at <= self.clock():
+      del self._responses[key]
+      return None
+    return response
+
+  async def put(self, key: str, response: StoredResponse) -> None:
+    self._responses[key] = (self.clock() + self.ttl_seconds, response)
+    self._responses.move_to_end(key)
+
+    # Every entry shares the same ttl, so the oldest entries expire first
+    while len(self._responses) > self.max_keys:
+      self._responses.popitem(last=False)
+
+  async def reset(self) -> None:
+    self._responses.clear()
+
+  def __len__(self) -> int:
+    return len(self._responses)
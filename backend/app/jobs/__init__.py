@@ -0,0 +1,3 @@
+from .job_runner import JobRunner
+from .user_content_purger import UserContentPurger
+from .blog_partitions import maintain_blog_partitions
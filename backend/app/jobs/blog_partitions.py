@@ -0,0 +1,98 @@
+import logging
+from datetime import date, datetime, timezone
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories import BlogViewRepository
+
+logger = logging.getLogger(__name__)
+
+def add_months(day: date, months: int) -> date:
+  month_index = day.year * 12 + day.month - 1 + months
+  return date(month_index // 12, month_index % 12 + 1, 1)
+
+def monthly_partitions(start: date, count: int) -> List[Tuple[str, date, date]]:
+  """Returns the name and [lower, upper) bounds of `count` monthly partitions from the month of `start`."""
+  first = date(start.year, start.month, 1)
+  return [month_partition(add_months(first, offset)) for offset in range(count)]
+
+def month_partition(month: date) -> Tuple[str, date, date]:
+  lower = date(month.year, month.month, 1)
+  return f"blogs_y{lower.year}m{lower.month:02d}", lower, add_months(lower, 1)
+
+async def is_partitioned(session: AsyncSession) -> bool:
+  if session.get_bind().dialect.name != "postgresql":
+    return False
+  relkind = await session.scalar(text("SELECT relkind FROM pg_class WHERE oid = to_regclass('blogs')"))
+  return relkind == "p"
+
+async def maintain_blog_partitions(
+  session_factory: Callable[[], AsyncSession],
+  months_ahead: int = 3,
+  today: Optional[date] = None
+) -> int:
+  """
+  Creates the monthly `blogs` partitions up to `months_ahead` months from now,
+  so rows never land in the default partition, and those of the months whose
+  rows landed there anyway, then purges the view counts of deleted blogs.
+  Returns the number of partitions created.
+  """
+  today = today or datetime.now(timezone.utc).date()
+  created = 0
+
+  async with session_factory() as session:
+    if await is_partitioned(session):
+      stranded = await _default_months(session)
+      if stranded:
+        logger.warning(
+          f"Blogs of {len(stranded)} months without a partition are in blogs_default, moving them out."
+        )
+
+      partitions = monthly_partitions(today, months_ahead + 1) + [month_partition(month) for month in stranded]
+      for name, lower, upper in sorted(set(partitions)):
+        exists = await session.scalar(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name})
+        if exists:
+          continue
+        moved = await _create_partition(session, name, lower, upper)
+        await session.commit()
+        created += 1
+        logger.info(f"Created blog partition {name} for [{lower}, {upper}), moving {moved} blogs into it.")
+
+    purged = await BlogViewRepository(session).delete_orphaned_views()
+    await session.commit()
+
+  if purged:
+    logger.info(f"Purged view counts of {purged} deleted blogs.")
+  return created
+
+async def _default_months(session: AsyncSession) -> List[date]:
+  result = await session.scalars(text(
+    "SELECT DISTINCT date_trunc('month', created_at AT TIME ZONE 'UTC')::date FROM blogs_default"
+  ))
+  return list(result.all())
+
+async def _create_partition(session: AsyncSession, name: str, lower: date, upper: date) -> int:
+  # A partition cannot be created over rows of its range in the default
+  # partition, so it is filled from there before being attached. The lock,
+  # which attaching takes anyway, keeps new rows out of the default meanwhile.
+  await session.execute(text("LOCK TABLE blogs_default IN ACCESS EXCLUSIVE MODE"))
+  await session.execute(text(f"CREATE TABLE {name} (LIKE blogs INCLUDING DEFAULTS)"))
+  moved = await session.execute(
+    text(
+      f"WITH moved AS ("
+      f"DELETE FROM blogs_default WHERE created_at >= :lower AND created_at < :upper RETURNING *"
+      f") INSERT INTO {name} SELECT * FROM moved"
+    ),
+    {
+      "lower": datetime(lower.year, lower.month, 1, tzinfo=timezone.utc),
+      "upper": datetime(upper.year, upper.month, 1, tzinfo=timezone.utc)
+    }
+  )
+  # Bounds are UTC month starts, the same whatever the session time zone
+  await session.execute(text(
+    f"ALTER TABLE blogs ATTACH PARTITION {name} "
+    f"FOR VALUES FROM ('{lower.isoformat()} 00:00:00+00') TO ('{upper.isoformat()} 00:00:00+00')"
+  ))
+  return moved.rowcount
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.application.services import IJobQueue
+
+logger = logging.getLogger(__name__)
+
+Job = Tuple[Callable[..., Awaitable[Any]], tuple, dict]
+
+class JobQueue:
+  def __init__(self, name: str, concurrency: int, max_size: int):
+    self.name = name
+    self.concurrency = concurrency
+    self.jobs: "asyncio.Queue[Job]" = asyncio.Queue(maxsize=max_size)
+    self.completed = 0
+    self.failed = 0
+
+class PeriodicJob:
+  def __init__(self, name: str, job: Callable[[], Awaitable[Any]], interval: float, queue_name: str):
+    self.name = name
+    self.job = job
+    self.interval = interval
+    self.queue_name = queue_name
+    self.running = False
+
+class JobRunner(IJobQueue):
+  """
+  Lightweight asyncio job scheduler owned by the app lifespan.
+
+  Each named queue is drained by a fixed number of worker tasks, which bounds
+  how much background work competes with requests. On shutdown the runner
+  stops accepting jobs and waits up to `drain_timeout` seconds for queued
+  jobs to finish before cancelling the rest.
+  """
+  def __init__(self, drain_timeout: float = 10.0):
+    self.drain_timeout = drain_timeout
+    self._queues: Dict[str, JobQueue] = {}
+    self._periodic_jobs: List[PeriodicJob] = []
+    self._workers: List[asyncio.Task] = []
+    self._schedulers: List[asyncio.Task] = []
+    self._accepting = True
+    self._started = False
+
+  def add_queue(self, name: str, concurrency: int = 1, max_size: int = 0) -> None:
+    if name in self._queues:
+      raise ValueError(f"Job queue '{name}' already exists.")
+    self._queues[name] = JobQueue(name, concurrency, max_size)
+
+  def add_periodic(
+    self,
+    name: str,
+    job: Callable[[], Awaitable[Any]],
+    interval: float,
+    queue_name: str = "default"
+  ) -> None:
+    self._get_queue(queue_name)
+    self._periodic_jobs.append(PeriodicJob(name, job, interval, queue_name))
+
+  def enqueue(
+    self,
+    queue_name: str,
+    job: Callable[..., Awaitable[Any]],
+    *args: Any,
+    **kwargs: Any
+  ) -> bool:
+    queue = self._get_queue(queue_name)
+    if not self._accepting:
+      logger.warning(f"Rejected job {getattr(job, '__qualname__', job)}: runner is shutting down.")
+      return False
+
+    try:
+      queue.jobs.put_nowait((job, args, kwargs))
+    except asyncio.QueueFull:
+      logger.warning(f"Rejected job {getattr(job, '__qualname__', job)}: queue '{queue_name}' is full.")
+      return False
+    return True
+
+  def stats(self) -> Dict[str, Dict[str, int]]:
+    return {
+      name: {
+        "queued": queue.jobs.qsize(),
+        "completed": queue.completed,
+        "failed": queue.failed,
+      }
+      for name, queue in self._queues.items()
+    }
+
+  async def start(self) -> None:
+    if self._started:
+      return
+
+    self._started = True
+    self._accepting = True
+    for queue in self._queues.values():
+      for index in range(queue.concurrency):
+        self._workers.append(asyncio.create_task(self._work(queue), name=f"job-worker:{queue.name}:{index}"))
+    for periodic_job in self._periodic_jobs:
+      self._schedulers.append(asyncio.create_task(self._schedule(periodic_job), name=f"job-scheduler:{periodic_job.name}"))
+    logger.info(f"Job runner started with queues: {', '.join(self._queues)}")
+
+  async def stop(self) -> None:
+    self._accepting = False
+    await self._cancel(self._schedulers)
+
+    pending = [queue.jobs.join() for queue in self._queues.values()]
+    try:
+      await asyncio.wait_for(asyncio.gather(*pending), timeout=self.drain_timeout)
+    except asyncio.TimeoutError:
+      abandoned = sum(queue.jobs.qsize() for queue in self._queues.values())
+      logger.warning(f"Job runner drain deadline of {self.drain_timeout}s exceeded, cancelling running jobs and {abandoned} queued jobs.")
+
+    await self._cancel(self._workers)
+    self._started = False
+    logger.info("Job runner stopped.")
+
+  def _get_queue(self, name: str) -> JobQueue:
+    queue: Optional[JobQueue] = self._queues.get(name)
+    if queue is None:
+      raise ValueError(f"Unknown job queue: '{name}'")
+    return queue
+
+  async def _work(self, queue: JobQueue) -> None:
+    while True:
+      job, args, kwargs = await queue.jobs.get()
+      try:
+        await job(*args, **kwargs)
+        queue.completed += 1
+      except Exception as e:
+        queue.failed += 1
+        logger.error(f"Job {getattr(job, '__qualname__', job)} failed on queue '{queue.name}': {str(e)}")
+      finally:
+        queue.jobs.task_done()
+
+  async def _schedule(self, periodic_job: PeriodicJob) -> None:
+    async def run() -> None:
+      try:
+        await periodic_job.job()
+      finally:
+        periodic_job.running = False
+
+    while True:
+      await asyncio.sleep(periodic_job.interval)
+      # A slow run is never stacked with the next one
+      if periodic_job.running:
+        continue
+      periodic_job.running = self.enqueue(periodic_job.queue_name, run)
+
+  @staticmethod
+  async def _cancel(tasks: List[asyncio.Task]) -> None:
+    for task in tasks:
+      task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    tasks.clear()
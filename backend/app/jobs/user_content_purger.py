@@ -0,0 +1,92 @@
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.sharding import ShardRouter
+from app.database.unit_of_work import UnitOfWork
+from src.application.services import IUserContentPurger
+from src.domain.events import BlogDeletedEvent
+
+logger = logging.getLogger(__name__)
+
+class UserContentPurger(IUserContentPurger):
+  """
+  Deletes the blogs and timeline entries of a user `chunk_size` at a time,
+  each chunk in its own transaction, and the user once none are left. Row
+  locks on `blogs` are only held for one chunk and the short pause between
+  chunks lets other writers in.
+
+  Every chunk first leases the deletion for `lease_seconds`, so the job
+  enqueued for a deletion and the periodic resume of every worker never purge
+  the same deletion at once. A purge that stopped midway leaves its lease to
+  expire and the next resume takes over.
+  """
+  def __init__(
+    self,
+    session_factory: Callable[[], AsyncSession],
+    chunk_size: int = 200,
+    pause_seconds: float = 0.05,
+    shard_router: Optional[ShardRouter] = None,
+    lease_seconds: float = 60.0
+  ):
+    self.session_factory = session_factory
+    self.shard_router = shard_router
+    self.chunk_size = chunk_size
+    self.pause_seconds = pause_seconds
+    self.lease_seconds = lease_seconds
+
+  async def purge(self, deletion_id: str) -> None:
+    owner = str(uuid.uuid4())
+    while True:
+      async with UnitOfWork(self.session_factory(), shard_router=self.shard_router) as uow:
+        now = datetime.now(timezone.utc)
+        lease_until = now + timedelta(seconds=self.lease_seconds)
+        if not await uow.user_deletions.claim_deletion(deletion_id, owner, now, lease_until):
+          logger.info(f"User deletion {deletion_id} is completed or being purged elsewhere.")
+          return
+        deletion = await uow.user_deletions.get_deletion(deletion_id)
+
+        blogs = await uow.blogs.delete_blogs_by_author(deletion.user_id, self.chunk_size)
+        for blog in blogs:
+          await uow.blog_revisions.delete_blog(blog.id)
+          uow.add_event(BlogDeletedEvent(blog.id, blog.author_id))
+
+        # The timeline has no foreign key to the user, nothing else removes it
+        entries = await uow.timelines.delete_timeline(deletion.user_id, self.chunk_size)
+
+        # A short chunk may only mean blogs were deleted concurrently, the count settles it
+        completed = (
+          len(blogs) < self.chunk_size
+          and entries < self.chunk_size
+          and await uow.blogs.count_blogs_by_author(deletion.user_id) == 0
+        )
+        if completed:
+          await uow.follows.delete_followings(deletion.user_id)
+          await uow.users.delete_user(deletion.user_id)
+        await uow.user_deletions.record_progress(
+          deletion_id,
+          len(blogs),
+          now,
+          completed=completed
+        )
+
+      logger.info(
+        f"User deletion {deletion_id}: {deletion.blogs_deleted + len(blogs)}/{deletion.blogs_total} blogs deleted"
+      )
+      if completed:
+        logger.info(f"User {deletion.user_id} deleted (deletion {deletion_id}).")
+        return
+      await asyncio.sleep(self.pause_seconds)
+
+  async def resume_pending(self) -> int:
+    """Finishes deletions left unfinished, e.g. by a restart while they ran."""
+    async with self.session_factory() as session:
+      deletion_ids = await UnitOfWork(session).user_deletions.get_pending_deletion_ids()
+
+    for deletion_id in deletion_ids:
+      await self.purge(deletion_id)
+    return len(deletion_ids)
@@ -1,15 +1,206 @@
 import logging
 import app.logger
+from contextlib import asynccontextmanager
+from functools import partial
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
 from app.config import config
 from app.api.v1 import register_routes
+from app.auth import purge_expired_sessions
+from app.database.db import SessionLocal
+from app.database.sharding import shard_router
+from app.events import EventBus, OutboxDispatcher, OutboxBroadcaster
+from app.feeds import FeedCache, TimelineFanout, BlogStreamHub
 from app.handlers import register_handlers
+from app.idempotency import IdempotencyMiddleware, InMemoryIdempotencyStore
+from app.jobs import JobRunner, UserContentPurger, maintain_blog_partitions
+from app.related import RelatedBlogsIndexer
+from app.rate_limiting import RateLimiter, create_rate_limit_store
+from app.services import ViewCounter, TrendingTracker, MarkdownRenderer, ImageProcessor
+from app.storage import create_image_storage
+from src.domain.events import BlogEvent, BlogDeletedEvent
 
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+  await app.state.job_runner.start()
+  await app.state.view_counter.start()
+  await app.state.trending_tracker.start()
+  await app.state.outbox_dispatcher.start()
+  await app.state.outbox_broadcaster.start()
+  # Builds the related blogs index if this worker takes its lease
+  app.state.job_runner.enqueue("default", app.state.related_blogs_indexer.run)
+  app.state.job_runner.enqueue("default", app.state.trending_tracker.snapshot)
+  logger.info("Background services started.")
+  yield
+  # Open streams would otherwise keep the server from shutting down
+  app.state.blog_stream_hub.close_all()
+  await app.state.outbox_broadcaster.stop()
+  await app.state.outbox_dispatcher.stop()
+  await app.state.job_runner.stop()
+  await app.state.related_blogs_indexer.stop()
+  await app.state.view_counter.stop()
+  await app.state.trending_tracker.stop()
+  app.state.markdown_renderer.shutdown()
+  app.state.image_processor.shutdown()
+  logger.info("Background services stopped.")
+
 def create_app() -> FastAPI:
-  app = FastAPI(title=config.APP_NAME)
+  app = FastAPI(title=config.APP_NAME, lifespan=lifespan)
+
+  app.state.rate_limiter = RateLimiter(
+    store=create_rate_limit_store(
+      config.RATE_LIMIT_STORAGE_URI,
+      max_keys=config.RATE_LIMIT_MAX_KEYS
+    ),
+    enabled=config.RATE_LIMIT_ENABLED
+  )
+  # Handlers are bound to this app's services, another app must not receive them.
+  # The event bus gets each event on one worker and carries the database side
+  # effects, the broadcast bus gets it on every worker for in-memory state only.
+  app.state.event_bus = EventBus()
+  app.state.broadcast_bus = EventBus()
+  app.state.job_runner = JobRunner(drain_timeout=config.JOB_DRAIN_TIMEOUT_SECONDS)
+  for queue_name, concurrency in config.JOB_QUEUE_CONCURRENCY.items():
+    app.state.job_runner.add_queue(queue_name, concurrency=concurrency, max_size=config.JOB_QUEUE_MAX_SIZE)
+  app.state.job_runner.add_periodic(
+    "purge-expired-auth-sessions",
+    partial(purge_expired_sessions, SessionLocal, config.AUTH_SESSION_PURGE_BATCH_SIZE),
+    interval=config.AUTH_SESSION_PURGE_INTERVAL_SECONDS
+  )
+  app.state.user_content_purger = UserContentPurger(
+    session_factory=SessionLocal,
+    chunk_size=config.USER_DELETION_CHUNK_SIZE,
+    pause_seconds=config.USER_DELETION_CHUNK_PAUSE_SECONDS,
+    shard_router=shard_router,
+    lease_seconds=config.USER_DELETION_LEASE_SECONDS
+  )
+  app.state.job_runner.add_periodic(
+    "resume-user-deletions",
+    app.state.user_content_purger.resume_pending,
+    interval=config.USER_DELETION_RESUME_INTERVAL_SECONDS
+  )
+  blog_databases = shard_router.session_factories if shard_router else {None: SessionLocal}
+  for shard, session_factory in blog_databases.items():
+    app.state.job_runner.add_periodic(
+      f"maintain-blog-partitions:{shard}" if shard else "maintain-blog-partitions",
+      partial(maintain_blog_partitions, session_factory, config.BLOG_PARTITION_MONTHS_AHEAD),
+      interval=config.BLOG_PARTITION_MAINTENANCE_INTERVAL_SECONDS
+    )
+  app.state.view_counter = ViewCounter(
+    session_factory=SessionLocal,
+    flush_interval=config.VIEW_COUNT_FLUSH_INTERVAL_SECONDS,
+    max_pending=config.VIEW_COUNT_MAX_PENDING,
+    shard_router=shard_router
+  )
+  app.state.trending_tracker = TrendingTracker(
+    session_factory=SessionLocal,
+    shard_router=shard_router,
+    half_life_seconds=config.TRENDING_HALF_LIFE_SECONDS,
+    top_k=config.TRENDING_TOP_K,
+    max_tracked=config.TRENDING_MAX_TRACKED,
+    snapshot_size=config.TRENDING_SNAPSHOT_SIZE,
+    queue_size=config.TRENDING_QUEUE_SIZE
+  )
+  app.state.job_runner.add_periodic(
+    "snapshot-trending-blogs",
+    app.state.trending_tracker.snapshot,
+    interval=config.TRENDING_SNAPSHOT_INTERVAL_SECONDS
+  )
+  app.state.event_bus.subscribe(BlogDeletedEvent, app.state.trending_tracker.handle_blog_event)
+  app.state.markdown_renderer = MarkdownRenderer(
+    cache_size=config.MARKDOWN_CACHE_SIZE,
+    max_workers=config.MARKDOWN_RENDER_WORKERS,
+    inline_max_chars=config.MARKDOWN_INLINE_RENDER_MAX_CHARS
+  )
+  app.state.outbox_dispatcher = OutboxDispatcher(
+    session_factory=SessionLocal,
+    event_bus=app.state.event_bus,
+    batch_size=config.OUTBOX_BATCH_SIZE,
+    poll_interval=config.OUTBOX_POLL_INTERVAL_SECONDS,
+    max_attempts=config.OUTBOX_MAX_ATTEMPTS,
+    retry_base_delay=config.OUTBOX_RETRY_BASE_DELAY_SECONDS,
+    retry_max_delay=config.OUTBOX_RETRY_MAX_DELAY_SECONDS,
+    lease_seconds=config.OUTBOX_LEASE_SECONDS,
+    retention_seconds=config.OUTBOX_RETENTION_SECONDS
+  )
+  app.state.job_runner.add_periodic(
+    "prune-outbox",
+    app.state.outbox_dispatcher.prune_dispatched,
+    interval=config.OUTBOX_PRUNE_INTERVAL_SECONDS
+  )
+  app.state.outbox_broadcaster = OutboxBroadcaster(
+    session_factory=SessionLocal,
+    event_bus=app.state.broadcast_bus,
+    batch_size=config.OUTBOX_BATCH_SIZE,
+    poll_interval=config.OUTBOX_BROADCAST_POLL_INTERVAL_SECONDS,
+    gap_timeout=config.OUTBOX_BROADCAST_GAP_TIMEOUT_SECONDS
+  )
+  app.state.feed_cache = FeedCache(
+    max_entries=config.FEED_CACHE_MAX_ENTRIES,
+    max_age_seconds=config.FEED_CACHE_MAX_AGE_SECONDS
+  )
+  app.state.broadcast_bus.subscribe(BlogEvent, app.state.feed_cache.handle_blog_event)
+  app.state.blog_stream_hub = BlogStreamHub(
+    max_subscribers=config.BLOG_STREAM_MAX_SUBSCRIBERS,
+    max_pending=config.BLOG_STREAM_MAX_PENDING_EVENTS,
+    replay_size=config.BLOG_STREAM_REPLAY_SIZE
+  )
+  app.state.broadcast_bus.subscribe(BlogEvent, app.state.blog_stream_hub.handle_blog_event)
+  app.state.timeline_fanout = TimelineFanout(
+    session_factory=SessionLocal,
+    shard_router=shard_router,
+    celebrity_threshold=config.FEED_CELEBRITY_FOLLOWER_THRESHOLD,
+    timeline_length=config.TIMELINE_MAX_LENGTH,
+    batch_size=config.TIMELINE_FANOUT_BATCH_SIZE
+  )
+  app.state.event_bus.subscribe(BlogEvent, app.state.timeline_fanout.handle_blog_event)
+  app.state.related_blogs_indexer = RelatedBlogsIndexer(
+    session_factory=SessionLocal,
+    shard_router=shard_router,
+    top_k=config.RELATED_BLOGS_TOP_K,
+    chunk_size=config.RELATED_BLOGS_CHUNK_SIZE,
+    min_score=config.RELATED_BLOGS_MIN_SCORE,
+    lease_seconds=config.RELATED_BLOGS_LEASE_SECONDS
+  )
+  app.state.event_bus.subscribe(BlogEvent, app.state.related_blogs_indexer.handle_blog_event)
+  app.state.job_runner.add_periodic(
+    "refresh-related-blogs",
+    app.state.related_blogs_indexer.run,
+    interval=config.RELATED_BLOGS_REFRESH_INTERVAL_SECONDS
+  )
+  app.state.job_runner.add_periodic(
+    "rebuild-related-blogs",
+    app.state.related_blogs_indexer.rebuild,
+    interval=config.RELATED_BLOGS_REBUILD_INTERVAL_SECONDS
+  )
+  app.state.image_processor = ImageProcessor(
+    max_workers=config.IMAGE_PROCESS_WORKERS,
+    formats=config.IMAGE_VARIANT_FORMATS,
+    max_pixels=config.IMAGE_MAX_PIXELS
+  )
+  app.state.image_storage = create_image_storage(
+    config.IMAGE_STORAGE_BACKEND,
+    base_url=config.IMAGE_BASE_URL,
+    root_dir=config.IMAGE_STORAGE_DIR,
+    bucket=config.IMAGE_S3_BUCKET,
+    endpoint_url=config.IMAGE_S3_ENDPOINT_URL
+  )
+
+  app.state.idempotency_store = InMemoryIdempotencyStore(
+    ttl_seconds=config.IDEMPOTENCY_TTL_SECONDS,
+    max_keys=config.IDEMPOTENCY_MAX_KEYS
+  )
+  if config.IDEMPOTENCY_ENABLED:
+    app.add_middleware(
+      IdempotencyMiddleware,
+      store=app.state.idempotency_store,
+      excluded_path_prefixes=config.IDEMPOTENCY_EXCLUDED_PATH_PREFIXES,
+      max_response_bytes=config.IDEMPOTENCY_MAX_RESPONSE_BYTES,
+      wait_timeout_seconds=config.IDEMPOTENCY_WAIT_TIMEOUT_SECONDS
+    )
 
   app.add_middleware(
     CORSMiddleware,
@@ -23,6 +214,14 @@ def create_app() -> FastAPI:
   async def health_check():
     return {"status": "ok"}
   
+  # Local images are served by the app itself, object storage serves its own
+  if config.IMAGE_STORAGE_BACKEND == "local" and config.IMAGE_BASE_URL.startswith("/"):
+    app.mount(
+      config.IMAGE_BASE_URL,
+      StaticFiles(directory=config.IMAGE_STORAGE_DIR, check_dir=False),
+      name="media"
+    )
+
   register_routes(app)
   register_handlers(app, logger=logger)
 
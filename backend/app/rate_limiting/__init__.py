@@ -0,0 +1,7 @@
+from .rate_limit_store import (
+  RateLimitStore,
+  InMemoryRateLimitStore,
+  SharedRateLimitStore,
+  create_rate_limit_store
+)
+from .rate_limiter import RateLimiter, RateLimitExceededException
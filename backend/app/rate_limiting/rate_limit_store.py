@@ -0,0 +1,127 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, List, Tuple
+
+from limits import RateLimitItemPerSecond
+from limits.aio.strategies import MovingWindowRateLimiter
+from limits.storage import storage_from_string
+
+
+class RateLimitStore(ABC):
+  @abstractmethod
+  async def consume(
+    self,
+    key: str,
+    capacity: int,
+    refill_per_second: float,
+    cost: int = 1
+  ) -> Tuple[bool, float]:
+    """Take tokens from the bucket identified by key.
+
+    Args:
+      key (str): Identifier of the bucket (e.g. "login:ip:127.0.0.1").
+      capacity (int): Maximum number of tokens the bucket can hold.
+      refill_per_second (float): Tokens added back to the bucket every second.
+      cost (int, optional): Number of tokens to take. Defaults to 1.
+
+    Returns:
+      Tuple[bool, float]: Whether the tokens were taken and, when they were not,
+        the number of seconds until enough tokens are available.
+    """
+    pass
+
+  @abstractmethod
+  async def reset(self) -> None:
+    """Drop every bucket held by the store."""
+    pass
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+  def __init__(
+    self,
+    max_keys: int = 100_000,
+    clock: Callable[[], float] = time.monotonic
+  ):
+    self.max_keys = max_keys
+    self.clock = clock
+    # key -> [tokens, last refill timestamp], least recently used first
+    self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+
+  async def consume(
+    self,
+    key: str,
+    capacity: int,
+    refill_per_second: float,
+    cost: int = 1
+  ) -> Tuple[bool, float]:
+    now = self.clock()
+    bucket = self._buckets.get(key)
+
+    if bucket is None:
+      tokens = float(capacity)
+    else:
+      elapsed = max(0.0, now - bucket[1])
+      tokens = min(float(capacity), bucket[0] + elapsed * refill_per_second)
+      self._buckets.move_to_end(key)
+
+    allowed = tokens >= cost
+    retry_after = 0.0
+    if allowed:
+      tokens -= cost
+    else:
+      retry_after = (cost - tokens) / refill_per_second
+
+    self._buckets[key] = [tokens, now]
+
+    # Idle buckets are the oldest ones and have (mostly) refilled already,
+    # so dropping them first keeps memory flat without loosening the limits.
+    while len(self._buckets) > self.max_keys:
+      self._buckets.popitem(last=False)
+
+    return allowed, retry_after
+
+  async def reset(self) -> None:
+    self._buckets.clear()
+
+  def __len__(self) -> int:
+    return len(self._buckets)
+
+
+class SharedRateLimitStore(RateLimitStore):
+  """Rate limit store backed by a `limits` storage (redis, memcached, mongodb...).
+
+  Shared storages cannot refill buckets atomically, so the token bucket is
+  approximated with a moving window holding `capacity` hits over the time the
+  bucket needs to refill completely.
+  """
+  def __init__(self, storage_uri: str):
+    if not storage_uri.startswith("async+"):
+      storage_uri = f"async+{storage_uri}"
+    self.storage = storage_from_string(storage_uri)
+    self.strategy = MovingWindowRateLimiter(self.storage)
+
+  async def consume(
+    self,
+    key: str,
+    capacity: int,
+    refill_per_second: float,
+    cost: int = 1
+  ) -> Tuple[bool, float]:
+    window = max(1, round(capacity / refill_per_second))
+    item = RateLimitItemPerSecond(capacity, window)
+
+    if await self.strategy.hit(item, key, cost=cost):
+      return True, 0.0
+
+    stats = await self.strategy.get_window_stats(item, key)
+    return False, max(0.0, stats.reset_time - time.time())
+
+  async def reset(self) -> None:
+    await self.storage.reset()
+
+
+def create_rate_limit_store(storage_uri: str, max_keys: int = 100_000) -> RateLimitStore:
+  if storage_uri in ("memory://", "async+memory://"):
+    return InMemoryRateLimitStore(max_keys=max_keys)
+  return SharedRateLimitStore(storage_uri)
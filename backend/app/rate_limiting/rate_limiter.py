@@ -0,0 +1,42 @@
+import logging
+import math
+from functools import lru_cache
+from typing import Tuple
+
+from limits import parse
+
+from .rate_limit_store import RateLimitStore
+
+logger = logging.getLogger(__name__)
+
+class RateLimitExceededException(Exception):
+  def __init__(self, retry_after: float):
+    self.retry_after = max(1, math.ceil(retry_after))
+    super().__init__(f"Too many requests. Retry in {self.retry_after} seconds.")
+
+
+@lru_cache(maxsize=64)
+def parse_rate(rate: str) -> Tuple[int, float]:
+  """Turn a rate such as "5/minute" into a bucket capacity and a refill rate per second."""
+  item = parse(rate)
+  return item.amount, item.amount / item.get_expiry()
+
+
+class RateLimiter:
+  def __init__(self, store: RateLimitStore, enabled: bool = True):
+    self.store = store
+    self.enabled = enabled
+
+  async def hit(self, rate: str, key: str) -> None:
+    if not self.enabled:
+      return
+
+    capacity, refill_per_second = parse_rate(rate)
+    allowed, retry_after = await self.store.consume(key, capacity, refill_per_second)
+
+    if not allowed:
+      logger.warning(f"Rate limit exceeded for key: {key} ({rate})")
+      raise RateLimitExceededException(retry_after)
+
+  async def reset(self) -> None:
+    await self.store.reset()
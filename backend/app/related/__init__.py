@@ -0,0 +1,2 @@
+from .tfidf import TfidfIndex, tokenize, term_counts
+from .related_blogs_indexer import RelatedBlogsIndexer
\ No newline at end of file
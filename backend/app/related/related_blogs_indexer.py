@@ -0,0 +1,159 @@
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Callable, List, Optional, Tuple
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.sharding import ShardRouter
+from app.database.unit_of_work import UnitOfWork
+from src.domain.events import BlogEvent
+from .tfidf import TfidfIndex, term_counts
+
+logger = logging.getLogger(__name__)
+
+LEASE_NAME = "related-blogs-index"
+
+class RelatedBlogsIndexer:
+  """
+  Keeps the related_blogs table in step with the blogs.
+
+  A single worker, the one holding the `related-blogs-index` lease, keeps a
+  TF-IDF index of every blog in memory; the other workers hold none. Blog
+  events on any worker only queue the changed blog in related_blog_refreshes,
+  and `run` on the lease holder rewrites the lists of the queued blogs and of
+  their neighbours from its index. `rebuild` builds a fresh index in two
+  passes over the blogs, `chunk_size` blogs at a time.
+  """
+  def __init__(
+    self,
+    session_factory: Callable[[], AsyncSession],
+    shard_router: Optional[ShardRouter] = None,
+    top_k: int = 5,
+    chunk_size: int = 500,
+    min_score: float = 0.05,
+    max_terms: int = 64,
+    max_document_frequency: float = 0.5,
+    lease_seconds: float = 60.0
+  ):
+    self.session_factory = session_factory
+    self.shard_router = shard_router
+    self.top_k = top_k
+    self.chunk_size = chunk_size
+    self.min_score = min_score
+    self.max_terms = max_terms
+    self.max_document_frequency = max_document_frequency
+    self.lease_seconds = lease_seconds
+    self.worker_id = str(uuid4())
+    self.index: Optional[TfidfIndex] = None
+    self._lock = asyncio.Lock()
+
+  async def handle_blog_event(self, event: BlogEvent) -> None:
+    async with self._unit_of_work() as uow:
+      await uow.related_blogs.request_refresh(event.blog_id)
+
+  async def run(self) -> int:
+    """Applies the queued refreshes if this worker holds the index, building it first if needed."""
+    async with self._lock:
+      if not await self._acquire_lease():
+        return 0
+      if self.index is None:
+        await self._rebuild()
+      return await self._apply_refreshes()
+
+  async def rebuild(self) -> int:
+    async with self._lock:
+      if not await self._acquire_lease():
+        return 0
+      return await self._rebuild()
+
+  async def stop(self) -> None:
+    # Another worker takes the index over without waiting for the lease to end
+    async with self._unit_of_work() as uow:
+      await uow.job_leases.release_lease(LEASE_NAME, self.worker_id)
+    self.index = None
+
+  async def _rebuild(self) -> int:
+    index = TfidfIndex(max_terms=self.max_terms, max_document_frequency=self.max_document_frequency)
+    # Weights depend on the document frequencies of the whole corpus, so the
+    # blogs are read twice rather than all held at once
+    for add_documents in (index.count_documents, index.weigh_documents):
+      async for documents in self._document_chunks():
+        await asyncio.to_thread(add_documents, documents)
+
+    # Only one chunk of neighbour lists is held at a time
+    chunks = index.neighbour_chunks(self.top_k, self.chunk_size, self.min_score)
+    stored = 0
+    while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+      if not await self._acquire_lease():
+        logger.warning("Lost the related blogs lease, abandoning the rebuild.")
+        return stored
+      async with self._unit_of_work() as uow:
+        await uow.related_blogs.replace_related(chunk)
+      stored += len(chunk)
+
+    # Blogs changed during the rebuild are still queued and refreshed next
+    self.index = index
+    logger.info(f"Rebuilt related blogs of {stored} blogs.")
+    return stored
+
+  async def _apply_refreshes(self) -> int:
+    applied = 0
+    while True:
+      if applied and not await self._acquire_lease():
+        return applied
+      async with self._unit_of_work() as uow:
+        blog_ids = await uow.related_blogs.claim_refreshes(self.chunk_size)
+        for blog_id in blog_ids:
+          await self._refresh(uow, blog_id)
+      applied += len(blog_ids)
+
+      if len(blog_ids) < self.chunk_size:
+        return applied
+
+  async def _refresh(self, uow: UnitOfWork, blog_id: str) -> None:
+    blog = await uow.blogs.get_blog_by_id(blog_id)
+
+    if blog is None:
+      affected = await uow.related_blogs.delete_blog(blog_id)
+      self.index.remove(blog_id)
+    else:
+      self.index.upsert(blog.id, term_counts(blog.title, blog.content))
+      affected = [blog.id] + [related_id for related_id, _ in self.index.neighbours(blog.id, self.top_k, self.min_score)]
+
+    await uow.related_blogs.replace_related({
+      affected_id: self.index.neighbours(affected_id, self.top_k, self.min_score)
+      for affected_id in affected
+      if affected_id in self.index
+    })
+
+  async def _acquire_lease(self) -> bool:
+    now = datetime.now(timezone.utc)
+    async with self._unit_of_work() as uow:
+      acquired = await uow.job_leases.acquire_lease(
+        LEASE_NAME,
+        self.worker_id,
+        now,
+        now + timedelta(seconds=self.lease_seconds)
+      )
+
+    if not acquired:
+      # Another worker holds the index, this one keeps no copy of it
+      self.index = None
+    return acquired
+
+  async def _document_chunks(self) -> AsyncIterator[List[Tuple[str, Counter]]]:
+    async with self._unit_of_work() as uow:
+      chunk = []
+      async for blog in uow.blogs.stream_blogs():
+        chunk.append((blog.id, term_counts(blog.title, blog.content)))
+        if len(chunk) == self.chunk_size:
+          yield chunk
+          chunk = []
+      if chunk:
+        yield chunk
+
+  def _unit_of_work(self) -> UnitOfWork:
+    return UnitOfWork(self.session_factory(), shard_router=self.shard_router)
@@ -0,0 +1,139 @@
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Tuple
+
+TOKEN_PATTERN = re.compile(r"[^\W_]{2,}")
+STOP_WORDS = frozenset("""
+  a about after all also an and any are as at be been but by can could do does for from had has have
+  how if in into is it its just more most no not of on one or our out so some than that the their them
+  then there these they this to up was we were what when which who will with would you your
+""".split())
+
+def tokenize(text: str) -> List[str]:
+  return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOP_WORDS]
+
+def term_counts(title: str, content: str, title_weight: int = 3) -> Counter:
+  """Counts the terms of a blog, a term of the title counts `title_weight` times."""
+  counts = Counter(tokenize(content))
+  for token in tokenize(title):
+    counts[token] += title_weight
+  return counts
+
+class TfidfIndex:
+  """
+  Sparse TF-IDF vectors of blogs with an inverted index from each term to the
+  blogs weighting it.
+
+  Vectors keep their `max_terms` heaviest terms and are L2 normalized, so the
+  cosine similarity of a blog to every other one is a sparse matrix-vector
+  product that only visits the blogs sharing a term with it. Terms found in
+  more than `max_document_frequency` of the blogs carry no signal and would
+  make that product visit most of the corpus, so they are left out.
+  """
+  def __init__(self, max_terms: int = 64, max_document_frequency: float = 0.5):
+    self.max_terms = max_terms
+    self.max_document_frequency = max_document_frequency
+    self.document_frequency: Counter = Counter()
+    self.vectors: Dict[str, Dict[str, float]] = {}
+    self._terms: Dict[str, FrozenSet[str]] = {}
+    self._postings: Dict[str, Dict[str, float]] = {}
+
+  def __len__(self) -> int:
+    return len(self._terms)
+
+  def __contains__(self, blog_id: str) -> bool:
+    return blog_id in self._terms
+
+  @classmethod
+  def build(cls, documents: Iterable[Tuple[str, Counter]], **kwargs) -> "TfidfIndex":
+    index = cls(**kwargs)
+    documents = list(documents)
+    index.count_documents(documents)
+    index.weigh_documents(documents)
+    return index
+
+  def count_documents(self, documents: Iterable[Tuple[str, Counter]]) -> None:
+    """First pass of a build: records the terms of each blog in the document frequencies."""
+    for blog_id, document in documents:
+      self._terms[blog_id] = frozenset(document)
+      self.document_frequency.update(self._terms[blog_id])
+
+  def weigh_documents(self, documents: Iterable[Tuple[str, Counter]]) -> None:
+    """
+    Second pass of a build, once every blog was counted: weights depend on
+    the final document frequencies. Blogs the first pass missed are skipped.
+    """
+    for blog_id, document in documents:
+      if blog_id in self._terms:
+        self._set_vector(blog_id, self._weigh(document))
+
+  def upsert(self, blog_id: str, document: Counter) -> None:
+    self.remove(blog_id)
+    self._terms[blog_id] = frozenset(document)
+    self.document_frequency.update(self._terms[blog_id])
+    # Other vectors keep the document frequencies of the last build until the next one
+    self._set_vector(blog_id, self._weigh(document))
+
+  def remove(self, blog_id: str) -> bool:
+    terms = self._terms.pop(blog_id, None)
+    if terms is None:
+      return False
+
+    self.document_frequency.subtract(terms)
+    for term in terms:
+      if self.document_frequency[term] <= 0:
+        del self.document_frequency[term]
+
+    for term in self.vectors.pop(blog_id, {}):
+      postings = self._postings[term]
+      postings.pop(blog_id, None)
+      if not postings:
+        del self._postings[term]
+    return True
+
+  def neighbours(self, blog_id: str, k: int, min_score: float = 0.0) -> List[Tuple[str, float]]:
+    """Returns the `k` blogs most similar to a blog with their cosine similarity, most similar first."""
+    vector = self.vectors.get(blog_id)
+    if not vector:
+      return []
+
+    scores: Dict[str, float] = {}
+    for term, weight in vector.items():
+      for other_id, other_weight in self._postings[term].items():
+        scores[other_id] = scores.get(other_id, 0.0) + weight * other_weight
+    scores.pop(blog_id, None)
+
+    best = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], item[0]))
+    return [(other_id, round(score, 6)) for other_id, score in best if score > min_score]
+
+  def neighbour_chunks(
+    self,
+    k: int,
+    chunk_size: int,
+    min_score: float = 0.0
+  ) -> Iterator[Dict[str, List[Tuple[str, float]]]]:
+    """Yields the neighbours of every blog, `chunk_size` blogs at a time."""
+    blog_ids = list(self.vectors)
+    for start in range(0, len(blog_ids), chunk_size):
+      yield {blog_id: self.neighbours(blog_id, k, min_score) for blog_id in blog_ids[start:start + chunk_size]}
+
+  def _weigh(self, document: Counter) -> Dict[str, float]:
+    documents = len(self._terms)
+    weights = {}
+    for term, count in document.items():
+      frequency = self.document_frequency[term]
+      if frequency > 1 and frequency > self.max_document_frequency * documents:
+        continue
+      # Sublinear term frequency times smoothed inverse document frequency
+      weights[term] = (1 + math.log(count)) * (math.log((1 + documents) / (1 + frequency)) + 1)
+
+    heaviest = heapq.nlargest(self.max_terms, weights.items(), key=lambda item: item[1])
+    norm = math.sqrt(sum(weight * weight for _, weight in heaviest))
+    return {term: weight / norm for term, weight in heaviest} if norm else {}
+
+  def _set_vector(self, blog_id: str, vector: Dict[str, float]) -> None:
+    self.vectors[blog_id] = vector
+    for term, weight in vector.items():
+      self._postings.setdefault(term, {})[blog_id] = weight
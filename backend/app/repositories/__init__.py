@@ -1,2 +1,15 @@
 from .user_repository import UserRepository
-from .blog_repository import BlogRepository
\ No newline at end of file
+from .blog_repository import BlogRepository
+from .blog_view_repository import BlogViewRepository
+from .sharded_blog_repository import ShardedBlogRepository
+from .sharded_blog_view_repository import ShardedBlogViewRepository
+from .author_stats_repository import AuthorStatsRepository
+from .outbox_repository import OutboxRepository
+from .auth_session_repository import AuthSessionRepository
+from .user_deletion_repository import UserDeletionRepository
+from .related_blog_repository import RelatedBlogRepository
+from .trending_score_repository import TrendingScoreRepository
+from .follow_repository import FollowRepository
+from .timeline_repository import TimelineRepository
+from .blog_revision_repository import BlogRevisionRepository
+from .job_lease_repository import JobLeaseRepository
\ No newline at end of file
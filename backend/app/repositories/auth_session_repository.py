@@ -0,0 +1,90 @@
+from app.database.mappers import auth_session_entity_to_model, auth_session_model_to_entity
+from app.database.models import AuthSessionModel
+
+from src.domain.entities import AuthSessionEntity
+from src.application.repositories import IAuthSessionRepository
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete
+from datetime import datetime
+from typing import Optional
+
+
+class AuthSessionRepository(IAuthSessionRepository):
+  def __init__(self, db_session: AsyncSession):
+    self.session = db_session
+
+
+  async def create_session(self, auth_session: AuthSessionEntity) -> AuthSessionEntity:
+    auth_session_model = auth_session_entity_to_model(auth_session)
+    self.session.add(auth_session_model)
+    await self.session.flush()
+
+    return auth_session_model_to_entity(auth_session_model)
+
+
+  async def get_session(self, session_id: str) -> Optional[AuthSessionEntity]:
+    auth_session_model = await self.session.get(AuthSessionModel, session_id)
+
+    if auth_session_model:
+      return auth_session_model_to_entity(auth_session_model)
+
+    return None
+
+
+  async def rotate_tokens(
+    self,
+    session_id: str,
+    refresh_token_id: str,
+    new_access_token_id: str,
+    new_refresh_token_id: str,
+    expires_at: datetime
+  ) -> bool:
+    stmt = (
+      update(AuthSessionModel)
+      .where(
+        AuthSessionModel.id == session_id,
+        AuthSessionModel.refresh_token_id == refresh_token_id
+      )
+      .values(
+        access_token_id=new_access_token_id,
+        refresh_token_id=new_refresh_token_id,
+        expires_at=expires_at
+      )
+      .execution_options(synchronize_session=False)
+    )
+    result = await self.session.execute(stmt)
+
+    return result.rowcount == 1
+
+
+  async def delete_session(self, session_id: str) -> bool:
+    result = await self.session.execute(
+      delete(AuthSessionModel).where(AuthSessionModel.id == session_id)
+    )
+
+    return result.rowcount > 0
+
+
+  async def delete_user_sessions(self, user_id: str) -> int:
+    result = await self.session.execute(
+      delete(AuthSessionModel).where(AuthSessionModel.user_id == user_id)
+    )
+
+    return result.rowcount
+
+
+  async def delete_expired(self, now: datetime, limit: int) -> int:
+    # Bounded batches keep each delete transaction short under a large backlog
+    expired_ids = (
+      select(AuthSessionModel.id)
+      .where(AuthSessionModel.expires_at <= now)
+      .limit(limit)
+    )
+    result = await self.session.execute(
+      delete(AuthSessionModel)
+      .where(AuthSessionModel.id.in_(expired_ids))
+      .execution_options(synchronize_session=False)
+    )
+
+    return result.rowcount
@@ -0,0 +1,108 @@
+from app.database.mappers import author_stats_model_to_entity
+from app.database.models import AuthorStatsModel, BlogModel
+from app.database.upsert import upsert
+
+from src.domain.entities import AuthorStatsEntity
+from src.application.repositories import IAuthorStatsRepository
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete, insert, case, func
+from datetime import datetime
+from typing import Optional
+
+
+class AuthorStatsRepository(IAuthorStatsRepository):
+  def __init__(self, db_session: AsyncSession):
+    self.session = db_session
+
+
+  async def get_stats(self, author_id: str) -> Optional[AuthorStatsEntity]:
+    stmt = (
+      select(AuthorStatsModel)
+      .where(AuthorStatsModel.author_id == author_id)
+      .execution_options(populate_existing=True)
+    )
+    stats_model = (await self.session.execute(stmt)).scalar_one_or_none()
+
+    if stats_model:
+      return author_stats_model_to_entity(stats_model)
+
+    return None
+
+
+  async def record_post(self, author_id: str, posted_at: datetime) -> None:
+    stmt = upsert(self.session, AuthorStatsModel).values(
+      author_id=author_id,
+      post_count=1,
+      last_posted_at=posted_at
+    )
+    stmt = stmt.on_conflict_do_update(
+      index_elements=[AuthorStatsModel.author_id],
+      set_={
+        "post_count": AuthorStatsModel.post_count + 1,
+        "last_posted_at": case(
+          (
+            AuthorStatsModel.last_posted_at.is_(None)
+            | (AuthorStatsModel.last_posted_at < stmt.excluded.last_posted_at),
+            stmt.excluded.last_posted_at
+          ),
+          else_=AuthorStatsModel.last_posted_at
+        ),
+        "updated_at": func.now()
+      }
+    )
+
+    await self.session.execute(stmt)
+    await self.session.flush()
+
+
+  async def record_deletion(self, author_id: str) -> None:
+    # Served by the (author_id, created_at) index, so this stays cheap for prolific authors
+    latest_post = (
+      select(func.max(BlogModel.created_at))
+      .where(BlogModel.author_id == author_id)
+      .scalar_subquery()
+    )
+    stmt = (
+      update(AuthorStatsModel)
+      .where(AuthorStatsModel.author_id == author_id)
+      .values(
+        post_count=case(
+          (AuthorStatsModel.post_count > 0, AuthorStatsModel.post_count - 1),
+          else_=0
+        ),
+        last_posted_at=latest_post
+      )
+      .execution_options(synchronize_session=False)
+    )
+
+    await self.session.execute(stmt)
+    await self.session.flush()
+
+
+  async def rebuild(self, author_id: Optional[str] = None) -> int:
+    delete_stmt = delete(AuthorStatsModel)
+    aggregate = select(
+      BlogModel.author_id,
+      func.count(BlogModel.id),
+      func.max(BlogModel.created_at)
+    ).group_by(BlogModel.author_id)
+
+    if author_id:
+      delete_stmt = delete_stmt.where(AuthorStatsModel.author_id == author_id)
+      aggregate = aggregate.where(BlogModel.author_id == author_id)
+
+    await self.session.execute(delete_stmt.execution_options(synchronize_session=False))
+    await self.session.execute(
+      insert(AuthorStatsModel).from_select(
+        ["author_id", "post_count", "last_posted_at"],
+        aggregate
+      )
+    )
+    await self.session.flush()
+
+    count_stmt = select(func.count()).select_from(AuthorStatsModel)
+    if author_id:
+      count_stmt = count_stmt.where(AuthorStatsModel.author_id == author_id)
+
+    return (await self.session.execute(count_stmt)).scalar_one()
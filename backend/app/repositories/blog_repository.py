@@ -1,13 +1,16 @@
 from app.database.mappers import blog_entity_to_model, blog_model_to_entity
-from app.database.models import BlogModel
+from app.database.models import BlogModel, BlogTagModel, TagCountModel
+from app.database.upsert import upsert
 
-from src.domain.exceptions import NotFoundException
+from src.domain.exceptions import NotFoundException, ConflictException
 from src.domain.entities.blog_entity import BlogEntity
 from src.application.repositories import IBlogRepository
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from typing import List, Optional, Tuple
+from sqlalchemy import Select, select, insert, update, delete, func, case, null
+from collections import Counter
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 
 class BlogRepository(IBlogRepository):
@@ -20,12 +23,14 @@ class BlogRepository(IBlogRepository):
 
     self.session.add(blog_model)
     await self.session.flush()
+    await self._index_tags(blog_model.id, blog.tags, stored=[])
 
     return blog_model_to_entity(blog_model)
 
 
   async def get_blog_by_id(self, blog_id: str) -> Optional[BlogEntity]:
-    blog_model = await self.session.get(BlogModel, blog_id)
+    # A comparison, unlike session.get, lets an id that is not a UUID find nothing
+    blog_model = (await self.session.scalars(select(BlogModel).where(BlogModel.id == blog_id))).one_or_none()
 
     if blog_model:
       return blog_model_to_entity(blog_model)
@@ -33,22 +38,40 @@ class BlogRepository(IBlogRepository):
     return None
 
 
+  async def get_blogs_by_ids(self, blog_ids: List[str]) -> List[BlogEntity]:
+    if not blog_ids:
+      return []
+
+    blog_models = (await self.session.scalars(select(BlogModel).where(BlogModel.id.in_(blog_ids)))).all()
+    by_id = {blog_model.id: blog_model for blog_model in blog_models}
+
+    return [blog_model_to_entity(by_id[blog_id]) for blog_id in blog_ids if blog_id in by_id]
+
+
   async def get_all_blogs(
     self,
     skip: int = 0,
     limit: int = 10,
-    search: Optional[str] = None
+    search: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    tags: Optional[List[str]] = None,
+    match_all_tags: bool = True
   ) -> Tuple[List[BlogEntity], int]:
 
-    stmt = select(BlogModel)
+    stmt = self._created_between(select(BlogModel), created_after, created_before)
 
     if search:
       stmt = stmt.where(BlogModel.title.ilike(f"%{search}%"))
 
+    if tags:
+      stmt = self._tagged(stmt, tags, match_all_tags)
+
     count_stmt = select(func.count()).select_from(stmt.subquery())
     total = (await self.session.execute(count_stmt)).scalar_one()
 
-    stmt = stmt.offset(skip).limit(limit)
+    # A total order, so pages from several shards can be merged
+    stmt = stmt.order_by(BlogModel.created_at.desc(), BlogModel.id.desc()).offset(skip).limit(limit)
 
     result = await self.session.execute(stmt)
     blogs = result.scalars().all()
@@ -61,10 +84,16 @@ class BlogRepository(IBlogRepository):
     author_id: str,
     skip: int = 0,
     limit: int = 10,
-    search: str | None = None
+    search: str | None = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None
   ) -> Tuple[List[BlogEntity], int]:
 
-    stmt = select(BlogModel).where(BlogModel.author_id == author_id)
+    stmt = self._created_between(
+      select(BlogModel).where(BlogModel.author_id == author_id),
+      created_after,
+      created_before
+    )
 
     if search:
       stmt = stmt.where(BlogModel.title.ilike(f"%{search}%"))
@@ -72,7 +101,8 @@ class BlogRepository(IBlogRepository):
     count_stmt = select(func.count()).select_from(stmt.subquery())
     total = (await self.session.execute(count_stmt)).scalar_one()
 
-    stmt = stmt.offset(skip).limit(limit)
+    # A total order keeps pages stable while rows are rewritten between requests
+    stmt = stmt.order_by(BlogModel.created_at.desc(), BlogModel.id.desc()).offset(skip).limit(limit)
 
     result = await self.session.execute(stmt)
     blogs = result.scalars().all()
@@ -82,27 +112,239 @@ class BlogRepository(IBlogRepository):
 
   async def update_blog(self, blog_id: str, blog: BlogEntity) -> BlogEntity:
 
-    existing_blog = await self.session.get(BlogModel, blog_id)
+    values = {field: value for field, value in blog.to_dict().items() if field not in ("id", "created_at", "version")}
+    values["version"] = blog.version + 1
 
-    if not existing_blog:
-      raise NotFoundException("Blog", f"blog_id: {blog_id}")
+    # Compare-and-set on the version: one statement, no row lock held between read and write
+    stmt = (
+      update(BlogModel)
+      .where(BlogModel.id == blog_id, BlogModel.version == blog.version)
+      .values(**values)
+      .execution_options(synchronize_session=False)
+    )
+    result = await self.session.execute(stmt)
 
-    for field in blog.to_dict():
-      setattr(existing_blog, field, getattr(blog, field))
+    if result.rowcount != 1:
+      exists = await self.session.scalar(select(BlogModel.id).where(BlogModel.id == blog_id))
+      if not exists:
+        raise NotFoundException("Blog", f"blog_id: {blog_id}")
+      raise ConflictException("Blog", f"blog_id: {blog_id}")
 
-    await self.session.flush()
+    await self._index_tags(blog_id, blog.tags)
+
+    return BlogEntity(**{**blog.to_dict(), **values})
+
+
+  async def update_owned_blog(
+    self,
+    blog_id: str,
+    author_id: str,
+    changes: Dict[str, Any],
+    expected_version: Optional[int] = None
+  ) -> Optional[BlogEntity]:
+
+    values = dict(changes)
+    values.setdefault("updated_at", datetime.now())
+    values["version"] = BlogModel.version + 1
+
+    # Variants belong to the stored image, they only survive when the image is unchanged
+    if "hero_image" in values and "hero_image_variants" not in values:
+      values["hero_image_variants"] = case(
+        (BlogModel.hero_image == values["hero_image"], BlogModel.hero_image_variants),
+        else_=null()
+      )
+
+    stmt = update(BlogModel).where(BlogModel.id == blog_id, BlogModel.author_id == author_id)
+    if expected_version is not None:
+      stmt = stmt.where(BlogModel.version == expected_version)
+
+    stmt = (
+      stmt.values(**values)
+      .returning(BlogModel)
+      .execution_options(populate_existing=True)
+    )
+    blog_model = (await self.session.execute(stmt)).scalars().one_or_none()
+
+    if blog_model and "tags" in changes:
+      await self._index_tags(blog_id, blog_model.tags)
+
+    return blog_model_to_entity(blog_model) if blog_model else None
+
+
+  async def delete_owned_blog(self, blog_id: str, author_id: str) -> bool:
+
+    stmt = (
+      delete(BlogModel)
+      .where(BlogModel.id == blog_id, BlogModel.author_id == author_id)
+      .execution_options(synchronize_session=False)
+    )
+    result = await self.session.execute(stmt)
+
+    if result.rowcount != 1:
+      return False
 
-    return blog_model_to_entity(existing_blog)
+    await self._unindex_tags([blog_id])
+    return True
 
 
   async def delete_blog(self, blog_id: str) -> bool:
 
-    blog_model = await self.session.get(BlogModel, blog_id)
+    blog_model = (await self.session.scalars(select(BlogModel).where(BlogModel.id == blog_id))).one_or_none()
 
     if not blog_model:
       raise NotFoundException("Blog", f"blog_id: {blog_id}")
 
     await self.session.delete(blog_model)
     await self.session.flush()
+    await self._unindex_tags([blog_id])
 
-    return True
\ No newline at end of file
+    return True
+
+
+  async def stream_blogs(
+    self,
+    author_id: Optional[str] = None,
+    limit: Optional[int] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None
+  ) -> AsyncIterator[BlogEntity]:
+
+    stmt = self._created_between(
+      select(BlogModel).order_by(BlogModel.created_at.desc(), BlogModel.id.desc()),
+      created_after,
+      created_before
+    )
+
+    if author_id:
+      stmt = stmt.where(BlogModel.author_id == author_id)
+
+    if limit:
+      stmt = stmt.limit(limit)
+
+    result = await self.session.stream_scalars(stmt.execution_options(yield_per=100))
+    async for blog in result:
+      yield blog_model_to_entity(blog)
+
+
+  async def stream_blog_updates(self, limit: Optional[int] = None) -> AsyncIterator[Tuple[str, datetime]]:
+
+    stmt = select(BlogModel.id, BlogModel.updated_at).order_by(BlogModel.updated_at.desc())
+
+    if limit:
+      stmt = stmt.limit(limit)
+
+    result = await self.session.stream(stmt.execution_options(yield_per=1000))
+    async for blog_id, updated_at in result:
+      yield blog_id, updated_at
+
+
+  async def count_blogs_by_author(self, author_id: str) -> int:
+    stmt = select(func.count()).select_from(BlogModel).where(BlogModel.author_id == author_id)
+    return (await self.session.execute(stmt)).scalar_one()
+
+
+  async def delete_blogs_by_author(self, author_id: str, limit: int) -> List[BlogEntity]:
+    stmt = (
+      select(BlogModel)
+      .where(BlogModel.author_id == author_id)
+      .order_by(BlogModel.id)
+      .limit(limit)
+    )
+    blog_models = (await self.session.execute(stmt)).scalars().all()
+    if not blog_models:
+      return []
+
+    # Blogs deleted concurrently since the select are not counted or announced twice
+    deleted_ids = set((await self.session.execute(
+      delete(BlogModel)
+      .where(BlogModel.id.in_([blog_model.id for blog_model in blog_models]))
+      .returning(BlogModel.id)
+      .execution_options(synchronize_session=False)
+    )).scalars().all())
+    blogs = [blog_model_to_entity(blog_model) for blog_model in blog_models if blog_model.id in deleted_ids]
+    for blog_model in blog_models:
+      self.session.expunge(blog_model)
+    await self._unindex_tags([blog.id for blog in blogs])
+
+    return blogs
+
+
+  async def get_tag_counts(self, tags: Optional[List[str]] = None, limit: int = 20) -> Dict[str, int]:
+    # Read from the counters kept by the writes, never aggregated from blog_tags
+    stmt = select(TagCountModel.tag, TagCountModel.blog_count).where(TagCountModel.blog_count > 0)
+
+    if tags:
+      stmt = stmt.where(TagCountModel.tag.in_(tags))
+    else:
+      stmt = stmt.order_by(TagCountModel.blog_count.desc(), TagCountModel.tag).limit(limit)
+
+    result = await self.session.execute(stmt)
+    return {tag: blog_count for tag, blog_count in result.all()}
+
+
+  async def _index_tags(self, blog_id: str, tags: List[str], stored: Optional[List[str]] = None) -> None:
+    if stored is None:
+      stored = (await self.session.scalars(select(BlogTagModel.tag).where(BlogTagModel.blog_id == blog_id))).all()
+
+    added = [tag for tag in tags if tag not in stored]
+    removed = [tag for tag in stored if tag not in tags]
+
+    if removed:
+      await self.session.execute(
+        delete(BlogTagModel)
+        .where(BlogTagModel.blog_id == blog_id, BlogTagModel.tag.in_(removed))
+        .execution_options(synchronize_session=False)
+      )
+    if added:
+      await self.session.execute(insert(BlogTagModel), [{"tag": tag, "blog_id": blog_id} for tag in added])
+
+    await self._count_tags({**{tag: 1 for tag in added}, **{tag: -1 for tag in removed}})
+
+
+  async def _unindex_tags(self, blog_ids: List[str]) -> None:
+    removed = (await self.session.scalars(
+      delete(BlogTagModel)
+      .where(BlogTagModel.blog_id.in_(blog_ids))
+      .returning(BlogTagModel.tag)
+      .execution_options(synchronize_session=False)
+    )).all()
+
+    await self._count_tags({tag: -count for tag, count in Counter(removed).items()})
+
+
+  async def _count_tags(self, deltas: Dict[str, int]) -> None:
+    if not deltas:
+      return
+
+    # Sorted so concurrent writers lock the counter rows in the same order
+    stmt = upsert(self.session, TagCountModel).values([
+      {"tag": tag, "blog_count": delta} for tag, delta in sorted(deltas.items())
+    ])
+    stmt = stmt.on_conflict_do_update(
+      index_elements=[TagCountModel.tag],
+      set_={
+        "blog_count": TagCountModel.blog_count + stmt.excluded.blog_count,
+        "updated_at": func.now()
+      }
+    )
+    await self.session.execute(stmt)
+
+
+  @staticmethod
+  def _created_between(stmt: Select, created_after: Optional[datetime], created_before: Optional[datetime]) -> Select:
+    # Bounds on the partition key let PostgreSQL skip every monthly partition outside them
+    if created_after:
+      stmt = stmt.where(BlogModel.created_at >= created_after)
+    if created_before:
+      stmt = stmt.where(BlogModel.created_at < created_before)
+    return stmt
+
+
+  @staticmethod
+  def _tagged(stmt: Select, tags: List[str], match_all: bool) -> Select:
+    # Each subquery is a range scan of the (tag, blog_id) primary key of blog_tags
+    if match_all:
+      for tag in tags:
+        stmt = stmt.where(BlogModel.id.in_(select(BlogTagModel.blog_id).where(BlogTagModel.tag == tag)))
+      return stmt
+    return stmt.where(BlogModel.id.in_(select(BlogTagModel.blog_id).where(BlogTagModel.tag.in_(tags))))
@@ -0,0 +1,128 @@
+from app.database.models import BlogRevisionModel
+from app.revisions import encode_delta, apply_delta, encode_full, decode_full
+
+from src.domain.entities import BlogEntity, BlogRevisionEntity
+from src.application.repositories import IBlogRevisionRepository
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, delete, func
+from typing import List, Optional, Tuple
+
+
+class BlogRevisionRepository(IBlogRevisionRepository):
+  """
+  Revisions stored as a keyframe every `keyframe_interval` versions and
+  compressed deltas to the previous version in between, so reading any
+  revision decodes at most `keyframe_interval` rows.
+  """
+
+  def __init__(self, db_session: AsyncSession, keyframe_interval: int = 20):
+    self.session = db_session
+    self.keyframe_interval = keyframe_interval
+
+
+  async def add_revision(self, blog: BlogEntity) -> None:
+    chain = await self._get_chain(blog.id, blog.version - 1)
+    full = encode_full(blog.content)
+    data, is_keyframe = full, True
+
+    # Versions written without a revision break the chain, which restarts at a keyframe
+    if chain and len(chain) < self.keyframe_interval:
+      delta = encode_delta(self._rebuild(chain), blog.content)
+      if len(delta) < len(full):
+        data, is_keyframe = delta, False
+
+    await self.session.execute(insert(BlogRevisionModel).values(
+      blog_id=blog.id,
+      version=blog.version,
+      title=blog.title,
+      is_keyframe=is_keyframe,
+      data=data,
+      content_length=len(blog.content),
+      created_at=blog.updated_at
+    ))
+
+
+  async def get_revisions(self, blog_id: str, skip: int = 0, limit: int = 10) -> Tuple[List[BlogRevisionEntity], int]:
+    count_stmt = select(func.count()).select_from(BlogRevisionModel).where(BlogRevisionModel.blog_id == blog_id)
+    total = (await self.session.execute(count_stmt)).scalar_one()
+
+    # Only metadata, the data column is never read for a listing
+    stmt = (
+      select(
+        BlogRevisionModel.version,
+        BlogRevisionModel.title,
+        BlogRevisionModel.content_length,
+        BlogRevisionModel.created_at
+      )
+      .where(BlogRevisionModel.blog_id == blog_id)
+      .order_by(BlogRevisionModel.version.desc())
+      .offset(skip)
+      .limit(limit)
+    )
+    rows = (await self.session.execute(stmt)).all()
+
+    return [
+      BlogRevisionEntity(blog_id, version, title, content_length, created_at)
+      for version, title, content_length, created_at in rows
+    ], total
+
+
+  async def get_revision(self, blog_id: str, version: int) -> Optional[BlogRevisionEntity]:
+    chain = await self._get_chain(blog_id, version)
+    if not chain:
+      return None
+
+    revision = chain[-1]
+    return BlogRevisionEntity(
+      blog_id,
+      revision.version,
+      revision.title,
+      revision.content_length,
+      revision.created_at,
+      content=self._rebuild(chain)
+    )
+
+
+  async def delete_blog(self, blog_id: str) -> None:
+    await self.session.execute(
+      delete(BlogRevisionModel)
+      .where(BlogRevisionModel.blog_id == blog_id)
+      .execution_options(synchronize_session=False)
+    )
+
+
+  async def _get_chain(self, blog_id: str, version: int) -> List[BlogRevisionModel]:
+    """The rows from the last keyframe up to a version, empty if that version or its keyframe is missing."""
+    keyframe = (
+      select(func.max(BlogRevisionModel.version))
+      .where(
+        BlogRevisionModel.blog_id == blog_id,
+        BlogRevisionModel.version <= version,
+        BlogRevisionModel.is_keyframe.is_(True)
+      )
+      .scalar_subquery()
+    )
+    stmt = (
+      select(BlogRevisionModel)
+      .where(
+        BlogRevisionModel.blog_id == blog_id,
+        BlogRevisionModel.version >= keyframe,
+        BlogRevisionModel.version <= version
+      )
+      .order_by(BlogRevisionModel.version)
+    )
+    chain = list((await self.session.scalars(stmt)).all())
+
+    # A gap means a delta lost its base, the version cannot be rebuilt
+    if not chain or chain[-1].version != version or len(chain) != version - chain[0].version + 1:
+      return []
+    return chain
+
+
+  @staticmethod
+  def _rebuild(chain: List[BlogRevisionModel]) -> str:
+    content = decode_full(chain[0].data)
+    for revision in chain[1:]:
+      content = apply_delta(content, revision.data)
+    return content
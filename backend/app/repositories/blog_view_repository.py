@@ -0,0 +1,64 @@
+from app.database.models import BlogModel, BlogViewModel
+from app.database.upsert import upsert
+
+from src.application.repositories import IBlogViewRepository
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, exists, func
+from typing import Dict, List
+
+
+class BlogViewRepository(IBlogViewRepository):
+  def __init__(self, db_session: AsyncSession):
+    self.session = db_session
+
+
+  async def get_views(self, blog_ids: List[str]) -> Dict[str, int]:
+    if not blog_ids:
+      return {}
+
+    stmt = select(BlogViewModel.blog_id, BlogViewModel.views).where(
+      BlogViewModel.blog_id.in_(blog_ids)
+    )
+    result = await self.session.execute(stmt)
+
+    return {blog_id: views for blog_id, views in result.all()}
+
+
+  async def increment_views(self, counts: Dict[str, int]) -> List[str]:
+    if not counts:
+      return []
+
+    # Blogs may have been deleted since the views were buffered
+    existing_stmt = select(BlogModel.id).where(BlogModel.id.in_(list(counts)))
+    existing_ids = (await self.session.execute(existing_stmt)).scalars().all()
+
+    # Sorted so concurrent flushes lock the view rows in the same order
+    rows = [{"blog_id": blog_id, "views": counts[blog_id]} for blog_id in sorted(existing_ids)]
+    if not rows:
+      return []
+
+    stmt = upsert(self.session, BlogViewModel).values(rows)
+    stmt = stmt.on_conflict_do_update(
+      index_elements=[BlogViewModel.blog_id],
+      set_={
+        "views": BlogViewModel.views + stmt.excluded.views,
+        "updated_at": func.now()
+      }
+    )
+
+    await self.session.execute(stmt)
+    await self.session.flush()
+
+    return list(existing_ids)
+
+
+  async def delete_orphaned_views(self) -> int:
+    stmt = (
+      delete(BlogViewModel)
+      .where(~exists().where(BlogModel.id == BlogViewModel.blog_id))
+      .execution_options(synchronize_session=False)
+    )
+    result = await self.session.execute(stmt)
+
+    return result.rowcount
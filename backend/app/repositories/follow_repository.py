@@ -0,0 +1,128 @@
+from app.database.mappers import user_model_to_entity
+from app.database.models import FollowModel, FollowerCountModel, UserModel
+from app.database.upsert import upsert
+
+from src.domain.entities.user_entity import UserEntity
+from src.application.repositories import IFollowRepository
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, update, func
+from typing import List, Optional, Tuple
+
+
+class FollowRepository(IFollowRepository):
+  def __init__(self, db_session: AsyncSession):
+    self.session = db_session
+
+
+  async def follow(self, follower_id: str, followee_id: str) -> bool:
+    stmt = (
+      upsert(self.session, FollowModel)
+      .values(follower_id=follower_id, followee_id=followee_id)
+      .on_conflict_do_nothing(index_elements=[FollowModel.follower_id, FollowModel.followee_id])
+      .returning(FollowModel.follower_id)
+    )
+    followed = (await self.session.execute(stmt)).scalar_one_or_none() is not None
+
+    if followed:
+      await self._count_followers(followee_id, 1)
+    return followed
+
+
+  async def unfollow(self, follower_id: str, followee_id: str) -> bool:
+    stmt = (
+      delete(FollowModel)
+      .where(FollowModel.follower_id == follower_id, FollowModel.followee_id == followee_id)
+      .returning(FollowModel.follower_id)
+      .execution_options(synchronize_session=False)
+    )
+    unfollowed = (await self.session.execute(stmt)).scalar_one_or_none() is not None
+
+    if unfollowed:
+      await self._count_followers(followee_id, -1)
+    return unfollowed
+
+
+  async def delete_followings(self, user_id: str) -> int:
+    stmt = (
+      delete(FollowModel)
+      .where(FollowModel.follower_id == user_id)
+      .returning(FollowModel.followee_id)
+      .execution_options(synchronize_session=False)
+    )
+    followee_ids = sorted((await self.session.scalars(stmt)).all())
+
+    # The deleted rows say whose counts to lower, so a concurrent unfollow never lowers one twice
+    for start in range(0, len(followee_ids), 1000):
+      await self.session.execute(
+        update(FollowerCountModel)
+        .where(FollowerCountModel.user_id.in_(followee_ids[start:start + 1000]))
+        .values(follower_count=FollowerCountModel.follower_count - 1, updated_at=func.now())
+        .execution_options(synchronize_session=False)
+      )
+    return len(followee_ids)
+
+
+  async def get_follower_count(self, user_id: str) -> int:
+    # Read from the counter kept by follow and unfollow, never counted from follows
+    stmt = select(FollowerCountModel.follower_count).where(FollowerCountModel.user_id == user_id)
+    return (await self.session.execute(stmt)).scalar_one_or_none() or 0
+
+
+  async def get_follower_ids(self, user_id: str, after: Optional[str] = None, limit: int = 1000) -> List[str]:
+    # Keyset pages of the (followee_id, follower_id) index, however many followers there are
+    stmt = select(FollowModel.follower_id).where(FollowModel.followee_id == user_id)
+
+    if after:
+      stmt = stmt.where(FollowModel.follower_id > after)
+
+    stmt = stmt.order_by(FollowModel.follower_id).limit(limit)
+    return list((await self.session.scalars(stmt)).all())
+
+
+  async def get_followee_ids(self, user_id: str, min_followers: int = 0) -> List[str]:
+    stmt = select(FollowModel.followee_id).where(FollowModel.follower_id == user_id)
+
+    if min_followers > 0:
+      stmt = stmt.join(FollowerCountModel, FollowerCountModel.user_id == FollowModel.followee_id).where(
+        FollowerCountModel.follower_count >= min_followers
+      )
+
+    return list((await self.session.scalars(stmt)).all())
+
+
+  async def get_followers(self, user_id: str, skip: int = 0, limit: int = 10) -> Tuple[List[UserEntity], int]:
+    return await self._get_users(FollowModel.follower_id, FollowModel.followee_id == user_id, skip, limit)
+
+
+  async def get_following(self, user_id: str, skip: int = 0, limit: int = 10) -> Tuple[List[UserEntity], int]:
+    return await self._get_users(FollowModel.followee_id, FollowModel.follower_id == user_id, skip, limit)
+
+
+  async def _get_users(self, user_column, condition, skip: int, limit: int) -> Tuple[List[UserEntity], int]:
+    count_stmt = select(func.count()).select_from(FollowModel).where(condition)
+    total = (await self.session.execute(count_stmt)).scalar_one()
+
+    stmt = (
+      select(UserModel)
+      .join(FollowModel, UserModel.id == user_column)
+      .where(condition)
+      .order_by(FollowModel.created_at.desc(), UserModel.id)
+      .offset(skip)
+      .limit(limit)
+    )
+    users = (await self.session.scalars(stmt)).all()
+
+    return [user_model_to_entity(user) for user in users], total
+
+
+  async def _count_followers(self, user_id: str, delta: int) -> None:
+    stmt = upsert(self.session, FollowerCountModel).values(user_id=user_id, follower_count=delta)
+    stmt = stmt.on_conflict_do_update(
+      index_elements=[FollowerCountModel.user_id],
+      set_={
+        "follower_count": FollowerCountModel.follower_count + stmt.excluded.follower_count,
+        "updated_at": func.now()
+      }
+    )
+    await self.session.execute(stmt)
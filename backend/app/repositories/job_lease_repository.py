@@ -0,0 +1,33 @@
+from app.database.models import JobLeaseModel
+from app.database.upsert import upsert
+
+from src.application.repositories import IJobLeaseRepository
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, or_
+from datetime import datetime
+
+
+class JobLeaseRepository(IJobLeaseRepository):
+  def __init__(self, db_session: AsyncSession):
+    self.session = db_session
+
+
+  async def acquire_lease(self, name: str, owner: str, now: datetime, lease_until: datetime) -> bool:
+    # A held lease only moves to another owner once it has ended
+    stmt = upsert(self.session, JobLeaseModel).values(name=name, owner=owner, lease_until=lease_until)
+    stmt = stmt.on_conflict_do_update(
+      index_elements=[JobLeaseModel.name],
+      set_={"owner": stmt.excluded.owner, "lease_until": stmt.excluded.lease_until},
+      where=or_(JobLeaseModel.lease_until < now, JobLeaseModel.owner == owner)
+    ).returning(JobLeaseModel.owner)
+
+    return (await self.session.execute(stmt)).scalar_one_or_none() == owner
+
+
+  async def release_lease(self, name: str, owner: str) -> None:
+    await self.session.execute(
+      delete(JobLeaseModel)
+      .where(JobLeaseModel.name == name, JobLeaseModel.owner == owner)
+      .execution_options(synchronize_session=False)
+    )
@@ -0,0 +1,130 @@
+from app.database.models import OutboxModel
+
+from src.application.dto import OutboxMessageDTO
+from src.application.repositories import IOutboxRepository
+
+from datetime import datetime, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete, func, or_
+from typing import Collection, List
+
+
+class OutboxRepository(IOutboxRepository):
+  def __init__(self, db_session: AsyncSession):
+    self.session = db_session
+
+
+  async def add_events(self, events: List[object]) -> None:
+    if not events:
+      return
+
+    now = datetime.now(timezone.utc)
+    self.session.add_all([
+      OutboxModel(
+        event_type=event.name,
+        payload=event.to_dict(),
+        attempts=0,
+        available_at=now
+      )
+      for event in events
+    ])
+    await self.session.flush()
+
+
+  async def claim_batch(
+    self,
+    limit: int,
+    max_attempts: int,
+    lease_until: datetime
+  ) -> List[OutboxMessageDTO]:
+    # SKIP LOCKED lets several workers drain the outbox without blocking each other
+    stmt = (
+      select(OutboxModel)
+      .where(
+        OutboxModel.dispatched_at.is_(None),
+        OutboxModel.available_at <= datetime.now(timezone.utc),
+        OutboxModel.attempts < max_attempts
+      )
+      .order_by(OutboxModel.id)
+      .limit(limit)
+      .with_for_update(skip_locked=True)
+    )
+    messages = (await self.session.execute(stmt)).scalars().all()
+    if not messages:
+      return []
+
+    await self.session.execute(
+      update(OutboxModel)
+      .where(OutboxModel.id.in_([message.id for message in messages]))
+      .values(available_at=lease_until, attempts=OutboxModel.attempts + 1)
+      .execution_options(synchronize_session=False)
+    )
+
+    return [
+      OutboxMessageDTO(
+        id=message.id,
+        event_type=message.event_type,
+        payload=message.payload,
+        attempts=message.attempts + 1
+      )
+      for message in messages
+    ]
+
+
+  async def complete(self, message_ids: List[int], dispatched_at: datetime) -> None:
+    if not message_ids:
+      return
+
+    await self.session.execute(
+      update(OutboxModel)
+      .where(OutboxModel.id.in_(message_ids))
+      .values(dispatched_at=dispatched_at)
+      .execution_options(synchronize_session=False)
+    )
+
+
+  async def retry_later(self, message_id: int, available_at: datetime, error: str) -> None:
+    await self.session.execute(
+      update(OutboxModel)
+      .where(OutboxModel.id == message_id)
+      .values(available_at=available_at, last_error=error[:1000])
+    )
+
+
+  async def get_last_id(self) -> int:
+    return await self.session.scalar(select(func.coalesce(func.max(OutboxModel.id), 0)))
+
+
+  async def list_messages(self, after_id: int, limit: int, ids: Collection[int] = ()) -> List[OutboxMessageDTO]:
+    condition = OutboxModel.id > after_id
+    if ids:
+      condition = or_(condition, OutboxModel.id.in_(list(ids)))
+
+    stmt = select(OutboxModel).where(condition).order_by(OutboxModel.id).limit(limit)
+    messages = (await self.session.execute(stmt)).scalars().all()
+
+    return [
+      OutboxMessageDTO(
+        id=message.id,
+        event_type=message.event_type,
+        payload=message.payload,
+        attempts=message.attempts
+      )
+      for message in messages
+    ]
+
+
+  async def delete_dispatched(self, dispatched_before: datetime, limit: int) -> int:
+    # Bounded batches keep each delete transaction short under a large backlog
+    dispatched_ids = (
+      select(OutboxModel.id)
+      .where(OutboxModel.dispatched_at < dispatched_before)
+      .limit(limit)
+    )
+    result = await self.session.execute(
+      delete(OutboxModel)
+      .where(OutboxModel.id.in_(dispatched_ids))
+      .execution_options(synchronize_session=False)
+    )
+
+    return result.rowcount
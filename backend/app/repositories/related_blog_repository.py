@@ -0,0 +1,75 @@
+from app.database.models import RelatedBlogModel, RelatedBlogRefreshModel
+from app.database.upsert import upsert
+
+from src.application.repositories import IRelatedBlogRepository
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, delete, or_
+from typing import Dict, List, Tuple
+
+
+class RelatedBlogRepository(IRelatedBlogRepository):
+  def __init__(self, db_session: AsyncSession):
+    self.session = db_session
+
+
+  async def get_related_ids(self, blog_id: str, limit: int = 5) -> List[str]:
+    # Served by the (blog_id, score) index alone
+    stmt = (
+      select(RelatedBlogModel.related_blog_id)
+      .where(RelatedBlogModel.blog_id == blog_id)
+      .order_by(RelatedBlogModel.score.desc(), RelatedBlogModel.related_blog_id)
+      .limit(limit)
+    )
+    return list((await self.session.scalars(stmt)).all())
+
+
+  async def replace_related(self, related: Dict[str, List[Tuple[str, float]]]) -> None:
+    if not related:
+      return
+
+    await self.session.execute(
+      delete(RelatedBlogModel)
+      .where(RelatedBlogModel.blog_id.in_(list(related)))
+      .execution_options(synchronize_session=False)
+    )
+
+    rows = [
+      {"blog_id": blog_id, "related_blog_id": related_blog_id, "score": score}
+      for blog_id, neighbours in related.items()
+      for related_blog_id, score in neighbours
+    ]
+    if rows:
+      await self.session.execute(insert(RelatedBlogModel), rows)
+
+
+  async def delete_blog(self, blog_id: str) -> List[str]:
+    stmt = (
+      delete(RelatedBlogModel)
+      .where(or_(RelatedBlogModel.blog_id == blog_id, RelatedBlogModel.related_blog_id == blog_id))
+      .returning(RelatedBlogModel.blog_id)
+      .execution_options(synchronize_session=False)
+    )
+    referencing = (await self.session.scalars(stmt)).all()
+
+    return sorted(set(referencing) - {blog_id})
+
+
+  async def request_refresh(self, blog_id: str) -> None:
+    stmt = upsert(self.session, RelatedBlogRefreshModel).values(blog_id=blog_id)
+    await self.session.execute(stmt.on_conflict_do_nothing(index_elements=[RelatedBlogRefreshModel.blog_id]))
+
+
+  async def claim_refreshes(self, limit: int) -> List[str]:
+    oldest = (
+      select(RelatedBlogRefreshModel.blog_id)
+      .order_by(RelatedBlogRefreshModel.requested_at)
+      .limit(limit)
+    )
+    stmt = (
+      delete(RelatedBlogRefreshModel)
+      .where(RelatedBlogRefreshModel.blog_id.in_(oldest.scalar_subquery()))
+      .returning(RelatedBlogRefreshModel.blog_id)
+      .execution_options(synchronize_session=False)
+    )
+    return list((await self.session.scalars(stmt)).all())
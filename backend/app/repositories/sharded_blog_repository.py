@@ -0,0 +1,173 @@
+from app.database.sharding import (
+  ShardSessions,
+  gather_shards,
+  merge_sorted,
+  merge_sorted_streams
+)
+from app.repositories.blog_repository import BlogRepository
+
+from src.domain.exceptions import NotFoundException
+from src.domain.entities.blog_entity import BlogEntity
+from src.application.repositories import IBlogRepository
+
+from collections import Counter
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+
+def _newest_first(blog: BlogEntity) -> Tuple[datetime, str]:
+  return blog.created_at, blog.id
+
+
+class ShardedBlogRepository(IBlogRepository):
+  """
+  Blogs spread across shards by author. Queries that know the author go to
+  one shard; the others scatter to every shard and merge the results.
+  """
+
+  def __init__(self, sessions: ShardSessions):
+    self.sessions = sessions
+
+
+  def _shard(self, author_id: str) -> BlogRepository:
+    return BlogRepository(self.sessions.for_key(author_id))
+
+
+  async def _find_shard(self, blog_id: str) -> Optional[BlogRepository]:
+    found = await gather_shards(self.sessions, lambda session: BlogRepository(session).get_blog_by_id(blog_id))
+    for session, blog in zip(self.sessions.all(), found):
+      if blog:
+        return BlogRepository(session)
+    return None
+
+
+  async def create_blog(self, blog: BlogEntity) -> BlogEntity:
+    return await self._shard(blog.author_id).create_blog(blog)
+
+
+  async def get_blog_by_id(self, blog_id: str) -> Optional[BlogEntity]:
+    found = await gather_shards(self.sessions, lambda session: BlogRepository(session).get_blog_by_id(blog_id))
+    return next((blog for blog in found if blog), None)
+
+
+  async def get_blogs_by_ids(self, blog_ids: List[str]) -> List[BlogEntity]:
+    found = await gather_shards(self.sessions, lambda session: BlogRepository(session).get_blogs_by_ids(blog_ids))
+    by_id = {blog.id: blog for blogs in found for blog in blogs}
+    return [by_id[blog_id] for blog_id in blog_ids if blog_id in by_id]
+
+
+  async def get_all_blogs(
+    self,
+    skip: int = 0,
+    limit: int = 10,
+    search: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    tags: Optional[List[str]] = None,
+    match_all_tags: bool = True
+  ) -> Tuple[List[BlogEntity], int]:
+
+    # Any shard may hold the whole page, so each returns its first skip + limit blogs
+    pages = await gather_shards(self.sessions, lambda session: BlogRepository(session).get_all_blogs(
+      skip=0,
+      limit=skip + limit,
+      search=search,
+      created_after=created_after,
+      created_before=created_before,
+      tags=tags,
+      match_all_tags=match_all_tags
+    ))
+
+    merged = merge_sorted([blogs for blogs, _ in pages], key=_newest_first, reverse=True)
+    return merged[skip:skip + limit], sum(total for _, total in pages)
+
+
+  async def get_all_blogs_by_author(
+    self,
+    author_id: str,
+    skip: int = 0,
+    limit: int = 10,
+    search: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None
+  ) -> Tuple[List[BlogEntity], int]:
+    return await self._shard(author_id).get_all_blogs_by_author(
+      author_id,
+      skip=skip,
+      limit=limit,
+      search=search,
+      created_after=created_after,
+      created_before=created_before
+    )
+
+
+  async def update_blog(self, blog_id: str, blog: BlogEntity) -> BlogEntity:
+    return await self._shard(blog.author_id).update_blog(blog_id, blog)
+
+
+  async def update_owned_blog(
+    self,
+    blog_id: str,
+    author_id: str,
+    changes: Dict[str, Any],
+    expected_version: Optional[int] = None
+  ) -> Optional[BlogEntity]:
+    return await self._shard(author_id).update_owned_blog(blog_id, author_id, changes, expected_version)
+
+
+  async def delete_owned_blog(self, blog_id: str, author_id: str) -> bool:
+    return await self._shard(author_id).delete_owned_blog(blog_id, author_id)
+
+
+  async def delete_blog(self, blog_id: str) -> bool:
+    repository = await self._find_shard(blog_id)
+    if not repository:
+      raise NotFoundException("Blog", f"blog_id: {blog_id}")
+    return await repository.delete_blog(blog_id)
+
+
+  def stream_blogs(
+    self,
+    author_id: Optional[str] = None,
+    limit: Optional[int] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None
+  ) -> AsyncIterator[BlogEntity]:
+
+    if author_id:
+      return self._shard(author_id).stream_blogs(author_id, limit, created_after, created_before)
+
+    streams = [
+      BlogRepository(session).stream_blogs(None, limit, created_after, created_before)
+      for session in self.sessions.all()
+    ]
+    return merge_sorted_streams(streams, key=_newest_first, reverse=True, limit=limit)
+
+
+  def stream_blog_updates(self, limit: Optional[int] = None) -> AsyncIterator[Tuple[str, datetime]]:
+    streams = [BlogRepository(session).stream_blog_updates(limit) for session in self.sessions.all()]
+    return merge_sorted_streams(streams, key=lambda update: update[1], reverse=True, limit=limit)
+
+
+  async def count_blogs_by_author(self, author_id: str) -> int:
+    return await self._shard(author_id).count_blogs_by_author(author_id)
+
+
+  async def delete_blogs_by_author(self, author_id: str, limit: int) -> List[BlogEntity]:
+    return await self._shard(author_id).delete_blogs_by_author(author_id, limit)
+
+
+  async def get_tag_counts(self, tags: Optional[List[str]] = None, limit: int = 20) -> Dict[str, int]:
+    top = not tags
+    if top:
+      # Candidates are the top tags of each shard, a tag just below every shard's top can be missed
+      candidates = await gather_shards(self.sessions, lambda session: BlogRepository(session).get_tag_counts(limit=limit))
+      tags = sorted({tag for counts in candidates for tag in counts})
+      if not tags:
+        return {}
+
+    totals = Counter()
+    for counts in await gather_shards(self.sessions, lambda session: BlogRepository(session).get_tag_counts(tags)):
+      totals.update(counts)
+
+    return dict(sorted(totals.items(), key=lambda item: (-item[1], item[0]))[:limit]) if top else dict(totals)
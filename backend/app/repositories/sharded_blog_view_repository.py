@@ -0,0 +1,32 @@
+from app.database.sharding import ShardSessions, gather_shards
+from app.repositories.blog_view_repository import BlogViewRepository
+
+from src.application.repositories import IBlogViewRepository
+
+from typing import Dict, List
+
+
+class ShardedBlogViewRepository(IBlogViewRepository):
+  """View counts kept next to their blogs, on whichever shard holds each blog."""
+
+  def __init__(self, sessions: ShardSessions):
+    self.sessions = sessions
+
+
+  async def get_views(self, blog_ids: List[str]) -> Dict[str, int]:
+    if not blog_ids:
+      return {}
+
+    found = await gather_shards(self.sessions, lambda session: BlogViewRepository(session).get_views(blog_ids))
+    return {blog_id: views for shard_views in found for blog_id, views in shard_views.items()}
+
+
+  async def increment_views(self, counts: Dict[str, int]) -> List[str]:
+    # Each shard only keeps the counts of the blogs it holds and ignores the rest
+    counted = await gather_shards(self.sessions, lambda session: BlogViewRepository(session).increment_views(counts))
+    return [blog_id for shard_counted in counted for blog_id in shard_counted]
+
+
+  async def delete_orphaned_views(self) -> int:
+    deleted = await gather_shards(self.sessions, lambda session: BlogViewRepository(session).delete_orphaned_views())
+    return sum(deleted)
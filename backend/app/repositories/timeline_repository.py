@@ -0,0 +1,109 @@
+from app.database.models import TimelineEntryModel
+from app.database.upsert import upsert
+
+from src.domain.entities.blog_entity import BlogEntity
+from src.application.repositories import ITimelineRepository
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, func, and_, or_, tuple_
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+
+class TimelineRepository(ITimelineRepository):
+  def __init__(self, db_session: AsyncSession):
+    self.session = db_session
+
+
+  async def add_blog(self, user_ids: List[str], blog: BlogEntity, max_length: int) -> None:
+    await self._add_entries([
+      {"user_id": user_id, "blog_id": blog.id, "author_id": blog.author_id, "created_at": blog.created_at}
+      for user_id in user_ids
+    ], user_ids, max_length)
+
+
+  async def add_blogs(self, user_id: str, blogs: List[BlogEntity], max_length: int) -> None:
+    await self._add_entries([
+      {"user_id": user_id, "blog_id": blog.id, "author_id": blog.author_id, "created_at": blog.created_at}
+      for blog in blogs
+    ], [user_id], max_length)
+
+
+  async def get_entries(
+    self,
+    user_id: str,
+    limit: int = 10,
+    before: Optional[Tuple[datetime, str]] = None
+  ) -> List[Tuple[str, datetime]]:
+
+    stmt = select(TimelineEntryModel.blog_id, TimelineEntryModel.created_at).where(TimelineEntryModel.user_id == user_id)
+
+    if before:
+      created_at, blog_id = before
+      stmt = stmt.where(or_(
+        TimelineEntryModel.created_at < created_at,
+        and_(TimelineEntryModel.created_at == created_at, TimelineEntryModel.blog_id < blog_id)
+      ))
+
+    stmt = stmt.order_by(TimelineEntryModel.created_at.desc(), TimelineEntryModel.blog_id.desc()).limit(limit)
+    return [tuple(row) for row in (await self.session.execute(stmt)).all()]
+
+
+  async def delete_blog(self, blog_id: str) -> None:
+    await self.session.execute(
+      delete(TimelineEntryModel)
+      .where(TimelineEntryModel.blog_id == blog_id)
+      .execution_options(synchronize_session=False)
+    )
+
+
+  async def delete_author(self, user_id: str, author_id: str) -> None:
+    await self.session.execute(
+      delete(TimelineEntryModel)
+      .where(TimelineEntryModel.user_id == user_id, TimelineEntryModel.author_id == author_id)
+      .execution_options(synchronize_session=False)
+    )
+
+
+  async def delete_timeline(self, user_id: str, limit: Optional[int] = None) -> int:
+    stmt = delete(TimelineEntryModel).where(TimelineEntryModel.user_id == user_id)
+
+    if limit is not None:
+      stmt = stmt.where(TimelineEntryModel.blog_id.in_(
+        select(TimelineEntryModel.blog_id).where(TimelineEntryModel.user_id == user_id).limit(limit)
+      ))
+
+    result = await self.session.execute(stmt.execution_options(synchronize_session=False))
+    return result.rowcount
+
+
+  async def _add_entries(self, rows: List[dict], user_ids: List[str], max_length: int) -> None:
+    if not rows:
+      return
+
+    # A retried fan-out pushes the same entries again
+    await self.session.execute(
+      upsert(self.session, TimelineEntryModel)
+      .values(rows)
+      .on_conflict_do_nothing(index_elements=[TimelineEntryModel.user_id, TimelineEntryModel.blog_id])
+    )
+
+    ranked = (
+      select(
+        TimelineEntryModel.user_id,
+        TimelineEntryModel.blog_id,
+        func.row_number().over(
+          partition_by=TimelineEntryModel.user_id,
+          order_by=(TimelineEntryModel.created_at.desc(), TimelineEntryModel.blog_id.desc())
+        ).label("position")
+      )
+      .where(TimelineEntryModel.user_id.in_(user_ids))
+      .subquery()
+    )
+    await self.session.execute(
+      delete(TimelineEntryModel)
+      .where(tuple_(TimelineEntryModel.user_id, TimelineEntryModel.blog_id).in_(
+        select(ranked.c.user_id, ranked.c.blog_id).where(ranked.c.position > max_length)
+      ))
+      .execution_options(synchronize_session=False)
+    )
@@ -0,0 +1,49 @@
+from app.database.models import TrendingScoreModel
+
+from src.application.repositories import ITrendingScoreRepository
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, delete
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+
+class TrendingScoreRepository(ITrendingScoreRepository):
+  def __init__(self, db_session: AsyncSession):
+    self.session = db_session
+
+
+  async def replace_worker_scores(self, worker_id: str, scores: Dict[str, float], decayed_at: datetime) -> None:
+    await self.session.execute(
+      delete(TrendingScoreModel)
+      .where(TrendingScoreModel.worker_id == worker_id)
+      .execution_options(synchronize_session=False)
+    )
+
+    if scores:
+      await self.session.execute(insert(TrendingScoreModel), [
+        {"worker_id": worker_id, "blog_id": blog_id, "score": score, "decayed_at": decayed_at}
+        for blog_id, score in scores.items()
+      ])
+
+
+  async def get_scores(self) -> List[Tuple[str, float, datetime]]:
+    stmt = select(TrendingScoreModel.blog_id, TrendingScoreModel.score, TrendingScoreModel.decayed_at)
+    return [tuple(row) for row in (await self.session.execute(stmt)).all()]
+
+
+  async def delete_scores_before(self, decayed_before: datetime) -> int:
+    result = await self.session.execute(
+      delete(TrendingScoreModel)
+      .where(TrendingScoreModel.decayed_at < decayed_before)
+      .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+  async def delete_blog(self, blog_id: str) -> None:
+    await self.session.execute(
+      delete(TrendingScoreModel)
+      .where(TrendingScoreModel.blog_id == blog_id)
+      .execution_options(synchronize_session=False)
+    )
@@ -0,0 +1,106 @@
+from app.database.mappers import user_deletion_entity_to_model, user_deletion_model_to_entity
+from app.database.models import UserDeletionModel
+
+from src.domain.entities import UserDeletionEntity, UserDeletionStatus
+from src.application.repositories import IUserDeletionRepository
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, or_
+from datetime import datetime
+from typing import List, Optional
+
+
+class UserDeletionRepository(IUserDeletionRepository):
+  def __init__(self, db_session: AsyncSession):
+    self.session = db_session
+
+
+  async def create_deletion(self, user_deletion: UserDeletionEntity) -> UserDeletionEntity:
+    user_deletion_model = user_deletion_entity_to_model(user_deletion)
+    self.session.add(user_deletion_model)
+    await self.session.flush()
+
+    return user_deletion_model_to_entity(user_deletion_model)
+
+
+  async def get_deletion(self, deletion_id: str) -> Optional[UserDeletionEntity]:
+    stmt = (
+      select(UserDeletionModel)
+      .where(UserDeletionModel.id == deletion_id)
+      .execution_options(populate_existing=True)
+    )
+    user_deletion_model = (await self.session.scalars(stmt)).one_or_none()
+
+    if user_deletion_model:
+      return user_deletion_model_to_entity(user_deletion_model)
+
+    return None
+
+
+  async def get_pending_deletion_for_user(self, user_id: str) -> Optional[UserDeletionEntity]:
+    stmt = select(UserDeletionModel).where(
+      UserDeletionModel.user_id == user_id,
+      UserDeletionModel.status == UserDeletionStatus.PENDING.value
+    )
+    user_deletion_model = (await self.session.execute(stmt)).scalars().first()
+
+    if user_deletion_model:
+      return user_deletion_model_to_entity(user_deletion_model)
+
+    return None
+
+
+  async def get_pending_deletion_ids(self, limit: int = 100) -> List[str]:
+    stmt = (
+      select(UserDeletionModel.id)
+      .where(UserDeletionModel.status == UserDeletionStatus.PENDING.value)
+      .order_by(UserDeletionModel.created_at)
+      .limit(limit)
+    )
+    return list((await self.session.execute(stmt)).scalars().all())
+
+
+  async def claim_deletion(self, deletion_id: str, owner: str, now: datetime, lease_until: datetime) -> bool:
+    # One conditional UPDATE, concurrent claims serialize on the row and only one matches
+    stmt = (
+      update(UserDeletionModel)
+      .where(
+        UserDeletionModel.id == deletion_id,
+        UserDeletionModel.status == UserDeletionStatus.PENDING.value,
+        or_(
+          UserDeletionModel.lease_until.is_(None),
+          UserDeletionModel.lease_until < now,
+          UserDeletionModel.lease_owner == owner
+        )
+      )
+      .values(lease_owner=owner, lease_until=lease_until)
+      .execution_options(synchronize_session=False)
+    )
+    result = await self.session.execute(stmt)
+    return result.rowcount == 1
+
+
+  async def record_progress(
+    self,
+    deletion_id: str,
+    blogs_deleted: int,
+    now: datetime,
+    completed: bool = False
+  ) -> None:
+    values = {
+      "blogs_deleted": UserDeletionModel.blogs_deleted + blogs_deleted,
+      "updated_at": now,
+    }
+    if completed:
+      values["status"] = UserDeletionStatus.COMPLETED.value
+      values["completed_at"] = now
+      values["lease_owner"] = None
+      values["lease_until"] = None
+
+    stmt = (
+      update(UserDeletionModel)
+      .where(UserDeletionModel.id == deletion_id)
+      .values(**values)
+      .execution_options(synchronize_session=False)
+    )
+    await self.session.execute(stmt)
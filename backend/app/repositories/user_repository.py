@@ -1,13 +1,14 @@
 from app.database.mappers import user_entity_to_model, user_model_to_entity
 from app.database.models import UserModel
 
-from src.domain.exceptions import NotFoundException
+from src.domain.exceptions import NotFoundException, ConflictException
 from src.domain.entities.user_entity import UserEntity
 from src.application.repositories import IUserRepository
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_
-from typing import Optional, Tuple, List
+from sqlalchemy import select, update, func, or_, case, null
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple, List
 
 
 class UserRepository(IUserRepository):
@@ -26,7 +27,8 @@ class UserRepository(IUserRepository):
 
 
   async def get_user_by_id(self, user_id: str) -> Optional[UserEntity]:
-    user_model = await self.session.get(UserModel, user_id)
+    # A comparison, unlike session.get, lets an id that is not a UUID find nothing
+    user_model = (await self.session.scalars(select(UserModel).where(UserModel.id == user_id))).one_or_none()
 
     if user_model:
       return user_model_to_entity(user_model)
@@ -76,19 +78,60 @@ class UserRepository(IUserRepository):
 
 
   async def update_user(self, user_id: str, user: UserEntity) -> UserEntity:
-    existing_user = await self.session.get(UserModel, user_id)
+    values = {field: value for field, value in user.to_dict().items() if field not in ("id", "created_at", "version")}
+    values["version"] = user.version + 1
+
+    stmt = (
+      update(UserModel)
+      .where(UserModel.id == user_id, UserModel.version == user.version)
+      .values(**values)
+      .execution_options(synchronize_session=False)
+    )
+    result = await self.session.execute(stmt)
+
+    if result.rowcount != 1:
+      exists = await self.session.scalar(select(UserModel.id).where(UserModel.id == user_id))
+      if not exists:
+        raise NotFoundException("User", f"user_id: {user_id}")
+      raise ConflictException("User", f"user_id: {user_id}")
+
+    return UserEntity(**{**user.to_dict(), **values})
+
+
+  async def update_user_fields(
+    self,
+    user_id: str,
+    changes: Dict[str, Any],
+    expected_version: Optional[int] = None
+  ) -> Optional[UserEntity]:
+
+    values = dict(changes)
+    values.setdefault("updated_at", datetime.now(timezone.utc))
+    values["version"] = UserModel.version + 1
+
+    # Variants belong to the stored avatar, they only survive when the avatar is unchanged
+    if "avatar" in values and "avatar_variants" not in values:
+      values["avatar_variants"] = case(
+        (UserModel.avatar == values["avatar"], UserModel.avatar_variants),
+        else_=null()
+      )
 
-    if not existing_user:
-      raise NotFoundException("User", f"user_id: {user_id}")
+    stmt = update(UserModel).where(UserModel.id == user_id)
+    if expected_version is not None:
+      stmt = stmt.where(UserModel.version == expected_version)
 
-    for field, value in user.to_dict().items():
-      setattr(existing_user, field, value)
+    stmt = (
+      stmt.values(**values)
+      .returning(UserModel)
+      .execution_options(populate_existing=True)
+    )
+    user_model = (await self.session.execute(stmt)).scalars().one_or_none()
 
-    return user_model_to_entity(existing_user)
+    return user_model_to_entity(user_model) if user_model else None
 
 
   async def delete_user(self, user_id: str) -> bool:
-    user_model = await self.session.get(UserModel, user_id)
+    user_model = (await self.session.scalars(select(UserModel).where(UserModel.id == user_id))).one_or_none()
 
     if not user_model:
       return False
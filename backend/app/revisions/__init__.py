@@ -0,0 +1 @@
+from .text_delta import encode_delta, apply_delta, encode_full, decode_full
@@ -0,0 +1,96 @@
+import zlib
+from difflib import SequenceMatcher
+from typing import Iterator, List, Tuple
+
+FORMAT_VERSION = 1
+COPY = ord("C")
+INSERT = ord("I")
+# Replaced blocks up to this many characters are diffed again character by character
+CHARACTER_DIFF_MAX_CHARS = 4096
+
+def _write_varint(out: bytearray, value: int) -> None:
+  while value >= 0x80:
+    out.append((value & 0x7F) | 0x80)
+    value >>= 7
+  out.append(value)
+
+def _read_varint(data: bytes, position: int) -> Tuple[int, int]:
+  value = shift = 0
+  while True:
+    byte = data[position]
+    position += 1
+    value |= (byte & 0x7F) << shift
+    if byte < 0x80:
+      return value, position
+    shift += 7
+
+def _line_offsets(lines: List[str]) -> List[int]:
+  offsets = [0]
+  for line in lines:
+    offsets.append(offsets[-1] + len(line))
+  return offsets
+
+def _operations(base: str, target: str) -> Iterator[Tuple[int, int, str]]:
+  """Yields (base start, base length, inserted text) operations rebuilding `target` in order."""
+  base_lines = base.splitlines(keepends=True)
+  target_lines = target.splitlines(keepends=True)
+  base_offsets = _line_offsets(base_lines)
+  target_offsets = _line_offsets(target_lines)
+
+  for tag, i1, i2, j1, j2 in SequenceMatcher(None, base_lines, target_lines).get_opcodes():
+    start, end = base_offsets[i1], base_offsets[i2]
+    inserted = target[target_offsets[j1]:target_offsets[j2]]
+
+    if tag == "equal":
+      yield start, end - start, ""
+    elif tag == "replace" and (end - start) + len(inserted) <= CHARACTER_DIFF_MAX_CHARS:
+      # A small edit inside a long line only stores the changed characters
+      for char_tag, k1, k2, l1, l2 in SequenceMatcher(None, base[start:end], inserted, autojunk=False).get_opcodes():
+        if char_tag == "equal":
+          yield start + k1, k2 - k1, ""
+        elif l2 > l1:
+          yield 0, 0, inserted[l1:l2]
+    elif inserted:
+      yield 0, 0, inserted
+
+def encode_full(text: str) -> bytes:
+  return zlib.compress(text.encode())
+
+def decode_full(data: bytes) -> str:
+  return zlib.decompress(data).decode()
+
+def encode_delta(base: str, target: str) -> bytes:
+  """Compressed copy/insert instructions turning `base` into `target`."""
+  out = bytearray([FORMAT_VERSION])
+  for start, length, inserted in _operations(base, target):
+    if length:
+      out.append(COPY)
+      _write_varint(out, start)
+      _write_varint(out, length)
+    else:
+      payload = inserted.encode()
+      out.append(INSERT)
+      _write_varint(out, len(payload))
+      out += payload
+  return zlib.compress(bytes(out))
+
+def apply_delta(base: str, delta: bytes) -> str:
+  data = zlib.decompress(delta)
+  if not data or data[0] != FORMAT_VERSION:
+    raise ValueError("Unsupported text delta format.")
+
+  pieces = []
+  position = 1
+  while position < len(data):
+    operation = data[position]
+    if operation == COPY:
+      start, position = _read_varint(data, position + 1)
+      length, position = _read_varint(data, position)
+      pieces.append(base[start:start + length])
+    elif operation == INSERT:
+      length, position = _read_varint(data, position + 1)
+      pieces.append(data[position:position + length].decode())
+      position += length
+    else:
+      raise ValueError(f"Unknown text delta operation: {operation}")
+  return "".join(pieces)
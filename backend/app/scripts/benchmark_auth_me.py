@@ -0,0 +1,79 @@
+import argparse
+import os
+import tempfile
+import time
+
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.auth import token_cache
+from app.database.db import Base, get_db
+from app.database.models import UserModel
+from app.main import app
+from app.services import PasswordHasher
+
+USERNAME = "benchmark"
+PASSWORD = "Benchmark.123"
+
+async def measure(client: AsyncClient, headers: dict, requests: int) -> float:
+  """Returns the CPU seconds spent per `/v1/auth/me` request."""
+  start = time.process_time()
+  for _ in range(requests):
+    response = await client.get("/v1/auth/me", headers=headers)
+    response.raise_for_status()
+  return (time.process_time() - start) / requests
+
+async def run_benchmark(requests: int):
+  with tempfile.TemporaryDirectory() as directory:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(directory, 'bench.db')}")
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+    async with engine.begin() as connection:
+      await connection.run_sync(Base.metadata.create_all)
+    async with session_factory() as session:
+      session.add(UserModel(
+        id="benchmark-user",
+        first_name="Bench",
+        last_name="Mark",
+        username=USERNAME,
+        password=PasswordHasher().hash(PASSWORD)
+      ))
+      await session.commit()
+
+    async def override_get_db():
+      async with session_factory() as session:
+        yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    await app.state.rate_limiter.reset()
+    try:
+      async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        login = await client.post("/v1/auth/login", data={"username": USERNAME, "password": PASSWORD})
+        login.raise_for_status()
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        token_cache.enabled = False
+        await measure(client, headers, min(requests, 50))
+        uncached = await measure(client, headers, requests)
+
+        token_cache.enabled = True
+        token_cache.clear()
+        await measure(client, headers, min(requests, 50))
+        cached = await measure(client, headers, requests)
+    finally:
+      app.dependency_overrides.clear()
+      await engine.dispose()
+
+  print(f"⏱️  /v1/auth/me over {requests} requests (CPU time per request)")
+  print(f"   without token cache: {uncached * 1e6:9.1f} µs")
+  print(f"   with token cache:    {cached * 1e6:9.1f} µs")
+  print(f"   saved:               {(uncached - cached) * 1e6:9.1f} µs ({(1 - cached / uncached) * 100:.1f}%)")
+  print(f"   cache stats: {token_cache.stats()}")
+
+if __name__ == "__main__":
+  import asyncio
+
+  parser = argparse.ArgumentParser(description="Measure the CPU saved by the token verification cache.")
+  parser.add_argument("--requests", type=int, default=2000, help="Requests per measurement.")
+  args = parser.parse_args()
+
+  asyncio.run(run_benchmark(args.requests))
@@ -0,0 +1,123 @@
+import argparse
+import os
+import tempfile
+import time
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database.db import Base
+from app.database.models import BlogModel, UserModel
+from app.database.unit_of_work import UnitOfWork
+from src.domain.exceptions import NotFoundException, UnauthorizedException
+
+AUTHOR_ID = "benchmark-author"
+
+async def read_then_update(uow: UnitOfWork, blog_id: str, iteration: int):
+  blog = await uow.blogs.get_blog_by_id(blog_id)
+  if not blog:
+    raise NotFoundException("Blog", f"blog_id: {blog_id}")
+  if blog.author_id != AUTHOR_ID:
+    raise UnauthorizedException("You are not authorized to update this blog.")
+  blog.title = f"Benchmark title {iteration}"
+  await uow.blogs.update_blog(blog_id, blog)
+
+async def owned_update(uow: UnitOfWork, blog_id: str, iteration: int):
+  await uow.blogs.update_owned_blog(blog_id, AUTHOR_ID, {"title": f"Benchmark title {iteration}"})
+
+async def read_then_delete(uow: UnitOfWork, blog_id: str, iteration: int):
+  blog = await uow.blogs.get_blog_by_id(blog_id)
+  if not blog:
+    raise NotFoundException("Blog", f"blog_id: {blog_id}")
+  if blog.author_id != AUTHOR_ID:
+    raise UnauthorizedException("You are not authorized to delete this blog.")
+  await uow.blogs.delete_blog(blog_id)
+
+async def owned_delete(uow: UnitOfWork, blog_id: str, iteration: int):
+  await uow.blogs.delete_owned_blog(blog_id, AUTHOR_ID)
+
+async def measure(
+  session_factory: async_sessionmaker,
+  statements: list,
+  blog_ids: list,
+  operation: Callable[[UnitOfWork, str, int], Awaitable[None]]
+) -> tuple:
+  """Returns the wall seconds and SQL statements per write, each write in its own transaction."""
+  statements.clear()
+  start = time.perf_counter()
+  for iteration, blog_id in enumerate(blog_ids):
+    async with session_factory() as session:
+      async with UnitOfWork(session) as uow:
+        await operation(uow, blog_id, iteration)
+  return (time.perf_counter() - start) / len(blog_ids), len(statements) / len(blog_ids)
+
+async def seed(session_factory: async_sessionmaker, prefix: str, count: int) -> list:
+  async with session_factory() as session:
+    blog_ids = [f"{prefix}-{index}" for index in range(count)]
+    session.add_all([
+      BlogModel(id=blog_id, title="Benchmark title", content="Benchmark content.", author_id=AUTHOR_ID)
+      for blog_id in blog_ids
+    ])
+    await session.commit()
+  return blog_ids
+
+async def run_benchmark(writes: int, database_url: Optional[str]):
+  with tempfile.TemporaryDirectory() as directory:
+    engine = create_async_engine(database_url or f"sqlite+aiosqlite:///{os.path.join(directory, 'bench.db')}")
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+
+    statements = []
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+      statements.append(statement)
+
+    async with engine.begin() as connection:
+      await connection.run_sync(Base.metadata.drop_all)
+      await connection.run_sync(Base.metadata.create_all)
+    async with session_factory() as session:
+      session.add(UserModel(
+        id=AUTHOR_ID,
+        first_name="Bench",
+        last_name="Mark",
+        username="benchmark",
+        password="not-a-real-hash"
+      ))
+      await session.commit()
+
+    try:
+      blog_ids = await seed(session_factory, "update", writes)
+      await measure(session_factory, statements, blog_ids[:20], read_then_update)
+      results = {
+        "update, read then write": await measure(session_factory, statements, blog_ids, read_then_update),
+        "update, single statement": await measure(session_factory, statements, blog_ids, owned_update),
+        "delete, read then write": await measure(
+          session_factory, statements, await seed(session_factory, "legacy-delete", writes), read_then_delete
+        ),
+        "delete, single statement": await measure(
+          session_factory, statements, await seed(session_factory, "owned-delete", writes), owned_delete
+        ),
+      }
+    finally:
+      if database_url:
+        async with engine.begin() as connection:
+          await connection.run_sync(Base.metadata.drop_all)
+      await engine.dispose()
+
+  print(f"⏱️  Blog writes over {writes} transactions on {engine.dialect.name}")
+  for label, (seconds, statement_count) in results.items():
+    print(f"   {label:<26} {seconds * 1e6:9.1f} µs  {statement_count:4.1f} statements")
+
+if __name__ == "__main__":
+  import asyncio
+
+  parser = argparse.ArgumentParser(description="Compare read-then-write blog updates and deletes to single statements.")
+  parser.add_argument("--writes", type=int, default=500, help="Transactions per measurement.")
+  parser.add_argument(
+    "--database-url",
+    default=None,
+    help="Database to benchmark against, its tables are dropped. Defaults to a temporary SQLite file."
+  )
+  args = parser.parse_args()
+
+  asyncio.run(run_benchmark(args.writes, args.database_url))
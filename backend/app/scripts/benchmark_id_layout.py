@@ -0,0 +1,135 @@
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Callable, Dict, Optional
+from uuid import uuid4
+
+from sqlalchemy import Column, Index, MetaData, String, Table, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.database.types import UUIDString
+from app.services import UuidGenerator
+
+BATCH_SIZE = 10_000
+AUTHORS = 10_000
+
+def build_table(metadata: MetaData, name: str, id_type) -> Table:
+  return Table(
+    name,
+    metadata,
+    Column("id", id_type, primary_key=True),
+    Column("author_id", id_type, nullable=False),
+    Column("title", String(100), nullable=False),
+    Index(f"ix_{name}_author_id", "author_id"),
+  )
+
+async def index_sizes(engine: AsyncEngine, table: Table) -> Dict[str, int]:
+  """Returns the on-disk bytes of the primary key and author index of a table."""
+  async with engine.connect() as connection:
+    if engine.dialect.name == "postgresql":
+      rows = await connection.execute(text(
+        "SELECT indexrelname, pg_relation_size(indexrelid) FROM pg_stat_user_indexes WHERE relname = :table"
+      ), {"table": table.name})
+    else:
+      rows = await connection.execute(text(
+        "SELECT dbstat.name, SUM(dbstat.pgsize) FROM dbstat JOIN sqlite_master ON sqlite_master.name = dbstat.name "
+        "WHERE sqlite_master.tbl_name = :table AND sqlite_master.type = 'index' GROUP BY dbstat.name"
+      ), {"table": table.name})
+    return {
+      ("author_id" if "author_id" in name else "primary key"): size
+      for name, size in rows.all()
+    }
+
+async def index_cache_hit_rate(engine: AsyncEngine, table: Table, ids: list, lookups: int) -> Optional[float]:
+  """Looks up recently inserted ids and returns the share of index blocks served from shared buffers."""
+  if engine.dialect.name != "postgresql":
+    return None
+
+  stats = text(
+    "SELECT SUM(idx_blks_hit), SUM(idx_blks_read) FROM pg_statio_user_indexes WHERE relname = :table"
+  )
+  async with engine.connect() as connection:
+    hit_before, read_before = (await connection.execute(stats, {"table": table.name})).one()
+    recent = ids[-max(len(ids) // 10, 1):]
+    for blog_id in random.choices(recent, k=lookups):
+      await connection.execute(select(table.c.id).where(table.c.id == blog_id))
+    # Statistics are flushed when the transaction ends
+    await connection.commit()
+    hit_after, read_after = (await connection.execute(stats, {"table": table.name})).one()
+
+  hits, reads = hit_after - hit_before, read_after - read_before
+  return hits / (hits + reads) if hits + reads else None
+
+async def load(engine: AsyncEngine, table: Table, generate: Callable[[], str], rows: int) -> tuple:
+  """Inserts `rows` rows in batches, returns the inserted ids and the rows inserted per second."""
+  authors = [generate() for _ in range(AUTHORS)]
+  ids = []
+  elapsed = 0.0
+  for offset in range(0, rows, BATCH_SIZE):
+    batch = [
+      {"id": generate(), "author_id": random.choice(authors), "title": "Benchmark title"}
+      for _ in range(min(BATCH_SIZE, rows - offset))
+    ]
+    start = time.perf_counter()
+    async with engine.begin() as connection:
+      await connection.execute(insert(table), batch)
+    elapsed += time.perf_counter() - start
+    ids.extend(row["id"] for row in batch)
+  return ids, rows / elapsed
+
+async def run_benchmark(rows: int, lookups: int, database_url: Optional[str]):
+  with tempfile.TemporaryDirectory() as directory:
+    engine = create_async_engine(database_url or f"sqlite+aiosqlite:///{os.path.join(directory, 'bench.db')}")
+    metadata = MetaData()
+    variants = {
+      "uuid4 as text": (build_table(metadata, "bench_ids_uuid4_text", String), lambda: str(uuid4())),
+      "uuid7 as UUIDString": (build_table(metadata, "bench_ids_uuid7", UUIDString), UuidGenerator().generate),
+    }
+
+    try:
+      async with engine.begin() as connection:
+        await connection.run_sync(metadata.drop_all)
+        await connection.run_sync(metadata.create_all)
+
+      results = {}
+      for label, (table, generate) in variants.items():
+        ids, throughput = await load(engine, table, generate, rows)
+        if engine.dialect.name == "postgresql":
+          async with engine.connect() as connection:
+            await connection.execute(text(f"ANALYZE {table.name}"))
+        results[label] = (
+          throughput,
+          await index_sizes(engine, table),
+          await index_cache_hit_rate(engine, table, ids, lookups),
+        )
+    finally:
+      async with engine.begin() as connection:
+        await connection.run_sync(metadata.drop_all)
+      await engine.dispose()
+
+  print(f"⏱️  {rows} rows on {engine.dialect.name}, {BATCH_SIZE} rows per transaction")
+  for label, (throughput, sizes, hit_rate) in results.items():
+    hit = f"{hit_rate * 100:5.1f}%" if hit_rate is not None else "  n/a"
+    print(
+      f"   {label:<20} {throughput:10.0f} rows/s"
+      f"  primary key {sizes.get('primary key', 0) / 2**20:8.1f} MiB"
+      f"  author_id {sizes.get('author_id', 0) / 2**20:8.1f} MiB"
+      f"  index cache hits {hit}"
+    )
+
+if __name__ == "__main__":
+  import asyncio
+
+  parser = argparse.ArgumentParser(description="Compare random text ids to time-ordered native UUID ids.")
+  parser.add_argument("--rows", type=int, default=1_000_000, help="Rows inserted per variant.")
+  parser.add_argument("--lookups", type=int, default=10_000, help="Point lookups of recent ids for the cache hit rate.")
+  parser.add_argument(
+    "--database-url",
+    default=None,
+    help="Database to benchmark against, e.g. PostgreSQL for native uuid columns. Defaults to a temporary SQLite file."
+  )
+  args = parser.parse_args()
+
+  asyncio.run(run_benchmark(args.rows, args.lookups, args.database_url))
@@ -0,0 +1,28 @@
+import argparse
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.db import engine
+from app.repositories import AuthorStatsRepository
+
+async def rebuild_author_stats(session: AsyncSession, author_id: Optional[str] = None) -> int:
+  repository = AuthorStatsRepository(session)
+  authors = await repository.rebuild(author_id)
+  await session.commit()
+  return authors
+
+async def run_rebuild(author_id: Optional[str] = None):
+  print("🔁 Rebuilding author stats...")
+  async with AsyncSession(engine, expire_on_commit=False) as session:
+    authors = await rebuild_author_stats(session, author_id)
+  print(f"✅ Author stats rebuilt for {authors} author(s)!")
+
+if __name__ == "__main__":
+  import asyncio
+
+  parser = argparse.ArgumentParser(description="Backfill the author_stats table from blogs.")
+  parser.add_argument("--author-id", default=None, help="Only rebuild the stats of this author.")
+  args = parser.parse_args()
+
+  asyncio.run(run_rebuild(args.author_id))
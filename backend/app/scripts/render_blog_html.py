@@ -0,0 +1,37 @@
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.db import engine
+from app.database.models import BlogModel
+from app.services.markdown_renderer import render_markdown
+
+async def render_missing_html(session: AsyncSession, batch_size: int = 500) -> int:
+  rendered = 0
+  while True:
+    stmt = (
+      select(BlogModel.id, BlogModel.content)
+      .where(BlogModel.content_html.is_(None))
+      .limit(batch_size)
+    )
+    rows = (await session.execute(stmt)).all()
+    if not rows:
+      return rendered
+
+    for blog_id, content in rows:
+      await session.execute(
+        update(BlogModel)
+        .where(BlogModel.id == blog_id)
+        .values(content_html=render_markdown(content))
+      )
+    await session.commit()
+    rendered += len(rows)
+
+async def run_render():
+  print("📝 Rendering blog HTML...")
+  async with AsyncSession(engine, expire_on_commit=False) as session:
+    rendered = await render_missing_html(session)
+  print(f"✅ Rendered HTML for {rendered} blog(s)!")
+
+if __name__ == "__main__":
+  import asyncio
+  asyncio.run(run_render())
@@ -1,2 +1,6 @@
 from .password_hasher import PasswordHasher
-from .uuid_generator import UuidGenerator
\ No newline at end of file
+from .uuid_generator import UuidGenerator
+from .view_counter import ViewCounter
+from .markdown_renderer import MarkdownRenderer
+from .image_processor import ImageProcessor
+from .trending_tracker import TrendingTracker
\ No newline at end of file
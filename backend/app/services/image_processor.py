@@ -0,0 +1,115 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Sequence, Tuple
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from src.application.dto import ImageVariantDTO, ProcessedImageDTO
+from src.application.services import IImageProcessor
+from src.domain.exceptions import InvalidDataException
+
+logger = logging.getLogger(__name__)
+
+# (name, max width, max height); variants keep the aspect ratio and are never upscaled
+DEFAULT_VARIANT_SIZES: Tuple[Tuple[str, int, int], ...] = (
+  ("thumbnail", 320, 320),
+  ("card", 800, 800),
+  ("full", 1920, 1920),
+)
+
+SAVE_OPTIONS = {
+  "webp": {"quality": 80, "method": 4},
+  "avif": {"quality": 60, "speed": 8},
+}
+
+def generate_variants(
+  source_path: str,
+  output_dir: str,
+  sizes: Sequence[Tuple[str, int, int]],
+  formats: Sequence[str],
+  max_pixels: int
+) -> dict:
+  # Runs in a worker process: everything in and out must be picklable
+  Image.MAX_IMAGE_PIXELS = max_pixels
+  with Image.open(source_path) as original:
+    if original.width * original.height > max_pixels:
+      raise ValueError(f"Image of {original.width}x{original.height} pixels is too large.")
+
+    source_format = original.format
+    image = ImageOps.exif_transpose(original)
+    if image.mode not in ("RGB", "RGBA"):
+      has_alpha = image.mode in ("LA", "PA") or "transparency" in image.info
+      image = image.convert("RGBA" if has_alpha else "RGB")
+
+    variants = []
+    for name, max_width, max_height in sizes:
+      variant = image.copy()
+      variant.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+      for image_format in formats:
+        path = os.path.join(output_dir, f"{name}.{image_format}")
+        variant.save(path, format=image_format.upper(), **SAVE_OPTIONS.get(image_format, {}))
+        variants.append({
+          "name": name,
+          "format": image_format,
+          "path": path,
+          "content_type": Image.MIME.get(image_format.upper(), f"image/{image_format}"),
+          "width": variant.width,
+          "height": variant.height,
+        })
+
+  return {
+    "format": source_format.lower(),
+    "content_type": Image.MIME.get(source_format, "application/octet-stream"),
+    "variants": variants,
+  }
+
+class ImageProcessor(IImageProcessor):
+  """
+  Generates responsive image variants on a process pool.
+
+  Decoding and encoding are CPU bound and hold the GIL, so they run in worker
+  processes and the event loop only awaits the result.
+  """
+  def __init__(
+    self,
+    max_workers: int = 2,
+    formats: Sequence[str] = ("webp", "avif"),
+    sizes: Sequence[Tuple[str, int, int]] = DEFAULT_VARIANT_SIZES,
+    max_pixels: int = 40_000_000
+  ):
+    self.formats = tuple(formats)
+    self.sizes = tuple(sizes)
+    self.max_pixels = max_pixels
+    # Spawned workers do not inherit the event loop or open connections of the server
+    self._executor = ProcessPoolExecutor(
+      max_workers=max_workers,
+      mp_context=multiprocessing.get_context("spawn")
+    )
+
+  async def create_variants(self, source_path: str, output_dir: str) -> ProcessedImageDTO:
+    loop = asyncio.get_running_loop()
+    try:
+      result = await loop.run_in_executor(
+        self._executor,
+        generate_variants,
+        source_path,
+        output_dir,
+        self.sizes,
+        self.formats,
+        self.max_pixels
+      )
+    except (UnidentifiedImageError, Image.DecompressionBombError, ValueError, OSError) as e:
+      logger.warning(f"Rejected uploaded image: {str(e)}")
+      raise InvalidDataException("The uploaded file is not a supported image.")
+
+    return ProcessedImageDTO(
+      format=result["format"],
+      content_type=result["content_type"],
+      variants=[ImageVariantDTO(**variant) for variant in result["variants"]]
+    )
+
+  def shutdown(self) -> None:
+    self._executor.shutdown(wait=True, cancel_futures=True)
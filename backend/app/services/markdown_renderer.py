@@ -0,0 +1,63 @@
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import markdown
+import nh3
+
+from src.application.services import IMarkdownRenderer
+
+logger = logging.getLogger(__name__)
+
+MARKDOWN_EXTENSIONS = ["extra", "sane_lists"]
+
+def render_markdown(content: str) -> str:
+  html = markdown.markdown(content, extensions=MARKDOWN_EXTENSIONS, output_format="html")
+  return nh3.clean(html)
+
+class MarkdownRenderer(IMarkdownRenderer):
+  """
+  Markdown renderer with an LRU cache keyed by the SHA-256 of the content.
+
+  Small documents are rendered inline, larger ones on a thread pool so a heavy
+  render never blocks the event loop.
+  """
+  def __init__(
+    self,
+    cache_size: int = 1024,
+    max_workers: int = 2,
+    inline_max_chars: int = 4096
+  ):
+    self.cache_size = cache_size
+    self.inline_max_chars = inline_max_chars
+    self.hits = 0
+    self.misses = 0
+    self._cache: "OrderedDict[str, str]" = OrderedDict()
+    self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="markdown")
+
+  async def render(self, content: str) -> str:
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    html = self._cache.get(digest)
+    if html is not None:
+      self.hits += 1
+      self._cache.move_to_end(digest)
+      return html
+
+    self.misses += 1
+    if len(content) <= self.inline_max_chars:
+      html = render_markdown(content)
+    else:
+      loop = asyncio.get_running_loop()
+      html = await loop.run_in_executor(self._executor, render_markdown, content)
+
+    self._cache[digest] = html
+    while len(self._cache) > self.cache_size:
+      self._cache.popitem(last=False)
+
+    return html
+
+  def shutdown(self) -> None:
+    self._executor.shutdown(wait=True)
@@ -0,0 +1,157 @@
+import asyncio
+import heapq
+import logging
+import time
+import uuid
+from datetime import datetime, timezone
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.sharding import ShardRouter
+from app.database.unit_of_work import UnitOfWork
+from src.application.services import ITrendingTracker
+from src.domain.entities import BlogEntity
+from src.domain.events import BlogDeletedEvent
+
+logger = logging.getLogger(__name__)
+
+# Beyond this many half-lives a score is below a thousandth of its weight
+STALE_AFTER_HALF_LIVES = 10
+MOVE_LANDMARK_AFTER_HALF_LIVES = 64
+
+def _timestamp(value: datetime) -> float:
+  # SQLite gives naive datetime → force UTC
+  if value.tzinfo is None:
+    value = value.replace(tzinfo=timezone.utc)
+  return value.timestamp()
+
+class TrendingTracker(ITrendingTracker):
+  """
+  Trending blogs ranked by engagement that halves every `half_life_seconds`.
+
+  Requests only put engagements on a bounded queue and a background task
+  folds them into the scores of this worker. Scores use forward decay: an
+  engagement at time t adds weight * 2^((t - landmark) / half_life), so
+  scores never have to be decayed one by one and their order already is the
+  order of the decayed scores.
+
+  `snapshot` persists the heaviest scores of this worker, merges the scores
+  persisted by every worker and caches the top blogs that `top` serves.
+  """
+  def __init__(
+    self,
+    session_factory: Callable[[], AsyncSession],
+    shard_router: Optional[ShardRouter] = None,
+    half_life_seconds: float = 21600.0,
+    top_k: int = 50,
+    max_tracked: int = 10_000,
+    snapshot_size: int = 500,
+    queue_size: int = 10_000,
+    clock: Callable[[], float] = time.time
+  ):
+    self.session_factory = session_factory
+    self.shard_router = shard_router
+    self.half_life_seconds = half_life_seconds
+    self.top_k = top_k
+    self.max_tracked = max_tracked
+    self.snapshot_size = snapshot_size
+    self.clock = clock
+    self.worker_id = str(uuid.uuid4())
+    self.dropped = 0
+    self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    self._landmark = clock()
+    self._scores: Dict[str, float] = {}
+    self._top: List[Tuple[BlogEntity, float]] = []
+    self._top_at = self._landmark
+    self._task: Optional[asyncio.Task] = None
+
+  def record(self, blog_id: str, weight: float = 1.0) -> None:
+    try:
+      self._queue.put_nowait((blog_id, weight, self.clock()))
+    except asyncio.QueueFull:
+      self.dropped += 1
+
+  def top(self, limit: int = 10) -> List[Tuple[BlogEntity, float]]:
+    decay = 2 ** ((self._top_at - self.clock()) / self.half_life_seconds)
+    return [(blog, score * decay) for blog, score in self._top[:limit]]
+
+  def apply_pending(self) -> int:
+    applied = 0
+    while not self._queue.empty():
+      self._add(*self._queue.get_nowait())
+      applied += 1
+    return applied
+
+  async def snapshot(self) -> int:
+    self.apply_pending()
+    now = self.clock()
+    self._move_landmark(now)
+    local = dict(heapq.nlargest(self.snapshot_size, self._scores.items(), key=itemgetter(1)))
+
+    async with self._unit_of_work() as uow:
+      await uow.trending_scores.replace_worker_scores(self.worker_id, local, datetime.fromtimestamp(now, timezone.utc))
+      # Rows of workers that stopped decay to nothing and are dropped
+      await uow.trending_scores.delete_scores_before(
+        datetime.fromtimestamp(now - STALE_AFTER_HALF_LIVES * self.half_life_seconds, timezone.utc)
+      )
+
+      merged: Dict[str, float] = {}
+      for blog_id, score, decayed_at in await uow.trending_scores.get_scores():
+        merged[blog_id] = merged.get(blog_id, 0.0) + score * 2 ** ((_timestamp(decayed_at) - now) / self.half_life_seconds)
+
+      best = dict(heapq.nlargest(self.top_k, merged.items(), key=itemgetter(1)))
+      blogs = await uow.blogs.get_blogs_by_ids(list(best))
+
+    self._top = [(blog, best[blog.id]) for blog in blogs]
+    self._top_at = now
+    return len(self._top)
+
+  async def handle_blog_event(self, event: BlogDeletedEvent) -> None:
+    self._scores.pop(event.blog_id, None)
+    self._top = [(blog, score) for blog, score in self._top if blog.id != event.blog_id]
+    async with self._unit_of_work() as uow:
+      await uow.trending_scores.delete_blog(event.blog_id)
+
+  async def start(self) -> None:
+    if self._task is None:
+      self._task = asyncio.create_task(self._run())
+
+  async def stop(self) -> None:
+    if self._task is not None:
+      self._task.cancel()
+      try:
+        await self._task
+      except asyncio.CancelledError:
+        pass
+      self._task = None
+
+    try:
+      await self.snapshot()
+    except Exception as e:
+      logger.error(f"Failed to persist trending scores on shutdown: {str(e)}")
+
+  async def _run(self) -> None:
+    while True:
+      self._add(*await self._queue.get())
+      self.apply_pending()
+
+  def _add(self, blog_id: str, weight: float, at: float) -> None:
+    if (at - self._landmark) / self.half_life_seconds > MOVE_LANDMARK_AFTER_HALF_LIVES:
+      self._move_landmark(at)
+
+    self._scores[blog_id] = self._scores.get(blog_id, 0.0) + weight * 2 ** ((at - self._landmark) / self.half_life_seconds)
+
+    if len(self._scores) > self.max_tracked:
+      # Halving at once keeps the cost of pruning amortized over many engagements
+      self._scores = dict(heapq.nlargest(self.max_tracked // 2, self._scores.items(), key=itemgetter(1)))
+
+  def _move_landmark(self, landmark: float) -> None:
+    decay = 2 ** ((self._landmark - landmark) / self.half_life_seconds)
+    for blog_id in self._scores:
+      self._scores[blog_id] *= decay
+    self._landmark = landmark
+
+  def _unit_of_work(self) -> UnitOfWork:
+    return UnitOfWork(self.session_factory(), shard_router=self.shard_router)
@@ -0,0 +1,152 @@
+import asyncio
+import logging
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.sharding import ShardRouter
+from app.repositories import BlogViewRepository
+from src.application.services import IViewCounter
+
+logger = logging.getLogger(__name__)
+
+class ViewCounter(IViewCounter):
+  """
+  Write-behind blog view counter.
+
+  Views are buffered in memory per worker and periodically persisted as a
+  single batched upsert, so reading a blog never writes to the database.
+  """
+  def __init__(
+    self,
+    session_factory: Callable[[], AsyncSession],
+    flush_interval: float = 5.0,
+    max_pending: int = 10_000,
+    shard_router: Optional[ShardRouter] = None
+  ):
+    self.session_factory = session_factory
+    self.shard_router = shard_router
+    self.flush_interval = flush_interval
+    self.max_pending = max_pending
+    self.dropped = 0
+    self._pending: Dict[str, int] = {}
+    self._flushing: Dict[str, int] = {}
+    self._flush_requested = asyncio.Event()
+    self._flush_lock = asyncio.Lock()
+    self._task: Optional[asyncio.Task] = None
+
+  def record(self, blog_id: str) -> None:
+    if blog_id in self._pending:
+      self._pending[blog_id] += 1
+      return
+
+    if len(self._pending) >= self.max_pending:
+      # Keep memory bounded under a flood of distinct ids: drop the view and
+      # ask the background task to flush right away.
+      self.dropped += 1
+      self._flush_requested.set()
+      return
+
+    self._pending[blog_id] = 1
+    if len(self._pending) >= self.max_pending:
+      self._flush_requested.set()
+
+  def pending(self, blog_id: str) -> int:
+    return self._pending.get(blog_id, 0) + self._flushing.get(blog_id, 0)
+
+  async def flush(self) -> int:
+    async with self._flush_lock:
+      if not self._pending:
+        return 0
+
+      self._flushing, self._pending = self._pending, {}
+      batch = self._flushing
+
+      try:
+        unsaved = await self._persist(batch)
+      except Exception as e:
+        logger.error(f"Failed to flush {len(batch)} blog view counts: {str(e)}")
+        self._requeue(batch)
+        return 0
+      finally:
+        self._flushing = {}
+
+      if unsaved:
+        self._requeue(unsaved)
+      flushed = len(batch) - len(unsaved)
+      logger.info(f"Flushed view counts for {flushed} blogs.")
+      return flushed
+
+  async def _persist(self, batch: Dict[str, int]) -> Dict[str, int]:
+    """Persists the batch and returns the counts that must be retried."""
+    if self.shard_router:
+      return await self._persist_shards(batch)
+
+    async with self.session_factory() as session:
+      await BlogViewRepository(session).increment_views(batch)
+      await session.commit()
+    return {}
+
+  async def _persist_shards(self, batch: Dict[str, int]) -> Dict[str, int]:
+    # Shards commit independently: retrying the whole batch after one shard
+    # failed would count the views the other shards already committed twice.
+    shards = list(self.shard_router.session_factories)
+    results = await asyncio.gather(
+      *(self._persist_shard(shard, batch) for shard in shards),
+      return_exceptions=True
+    )
+
+    counted = set()
+    failed = []
+    for shard, result in zip(shards, results):
+      if isinstance(result, BaseException):
+        if not isinstance(result, Exception):
+          raise result
+        logger.error(f"Failed to flush blog view counts on shard {shard}: {str(result)}")
+        failed.append(shard)
+      else:
+        counted.update(result)
+
+    if not failed:
+      return {}
+    # A blog lives on a single shard, so only the ids no healthy shard counted
+    # can belong to a failed one
+    return {blog_id: count for blog_id, count in batch.items() if blog_id not in counted}
+
+  async def _persist_shard(self, shard: str, batch: Dict[str, int]) -> List[str]:
+    async with self.shard_router.session_factories[shard]() as session:
+      counted = await BlogViewRepository(session).increment_views(batch)
+      await session.commit()
+    return counted
+
+  def _requeue(self, batch: Dict[str, int]) -> None:
+    for blog_id, count in batch.items():
+      if blog_id in self._pending:
+        self._pending[blog_id] += count
+      elif len(self._pending) < self.max_pending:
+        self._pending[blog_id] = count
+      else:
+        self.dropped += count
+
+  async def start(self) -> None:
+    if self._task is None:
+      self._task = asyncio.create_task(self._run())
+
+  async def stop(self) -> None:
+    if self._task is not None:
+      self._task.cancel()
+      try:
+        await self._task
+      except asyncio.CancelledError:
+        pass
+      self._task = None
+    await self.flush()
+
+  async def _run(self) -> None:
+    while True:
+      try:
+        await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+      except asyncio.TimeoutError:
+        pass
+      self._flush_requested.clear()
+      await self.flush()
@@ -0,0 +1,3 @@
+from .local_image_storage import LocalImageStorage
+from .s3_image_storage import S3ImageStorage
+from .image_storage_factory import create_image_storage
@@ -0,0 +1,18 @@
+from typing import Optional
+
+from src.application.services import IImageStorage
+from .local_image_storage import LocalImageStorage
+from .s3_image_storage import S3ImageStorage
+
+def create_image_storage(
+  backend: str,
+  base_url: str,
+  root_dir: str = "media",
+  bucket: str = "",
+  endpoint_url: Optional[str] = None
+) -> IImageStorage:
+  if backend == "local":
+    return LocalImageStorage(root_dir=root_dir, base_url=base_url)
+  if backend == "s3":
+    return S3ImageStorage(bucket=bucket, base_url=base_url, endpoint_url=endpoint_url)
+  raise ValueError(f"Unknown image storage backend: '{backend}'")
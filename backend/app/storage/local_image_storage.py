@@ -0,0 +1,41 @@
+import asyncio
+import os
+import shutil
+from typing import List, Optional
+
+from src.application.services import IImageStorage
+
+class LocalImageStorage(IImageStorage):
+  def __init__(self, root_dir: str, base_url: str):
+    self.root_dir = os.path.abspath(root_dir)
+    self.base_url = base_url.rstrip("/")
+
+  async def save(self, key: str, source_path: str, content_type: str) -> str:
+    await asyncio.to_thread(self._copy, source_path, self._path(key))
+    return f"{self.base_url}/{key}"
+
+  def key_for_url(self, url: str) -> Optional[str]:
+    prefix = f"{self.base_url}/"
+    return url[len(prefix):] if url.startswith(prefix) else None
+
+  async def delete(self, keys: List[str]) -> None:
+    await asyncio.to_thread(self._remove, [self._path(key) for key in keys])
+
+  def _path(self, key: str) -> str:
+    path = os.path.abspath(os.path.join(self.root_dir, key))
+    if os.path.commonpath([self.root_dir, path]) != self.root_dir:
+      raise ValueError(f"Storage key '{key}' escapes the storage directory.")
+    return path
+
+  @staticmethod
+  def _copy(source_path: str, destination: str) -> None:
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    shutil.copyfile(source_path, destination)
+
+  @staticmethod
+  def _remove(paths: List[str]) -> None:
+    for path in paths:
+      try:
+        os.remove(path)
+      except FileNotFoundError:
+        pass
@@ -0,0 +1,53 @@
+import asyncio
+from typing import List, Optional
+
+from src.application.services import IImageStorage
+
+try:
+  import boto3
+except ImportError:
+  boto3 = None
+
+class S3ImageStorage(IImageStorage):
+  """
+  Stores images in an S3 compatible bucket. Requires the optional boto3 package.
+  """
+  def __init__(
+    self,
+    bucket: str,
+    base_url: str,
+    endpoint_url: Optional[str] = None,
+    cache_control: str = "public, max-age=31536000, immutable"
+  ):
+    if boto3 is None:
+      raise RuntimeError("The 's3' image storage backend requires the boto3 package.")
+
+    self.bucket = bucket
+    self.base_url = base_url.rstrip("/")
+    self.cache_control = cache_control
+    self._client = boto3.client("s3", endpoint_url=endpoint_url)
+
+  async def save(self, key: str, source_path: str, content_type: str) -> str:
+    # upload_file streams the file in multipart chunks instead of reading it whole
+    await asyncio.to_thread(
+      self._client.upload_file,
+      source_path,
+      self.bucket,
+      key,
+      ExtraArgs={"ContentType": content_type, "CacheControl": self.cache_control}
+    )
+    return f"{self.base_url}/{key}"
+
+  def key_for_url(self, url: str) -> Optional[str]:
+    prefix = f"{self.base_url}/"
+    return url[len(prefix):] if url.startswith(prefix) else None
+
+  async def delete(self, keys: List[str]) -> None:
+    # delete_objects accepts at most 1000 keys per call
+    for start in range(0, len(keys), 1000):
+      batch = keys[start:start + 1000]
+      await asyncio.to_thread(
+        self._client.delete_objects,
+        Bucket=self.bucket,
+        Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True}
+      )
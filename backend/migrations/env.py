@@ -13,7 +13,16 @@ from app.database.models import (
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
-config.set_main_option("sqlalchemy.url", app_config.DATABASE_URL)
+
+# `alembic -x shard=<name> upgrade head` migrates one of the blog shards
+# in BLOG_SHARD_URLS instead of the main database.
+shard = context.get_x_argument(as_dictionary=True).get("shard")
+if shard is not None and shard not in app_config.BLOG_SHARD_URLS:
+    raise ValueError(f"Unknown blog shard: {shard}")
+config.set_main_option(
+    "sqlalchemy.url",
+    app_config.BLOG_SHARD_URLS[shard] if shard else app_config.DATABASE_URL
+)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
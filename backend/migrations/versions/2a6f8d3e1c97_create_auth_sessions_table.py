@@ -0,0 +1,46 @@
+"""create auth sessions table.
+
+Revision ID: 2a6f8d3e1c97
+Revises: e7c3a1f9b452
+Create Date: 2026-10-19 16:48:37.915204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2a6f8d3e1c97'
+down_revision: Union[str, Sequence[str], None] = 'e7c3a1f9b452'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('auth_sessions',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('access_token_id', sa.String(), nullable=False),
+    sa.Column('refresh_token_id', sa.String(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_auth_sessions_user_id'), 'auth_sessions', ['user_id'], unique=False)
+    op.create_index(op.f('ix_auth_sessions_expires_at'), 'auth_sessions', ['expires_at'], unique=False)
+    # Tokens issued before this revision carry no session and have to be renewed by logging in again
+    op.drop_column('users', 'refresh_token_id')
+    op.drop_column('users', 'access_token_id')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('users', sa.Column('access_token_id', sa.String(), nullable=True))
+    op.add_column('users', sa.Column('refresh_token_id', sa.String(), nullable=True))
+    op.drop_index(op.f('ix_auth_sessions_expires_at'), table_name='auth_sessions')
+    op.drop_index(op.f('ix_auth_sessions_user_id'), table_name='auth_sessions')
+    op.drop_table('auth_sessions')
@@ -0,0 +1,34 @@
+"""create blog views table.
+
+Revision ID: 3b9d2c71e4a8
+Revises: 81ff36a3fe90
+Create Date: 2026-10-19 09:12:44.218731
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9d2c71e4a8'
+down_revision: Union[str, Sequence[str], None] = '81ff36a3fe90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('blog_views',
+    sa.Column('blog_id', sa.String(), nullable=False),
+    sa.Column('views', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['blog_id'], ['blogs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('blog_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('blog_views')
@@ -0,0 +1,28 @@
+"""add content html to blogs.
+
+Revision ID: 5f1a9e3c7b20
+Revises: c4e8a0f5d2b6
+Create Date: 2026-10-19 12:41:08.337190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f1a9e3c7b20'
+down_revision: Union[str, Sequence[str], None] = 'c4e8a0f5d2b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('blogs', sa.Column('content_html', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('blogs', 'content_html')
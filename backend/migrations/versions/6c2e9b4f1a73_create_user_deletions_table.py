@@ -0,0 +1,42 @@
+"""create user deletions table.
+
+Revision ID: 6c2e9b4f1a73
+Revises: 2a6f8d3e1c97
+Create Date: 2026-10-19 19:12:05.481730
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c2e9b4f1a73'
+down_revision: Union[str, Sequence[str], None] = '2a6f8d3e1c97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('user_deletions',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('blogs_total', sa.Integer(), nullable=False),
+    sa.Column('blogs_deleted', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_user_deletions_user_id'), 'user_deletions', ['user_id'], unique=False)
+    op.create_index(op.f('ix_user_deletions_status'), 'user_deletions', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_user_deletions_status'), table_name='user_deletions')
+    op.drop_index(op.f('ix_user_deletions_user_id'), table_name='user_deletions')
+    op.drop_table('user_deletions')
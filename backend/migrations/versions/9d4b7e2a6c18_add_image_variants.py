@@ -0,0 +1,30 @@
+"""add image variants to blogs and users.
+
+Revision ID: 9d4b7e2a6c18
+Revises: 5f1a9e3c7b20
+Create Date: 2026-10-19 14:05:52.418306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4b7e2a6c18'
+down_revision: Union[str, Sequence[str], None] = '5f1a9e3c7b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('blogs', sa.Column('hero_image_variants', sa.JSON(), nullable=True))
+    op.add_column('users', sa.Column('avatar_variants', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'avatar_variants')
+    op.drop_column('blogs', 'hero_image_variants')
@@ -0,0 +1,49 @@
+"""create blog tags tables.
+
+Revision ID: a3c7e1b9d264
+Revises: f2b6d9a4c158
+Create Date: 2026-10-19 23:14:48.207391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c7e1b9d264'
+down_revision: Union[str, Sequence[str], None] = 'f2b6d9a4c158'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    id_type = postgresql.UUID() if op.get_bind().dialect.name == 'postgresql' else sa.String()
+
+    # On PostgreSQL this reaches every monthly partition
+    op.add_column('blogs', sa.Column('tags', sa.JSON(), server_default='[]', nullable=False))
+    op.create_table('blog_tags',
+    sa.Column('tag', sa.String(length=30), nullable=False),
+    sa.Column('blog_id', id_type, nullable=False),
+    sa.PrimaryKeyConstraint('tag', 'blog_id')
+    )
+    op.create_index('ix_blog_tags_blog_id_tag', 'blog_tags', ['blog_id', 'tag'], unique=False)
+    op.create_table('tag_counts',
+    sa.Column('tag', sa.String(length=30), nullable=False),
+    sa.Column('blog_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('tag')
+    )
+    op.create_index('ix_tag_counts_blog_count', 'tag_counts', ['blog_count'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tag_counts_blog_count', table_name='tag_counts')
+    op.drop_table('tag_counts')
+    op.drop_index('ix_blog_tags_blog_id_tag', table_name='blog_tags')
+    op.drop_table('blog_tags')
+    op.drop_column('blogs', 'tags')
@@ -0,0 +1,40 @@
+"""create blog revisions table.
+
+Revision ID: a4c9e2b7d615
+Revises: b6f3a8d1c592
+Create Date: 2026-10-20 02:41:56.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c9e2b7d615'
+down_revision: Union[str, Sequence[str], None] = 'b6f3a8d1c592'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    id_type = postgresql.UUID() if op.get_bind().dialect.name == 'postgresql' else sa.String()
+
+    op.create_table('blog_revisions',
+    sa.Column('blog_id', id_type, nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=100), nullable=False),
+    sa.Column('is_keyframe', sa.Boolean(), nullable=False),
+    sa.Column('data', sa.LargeBinary(), nullable=False),
+    sa.Column('content_length', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('blog_id', 'version')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('blog_revisions')
@@ -0,0 +1,66 @@
+"""create follows and timelines.
+
+Revision ID: b6f3a8d1c592
+Revises: e1d8b5c3a407
+Create Date: 2026-10-20 01:37:12.408163
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6f3a8d1c592'
+down_revision: Union[str, Sequence[str], None] = 'e1d8b5c3a407'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    id_type = postgresql.UUID() if op.get_bind().dialect.name == 'postgresql' else sa.String()
+
+    op.create_table('follows',
+    sa.Column('follower_id', id_type, nullable=False),
+    sa.Column('followee_id', id_type, nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['follower_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['followee_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('follower_id', 'followee_id')
+    )
+    op.create_index('ix_follows_followee_id_follower_id', 'follows', ['followee_id', 'follower_id'], unique=False)
+
+    op.create_table('follower_counts',
+    sa.Column('user_id', id_type, nullable=False),
+    sa.Column('follower_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_index('ix_follower_counts_follower_count', 'follower_counts', ['follower_count'], unique=False)
+
+    op.create_table('timeline_entries',
+    sa.Column('user_id', id_type, nullable=False),
+    sa.Column('blog_id', id_type, nullable=False),
+    sa.Column('author_id', id_type, nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('user_id', 'blog_id')
+    )
+    op.create_index('ix_timeline_entries_user_id_created_at_blog_id', 'timeline_entries', ['user_id', 'created_at', 'blog_id'], unique=False)
+    op.create_index('ix_timeline_entries_user_id_author_id', 'timeline_entries', ['user_id', 'author_id'], unique=False)
+    op.create_index('ix_timeline_entries_blog_id', 'timeline_entries', ['blog_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_timeline_entries_blog_id', table_name='timeline_entries')
+    op.drop_index('ix_timeline_entries_user_id_author_id', table_name='timeline_entries')
+    op.drop_index('ix_timeline_entries_user_id_created_at_blog_id', table_name='timeline_entries')
+    op.drop_table('timeline_entries')
+    op.drop_index('ix_follower_counts_follower_count', table_name='follower_counts')
+    op.drop_table('follower_counts')
+    op.drop_index('ix_follows_followee_id_follower_id', table_name='follows')
+    op.drop_table('follows')
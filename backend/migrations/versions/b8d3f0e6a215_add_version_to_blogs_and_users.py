@@ -0,0 +1,31 @@
+"""add version to blogs and users.
+
+Revision ID: b8d3f0e6a215
+Revises: 6c2e9b4f1a73
+Create Date: 2026-10-19 20:03:44.102958
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d3f0e6a215'
+down_revision: Union[str, Sequence[str], None] = '6c2e9b4f1a73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A constant default keeps this a metadata-only change on PostgreSQL 11+
+    op.add_column('blogs', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('users', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'version')
+    op.drop_column('blogs', 'version')
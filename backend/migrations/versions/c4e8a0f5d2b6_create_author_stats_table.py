@@ -0,0 +1,42 @@
+"""create author stats table.
+
+Revision ID: c4e8a0f5d2b6
+Revises: 3b9d2c71e4a8
+Create Date: 2026-10-19 11:03:27.904512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a0f5d2b6'
+down_revision: Union[str, Sequence[str], None] = '3b9d2c71e4a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('author_stats',
+    sa.Column('author_id', sa.String(), nullable=False),
+    sa.Column('post_count', sa.Integer(), nullable=False),
+    sa.Column('last_posted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['author_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('author_id')
+    )
+    op.create_index('ix_blogs_author_id_created_at', 'blogs', ['author_id', 'created_at'], unique=False)
+    # Backfill existing authors, later changes are maintained by the blog use cases
+    op.execute(
+        "INSERT INTO author_stats (author_id, post_count, last_posted_at) "
+        "SELECT author_id, count(id), max(created_at) FROM blogs GROUP BY author_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_blogs_author_id_created_at', table_name='blogs')
+    op.drop_table('author_stats')
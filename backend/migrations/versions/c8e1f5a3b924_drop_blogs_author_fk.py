@@ -0,0 +1,36 @@
+"""drop blogs author foreign key.
+
+Revision ID: c8e1f5a3b924
+Revises: f7a2c4e9b318
+Create Date: 2026-10-20 11:02:48.219573
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e1f5a3b924'
+down_revision: Union[str, Sequence[str], None] = 'f7a2c4e9b318'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Blogs on a shard database cannot reference users, which stay on the main
+    # database. SQLite does not enforce the constraint, so it is left alone there.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('ALTER TABLE blogs DROP CONSTRAINT IF EXISTS blogs_author_id_fkey')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.create_foreign_key('blogs_author_id_fkey', 'blogs', 'users', ['author_id'], ['id'])
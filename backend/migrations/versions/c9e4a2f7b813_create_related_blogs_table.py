@@ -0,0 +1,41 @@
+"""create related blogs table.
+
+Revision ID: c9e4a2f7b813
+Revises: a3c7e1b9d264
+Create Date: 2026-10-20 00:02:16.583920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e4a2f7b813'
+down_revision: Union[str, Sequence[str], None] = 'a3c7e1b9d264'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    id_type = postgresql.UUID() if op.get_bind().dialect.name == 'postgresql' else sa.String()
+
+    # Filled by the related blogs rebuild job, see app.related
+    op.create_table('related_blogs',
+    sa.Column('blog_id', id_type, nullable=False),
+    sa.Column('related_blog_id', id_type, nullable=False),
+    sa.Column('score', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('blog_id', 'related_blog_id')
+    )
+    op.create_index('ix_related_blogs_blog_id_score', 'related_blogs', ['blog_id', 'score'], unique=False)
+    op.create_index('ix_related_blogs_related_blog_id', 'related_blogs', ['related_blog_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_related_blogs_related_blog_id', table_name='related_blogs')
+    op.drop_index('ix_related_blogs_blog_id_score', table_name='related_blogs')
+    op.drop_table('related_blogs')
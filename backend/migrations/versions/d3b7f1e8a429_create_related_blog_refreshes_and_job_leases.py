@@ -0,0 +1,43 @@
+"""create related blog refreshes and job leases.
+
+Revision ID: d3b7f1e8a429
+Revises: c8e1f5a3b924
+Create Date: 2026-10-20 13:47:09.362185
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3b7f1e8a429'
+down_revision: Union[str, Sequence[str], None] = 'c8e1f5a3b924'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    id_type = postgresql.UUID() if op.get_bind().dialect.name == 'postgresql' else sa.String()
+
+    # Blog events on any worker queue a refresh for the worker holding the index
+    op.create_table('related_blog_refreshes',
+    sa.Column('blog_id', id_type, nullable=False),
+    sa.Column('requested_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('blog_id')
+    )
+    op.create_table('job_leases',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('owner', sa.String(length=36), nullable=False),
+    sa.Column('lease_until', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('job_leases')
+    op.drop_table('related_blog_refreshes')
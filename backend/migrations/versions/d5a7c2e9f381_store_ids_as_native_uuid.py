@@ -0,0 +1,65 @@
+"""store ids as native uuid.
+
+Revision ID: d5a7c2e9f381
+Revises: b8d3f0e6a215
+Create Date: 2026-10-19 21:12:37.480215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a7c2e9f381'
+down_revision: Union[str, Sequence[str], None] = 'b8d3f0e6a215'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, constraint, column, referenced table, ON DELETE)
+FOREIGN_KEYS = [
+    ('blogs', 'blogs_author_id_fkey', 'author_id', 'users', None),
+    ('blog_views', 'blog_views_blog_id_fkey', 'blog_id', 'blogs', 'CASCADE'),
+    ('author_stats', 'author_stats_author_id_fkey', 'author_id', 'users', 'CASCADE'),
+    ('auth_sessions', 'auth_sessions_user_id_fkey', 'user_id', 'users', 'CASCADE'),
+]
+
+# Referenced columns come before the columns pointing at them
+ID_COLUMNS = [
+    ('users', 'id'),
+    ('blogs', 'id'),
+    ('blogs', 'author_id'),
+    ('blog_views', 'blog_id'),
+    ('author_stats', 'author_id'),
+    ('auth_sessions', 'id'),
+    ('auth_sessions', 'user_id'),
+    ('user_deletions', 'id'),
+    ('user_deletions', 'user_id'),
+]
+
+
+def _convert(column_type: str, using: str) -> None:
+    for table, constraint, _, _, _ in FOREIGN_KEYS:
+        op.drop_constraint(constraint, table, type_='foreignkey')
+
+    # Rewrites each table and rebuilds its indexes, existing uuid4 text ids keep their value
+    for table, column in ID_COLUMNS:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} TYPE {column_type} USING {column}{using}')
+
+    for table, constraint, column, referenced, ondelete in FOREIGN_KEYS:
+        op.create_foreign_key(constraint, table, referenced, [column], ['id'], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Other databases keep ids as text, see app.database.types.UUIDString
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    _convert('uuid', '::uuid')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    _convert('varchar', '::text')
@@ -0,0 +1,39 @@
+"""create trending scores table.
+
+Revision ID: e1d8b5c3a407
+Revises: c9e4a2f7b813
+Create Date: 2026-10-20 00:48:31.092657
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1d8b5c3a407'
+down_revision: Union[str, Sequence[str], None] = 'c9e4a2f7b813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    id_type = postgresql.UUID() if op.get_bind().dialect.name == 'postgresql' else sa.String()
+
+    op.create_table('trending_scores',
+    sa.Column('worker_id', sa.String(length=36), nullable=False),
+    sa.Column('blog_id', id_type, nullable=False),
+    sa.Column('score', sa.Float(), nullable=False),
+    sa.Column('decayed_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('worker_id', 'blog_id')
+    )
+    op.create_index(op.f('ix_trending_scores_decayed_at'), 'trending_scores', ['decayed_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_trending_scores_decayed_at'), table_name='trending_scores')
+    op.drop_table('trending_scores')
@@ -0,0 +1,31 @@
+"""add dispatched at to outbox events.
+
+Revision ID: e5f9c2a7d384
+Revises: d3b7f1e8a429
+Create Date: 2026-10-20 16:25:53.804117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f9c2a7d384'
+down_revision: Union[str, Sequence[str], None] = 'd3b7f1e8a429'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Dispatched messages are kept for the broadcasters of every worker, then pruned
+    op.add_column('outbox_events', sa.Column('dispatched_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index(op.f('ix_outbox_events_dispatched_at'), 'outbox_events', ['dispatched_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_outbox_events_dispatched_at'), table_name='outbox_events')
+    op.drop_column('outbox_events', 'dispatched_at')
@@ -0,0 +1,117 @@
+"""partition blogs by month.
+
+Revision ID: f2b6d9a4c158
+Revises: d5a7c2e9f381
+Create Date: 2026-10-19 22:31:05.614872
+
+"""
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b6d9a4c158'
+down_revision: Union[str, Sequence[str], None] = 'd5a7c2e9f381'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Later months are created by app.jobs.maintain_blog_partitions
+MONTHS_AHEAD = 3
+
+COLUMNS = (
+    'id, title, content, author_id, hero_image, hero_image_variants, '
+    'content_html, created_at, updated_at, version'
+)
+
+
+def _add_months(day: date, months: int) -> date:
+    month_index = day.year * 12 + day.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _create_blogs_table(partitioned: bool) -> None:
+    # A primary key of a partitioned table must include the partition key
+    primary_key = '(id, created_at)' if partitioned else '(id)'
+    op.execute(f"""
+        CREATE TABLE blogs (
+            id uuid NOT NULL,
+            title varchar(100) NOT NULL,
+            content varchar NOT NULL,
+            author_id uuid NOT NULL,
+            hero_image varchar,
+            hero_image_variants json,
+            content_html varchar,
+            created_at timestamptz NOT NULL DEFAULT now(),
+            updated_at timestamptz NOT NULL DEFAULT now(),
+            version integer NOT NULL DEFAULT 1,
+            CONSTRAINT blogs_pkey PRIMARY KEY {primary_key},
+            CONSTRAINT blogs_author_id_fkey FOREIGN KEY (author_id) REFERENCES users (id)
+        ){' PARTITION BY RANGE (created_at)' if partitioned else ''}
+    """)
+
+
+def _move_blogs_aside() -> None:
+    op.execute('ALTER TABLE blogs RENAME TO blogs_previous')
+    op.execute('ALTER INDEX blogs_pkey RENAME TO blogs_previous_pkey')
+    op.execute('ALTER INDEX ix_blogs_author_id RENAME TO ix_blogs_previous_author_id')
+    op.execute('ALTER INDEX ix_blogs_author_id_created_at RENAME TO ix_blogs_previous_author_id_created_at')
+
+
+def _copy_blogs_back() -> None:
+    # Indexes are built once after the copy rather than maintained row by row
+    op.execute(f'INSERT INTO blogs ({COLUMNS}) SELECT {COLUMNS} FROM blogs_previous')
+    op.execute('DROP TABLE blogs_previous')
+    op.create_index('ix_blogs_author_id', 'blogs', ['author_id'], unique=False)
+    op.create_index('ix_blogs_author_id_created_at', 'blogs', ['author_id', 'created_at'], unique=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    # Partitions cannot back a unique constraint on id alone, so blog_views loses its foreign key
+    op.drop_constraint('blog_views_blog_id_fkey', 'blog_views', type_='foreignkey')
+    _move_blogs_aside()
+    _create_blogs_table(partitioned=True)
+
+    oldest, newest = bind.execute(sa.text(
+        "SELECT min(created_at) AT TIME ZONE 'UTC', max(created_at) AT TIME ZONE 'UTC' FROM blogs_previous"
+    )).one()
+    today = datetime.now(timezone.utc).date()
+    month = date((oldest or today).year, (oldest or today).month, 1)
+    # Every copied row gets a partition, the default one starts out empty
+    last = max(
+        _add_months(date(today.year, today.month, 1), MONTHS_AHEAD),
+        date((newest or today).year, (newest or today).month, 1)
+    )
+    while month <= last:
+        upper = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE blogs_y{month.year}m{month.month:02d} PARTITION OF blogs "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{upper.isoformat()} 00:00:00+00')"
+        )
+        month = upper
+    # Catches rows past the last maintained month instead of failing their insert
+    op.execute('CREATE TABLE blogs_default PARTITION OF blogs DEFAULT')
+
+    _copy_blogs_back()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    _move_blogs_aside()
+    _create_blogs_table(partitioned=False)
+    _copy_blogs_back()
+
+    op.execute('DELETE FROM blog_views WHERE NOT EXISTS (SELECT 1 FROM blogs WHERE blogs.id = blog_views.blog_id)')
+    op.create_foreign_key(
+        'blog_views_blog_id_fkey', 'blog_views', 'blogs', ['blog_id'], ['id'], ondelete='CASCADE'
+    )
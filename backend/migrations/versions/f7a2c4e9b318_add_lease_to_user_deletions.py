@@ -0,0 +1,30 @@
+"""add lease to user deletions.
+
+Revision ID: f7a2c4e9b318
+Revises: a4c9e2b7d615
+Create Date: 2026-10-20 09:14:27.530418
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7a2c4e9b318'
+down_revision: Union[str, Sequence[str], None] = 'a4c9e2b7d615'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('user_deletions', sa.Column('lease_owner', sa.String(length=36), nullable=True))
+    op.add_column('user_deletions', sa.Column('lease_until', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('user_deletions', 'lease_until')
+    op.drop_column('user_deletions', 'lease_owner')
@@ -1,4 +1,26 @@
 from .user_dto import CreateUserDTO, UpdateUserDTO, ChangePasswordDTO, UserResponseDTO
-from .pagination_dto import PaginationDTO, PaginationResponseDTO
-from .blog_dto import CreateBlogDTO, UpdateBlogDTO, BlogResponseDTO
-from .basic_dto import BasicUserDTO
\ No newline at end of file
+from .pagination_dto import (
+  PaginationDTO,
+  BlogPaginationDTO,
+  BlogSearchDTO,
+  CursorPaginationDTO,
+  PaginationResponseDTO,
+  BlogSearchResponseDTO,
+  CursorPaginationResponseDTO
+)
+from .blog_dto import (
+  CreateBlogDTO,
+  UpdateBlogDTO,
+  TextPatchOperationDTO,
+  PatchBlogDTO,
+  BlogResponseDTO,
+  BlogPatchResponseDTO,
+  TrendingBlogDTO,
+  BlogRevisionDTO,
+  BlogRevisionContentDTO
+)
+from .basic_dto import BasicUserDTO
+from .author_stats_dto import AuthorStatsDTO
+from .image_dto import ImageVariantDTO, ProcessedImageDTO
+from .outbox_dto import OutboxMessageDTO
+from .user_deletion_dto import UserDeletionDTO
\ No newline at end of file
@@ -0,0 +1,8 @@
+from datetime import datetime
+from pydantic import BaseModel
+from typing import Optional
+
+class AuthorStatsDTO(BaseModel):
+  author_id: str
+  post_count: int = 0
+  last_posted_at: Optional[datetime] = None
@@ -1,9 +1,10 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Dict, Optional
 
 class BasicUserDTO(BaseModel):
   id: str
   first_name: str
   last_name: str
   username: str
-  avatar: Optional[str] = None
\ No newline at end of file
+  avatar: Optional[str] = None
+  avatar_variants: Optional[Dict[str, Dict[str, str]]] = None
@@ -1,6 +1,6 @@
 from datetime import datetime
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
 from .basic_dto import BasicUserDTO
 
 class CreateBlogDTO(BaseModel):
@@ -8,11 +8,23 @@ class CreateBlogDTO(BaseModel):
   content: str
   author_id: str
   hero_image: Optional[str] = None
+  tags: List[str] = []
 
 class UpdateBlogDTO(BaseModel):
   title: Optional[str] = None
   content: Optional[str] = None
   hero_image: Optional[str] = None
+  tags: Optional[List[str]] = None
+
+class TextPatchOperationDTO(BaseModel):
+  offset: int
+  delete: int = 0
+  insert: str = ""
+
+class PatchBlogDTO(BaseModel):
+  operations: List[TextPatchOperationDTO]
+  # SHA-256 hex digest of the content once patched
+  content_hash: str = Field(pattern=r"^[0-9a-f]{64}$")
 
 class BlogResponseDTO(BaseModel):
   id: str
@@ -22,4 +34,28 @@ class BlogResponseDTO(BaseModel):
   created_at: datetime
   updated_at: datetime
   hero_image: Optional[str] = None 
-  author: Optional[BasicUserDTO] = None
\ No newline at end of file
+  hero_image_variants: Optional[Dict[str, Dict[str, str]]] = None
+  content_html: Optional[str] = None
+  tags: List[str] = []
+  author: Optional[BasicUserDTO] = None
+  views: int = 0
+  version: int = 1
+
+class TrendingBlogDTO(BlogResponseDTO):
+  score: float
+
+class BlogPatchResponseDTO(BaseModel):
+  id: str
+  version: int
+  updated_at: datetime
+  content_length: int
+  content_hash: str
+
+class BlogRevisionDTO(BaseModel):
+  version: int
+  title: str
+  content_length: int
+  created_at: datetime
+
+class BlogRevisionContentDTO(BlogRevisionDTO):
+  content: str
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from typing import List
+
+class ImageVariantDTO(BaseModel):
+  name: str
+  format: str
+  path: str
+  content_type: str
+  width: int
+  height: int
+
+class ProcessedImageDTO(BaseModel):
+  format: str
+  content_type: str
+  variants: List[ImageVariantDTO]
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+class OutboxMessageDTO(BaseModel):
+  id: int
+  event_type: str
+  payload: dict
+  attempts: int
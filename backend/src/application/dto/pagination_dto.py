@@ -1,5 +1,6 @@
-from pydantic import BaseModel
-from typing import Optional, Generic, TypeVar, List
+from datetime import datetime
+from pydantic import BaseModel, Field
+from typing import Dict, Generic, List, Literal, Optional, TypeVar
 
 T = TypeVar("T")
 
@@ -8,8 +9,27 @@ class PaginationDTO(BaseModel):
   limit: int = 10
   search: Optional[str] = None
 
+class BlogPaginationDTO(PaginationDTO):
+  created_after: Optional[datetime] = None
+  created_before: Optional[datetime] = None
+
+class BlogSearchDTO(BlogPaginationDTO):
+  tag: List[str] = []
+  tag_match: Literal["all", "any"] = "all"
+
+class CursorPaginationDTO(BaseModel):
+  cursor: Optional[str] = None
+  limit: int = Field(10, ge=1, le=50)
+
 class PaginationResponseDTO(BaseModel, Generic[T]):
   total: int
   skip: int
   limit: int
-  items: List[T]
\ No newline at end of file
+  items: List[T]
+
+class BlogSearchResponseDTO(PaginationResponseDTO[T], Generic[T]):
+  facets: Dict[str, int] = {}
+
+class CursorPaginationResponseDTO(BaseModel, Generic[T]):
+  items: List[T]
+  next_cursor: Optional[str] = None
\ No newline at end of file
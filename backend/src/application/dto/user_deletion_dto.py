@@ -0,0 +1,13 @@
+from datetime import datetime
+from pydantic import BaseModel
+from typing import Optional
+
+class UserDeletionDTO(BaseModel):
+  id: str
+  user_id: str
+  status: str
+  blogs_total: int
+  blogs_deleted: int
+  progress: float
+  created_at: datetime
+  completed_at: Optional[datetime] = None
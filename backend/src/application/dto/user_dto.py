@@ -1,5 +1,5 @@
 from pydantic import BaseModel, field_serializer, field_validator
-from typing import Optional
+from typing import Dict, Optional
 from datetime import datetime, timezone
 
 class CreateUserDTO(BaseModel):
@@ -36,8 +36,10 @@ class UserResponseDTO(BaseModel):
   last_name: str
   username: str
   avatar: Optional[str] = None
+  avatar_variants: Optional[Dict[str, Dict[str, str]]] = None
   created_at: datetime
   updated_at: datetime
+  version: int = 1
   
   model_config = {
     'from_attributes': True
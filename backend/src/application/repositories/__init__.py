@@ -1,2 +1,13 @@
 from .user_repository import IUserRepository
-from .blog_repository import IBlogRepository
\ No newline at end of file
+from .blog_repository import IBlogRepository
+from .blog_view_repository import IBlogViewRepository
+from .author_stats_repository import IAuthorStatsRepository
+from .outbox_repository import IOutboxRepository
+from .auth_session_repository import IAuthSessionRepository
+from .user_deletion_repository import IUserDeletionRepository
+from .related_blog_repository import IRelatedBlogRepository
+from .trending_score_repository import ITrendingScoreRepository
+from .follow_repository import IFollowRepository
+from .timeline_repository import ITimelineRepository
+from .blog_revision_repository import IBlogRevisionRepository
+from .job_lease_repository import IJobLeaseRepository
\ No newline at end of file
@@ -0,0 +1,92 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+from src.domain.entities import AuthSessionEntity
+
+class IAuthSessionRepository(ABC):
+  @abstractmethod
+  async def create_session(self, auth_session: AuthSessionEntity) -> AuthSessionEntity:
+    """Store a new login session.
+
+    Args:
+      auth_session (AuthSessionEntity): The session to store.
+
+    Returns:
+      AuthSessionEntity: The stored session.
+    """
+    pass
+
+  @abstractmethod
+  async def get_session(self, session_id: str) -> Optional[AuthSessionEntity]:
+    """Retrieve a session by its ID.
+
+    Args:
+      session_id (str): The ID of the session.
+
+    Returns:
+      Optional[AuthSessionEntity]: The session if it exists, otherwise None.
+    """
+    pass
+
+  @abstractmethod
+  async def rotate_tokens(
+    self,
+    session_id: str,
+    refresh_token_id: str,
+    new_access_token_id: str,
+    new_refresh_token_id: str,
+    expires_at: datetime
+  ) -> bool:
+    """Replace the token IDs of a session if its refresh token is still the current one.
+
+    The check and the update are a single statement, so two concurrent refreshes
+    with the same token can never both succeed.
+
+    Args:
+      session_id (str): The ID of the session.
+      refresh_token_id (str): The refresh token ID presented by the client.
+      new_access_token_id (str): The ID of the newly issued access token.
+      new_refresh_token_id (str): The ID of the newly issued refresh token.
+      expires_at (datetime): The new expiry of the session.
+
+    Returns:
+      bool: True if the tokens were rotated, False if the session is gone or the token was already used.
+    """
+    pass
+
+  @abstractmethod
+  async def delete_session(self, session_id: str) -> bool:
+    """Revoke a single session.
+
+    Args:
+      session_id (str): The ID of the session.
+
+    Returns:
+      bool: True if a session was deleted.
+    """
+    pass
+
+  @abstractmethod
+  async def delete_user_sessions(self, user_id: str) -> int:
+    """Revoke every session of a user.
+
+    Args:
+      user_id (str): The ID of the user.
+
+    Returns:
+      int: The number of deleted sessions.
+    """
+    pass
+
+  @abstractmethod
+  async def delete_expired(self, now: datetime, limit: int) -> int:
+    """Delete at most `limit` sessions that expired before `now`.
+
+    Args:
+      now (datetime): The current time.
+      limit (int): Maximum number of sessions deleted by this call.
+
+    Returns:
+      int: The number of deleted sessions.
+    """
+    pass
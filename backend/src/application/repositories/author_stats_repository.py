@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+from src.domain.entities import AuthorStatsEntity
+
+class IAuthorStatsRepository(ABC):
+  @abstractmethod
+  async def get_stats(self, author_id: str) -> Optional[AuthorStatsEntity]:
+    """Retrieve the blog statistics of an author.
+
+    Args:
+      author_id (str): The ID of the author.
+
+    Returns:
+      Optional[AuthorStatsEntity]: The statistics if the author has ever posted, otherwise None.
+    """
+    pass
+
+  @abstractmethod
+  async def record_post(self, author_id: str, posted_at: datetime) -> None:
+    """Account for a new blog of an author.
+
+    Args:
+      author_id (str): The ID of the author.
+      posted_at (datetime): Creation time of the new blog.
+    """
+    pass
+
+  @abstractmethod
+  async def record_deletion(self, author_id: str) -> None:
+    """Account for a deleted blog of an author. Must run after the blog is deleted.
+
+    Args:
+      author_id (str): The ID of the author.
+    """
+    pass
+
+  @abstractmethod
+  async def rebuild(self, author_id: Optional[str] = None) -> int:
+    """Recompute statistics from the blogs table.
+
+    Args:
+      author_id (Optional[str], optional): Only rebuild this author. Defaults to None (every author).
+
+    Returns:
+      int: The number of authors with statistics after the rebuild.
+    """
+    pass
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, List
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional, Tuple, List
 from src.domain.entities import BlogEntity
 
 class IBlogRepository(ABC):
@@ -27,19 +28,39 @@ class IBlogRepository(ABC):
     """
     pass
 
+  @abstractmethod
+  async def get_blogs_by_ids(self, blog_ids: List[str]) -> List[BlogEntity]:
+    """Retrieve several blogs by their IDs.
+
+    Args:
+      blog_ids (List[str]): The IDs of the blogs to retrieve.
+
+    Returns:
+      List[BlogEntity]: The blogs found, in the order of `blog_ids`. Unknown IDs are skipped.
+    """
+    pass
+
   @abstractmethod
   async def get_all_blogs(
     self,
     skip: int = 0,
     limit: int = 10,
-    search: Optional[str] = None
+    search: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    tags: Optional[List[str]] = None,
+    match_all_tags: bool = True
   ) -> Tuple[List[BlogEntity], int]:
-    """Retrieve all blogs with pagination and optional search.
+    """Retrieve all blogs, newest first, with pagination and optional search.
 
     Args:
       skip (int, optional): Number of records to skip. Defaults to 0.
       limit (int, optional): Maximum number of records to return. Defaults to 10.
       search (Optional[str], optional): Search term for filtering blogs. Defaults to None.
+      created_after (Optional[datetime], optional): Only blogs created at or after this time. Defaults to None.
+      created_before (Optional[datetime], optional): Only blogs created before this time. Defaults to None.
+      tags (Optional[List[str]], optional): Only blogs with these normalized tags. Defaults to None.
+      match_all_tags (bool, optional): Require every tag instead of any of them. Defaults to True.
 
     Returns:
       Tuple[List[BlogEntity], int]: A tuple containing the list of blog entities and the total count.
@@ -52,7 +73,9 @@ class IBlogRepository(ABC):
     author_id: str,
     skip: int = 0,
     limit: int = 10,
-    search: Optional[str] = None
+    search: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None
   ) -> Tuple[List[BlogEntity], int]:
     """Retrieve all blogs by a specific author with pagination and optional search.
 
@@ -61,6 +84,8 @@ class IBlogRepository(ABC):
       skip (int, optional): Number of records to skip. Defaults to 0.
       limit (int, optional): Maximum number of records to return. Defaults to 10.
       search (Optional[str], optional): Search term for filtering blogs. Defaults to None.
+      created_after (Optional[datetime], optional): Only blogs created at or after this time. Defaults to None.
+      created_before (Optional[datetime], optional): Only blogs created before this time. Defaults to None.
 
     Returns:
       Tuple[List[BlogEntity], int]: A tuple containing the list of blog entities and the total count.
@@ -69,14 +94,52 @@ class IBlogRepository(ABC):
 
   @abstractmethod
   async def update_blog(self, blog_id: str, blog: BlogEntity) -> BlogEntity:
-    """Update an existing blog.
+    """Update an existing blog if it is still at the version it was read at.
+
+    Args:
+      blog_id (str): The ID of the blog to update.
+      blog (BlogEntity): The blog entity with updated data, its version is the one expected in storage.
+
+    Returns:
+      BlogEntity: The updated blog entity, with its version incremented.
+
+    Raises:
+      NotFoundException: If the blog does not exist.
+      ConflictException: If the blog was modified since it was read.
+    """
+    pass
+
+  @abstractmethod
+  async def update_owned_blog(
+    self,
+    blog_id: str,
+    author_id: str,
+    changes: Dict[str, Any],
+    expected_version: Optional[int] = None
+  ) -> Optional[BlogEntity]:
+    """Apply changes to a blog in one statement, only if it belongs to the author and is at the expected version.
 
     Args:
       blog_id (str): The ID of the blog to update.
-      blog (BlogEntity): The blog entity with updated data.
+      author_id (str): The ID of the author who must own the blog.
+      changes (Dict[str, Any]): The already validated column values to set.
+      expected_version (Optional[int], optional): The version the blog must be at. Defaults to None.
+
+    Returns:
+      Optional[BlogEntity]: The updated blog, or None if no blog matched all the conditions.
+    """
+    pass
+
+  @abstractmethod
+  async def delete_owned_blog(self, blog_id: str, author_id: str) -> bool:
+    """Delete a blog in one statement, only if it belongs to the author.
+
+    Args:
+      blog_id (str): The ID of the blog to delete.
+      author_id (str): The ID of the author who must own the blog.
 
     Returns:
-      BlogEntity: The updated blog entity.
+      bool: True if the blog was deleted, False if no blog matched both conditions.
     """
     pass
 
@@ -87,4 +150,76 @@ class IBlogRepository(ABC):
     Args:
       blog_id (str): The ID of the blog to delete.
     """
-    pass
\ No newline at end of file
+    pass
+
+  @abstractmethod
+  def stream_blogs(
+    self,
+    author_id: Optional[str] = None,
+    limit: Optional[int] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None
+  ) -> AsyncIterator[BlogEntity]:
+    """Stream blogs, newest first, without loading the whole result in memory.
+
+    Args:
+      author_id (Optional[str], optional): Only stream the blogs of this author. Defaults to None.
+      limit (Optional[int], optional): Maximum number of blogs to stream. Defaults to None.
+      created_after (Optional[datetime], optional): Only blogs created at or after this time. Defaults to None.
+      created_before (Optional[datetime], optional): Only blogs created before this time. Defaults to None.
+
+    Returns:
+      AsyncIterator[BlogEntity]: An async iterator over the blog entities.
+    """
+    pass
+
+  @abstractmethod
+  def stream_blog_updates(self, limit: Optional[int] = None) -> AsyncIterator[Tuple[str, datetime]]:
+    """Stream the ID and last update time of blogs, most recently updated first.
+
+    Args:
+      limit (Optional[int], optional): Maximum number of blogs to stream. Defaults to None.
+
+    Returns:
+      AsyncIterator[Tuple[str, datetime]]: An async iterator over (blog_id, updated_at) pairs.
+    """
+    pass
+
+  @abstractmethod
+  async def count_blogs_by_author(self, author_id: str) -> int:
+    """Count the blogs of an author.
+
+    Args:
+      author_id (str): The ID of the author.
+
+    Returns:
+      int: The number of blogs written by the author.
+    """
+    pass
+
+  @abstractmethod
+  async def delete_blogs_by_author(self, author_id: str, limit: int) -> List[BlogEntity]:
+    """Delete at most `limit` blogs of an author, so large deletions can run in short transactions.
+
+    Args:
+      author_id (str): The ID of the author whose blogs to delete.
+      limit (int): Maximum number of blogs to delete.
+
+    Returns:
+      List[BlogEntity]: The blogs this call deleted, fewer than `limit` once none are left or
+        when some were deleted concurrently.
+    """
+    pass
+
+  @abstractmethod
+  async def get_tag_counts(self, tags: Optional[List[str]] = None, limit: int = 20) -> Dict[str, int]:
+    """Retrieve how many blogs carry each tag, from counts maintained on every write.
+
+    Args:
+      tags (Optional[List[str]], optional): The tags to count. Defaults to None (the most used tags).
+      limit (int, optional): Maximum number of tags returned when no tags are given. Defaults to 20.
+
+    Returns:
+      Dict[str, int]: The number of blogs per tag, tags without blogs are left out.
+    """
+    pass
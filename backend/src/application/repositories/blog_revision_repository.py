@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from src.domain.entities import BlogEntity, BlogRevisionEntity
+
+class IBlogRevisionRepository(ABC):
+  @abstractmethod
+  async def add_revision(self, blog: BlogEntity) -> None:
+    """Record the current version of a blog as a revision.
+
+    Args:
+      blog (BlogEntity): The blog as just written.
+    """
+    pass
+
+  @abstractmethod
+  async def get_revisions(self, blog_id: str, skip: int = 0, limit: int = 10) -> Tuple[List[BlogRevisionEntity], int]:
+    """Retrieve the revisions of a blog without their content, newest first.
+
+    Args:
+      blog_id (str): The ID of the blog.
+      skip (int, optional): Number of revisions to skip. Defaults to 0.
+      limit (int, optional): Maximum number of revisions to return. Defaults to 10.
+
+    Returns:
+      Tuple[List[BlogRevisionEntity], int]: The revisions and their total count.
+    """
+    pass
+
+  @abstractmethod
+  async def get_revision(self, blog_id: str, version: int) -> Optional[BlogRevisionEntity]:
+    """Retrieve one revision of a blog with its content.
+
+    Args:
+      blog_id (str): The ID of the blog.
+      version (int): The version of the blog.
+
+    Returns:
+      Optional[BlogRevisionEntity]: The revision if it was recorded, otherwise None.
+    """
+    pass
+
+  @abstractmethod
+  async def delete_blog(self, blog_id: str) -> None:
+    """Delete every revision of a blog.
+
+    Args:
+      blog_id (str): The ID of the deleted blog.
+    """
+    pass
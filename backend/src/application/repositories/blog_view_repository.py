@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+class IBlogViewRepository(ABC):
+  @abstractmethod
+  async def get_views(self, blog_ids: List[str]) -> Dict[str, int]:
+    """Retrieve the persisted view counts of several blogs at once.
+
+    Args:
+      blog_ids (List[str]): The IDs of the blogs to look up.
+
+    Returns:
+      Dict[str, int]: View counts keyed by blog ID. Blogs without views are omitted.
+    """
+    pass
+
+  @abstractmethod
+  async def increment_views(self, counts: Dict[str, int]) -> List[str]:
+    """Add a batch of view increments in a single upsert.
+
+    Args:
+      counts (Dict[str, int]): Number of new views keyed by blog ID. Unknown blogs are ignored.
+
+    Returns:
+      List[str]: The IDs of the blogs whose views were counted.
+    """
+    pass
+
+  @abstractmethod
+  async def delete_orphaned_views(self) -> int:
+    """Delete the view counts of blogs that no longer exist.
+
+    Returns:
+      int: The number of view counts deleted.
+    """
+    pass
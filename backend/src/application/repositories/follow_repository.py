@@ -0,0 +1,109 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from src.domain.entities import UserEntity
+
+class IFollowRepository(ABC):
+  @abstractmethod
+  async def follow(self, follower_id: str, followee_id: str) -> bool:
+    """Make a user follow another one.
+
+    Args:
+      follower_id (str): The ID of the following user.
+      followee_id (str): The ID of the followed user.
+
+    Returns:
+      bool: True if the user did not follow the other one yet.
+    """
+    pass
+
+  @abstractmethod
+  async def unfollow(self, follower_id: str, followee_id: str) -> bool:
+    """Make a user stop following another one.
+
+    Args:
+      follower_id (str): The ID of the following user.
+      followee_id (str): The ID of the followed user.
+
+    Returns:
+      bool: True if the user followed the other one.
+    """
+    pass
+
+  @abstractmethod
+  async def get_follower_count(self, user_id: str) -> int:
+    """Retrieve how many users follow a user.
+
+    Args:
+      user_id (str): The ID of the user.
+
+    Returns:
+      int: The number of followers.
+    """
+    pass
+
+  @abstractmethod
+  async def get_follower_ids(self, user_id: str, after: Optional[str] = None, limit: int = 1000) -> List[str]:
+    """Retrieve the IDs of the followers of a user in ID order, one batch at a time.
+
+    Args:
+      user_id (str): The ID of the followed user.
+      after (Optional[str], optional): Only return IDs after this one. Defaults to None.
+      limit (int, optional): Maximum number of IDs to return. Defaults to 1000.
+
+    Returns:
+      List[str]: Follower IDs, ascending.
+    """
+    pass
+
+  @abstractmethod
+  async def get_followee_ids(self, user_id: str, min_followers: int = 0) -> List[str]:
+    """Retrieve the IDs of the users a user follows.
+
+    Args:
+      user_id (str): The ID of the following user.
+      min_followers (int, optional): Only return users with at least this many followers. Defaults to 0.
+
+    Returns:
+      List[str]: Followed user IDs.
+    """
+    pass
+
+  @abstractmethod
+  async def get_followers(self, user_id: str, skip: int = 0, limit: int = 10) -> Tuple[List[UserEntity], int]:
+    """Retrieve the users following a user, most recent first.
+
+    Args:
+      user_id (str): The ID of the followed user.
+      skip (int, optional): Number of users to skip. Defaults to 0.
+      limit (int, optional): Maximum number of users to return. Defaults to 10.
+
+    Returns:
+      Tuple[List[UserEntity], int]: The followers and their total count.
+    """
+    pass
+
+  @abstractmethod
+  async def get_following(self, user_id: str, skip: int = 0, limit: int = 10) -> Tuple[List[UserEntity], int]:
+    """Retrieve the users a user follows, most recent first.
+
+    Args:
+      user_id (str): The ID of the following user.
+      skip (int, optional): Number of users to skip. Defaults to 0.
+      limit (int, optional): Maximum number of users to return. Defaults to 10.
+
+    Returns:
+      Tuple[List[UserEntity], int]: The followed users and their total count.
+    """
+    pass
+
+  @abstractmethod
+  async def delete_followings(self, user_id: str) -> int:
+    """Remove the follows of a user and take them off the follower counts of the users they followed.
+
+    Args:
+      user_id (str): The ID of the following user.
+
+    Returns:
+      int: The number of follows removed.
+    """
+    pass
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+class IJobLeaseRepository(ABC):
+  @abstractmethod
+  async def acquire_lease(self, name: str, owner: str, now: datetime, lease_until: datetime) -> bool:
+    """Lease a job to one worker, or renew the lease that worker already holds.
+
+    Args:
+      name (str): The name of the job.
+      owner (str): Identifies the worker taking the lease.
+      now (datetime): Current time, leases that ended before it are free.
+      lease_until (datetime): When the lease ends unless renewed.
+
+    Returns:
+      bool: True if the job is now leased to `owner`, False if another worker holds it.
+    """
+    pass
+
+  @abstractmethod
+  async def release_lease(self, name: str, owner: str) -> None:
+    """Give up a lease so another worker can take the job right away.
+
+    Args:
+      name (str): The name of the job.
+      owner (str): The worker holding the lease. Leases of other workers are left alone.
+    """
+    pass
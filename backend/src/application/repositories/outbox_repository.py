@@ -0,0 +1,90 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Collection, List
+from src.application.dto import OutboxMessageDTO
+
+class IOutboxRepository(ABC):
+  @abstractmethod
+  async def add_events(self, events: List[object]) -> None:
+    """Store domain events in the outbox as part of the current transaction.
+
+    Args:
+      events (List[object]): Domain events exposing `name` and `to_dict()`.
+    """
+    pass
+
+  @abstractmethod
+  async def claim_batch(
+    self,
+    limit: int,
+    max_attempts: int,
+    lease_until: datetime
+  ) -> List[OutboxMessageDTO]:
+    """Lease the oldest due messages so concurrent dispatchers skip them.
+
+    Args:
+      limit (int): Maximum number of messages to claim.
+      max_attempts (int): Messages that failed this many times are no longer claimed.
+      lease_until (datetime): When the claim expires if the dispatcher never reports back.
+
+    Returns:
+      List[OutboxMessageDTO]: The claimed messages, oldest first, with their attempt counted.
+    """
+    pass
+
+  @abstractmethod
+  async def complete(self, message_ids: List[int], dispatched_at: datetime) -> None:
+    """Mark messages dispatched successfully, they are no longer claimed.
+
+    Args:
+      message_ids (List[int]): The IDs of the dispatched messages.
+      dispatched_at (datetime): When the messages were dispatched.
+    """
+    pass
+
+  @abstractmethod
+  async def retry_later(self, message_id: int, available_at: datetime, error: str) -> None:
+    """Schedule a failed message for another attempt.
+
+    Args:
+      message_id (int): The ID of the failed message.
+      available_at (datetime): Earliest time of the next attempt.
+      error (str): Description of the failure, kept for inspection.
+    """
+    pass
+
+  @abstractmethod
+  async def get_last_id(self) -> int:
+    """Retrieve the ID of the newest message.
+
+    Returns:
+      int: The highest message ID, 0 if the outbox is empty.
+    """
+    pass
+
+  @abstractmethod
+  async def list_messages(self, after_id: int, limit: int, ids: Collection[int] = ()) -> List[OutboxMessageDTO]:
+    """List the messages following an ID, whether dispatched or not.
+
+    Args:
+      after_id (int): Only messages with a greater ID are listed.
+      limit (int): Maximum number of messages to list.
+      ids (Collection[int], optional): Earlier IDs to list as well. Defaults to none.
+
+    Returns:
+      List[OutboxMessageDTO]: The messages, in ID order.
+    """
+    pass
+
+  @abstractmethod
+  async def delete_dispatched(self, dispatched_before: datetime, limit: int) -> int:
+    """Delete a batch of messages dispatched before a given time.
+
+    Args:
+      dispatched_before (datetime): Messages dispatched at or after this time are kept.
+      limit (int): Maximum number of messages to delete.
+
+    Returns:
+      int: The number of messages deleted.
+    """
+    pass
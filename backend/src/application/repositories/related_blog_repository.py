@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Tuple
+
+class IRelatedBlogRepository(ABC):
+  @abstractmethod
+  async def get_related_ids(self, blog_id: str, limit: int = 5) -> List[str]:
+    """Retrieve the IDs of the blogs most similar to a blog.
+
+    Args:
+      blog_id (str): The ID of the blog.
+      limit (int, optional): Maximum number of IDs to return. Defaults to 5.
+
+    Returns:
+      List[str]: Related blog IDs, most similar first.
+    """
+    pass
+
+  @abstractmethod
+  async def replace_related(self, related: Dict[str, List[Tuple[str, float]]]) -> None:
+    """Replace the related blogs of several blogs at once.
+
+    Args:
+      related (Dict[str, List[Tuple[str, float]]]): (related blog ID, similarity) pairs keyed by blog ID.
+    """
+    pass
+
+  @abstractmethod
+  async def delete_blog(self, blog_id: str) -> List[str]:
+    """Delete the related blogs of a blog and every reference to it.
+
+    Args:
+      blog_id (str): The ID of the deleted blog.
+
+    Returns:
+      List[str]: The IDs of the blogs that listed it as related.
+    """
+    pass
+
+  @abstractmethod
+  async def request_refresh(self, blog_id: str) -> None:
+    """Queue a changed blog so that its related blogs, and those of its neighbours, are refreshed.
+
+    Args:
+      blog_id (str): The ID of the created, updated or deleted blog.
+    """
+    pass
+
+  @abstractmethod
+  async def claim_refreshes(self, limit: int) -> List[str]:
+    """Take queued refreshes off the queue. They are queued again if the transaction rolls back.
+
+    Args:
+      limit (int): Maximum number of refreshes to take.
+
+    Returns:
+      List[str]: The IDs of the blogs to refresh.
+    """
+    pass
@@ -0,0 +1,79 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional, Tuple
+from src.domain.entities import BlogEntity
+
+class ITimelineRepository(ABC):
+  @abstractmethod
+  async def add_blog(self, user_ids: List[str], blog: BlogEntity, max_length: int) -> None:
+    """Push a blog onto the timelines of several users.
+
+    Args:
+      user_ids (List[str]): The IDs of the timeline owners.
+      blog (BlogEntity): The blog to push.
+      max_length (int): Older entries beyond this many are dropped from each timeline.
+    """
+    pass
+
+  @abstractmethod
+  async def add_blogs(self, user_id: str, blogs: List[BlogEntity], max_length: int) -> None:
+    """Push several blogs onto the timeline of a user.
+
+    Args:
+      user_id (str): The ID of the timeline owner.
+      blogs (List[BlogEntity]): The blogs to push.
+      max_length (int): Older entries beyond this many are dropped from the timeline.
+    """
+    pass
+
+  @abstractmethod
+  async def get_entries(
+    self,
+    user_id: str,
+    limit: int = 10,
+    before: Optional[Tuple[datetime, str]] = None
+  ) -> List[Tuple[str, datetime]]:
+    """Retrieve a page of a timeline, newest first.
+
+    Args:
+      user_id (str): The ID of the timeline owner.
+      limit (int, optional): Maximum number of entries to return. Defaults to 10.
+      before (Optional[Tuple[datetime, str]], optional): Only return entries ordered after this
+        (created_at, blog ID) position. Defaults to None.
+
+    Returns:
+      List[Tuple[str, datetime]]: (blog ID, created_at) entries.
+    """
+    pass
+
+  @abstractmethod
+  async def delete_blog(self, blog_id: str) -> None:
+    """Remove a blog from every timeline.
+
+    Args:
+      blog_id (str): The ID of the deleted blog.
+    """
+    pass
+
+  @abstractmethod
+  async def delete_author(self, user_id: str, author_id: str) -> None:
+    """Remove the blogs of an author from the timeline of a user.
+
+    Args:
+      user_id (str): The ID of the timeline owner.
+      author_id (str): The ID of the author.
+    """
+    pass
+
+  @abstractmethod
+  async def delete_timeline(self, user_id: str, limit: Optional[int] = None) -> int:
+    """Remove the entries of the timeline of a user.
+
+    Args:
+      user_id (str): The ID of the timeline owner.
+      limit (Optional[int], optional): Maximum number of entries to remove. Defaults to None, all of them.
+
+    Returns:
+      int: The number of entries removed.
+    """
+    pass
@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+class ITrendingScoreRepository(ABC):
+  @abstractmethod
+  async def replace_worker_scores(self, worker_id: str, scores: Dict[str, float], decayed_at: datetime) -> None:
+    """Replace the trending scores a worker persisted before.
+
+    Args:
+      worker_id (str): The ID of the worker.
+      scores (Dict[str, float]): Scores keyed by blog ID.
+      decayed_at (datetime): The time the scores were decayed to.
+    """
+    pass
+
+  @abstractmethod
+  async def get_scores(self) -> List[Tuple[str, float, datetime]]:
+    """Retrieve the persisted scores of every worker.
+
+    Returns:
+      List[Tuple[str, float, datetime]]: (blog ID, score, time the score was decayed to) rows.
+    """
+    pass
+
+  @abstractmethod
+  async def delete_scores_before(self, decayed_before: datetime) -> int:
+    """Delete scores last persisted before a time, e.g. those of stopped workers.
+
+    Args:
+      decayed_before (datetime): Scores decayed to an earlier time are deleted.
+
+    Returns:
+      int: The number of scores deleted.
+    """
+    pass
+
+  @abstractmethod
+  async def delete_blog(self, blog_id: str) -> None:
+    """Delete the scores of a blog.
+
+    Args:
+      blog_id (str): The ID of the deleted blog.
+    """
+    pass
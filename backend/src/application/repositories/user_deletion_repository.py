@@ -0,0 +1,87 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+from src.domain.entities import UserDeletionEntity
+
+class IUserDeletionRepository(ABC):
+  @abstractmethod
+  async def create_deletion(self, user_deletion: UserDeletionEntity) -> UserDeletionEntity:
+    """Store a new account deletion request.
+
+    Args:
+      user_deletion (UserDeletionEntity): The deletion to store.
+
+    Returns:
+      UserDeletionEntity: The stored deletion.
+    """
+    pass
+
+  @abstractmethod
+  async def get_deletion(self, deletion_id: str) -> Optional[UserDeletionEntity]:
+    """Retrieve a deletion by its ID.
+
+    Args:
+      deletion_id (str): The ID of the deletion.
+
+    Returns:
+      Optional[UserDeletionEntity]: The deletion if it exists, otherwise None.
+    """
+    pass
+
+  @abstractmethod
+  async def get_pending_deletion_for_user(self, user_id: str) -> Optional[UserDeletionEntity]:
+    """Retrieve the unfinished deletion of a user, if one was already requested.
+
+    Args:
+      user_id (str): The ID of the user being deleted.
+
+    Returns:
+      Optional[UserDeletionEntity]: The pending deletion if it exists, otherwise None.
+    """
+    pass
+
+  @abstractmethod
+  async def get_pending_deletion_ids(self, limit: int = 100) -> List[str]:
+    """Retrieve the IDs of deletions that have not completed yet, oldest first.
+
+    Args:
+      limit (int, optional): Maximum number of IDs to return. Defaults to 100.
+
+    Returns:
+      List[str]: The IDs of the pending deletions.
+    """
+    pass
+
+  @abstractmethod
+  async def claim_deletion(self, deletion_id: str, owner: str, now: datetime, lease_until: datetime) -> bool:
+    """Lease a pending deletion to one purge, or renew the lease that purge already holds.
+
+    Args:
+      deletion_id (str): The ID of the deletion.
+      owner (str): Identifies the purge taking the lease.
+      now (datetime): Current time, leases that ended before it are free.
+      lease_until (datetime): When the lease ends unless renewed.
+
+    Returns:
+      bool: True if the deletion is pending and now leased to `owner`, False otherwise.
+    """
+    pass
+
+  @abstractmethod
+  async def record_progress(
+    self,
+    deletion_id: str,
+    blogs_deleted: int,
+    now: datetime,
+    completed: bool = False
+  ) -> None:
+    """Add deleted blogs to the progress of a deletion without reading it first.
+
+    Args:
+      deletion_id (str): The ID of the deletion.
+      blogs_deleted (int): Number of blogs deleted by the last chunk.
+      now (datetime): Time of the update.
+      completed (bool, optional): Whether the deletion finished with this chunk, which also
+        releases its lease. Defaults to False.
+    """
+    pass
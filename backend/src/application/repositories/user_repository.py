@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, List
+from typing import Any, Dict, Optional, Tuple, List
 from src.domain.entities import UserEntity
 
 class IUserRepository(ABC):
@@ -60,16 +60,40 @@ class IUserRepository(ABC):
   
   @abstractmethod
   async def update_user(self, user_id: str, user: UserEntity) -> UserEntity:
-    """Update an existing user.
+    """Update an existing user if it is still at the version it was read at.
 
     Args:
-      user (UserEntity): The user entity with updated data.
+      user_id (str): The ID of the user to update.
+      user (UserEntity): The user entity with updated data, its version is the one expected in storage.
 
     Returns:
-      UserEntity: The updated user entity.
+      UserEntity: The updated user entity, with its version incremented.
+
+    Raises:
+      NotFoundException: If the user does not exist.
+      ConflictException: If the user was modified since it was read.
     """
     pass
   
+  @abstractmethod
+  async def update_user_fields(
+    self,
+    user_id: str,
+    changes: Dict[str, Any],
+    expected_version: Optional[int] = None
+  ) -> Optional[UserEntity]:
+    """Apply changes to a user in one statement, only if it is at the expected version.
+
+    Args:
+      user_id (str): The ID of the user to update.
+      changes (Dict[str, Any]): The already validated column values to set.
+      expected_version (Optional[int], optional): The version the user must be at. Defaults to None.
+
+    Returns:
+      Optional[UserEntity]: The updated user, or None if no user matched all the conditions.
+    """
+    pass
+
   @abstractmethod
   async def delete_user(self, user_id: str) -> bool:
     """Delete a user by their ID.
@@ -1,3 +1,10 @@
 from .unit_of_work import IUnitOfWork
+from .job_queue import IJobQueue
 from .password_hasher import IPasswordHasher
-from .id_generator import IIdGenerator
\ No newline at end of file
+from .id_generator import IIdGenerator
+from .view_counter import IViewCounter
+from .markdown_renderer import IMarkdownRenderer
+from .image_processor import IImageProcessor
+from .image_storage import IImageStorage
+from .user_content_purger import IUserContentPurger
+from .trending_tracker import ITrendingTracker
\ No newline at end of file
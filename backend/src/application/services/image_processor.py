@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from src.application.dto import ProcessedImageDTO
+
+class IImageProcessor(ABC):
+  @abstractmethod
+  async def create_variants(self, source_path: str, output_dir: str) -> ProcessedImageDTO:
+    """Generate the resized variants of an uploaded image
+
+    Args:
+      source_path (str): path of the uploaded original on local disk
+      output_dir (str): directory the variant files are written to
+
+    Returns:
+      ProcessedImageDTO: returns the detected format of the original and the generated variants
+
+    Raises:
+      InvalidDataException: if the file is not a supported image
+    """
+    pass
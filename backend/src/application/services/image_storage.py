@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+class IImageStorage(ABC):
+  @abstractmethod
+  async def save(self, key: str, source_path: str, content_type: str) -> str:
+    """Store a file under the given key
+
+    Args:
+      key (str): storage key, e.g. "blogs/<blog_id>/<upload_id>/card.webp"
+      source_path (str): path of the file on local disk
+      content_type (str): MIME type served with the file
+
+    Returns:
+      str: returns the public URL of the stored file
+    """
+    pass
+
+  @abstractmethod
+  async def delete(self, keys: List[str]) -> None:
+    """Remove stored files, ignoring keys that do not exist
+
+    Args:
+      keys (List[str]): storage keys to remove
+    """
+    pass
+
+  @abstractmethod
+  def key_for_url(self, url: str) -> Optional[str]:
+    """Find the storage key of a URL returned by `save`
+
+    Args:
+      url (str): public URL of a stored file
+
+    Returns:
+      Optional[str]: returns the key, or None if the URL is not served by this storage
+    """
+    pass
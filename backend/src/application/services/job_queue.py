@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable
+
+class IJobQueue(ABC):
+  @abstractmethod
+  def enqueue(
+    self,
+    queue_name: str,
+    job: Callable[..., Awaitable[Any]],
+    *args: Any,
+    **kwargs: Any
+  ) -> bool:
+    """Schedule a coroutine function to run in the background
+
+    Jobs run after the request that enqueued them returned, so they must not
+    use its database session and should open their own instead.
+
+    Args:
+      queue_name (str): name of the queue, each queue has its own concurrency limit
+      job (Callable[..., Awaitable[Any]]): coroutine function to run
+      *args, **kwargs: arguments passed to the job
+
+    Returns:
+      bool: returns False if the job was rejected because the queue is full or shutting down
+    """
+    pass
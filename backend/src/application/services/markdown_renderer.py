@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+class IMarkdownRenderer(ABC):
+  @abstractmethod
+  async def render(self, content: str) -> str:
+    """Render Markdown content to sanitized HTML
+
+    Args:
+      content (str): raw Markdown content of a blog
+
+    Returns:
+      str: returns HTML that is safe to embed in a page
+    """
+    pass
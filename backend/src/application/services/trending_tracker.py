@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+from src.domain.entities import BlogEntity
+
+class ITrendingTracker(ABC):
+  @abstractmethod
+  def record(self, blog_id: str, weight: float = 1.0) -> None:
+    """Queue an engagement with a blog without waiting for it to be counted.
+
+    Args:
+      blog_id (str): The ID of the blog.
+      weight (float, optional): How much the engagement counts, a view counts 1. Defaults to 1.0.
+    """
+    pass
+
+  @abstractmethod
+  def top(self, limit: int = 10) -> List[Tuple[BlogEntity, float]]:
+    """The blogs with the highest time-decayed engagement, served from memory.
+
+    Args:
+      limit (int, optional): Maximum number of blogs to return. Defaults to 10.
+
+    Returns:
+      List[Tuple[BlogEntity, float]]: Blogs with their current score, highest first.
+    """
+    pass
@@ -1,12 +1,30 @@
 from abc import ABC, abstractmethod
 from src.application.repositories import (
   IUserRepository,
-  IBlogRepository
+  IBlogRepository,
+  IAuthorStatsRepository,
+  IAuthSessionRepository,
+  IUserDeletionRepository,
+  IRelatedBlogRepository,
+  ITrendingScoreRepository,
+  IFollowRepository,
+  ITimelineRepository,
+  IBlogRevisionRepository,
+  IJobLeaseRepository
 )
 
 class IUnitOfWork(ABC):
   users: IUserRepository
   blogs: IBlogRepository
+  author_stats: IAuthorStatsRepository
+  auth_sessions: IAuthSessionRepository
+  user_deletions: IUserDeletionRepository
+  related_blogs: IRelatedBlogRepository
+  trending_scores: ITrendingScoreRepository
+  follows: IFollowRepository
+  timelines: ITimelineRepository
+  blog_revisions: IBlogRevisionRepository
+  job_leases: IJobLeaseRepository
   
   @abstractmethod
   async def __aenter__(self) -> 'IUnitOfWork':
@@ -22,4 +40,13 @@ class IUnitOfWork(ABC):
   
   @abstractmethod
   async def rollback(self):
+    pass
+
+  @abstractmethod
+  def add_event(self, event: object) -> None:
+    """Record a domain event, stored in the outbox by the same commit as the change.
+
+    Args:
+      event (object): The domain event to publish.
+    """
     pass
\ No newline at end of file
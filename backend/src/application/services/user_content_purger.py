@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+class IUserContentPurger(ABC):
+  @abstractmethod
+  async def purge(self, deletion_id: str) -> None:
+    """Delete the blogs of a user in bounded chunks, then the user itself
+
+    Each chunk runs in its own short transaction and records its progress on
+    the deletion, so an interrupted purge can simply be run again.
+
+    Args:
+      deletion_id (str): ID of the account deletion to carry out
+    """
+    pass
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+
+class IViewCounter(ABC):
+  @abstractmethod
+  def record(self, blog_id: str) -> None:
+    """Buffer a single view of a blog without touching the database.
+
+    Args:
+      blog_id (str): The ID of the viewed blog.
+    """
+    pass
+
+  @abstractmethod
+  def pending(self, blog_id: str) -> int:
+    """Number of buffered views of a blog that are not persisted yet.
+
+    Args:
+      blog_id (str): The ID of the blog.
+
+    Returns:
+      int: returns the number of views waiting to be flushed
+    """
+    pass
@@ -1,4 +1,10 @@
 from .create_blog import CreateBlogUseCase
 from .get_blog import GetBlogUseCase
 from .update_blog import UpdateBlogUseCase
-from .delete_blog import DeleteBlogUseCase
\ No newline at end of file
+from .patch_blog import PatchBlogUseCase
+from .delete_blog import DeleteBlogUseCase
+from .upload_hero_image import UploadHeroImageUseCase
+from .get_related_blogs import GetRelatedBlogsUseCase
+from .get_trending_blogs import GetTrendingBlogsUseCase
+from .get_feed import GetFeedUseCase
+from .get_blog_revisions import GetBlogRevisionsUseCase
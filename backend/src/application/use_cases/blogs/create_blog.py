@@ -1,21 +1,30 @@
-from src.application.services import IUnitOfWork, IIdGenerator
+from typing import Optional
+from src.application.services import IUnitOfWork, IIdGenerator, IMarkdownRenderer
 from src.application.dto import CreateBlogDTO, BlogResponseDTO
 from src.domain.entities import BlogEntity
+from src.domain.events import BlogCreatedEvent
 from src.domain.exceptions import InvalidDataException 
 
 class CreateBlogUseCase:
   def __init__(
     self,
     unit_of_work: IUnitOfWork,
-    id_generator: IIdGenerator
+    id_generator: IIdGenerator,
+    markdown_renderer: Optional[IMarkdownRenderer] = None
   ):
     self.uow = unit_of_work
     self.id_generator = id_generator
+    self.markdown_renderer = markdown_renderer
 
   async def execute(
     self, 
     blog_data: CreateBlogDTO, 
   ) -> BlogResponseDTO:
+    # Render before the transaction starts so a long render never holds it open
+    content_html = None
+    if self.markdown_renderer and blog_data.content and blog_data.content.strip():
+      content_html = await self.markdown_renderer.render(blog_data.content.strip())
+
     async with self.uow:
       user = await self.uow.users.get_user_by_id(blog_data.author_id)
 
@@ -29,8 +38,13 @@ class CreateBlogUseCase:
         title=blog_data.title,
         content=blog_data.content,
         author_id=blog_data.author_id,
-        hero_image=blog_data.hero_image
+        hero_image=blog_data.hero_image,
+        content_html=content_html,
+        tags=blog_data.tags
       )
       created_blog = await self.uow.blogs.create_blog(new_blog)
+      await self.uow.author_stats.record_post(created_blog.author_id, created_blog.created_at)
+      await self.uow.blog_revisions.add_revision(created_blog)
+      self.uow.add_event(BlogCreatedEvent(created_blog.id, created_blog.author_id))
 
       return BlogResponseDTO.model_validate(created_blog.to_dict())
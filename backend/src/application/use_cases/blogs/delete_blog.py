@@ -1,5 +1,6 @@
 from src.application.services import IUnitOfWork
 from src.domain.entities import UserEntity
+from src.domain.events import BlogDeletedEvent
 from src.domain.exceptions import NotFoundException, UnauthorizedException
 
 class DeleteBlogUseCase:
@@ -8,12 +9,16 @@ class DeleteBlogUseCase:
   
   async def execute(self, current_user: UserEntity, blog_id: str) -> None:
     async with self.uow:
-      blog = await self.uow.blogs.get_blog_by_id(blog_id)
+      deleted = await self.uow.blogs.delete_owned_blog(blog_id, current_user.id)
 
-      if not blog:
-        raise NotFoundException("Blog", f"blog_id: {blog_id}")
+      if not deleted:
+        blog = await self.uow.blogs.get_blog_by_id(blog_id)
+
+        if not blog:
+          raise NotFoundException("Blog", f"blog_id: {blog_id}")
 
-      if current_user.id != blog.author_id:
         raise UnauthorizedException("You are not authorized to delete this blog.")
       
-      await self.uow.blogs.delete_blog(blog_id)
\ No newline at end of file
+      await self.uow.author_stats.record_deletion(current_user.id)
+      await self.uow.blog_revisions.delete_blog(blog_id)
+      self.uow.add_event(BlogDeletedEvent(blog_id, current_user.id))
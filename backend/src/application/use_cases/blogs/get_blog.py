@@ -1,25 +1,64 @@
-from src.application.dto import BlogResponseDTO, PaginationDTO, PaginationResponseDTO
-from src.application.repositories import IBlogRepository
+from typing import List, Optional
+from src.application.dto import (
+  BlogResponseDTO,
+  BlogPaginationDTO,
+  BlogSearchDTO,
+  PaginationDTO,
+  PaginationResponseDTO,
+  BlogSearchResponseDTO
+)
+from src.application.repositories import IBlogRepository, IBlogViewRepository
+from src.application.services import IViewCounter, ITrendingTracker
+from src.domain.value_objects import Tags
 
 class GetBlogUseCase:
-  def __init__(self, blog_repository: IBlogRepository):
+  FACET_LIMIT = 20
+
+  def __init__(
+    self,
+    blog_repository: IBlogRepository,
+    view_repository: Optional[IBlogViewRepository] = None,
+    view_counter: Optional[IViewCounter] = None,
+    trending_tracker: Optional[ITrendingTracker] = None
+  ):
     self.blog_repository = blog_repository
+    self.view_repository = view_repository
+    self.view_counter = view_counter
+    self.trending_tracker = trending_tracker
 
   async def get_by_id(self, blog_id: str) -> BlogResponseDTO | None:
     blog = await self.blog_repository.get_blog_by_id(blog_id)
     if not blog:
       return None
 
-    return BlogResponseDTO.model_validate(blog.to_dict())
+    blog_dto = BlogResponseDTO.model_validate(blog.to_dict())
+    await self._attach_views([blog_dto])
+    return blog_dto
+
+  async def view_by_id(self, blog_id: str) -> BlogResponseDTO | None:
+    blog = await self.blog_repository.get_blog_by_id(blog_id)
+    if not blog:
+      return None
+
+    if self.view_counter:
+      self.view_counter.record(blog_id)
+    if self.trending_tracker:
+      self.trending_tracker.record(blog_id)
+
+    blog_dto = BlogResponseDTO.model_validate(blog.to_dict())
+    await self._attach_views([blog_dto])
+    return blog_dto
   
   async def get_all_blogs(self, pagination: PaginationDTO) -> PaginationResponseDTO[BlogResponseDTO]:
     blogs, count = await self.blog_repository.get_all_blogs(
       skip=pagination.skip,
       limit=pagination.limit,
-      search=pagination.search
+      search=pagination.search,
+      **self._created_between(pagination)
     )
 
     blog_dtos = [BlogResponseDTO.model_validate(blog.to_dict()) for blog in blogs]
+    await self._attach_views(blog_dtos)
     return PaginationResponseDTO(
       total=count,
       skip=pagination.skip,
@@ -27,18 +66,61 @@ class GetBlogUseCase:
       items=blog_dtos
     )
   
+  async def search_blogs(self, search: BlogSearchDTO) -> BlogSearchResponseDTO[BlogResponseDTO]:
+    tags = Tags(search.tag).values
+    blogs, count = await self.blog_repository.get_all_blogs(
+      skip=search.skip,
+      limit=search.limit,
+      search=search.search,
+      tags=tags,
+      match_all_tags=search.tag_match == "all",
+      **self._created_between(search)
+    )
+
+    facets = await self.blog_repository.get_tag_counts(limit=self.FACET_LIMIT)
+    if tags:
+      facets.update(await self.blog_repository.get_tag_counts(tags))
+
+    blog_dtos = [BlogResponseDTO.model_validate(blog.to_dict()) for blog in blogs]
+    await self._attach_views(blog_dtos)
+    return BlogSearchResponseDTO(
+      total=count,
+      skip=search.skip,
+      limit=search.limit,
+      items=blog_dtos,
+      facets=facets
+    )
+
   async def get_all_blogs_by_author(self, author_id: str, pagination: PaginationDTO) -> PaginationResponseDTO[BlogResponseDTO]:
     blogs, count = await self.blog_repository.get_all_blogs_by_author(
       author_id=author_id,
       skip=pagination.skip,
       limit=pagination.limit,
-      search=pagination.search
+      search=pagination.search,
+      **self._created_between(pagination)
     )
 
     blog_dtos = [BlogResponseDTO.model_validate(blog.to_dict()) for blog in blogs]
+    await self._attach_views(blog_dtos)
     return PaginationResponseDTO(
       total=count,
       skip=pagination.skip,
       limit=pagination.limit,
       items=blog_dtos
-    )
\ No newline at end of file
+    )
+
+  @staticmethod
+  def _created_between(pagination: PaginationDTO) -> dict:
+    if not isinstance(pagination, BlogPaginationDTO):
+      return {}
+    return {"created_after": pagination.created_after, "created_before": pagination.created_before}
+
+  async def _attach_views(self, blog_dtos: List[BlogResponseDTO]) -> None:
+    if not self.view_repository or not blog_dtos:
+      return
+
+    views = await self.view_repository.get_views([blog.id for blog in blog_dtos])
+    for blog in blog_dtos:
+      blog.views = views.get(blog.id, 0)
+      if self.view_counter:
+        blog.views += self.view_counter.pending(blog.id)
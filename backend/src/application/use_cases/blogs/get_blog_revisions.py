@@ -0,0 +1,40 @@
+from typing import Optional
+from src.application.dto import (
+  BlogRevisionDTO,
+  BlogRevisionContentDTO,
+  PaginationDTO,
+  PaginationResponseDTO
+)
+from src.application.repositories import IBlogRepository, IBlogRevisionRepository
+
+class GetBlogRevisionsUseCase:
+  def __init__(
+    self,
+    blog_repository: IBlogRepository,
+    revision_repository: IBlogRevisionRepository
+  ):
+    self.blog_repository = blog_repository
+    self.revision_repository = revision_repository
+
+  async def list_revisions(self, blog_id: str, pagination: PaginationDTO) -> Optional[PaginationResponseDTO[BlogRevisionDTO]]:
+    revisions, count = await self.revision_repository.get_revisions(
+      blog_id,
+      skip=pagination.skip,
+      limit=pagination.limit
+    )
+    # Revisions are deleted with their blog, so only an empty history needs the blog looked up
+    if not count and not await self.blog_repository.get_blog_by_id(blog_id):
+      return None
+
+    return PaginationResponseDTO(
+      total=count,
+      skip=pagination.skip,
+      limit=pagination.limit,
+      items=[BlogRevisionDTO.model_validate(revision.to_dict()) for revision in revisions]
+    )
+
+  async def get_revision(self, blog_id: str, version: int) -> Optional[BlogRevisionContentDTO]:
+    revision = await self.revision_repository.get_revision(blog_id, version)
+    if not revision:
+      return None
+    return BlogRevisionContentDTO.model_validate(revision.to_dict())
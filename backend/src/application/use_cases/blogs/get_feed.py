@@ -0,0 +1,76 @@
+import base64
+import binascii
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+from src.application.dto import BlogResponseDTO, CursorPaginationDTO, CursorPaginationResponseDTO
+from src.application.repositories import IBlogRepository, IFollowRepository, ITimelineRepository
+from src.domain.entities import BlogEntity
+from src.domain.exceptions import InvalidDataException
+
+Position = Tuple[datetime, str]
+
+def _utc(value: datetime) -> datetime:
+  # SQLite gives naive datetime → force UTC
+  return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+def encode_cursor(position: Position) -> str:
+  created_at, blog_id = position
+  return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{blog_id}".encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Position:
+  try:
+    created_at, blog_id = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode().split("|")
+    return _utc(datetime.fromisoformat(created_at)), blog_id
+  except (binascii.Error, UnicodeDecodeError, ValueError):
+    raise InvalidDataException("Invalid feed cursor.")
+
+class GetFeedUseCase:
+  """
+  Home feed of a user: the blogs fanned out to their timeline merged with
+  the latest blogs of the celebrities they follow, which are never fanned out.
+  """
+  def __init__(
+    self,
+    follow_repository: IFollowRepository,
+    timeline_repository: ITimelineRepository,
+    blog_repository: IBlogRepository,
+    celebrity_threshold: int = 10_000
+  ):
+    self.follow_repository = follow_repository
+    self.timeline_repository = timeline_repository
+    self.blog_repository = blog_repository
+    self.celebrity_threshold = celebrity_threshold
+
+  async def execute(self, user_id: str, pagination: CursorPaginationDTO) -> CursorPaginationResponseDTO[BlogResponseDTO]:
+    before = decode_cursor(pagination.cursor) if pagination.cursor else None
+    # One entry more than a page tells whether another page follows
+    fetch = pagination.limit + 1
+
+    positions: Dict[str, datetime] = {
+      blog_id: _utc(created_at)
+      for blog_id, created_at in await self.timeline_repository.get_entries(user_id, fetch, before)
+    }
+
+    pulled: Dict[str, BlogEntity] = {}
+    for author_id in await self.follow_repository.get_followee_ids(user_id, min_followers=self.celebrity_threshold):
+      # The bound is exclusive on created_at alone, ties with the cursor are filtered below
+      created_before = before[0] + timedelta(microseconds=1) if before else None
+      async for blog in self.blog_repository.stream_blogs(author_id=author_id, limit=fetch, created_before=created_before):
+        position = (_utc(blog.created_at), blog.id)
+        if before is None or position < before:
+          positions[blog.id] = position[0]
+          pulled[blog.id] = blog
+
+    page = sorted(positions.items(), key=lambda item: (item[1], item[0]), reverse=True)
+    has_more = len(page) > pagination.limit
+    page = page[:pagination.limit]
+    next_cursor = encode_cursor((page[-1][1], page[-1][0])) if has_more else None
+
+    loaded = await self.blog_repository.get_blogs_by_ids([blog_id for blog_id, _ in page if blog_id not in pulled])
+    blogs = {**{blog.id: blog for blog in loaded}, **pulled}
+
+    # Timeline entries of blogs deleted since are dropped rather than refilled
+    return CursorPaginationResponseDTO(
+      items=[BlogResponseDTO.model_validate(blogs[blog_id].to_dict()) for blog_id, _ in page if blog_id in blogs],
+      next_cursor=next_cursor
+    )
@@ -0,0 +1,21 @@
+from typing import List, Optional
+from src.application.dto import BlogResponseDTO
+from src.application.repositories import IBlogRepository, IRelatedBlogRepository
+
+class GetRelatedBlogsUseCase:
+  def __init__(
+    self,
+    blog_repository: IBlogRepository,
+    related_blog_repository: IRelatedBlogRepository
+  ):
+    self.blog_repository = blog_repository
+    self.related_blog_repository = related_blog_repository
+
+  async def execute(self, blog_id: str, limit: int = 5) -> Optional[List[BlogResponseDTO]]:
+    # Neighbours are precomputed, a blog without any only needs to prove it exists
+    related_ids = await self.related_blog_repository.get_related_ids(blog_id, limit)
+    if not related_ids:
+      return [] if await self.blog_repository.get_blog_by_id(blog_id) else None
+
+    blogs = await self.blog_repository.get_blogs_by_ids(related_ids)
+    return [BlogResponseDTO.model_validate(blog.to_dict()) for blog in blogs]
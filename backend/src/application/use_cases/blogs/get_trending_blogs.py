@@ -0,0 +1,13 @@
+from typing import List
+from src.application.dto import TrendingBlogDTO
+from src.application.services import ITrendingTracker
+
+class GetTrendingBlogsUseCase:
+  def __init__(self, trending_tracker: ITrendingTracker):
+    self.trending_tracker = trending_tracker
+
+  def execute(self, limit: int = 10) -> List[TrendingBlogDTO]:
+    return [
+      TrendingBlogDTO.model_validate({**blog.to_dict(), "score": score})
+      for blog, score in self.trending_tracker.top(limit)
+    ]
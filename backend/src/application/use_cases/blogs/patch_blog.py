@@ -0,0 +1,74 @@
+from typing import Optional
+from src.application.dto import PatchBlogDTO, BlogPatchResponseDTO
+from src.application.services import IUnitOfWork, IMarkdownRenderer
+from src.domain.entities import UserEntity
+from src.domain.events import BlogUpdatedEvent
+from src.domain.exceptions import (
+  NotFoundException,
+  UnauthorizedException,
+  PreconditionFailedException,
+  ConflictException,
+  InvalidDataException
+)
+from src.domain.value_objects import Content, TextPatch
+
+class PatchBlogUseCase:
+  def __init__(
+    self,
+    unit_of_work: IUnitOfWork,
+    markdown_renderer: Optional[IMarkdownRenderer] = None
+  ):
+    self.uow = unit_of_work
+    self.markdown_renderer = markdown_renderer
+
+  async def execute(
+    self,
+    current_user: UserEntity,
+    blog_id: str,
+    patch_data: PatchBlogDTO,
+    expected_version: int
+  ) -> BlogPatchResponseDTO:
+    patch = TextPatch((operation.offset, operation.delete, operation.insert) for operation in patch_data.operations)
+
+    async with self.uow:
+      blog = await self.uow.blogs.get_blog_by_id(blog_id)
+
+      if not blog:
+        raise NotFoundException("Blog", f"blog_id: {blog_id}")
+
+      if current_user.id != blog.author_id:
+        raise UnauthorizedException("You are not authorized to update this blog.")
+
+      # Offsets only mean something against the version the client patched
+      if blog.version != expected_version:
+        raise PreconditionFailedException(f"Blog '{blog_id}' is at version {blog.version}, not {expected_version}.")
+
+    patched = patch.apply(blog.content)
+    if TextPatch.hash(patched) != patch_data.content_hash:
+      raise InvalidDataException("The patched content does not match the content hash, reload the blog and try again.")
+
+    # The client hashed the exact text it expects to be stored, so it must not be normalized
+    if Content(patched).value != patched:
+      raise InvalidDataException("The patched content cannot start or end with whitespace.")
+
+    # Rendered before the transaction opens, as create and update do
+    changes = {
+      "content": patched,
+      "content_html": await self.markdown_renderer.render(patched) if self.markdown_renderer else None
+    }
+
+    async with self.uow:
+      # The version guard catches a write that landed since the read
+      updated_blog = await self.uow.blogs.update_owned_blog(blog_id, current_user.id, changes, expected_version)
+      if not updated_blog:
+        raise ConflictException("Blog", f"blog_id: {blog_id}")
+
+      await self.uow.blog_revisions.add_revision(updated_blog)
+      self.uow.add_event(BlogUpdatedEvent(updated_blog.id, updated_blog.author_id))
+      return BlogPatchResponseDTO(
+        id=updated_blog.id,
+        version=updated_blog.version,
+        updated_at=updated_blog.updated_at,
+        content_length=len(updated_blog.content),
+        content_hash=TextPatch.hash(updated_blog.content)
+      )
@@ -1,29 +1,73 @@
+from typing import Any, Dict, Optional
 from src.application.dto import UpdateBlogDTO, BlogResponseDTO
-from src.application.services import IUnitOfWork
+from src.application.services import IUnitOfWork, IMarkdownRenderer
 from src.domain.entities import UserEntity
-from src.domain.exceptions import NotFoundException, UnauthorizedException
+from src.domain.events import BlogUpdatedEvent
+from src.domain.exceptions import (
+  NotFoundException,
+  UnauthorizedException,
+  PreconditionFailedException,
+  ConflictException
+)
+from src.domain.value_objects import Title, Content, Tags
 
 class UpdateBlogUseCase:
-  def __init__(self, unit_of_work: IUnitOfWork):
+  def __init__(
+    self,
+    unit_of_work: IUnitOfWork,
+    markdown_renderer: Optional[IMarkdownRenderer] = None
+  ):
     self.uow = unit_of_work 
+    self.markdown_renderer = markdown_renderer
   
   async def execute(
     self,
     current_user: UserEntity,
     blog_id: str,
-    blog_data: UpdateBlogDTO
+    blog_data: UpdateBlogDTO,
+    expected_version: Optional[int] = None
   ) -> BlogResponseDTO:
+    changes = await self._build_changes(blog_data)
+
     async with self.uow:
-      blog = await self.uow.blogs.get_blog_by_id(blog_id)
-
-      if not blog:
-        raise NotFoundException("Blog", f"blog_id: {blog_id}")
-      
-      if current_user.id != blog.author_id:
-        raise UnauthorizedException("You are not authorized to update this blog.")
-      
-      for field, value in blog_data.model_dump(exclude_none=True).items():
-        setattr(blog, field, value)
-      
-      updated_blog = await self.uow.blogs.update_blog(blog_id, blog)
-      return BlogResponseDTO.model_validate(updated_blog.to_dict())
\ No newline at end of file
+      # Ownership and version are checked by the UPDATE itself, the blog is only read when it matched nothing
+      updated_blog = await self.uow.blogs.update_owned_blog(blog_id, current_user.id, changes, expected_version)
+
+      if not updated_blog:
+        blog = await self.uow.blogs.get_blog_by_id(blog_id)
+
+        if not blog:
+          raise NotFoundException("Blog", f"blog_id: {blog_id}")
+
+        if current_user.id != blog.author_id:
+          raise UnauthorizedException("You are not authorized to update this blog.")
+
+        if expected_version is not None and blog.version != expected_version:
+          raise PreconditionFailedException(f"Blog '{blog_id}' is at version {blog.version}, not {expected_version}.")
+
+        raise ConflictException("Blog", f"blog_id: {blog_id}")
+
+      await self.uow.blog_revisions.add_revision(updated_blog)
+      self.uow.add_event(BlogUpdatedEvent(updated_blog.id, updated_blog.author_id))
+      return BlogResponseDTO.model_validate(updated_blog.to_dict())
+
+  async def _build_changes(self, blog_data: UpdateBlogDTO) -> Dict[str, Any]:
+    changes: Dict[str, Any] = {}
+
+    if blog_data.title is not None:
+      changes["title"] = Title(blog_data.title).value
+
+    if blog_data.content is not None:
+      changes["content"] = Content(blog_data.content).value
+      # Rendered before the transaction opens, unchanged content is served from the renderer cache
+      changes["content_html"] = (
+        await self.markdown_renderer.render(changes["content"]) if self.markdown_renderer else None
+      )
+
+    if blog_data.hero_image is not None:
+      changes["hero_image"] = blog_data.hero_image
+
+    if blog_data.tags is not None:
+      changes["tags"] = Tags(blog_data.tags).values
+
+    return changes
@@ -0,0 +1,75 @@
+from typing import Optional
+from src.application.dto import BlogResponseDTO
+from src.application.services import (
+  IUnitOfWork,
+  IIdGenerator,
+  IImageProcessor,
+  IImageStorage,
+  IJobQueue
+)
+from src.application.use_cases.images import publish_image, discard_images, delete_images
+from src.domain.entities import UserEntity
+from src.domain.events import BlogUpdatedEvent
+from src.domain.exceptions import NotFoundException, UnauthorizedException
+
+class UploadHeroImageUseCase:
+  def __init__(
+    self,
+    unit_of_work: IUnitOfWork,
+    image_processor: IImageProcessor,
+    image_storage: IImageStorage,
+    id_generator: IIdGenerator,
+    job_queue: Optional[IJobQueue] = None
+  ):
+    self.uow = unit_of_work
+    self.image_processor = image_processor
+    self.image_storage = image_storage
+    self.id_generator = id_generator
+    self.job_queue = job_queue
+
+  async def execute(
+    self,
+    current_user: UserEntity,
+    blog_id: str,
+    source_path: str
+  ) -> BlogResponseDTO:
+    async with self.uow:
+      blog = await self.uow.blogs.get_blog_by_id(blog_id)
+
+      if not blog:
+        raise NotFoundException("Blog", f"blog_id: {blog_id}")
+
+      if current_user.id != blog.author_id:
+        raise UnauthorizedException("You are not authorized to update this blog.")
+
+    # Image processing happens outside the transaction so it never holds it open
+    hero_image, variants = await publish_image(
+      self.image_processor,
+      self.image_storage,
+      f"blogs/{blog_id}/{self.id_generator.generate()}",
+      source_path
+    )
+
+    try:
+      async with self.uow:
+        blog = await self.uow.blogs.get_blog_by_id(blog_id)
+
+        if not blog:
+          raise NotFoundException("Blog", f"blog_id: {blog_id}")
+
+        previous_image, previous_variants = blog.hero_image, blog.hero_image_variants
+        blog.hero_image = hero_image
+        blog.hero_image_variants = variants
+
+        updated_blog = await self.uow.blogs.update_blog(blog_id, blog)
+        # Every version has a revision, even when only the image changed
+        await self.uow.blog_revisions.add_revision(updated_blog)
+        self.uow.add_event(BlogUpdatedEvent(updated_blog.id, updated_blog.author_id))
+    except Exception:
+      # Nothing refers to the published files once the write failed
+      await delete_images(self.image_storage, hero_image, variants)
+      raise
+
+    # The replaced files are removed in the background once the change is committed
+    discard_images(self.image_storage, self.job_queue, previous_image, previous_variants)
+    return BlogResponseDTO.model_validate(updated_blog.to_dict())
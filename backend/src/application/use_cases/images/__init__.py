@@ -0,0 +1 @@
+from .publish_image import publish_image, discard_images, delete_images, IMAGE_JOB_QUEUE
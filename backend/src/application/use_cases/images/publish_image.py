@@ -0,0 +1,61 @@
+import asyncio
+import tempfile
+from typing import Dict, List, Optional, Tuple
+from src.application.services import IImageProcessor, IImageStorage, IJobQueue
+
+IMAGE_JOB_QUEUE = "images"
+
+async def publish_image(
+  image_processor: IImageProcessor,
+  image_storage: IImageStorage,
+  key_prefix: str,
+  source_path: str
+) -> Tuple[str, Dict[str, Dict[str, str]]]:
+  with tempfile.TemporaryDirectory(prefix="image-variants-") as output_dir:
+    processed = await image_processor.create_variants(source_path, output_dir)
+
+    keys = [f"{key_prefix}/original.{processed.format}"]
+    uploads = [image_storage.save(keys[0], source_path, processed.content_type)]
+    for variant in processed.variants:
+      key = f"{key_prefix}/{variant.name}.{variant.format}"
+      keys.append(key)
+      uploads.append(image_storage.save(key, variant.path, variant.content_type))
+
+    urls = await asyncio.gather(*uploads)
+
+  variants: Dict[str, Dict[str, str]] = {}
+  for variant, url in zip(processed.variants, urls[1:]):
+    variants.setdefault(variant.name, {})[variant.format] = url
+
+  return urls[0], variants
+
+def discard_images(
+  image_storage: IImageStorage,
+  job_queue: Optional[IJobQueue],
+  url: Optional[str],
+  variants: Optional[Dict[str, Dict[str, str]]]
+) -> None:
+  if job_queue is None:
+    return
+
+  keys = _image_keys(image_storage, url, variants)
+  if keys:
+    job_queue.enqueue(IMAGE_JOB_QUEUE, image_storage.delete, keys)
+
+async def delete_images(
+  image_storage: IImageStorage,
+  url: Optional[str],
+  variants: Optional[Dict[str, Dict[str, str]]]
+) -> None:
+  """Removes published files right away, e.g. when the write that would have referenced them failed."""
+  keys = _image_keys(image_storage, url, variants)
+  if keys:
+    await image_storage.delete(keys)
+
+def _image_keys(
+  image_storage: IImageStorage,
+  url: Optional[str],
+  variants: Optional[Dict[str, Dict[str, str]]]
+) -> List[str]:
+  urls = [url] + [variant_url for formats in (variants or {}).values() for variant_url in formats.values()]
+  return [key for key in (image_storage.key_for_url(url) for url in urls if url) if key]
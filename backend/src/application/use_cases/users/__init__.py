@@ -2,4 +2,9 @@ from .create_user import CreateUserUseCase
 from .get_user import GetUserUseCase
 from .update_user import UpdateUserUseCase
 from .delete_user import DeleteUserUseCase
-from .change_password import ChangePasswordUseCase
\ No newline at end of file
+from .change_password import ChangePasswordUseCase
+from .get_author_stats import GetAuthorStatsUseCase
+from .upload_avatar import UploadAvatarUseCase
+from .get_user_deletion import GetUserDeletionUseCase
+from .follow_user import FollowUserUseCase
+from .get_follows import GetFollowsUseCase
\ No newline at end of file
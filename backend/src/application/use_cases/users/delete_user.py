@@ -1,12 +1,26 @@
-from src.application.services import IUnitOfWork
-from src.domain.entities import UserEntity
+from datetime import datetime, timezone
+from typing import Optional
+from src.application.dto import UserDeletionDTO
+from src.application.services import IUnitOfWork, IIdGenerator, IJobQueue, IUserContentPurger
+from src.domain.entities import UserEntity, UserDeletionEntity, UserDeletionStatus
 from src.domain.exceptions import NotFoundException, UnauthorizedException
 
+USER_DELETION_JOB_QUEUE = "default"
+
 class DeleteUserUseCase:
-  def __init__(self, unit_of_work: IUnitOfWork):
+  def __init__(
+    self,
+    unit_of_work: IUnitOfWork,
+    id_generator: IIdGenerator,
+    content_purger: Optional[IUserContentPurger] = None,
+    job_queue: Optional[IJobQueue] = None
+  ):
     self.unit_of_work = unit_of_work
+    self.id_generator = id_generator
+    self.content_purger = content_purger
+    self.job_queue = job_queue
     
-  async def execute(self, active_user: UserEntity, user_id: str) -> None: 
+  async def execute(self, active_user: UserEntity, user_id: str) -> UserDeletionDTO:
     if not active_user:
       raise UnauthorizedException("You must be authenticated to delete a user.")
 
@@ -18,4 +32,28 @@ class DeleteUserUseCase:
       
       if active_user.id != user_id:
         raise UnauthorizedException("You are not authorized to delete this user.")
-      await self.unit_of_work.users.delete_user(user_id)
\ No newline at end of file
+
+      deletion = await self.unit_of_work.user_deletions.get_pending_deletion_for_user(user_id)
+      if not deletion:
+        await self.unit_of_work.auth_sessions.delete_user_sessions(user_id)
+        blogs_total = await self.unit_of_work.blogs.count_blogs_by_author(user_id)
+
+        if blogs_total:
+          deletion = UserDeletionEntity(id=self.id_generator.generate(), user_id=user_id, blogs_total=blogs_total)
+        else:
+          # Nothing to delete in chunks, the account goes right away
+          await self.unit_of_work.timelines.delete_timeline(user_id)
+          await self.unit_of_work.follows.delete_followings(user_id)
+          await self.unit_of_work.users.delete_user(user_id)
+          deletion = UserDeletionEntity(
+            id=self.id_generator.generate(),
+            user_id=user_id,
+            status=UserDeletionStatus.COMPLETED,
+            completed_at=datetime.now(timezone.utc)
+          )
+        deletion = await self.unit_of_work.user_deletions.create_deletion(deletion)
+
+    if deletion.status == UserDeletionStatus.PENDING and self.content_purger and self.job_queue:
+      self.job_queue.enqueue(USER_DELETION_JOB_QUEUE, self.content_purger.purge, deletion.id)
+
+    return UserDeletionDTO(**deletion.to_dict(), progress=deletion.progress)
@@ -0,0 +1,46 @@
+from src.application.services import IUnitOfWork
+from src.domain.entities import UserEntity
+from src.domain.exceptions import InvalidDataException, NotFoundException, UnauthorizedException
+
+class FollowUserUseCase:
+  def __init__(
+    self,
+    unit_of_work: IUnitOfWork,
+    celebrity_threshold: int = 10_000,
+    timeline_length: int = 800,
+    backfill_size: int = 20
+  ):
+    self.uow = unit_of_work
+    self.celebrity_threshold = celebrity_threshold
+    self.timeline_length = timeline_length
+    self.backfill_size = backfill_size
+
+  async def follow(self, active_user: UserEntity, user_id: str) -> None:
+    if not active_user:
+      raise UnauthorizedException("You must be authenticated to follow a user.")
+
+    if active_user.id == user_id:
+      raise InvalidDataException("Users cannot follow themselves.")
+
+    async with self.uow:
+      if not await self.uow.users.get_user_by_id(user_id):
+        raise NotFoundException("User", f"user_id: {user_id}")
+
+      if not await self.uow.follows.follow(active_user.id, user_id):
+        return
+
+      # Blogs of celebrities are read at request time and never land on timelines
+      if await self.uow.follows.get_follower_count(user_id) < self.celebrity_threshold:
+        recent = [blog async for blog in self.uow.blogs.stream_blogs(author_id=user_id, limit=self.backfill_size)]
+        await self.uow.timelines.add_blogs(active_user.id, recent, self.timeline_length)
+
+  async def unfollow(self, active_user: UserEntity, user_id: str) -> None:
+    if not active_user:
+      raise UnauthorizedException("You must be authenticated to unfollow a user.")
+
+    async with self.uow:
+      if not await self.uow.users.get_user_by_id(user_id):
+        raise NotFoundException("User", f"user_id: {user_id}")
+
+      if await self.uow.follows.unfollow(active_user.id, user_id):
+        await self.uow.timelines.delete_author(active_user.id, user_id)
@@ -0,0 +1,23 @@
+from src.application.dto import AuthorStatsDTO
+from src.application.repositories import IUserRepository, IAuthorStatsRepository
+
+class GetAuthorStatsUseCase:
+  def __init__(
+    self,
+    user_repository: IUserRepository,
+    author_stats_repository: IAuthorStatsRepository
+  ):
+    self.user_repository = user_repository
+    self.author_stats_repository = author_stats_repository
+
+  async def execute(self, user_id: str) -> AuthorStatsDTO | None:
+    stats = await self.author_stats_repository.get_stats(user_id)
+    if stats:
+      return AuthorStatsDTO.model_validate(stats.to_dict())
+
+    # Authors who never posted have no statistics row
+    user = await self.user_repository.get_user_by_id(user_id)
+    if not user:
+      return None
+
+    return AuthorStatsDTO(author_id=user.id)
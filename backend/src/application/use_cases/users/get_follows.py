@@ -0,0 +1,30 @@
+from src.application.dto import UserResponseDTO, PaginationDTO, PaginationResponseDTO
+from src.application.repositories import IUserRepository, IFollowRepository
+
+class GetFollowsUseCase:
+  def __init__(self, user_repository: IUserRepository, follow_repository: IFollowRepository):
+    self.user_repository = user_repository
+    self.follow_repository = follow_repository
+
+  async def get_followers(self, user_id: str, pagination: PaginationDTO) -> PaginationResponseDTO[UserResponseDTO] | None:
+    if not await self.user_repository.get_user_by_id(user_id):
+      return None
+
+    users, count = await self.follow_repository.get_followers(user_id, pagination.skip, pagination.limit)
+    return self._page(users, count, pagination)
+
+  async def get_following(self, user_id: str, pagination: PaginationDTO) -> PaginationResponseDTO[UserResponseDTO] | None:
+    if not await self.user_repository.get_user_by_id(user_id):
+      return None
+
+    users, count = await self.follow_repository.get_following(user_id, pagination.skip, pagination.limit)
+    return self._page(users, count, pagination)
+
+  @staticmethod
+  def _page(users, count: int, pagination: PaginationDTO) -> PaginationResponseDTO[UserResponseDTO]:
+    return PaginationResponseDTO(
+      total=count,
+      skip=pagination.skip,
+      limit=pagination.limit,
+      items=[UserResponseDTO.model_validate(user.to_dict()) for user in users]
+    )
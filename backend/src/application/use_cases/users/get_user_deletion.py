@@ -0,0 +1,16 @@
+from src.application.dto import UserDeletionDTO
+from src.application.services import IUnitOfWork
+from src.domain.exceptions import NotFoundException
+
+class GetUserDeletionUseCase:
+  def __init__(self, unit_of_work: IUnitOfWork):
+    self.unit_of_work = unit_of_work
+
+  async def execute(self, deletion_id: str) -> UserDeletionDTO:
+    async with self.unit_of_work:
+      deletion = await self.unit_of_work.user_deletions.get_deletion(deletion_id)
+
+    if not deletion:
+      raise NotFoundException("User deletion", f"deletion_id: {deletion_id}")
+
+    return UserDeletionDTO(**deletion.to_dict(), progress=deletion.progress)
@@ -1,32 +1,74 @@
+from typing import Any, Dict, Optional
 from src.application.dto import UpdateUserDTO, UserResponseDTO
 from src.application.services import IUnitOfWork
 from src.domain.entities import UserEntity
-from src.domain.exceptions import NotFoundException, InvalidDataException, UnauthorizedException
+from src.domain.exceptions import (
+  NotFoundException,
+  InvalidDataException,
+  UnauthorizedException,
+  PreconditionFailedException,
+  ConflictException
+)
+from src.domain.value_objects import FirstName, LastName, Username
 
 class UpdateUserUseCase:
   def __init__(self, unit_of_work: IUnitOfWork):
     self.uow = unit_of_work
   
-  async def execute(self, active_user: UserEntity, user_id: str, data: UpdateUserDTO) -> UserResponseDTO:
+  async def execute(
+    self,
+    active_user: UserEntity,
+    user_id: str,
+    data: UpdateUserDTO,
+    expected_version: Optional[int] = None
+  ) -> UserResponseDTO:
     if not active_user:
       raise UnauthorizedException("You must be authenticated to update a user.")
 
-    async with self.uow:
-      user = await self.uow.users.get_user_by_id(user_id)
-
-      if not user:
-        raise NotFoundException("User", f"user_id: {user_id}")
+    changes = self._build_changes(data)
 
+    async with self.uow:
       if active_user.id != user_id:
+        # Only a refused request reads the user, to tell a missing user from someone else's
+        if not await self.uow.users.get_user_by_id(user_id):
+          raise NotFoundException("User", f"user_id: {user_id}")
         raise UnauthorizedException("You are not authorized to update this user.")
 
-      existing_username = await self.uow.users.get_user_by_username(data.username) if data.username else None
+      existing_username = await self.uow.users.get_user_by_username(changes["username"]) if "username" in changes else None
       if existing_username and existing_username.id != user_id:
-        raise InvalidDataException(f"The username '{data.username}' is already taken.")
-    
-    
-    for field, value in data.model_dump(exclude_unset=True).items():
-      setattr(user, field, value)
-    
-    updated_user = await self.uow.users.update_user(user_id, user)
-    return UserResponseDTO.model_validate(updated_user.to_dict())
\ No newline at end of file
+        raise InvalidDataException(f"The username '{changes['username']}' is already taken.")
+
+      # The version is compared by the UPDATE itself, the user is only read when it matched nothing
+      updated_user = await self.uow.users.update_user_fields(user_id, changes, expected_version)
+
+      if not updated_user:
+        user = await self.uow.users.get_user_by_id(user_id)
+
+        if not user:
+          raise NotFoundException("User", f"user_id: {user_id}")
+
+        if expected_version is not None and user.version != expected_version:
+          raise PreconditionFailedException(f"User '{user_id}' is at version {user.version}, not {expected_version}.")
+
+        raise ConflictException("User", f"user_id: {user_id}")
+
+      return UserResponseDTO.model_validate(updated_user.to_dict())
+
+  @staticmethod
+  def _build_changes(data: UpdateUserDTO) -> Dict[str, Any]:
+    fields = data.model_dump(exclude_unset=True)
+    changes: Dict[str, Any] = {}
+
+    if "first_name" in fields:
+      changes["first_name"] = FirstName(fields["first_name"]).value
+
+    if "last_name" in fields:
+      changes["last_name"] = LastName(fields["last_name"]).value
+
+    if "username" in fields:
+      changes["username"] = Username(fields["username"]).value
+
+    if "avatar" in fields:
+      changes["avatar"] = fields["avatar"]
+
+    return changes
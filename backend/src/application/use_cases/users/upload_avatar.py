@@ -0,0 +1,71 @@
+from typing import Optional
+from src.application.dto import UserResponseDTO
+from src.application.services import (
+  IUnitOfWork,
+  IIdGenerator,
+  IImageProcessor,
+  IImageStorage,
+  IJobQueue
+)
+from src.application.use_cases.images import publish_image, discard_images, delete_images
+from src.domain.entities import UserEntity
+from src.domain.exceptions import NotFoundException, UnauthorizedException
+
+class UploadAvatarUseCase:
+  def __init__(
+    self,
+    unit_of_work: IUnitOfWork,
+    image_processor: IImageProcessor,
+    image_storage: IImageStorage,
+    id_generator: IIdGenerator,
+    job_queue: Optional[IJobQueue] = None
+  ):
+    self.uow = unit_of_work
+    self.image_processor = image_processor
+    self.image_storage = image_storage
+    self.id_generator = id_generator
+    self.job_queue = job_queue
+
+  async def execute(
+    self,
+    active_user: UserEntity,
+    user_id: str,
+    source_path: str
+  ) -> UserResponseDTO:
+    if active_user.id != user_id:
+      raise UnauthorizedException("You are not authorized to update this user.")
+
+    # Committing this read also ends the transaction the request opened, so no
+    # connection is held while the image is processed
+    async with self.uow:
+      user = await self.uow.users.get_user_by_id(user_id)
+
+      if not user:
+        raise NotFoundException("User", f"user_id: {user_id}")
+
+    avatar, variants = await publish_image(
+      self.image_processor,
+      self.image_storage,
+      f"avatars/{user_id}/{self.id_generator.generate()}",
+      source_path
+    )
+
+    try:
+      async with self.uow:
+        user = await self.uow.users.get_user_by_id(user_id)
+
+        if not user:
+          raise NotFoundException("User", f"user_id: {user_id}")
+
+        previous_avatar, previous_variants = user.avatar, user.avatar_variants
+        user.avatar = avatar
+        user.avatar_variants = variants
+
+        updated_user = await self.uow.users.update_user(user_id, user)
+    except Exception:
+      # Nothing refers to the published files once the write failed
+      await delete_images(self.image_storage, avatar, variants)
+      raise
+
+    discard_images(self.image_storage, self.job_queue, previous_avatar, previous_variants)
+    return UserResponseDTO.model_validate(updated_user.to_dict())
@@ -1,2 +1,6 @@
 from .user_entity import UserEntity
-from .blog_entity import BlogEntity
\ No newline at end of file
+from .blog_entity import BlogEntity
+from .author_stats_entity import AuthorStatsEntity
+from .auth_session_entity import AuthSessionEntity
+from .user_deletion_entity import UserDeletionEntity, UserDeletionStatus
+from .blog_revision_entity import BlogRevisionEntity
\ No newline at end of file
@@ -0,0 +1,61 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+class AuthSessionEntity:
+  def __init__(
+    self,
+    id: str,
+    user_id: str,
+    access_token_id: str,
+    refresh_token_id: str,
+    expires_at: datetime,
+    created_at: Optional[datetime] = None
+  ):
+    self.__id = id
+    self.__user_id = user_id
+    self.__access_token_id = access_token_id
+    self.__refresh_token_id = refresh_token_id
+    self.__expires_at = expires_at
+    self.__created_at = created_at or datetime.now(timezone.utc)
+
+  @property
+  def id(self) -> str:
+    return self.__id
+
+  @property
+  def user_id(self) -> str:
+    return self.__user_id
+
+  @property
+  def access_token_id(self) -> str:
+    return self.__access_token_id
+
+  @property
+  def refresh_token_id(self) -> str:
+    return self.__refresh_token_id
+
+  @property
+  def expires_at(self) -> datetime:
+    return self.__expires_at
+
+  @property
+  def created_at(self) -> datetime:
+    return self.__created_at
+
+  def is_expired(self, now: Optional[datetime] = None) -> bool:
+    now = now or datetime.now(timezone.utc)
+    expires_at = self.expires_at
+    # SQLite gives naive datetime → force UTC
+    if expires_at.tzinfo is None:
+      expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return expires_at <= now
+
+  def to_dict(self) -> dict:
+    return {
+      "id": self.id,
+      "user_id": self.user_id,
+      "access_token_id": self.access_token_id,
+      "refresh_token_id": self.refresh_token_id,
+      "expires_at": self.expires_at,
+      "created_at": self.created_at,
+    }
@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import Optional
+
+class AuthorStatsEntity:
+  def __init__(
+    self,
+    author_id: str,
+    post_count: int = 0,
+    last_posted_at: Optional[datetime] = None
+  ):
+    self.__author_id = author_id
+    self.__post_count = post_count
+    self.__last_posted_at = last_posted_at
+
+  @property
+  def author_id(self) -> str:
+    return self.__author_id
+
+  @property
+  def post_count(self) -> int:
+    return self.__post_count
+
+  @property
+  def last_posted_at(self) -> Optional[datetime]:
+    return self.__last_posted_at
+
+  def to_dict(self) -> dict:
+    return {
+      "author_id": self.author_id,
+      "post_count": self.post_count,
+      "last_posted_at": self.last_posted_at,
+    }
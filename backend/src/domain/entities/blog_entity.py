@@ -1,6 +1,6 @@
 from datetime import datetime
-from typing import Optional
-from src.domain.value_objects import Title, Content
+from typing import Dict, List, Optional
+from src.domain.value_objects import Title, Content, Tags
 
 class BlogEntity:
   def __init__(
@@ -10,16 +10,24 @@ class BlogEntity:
     content: str,
     author_id: str,
     hero_image: Optional[str] = None,
+    hero_image_variants: Optional[Dict[str, Dict[str, str]]] = None,
+    content_html: Optional[str] = None,
+    tags: Optional[List[str]] = None,
     created_at: Optional[datetime] = None,
-    updated_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None,
+    version: int = 1
   ):
     self.__id = id
     self.__title = Title(title) 
     self.__content = Content(content)
     self.__author_id = author_id
     self.__hero_image = hero_image
+    self.__hero_image_variants = hero_image_variants
+    self.__content_html = content_html
+    self.__tags = Tags(tags or [])
     self.__created_at = created_at or datetime.now()
     self.__updated_at = updated_at or datetime.now()
+    self.__version = version
   
   @property
   def id(self) -> str:
@@ -40,9 +48,20 @@ class BlogEntity:
   
   @content.setter
   def content(self, value: str):
-    self.__content = Content(value)
+    content = Content(value)
+    if content.value != self.__content.value:
+      self.__content_html = None
+    self.__content = content
     self.__updated_at = datetime.now()
 
+  @property
+  def content_html(self) -> Optional[str]:
+    return self.__content_html
+  
+  @content_html.setter
+  def content_html(self, value: Optional[str]):
+    self.__content_html = value
+
   @property
   def author_id(self) -> str:
     return self.__author_id
@@ -53,9 +72,28 @@ class BlogEntity:
   
   @hero_image.setter
   def hero_image(self, value: Optional[str]):
+    if value != self.__hero_image:
+      self.__hero_image_variants = None
     self.__hero_image = value
     self.__updated_at = datetime.now()
 
+  @property
+  def hero_image_variants(self) -> Optional[Dict[str, Dict[str, str]]]:
+    return self.__hero_image_variants
+
+  @hero_image_variants.setter
+  def hero_image_variants(self, value: Optional[Dict[str, Dict[str, str]]]):
+    self.__hero_image_variants = value
+
+  @property
+  def tags(self) -> List[str]:
+    return list(self.__tags.values)
+
+  @tags.setter
+  def tags(self, value: List[str]):
+    self.__tags = Tags(value)
+    self.__updated_at = datetime.now()
+
   @property
   def created_at(self) -> datetime:
     return self.__created_at
@@ -64,6 +102,10 @@ class BlogEntity:
   def updated_at(self) -> datetime:
     return self.__updated_at
   
+  @property
+  def version(self) -> int:
+    return self.__version
+
   def to_dict(self) -> dict:
     return {
       "id": self.id,
@@ -71,6 +113,10 @@ class BlogEntity:
       "content": self.content,
       "author_id": self.author_id,
       "hero_image": self.hero_image,
+      "hero_image_variants": self.hero_image_variants,
+      "content_html": self.content_html,
+      "tags": self.tags,
       "created_at": self.created_at,
       "updated_at": self.updated_at,
+      "version": self.version,
     }
\ No newline at end of file
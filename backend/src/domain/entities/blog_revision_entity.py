@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import Optional
+
+class BlogRevisionEntity:
+  def __init__(
+    self,
+    blog_id: str,
+    version: int,
+    title: str,
+    content_length: int,
+    created_at: datetime,
+    content: Optional[str] = None
+  ):
+    self.__blog_id = blog_id
+    self.__version = version
+    self.__title = title
+    self.__content_length = content_length
+    self.__created_at = created_at
+    self.__content = content
+
+  @property
+  def blog_id(self) -> str:
+    return self.__blog_id
+
+  @property
+  def version(self) -> int:
+    return self.__version
+
+  @property
+  def title(self) -> str:
+    return self.__title
+
+  @property
+  def content_length(self) -> int:
+    return self.__content_length
+
+  @property
+  def created_at(self) -> datetime:
+    return self.__created_at
+
+  @property
+  def content(self) -> Optional[str]:
+    return self.__content
+
+  def to_dict(self) -> dict:
+    return {
+      "blog_id": self.blog_id,
+      "version": self.version,
+      "title": self.title,
+      "content_length": self.content_length,
+      "created_at": self.created_at,
+      "content": self.content,
+    }
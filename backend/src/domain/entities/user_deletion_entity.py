@@ -0,0 +1,81 @@
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Optional
+
+class UserDeletionStatus(str, Enum):
+  PENDING = "pending"
+  COMPLETED = "completed"
+
+class UserDeletionEntity:
+  def __init__(
+    self,
+    id: str,
+    user_id: str,
+    status: UserDeletionStatus = UserDeletionStatus.PENDING,
+    blogs_total: int = 0,
+    blogs_deleted: int = 0,
+    created_at: Optional[datetime] = None,
+    updated_at: Optional[datetime] = None,
+    completed_at: Optional[datetime] = None
+  ):
+    self.__id = id
+    self.__user_id = user_id
+    self.__status = UserDeletionStatus(status)
+    self.__blogs_total = blogs_total
+    self.__blogs_deleted = blogs_deleted
+    self.__created_at = created_at or datetime.now(timezone.utc)
+    self.__updated_at = updated_at or self.__created_at
+    self.__completed_at = completed_at
+
+  @property
+  def id(self) -> str:
+    return self.__id
+
+  @property
+  def user_id(self) -> str:
+    return self.__user_id
+
+  @property
+  def status(self) -> UserDeletionStatus:
+    return self.__status
+
+  @property
+  def blogs_total(self) -> int:
+    return self.__blogs_total
+
+  @property
+  def blogs_deleted(self) -> int:
+    return self.__blogs_deleted
+
+  @property
+  def created_at(self) -> datetime:
+    return self.__created_at
+
+  @property
+  def updated_at(self) -> datetime:
+    return self.__updated_at
+
+  @property
+  def completed_at(self) -> Optional[datetime]:
+    return self.__completed_at
+
+  @property
+  def progress(self) -> float:
+    if self.status == UserDeletionStatus.COMPLETED:
+      return 1.0
+    if not self.blogs_total:
+      return 0.0
+    # Blogs written while the deletion runs are deleted too
+    return min(1.0, self.blogs_deleted / self.blogs_total)
+
+  def to_dict(self) -> dict:
+    return {
+      "id": self.id,
+      "user_id": self.user_id,
+      "status": self.status.value,
+      "blogs_total": self.blogs_total,
+      "blogs_deleted": self.blogs_deleted,
+      "created_at": self.created_at,
+      "updated_at": self.updated_at,
+      "completed_at": self.completed_at,
+    }
@@ -5,7 +5,7 @@ from src.domain.value_objects import (
   Password
 )
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Dict, Optional
 
 class UserEntity:
   def __init__(
@@ -16,10 +16,10 @@ class UserEntity:
     username: str,
     password: str,
     avatar: Optional[str] = None,
+    avatar_variants: Optional[Dict[str, Dict[str, str]]] = None,
     created_at: Optional[datetime] = None,
     updated_at: Optional[datetime] = None,
-    access_token_id: Optional[str] = None,
-    refresh_token_id: Optional[str] = None
+    version: int = 1
   ):
     self.__id = id
     self.__first_name = FirstName(first_name) 
@@ -27,10 +27,10 @@ class UserEntity:
     self.__username = Username(username)
     self.__password = Password(password) 
     self.__avatar = avatar
+    self.__avatar_variants = avatar_variants
     self.__created_at = created_at or datetime.now(timezone.utc)
     self.__updated_at = updated_at or datetime.now(timezone.utc)
-    self.__access_token_id = access_token_id
-    self.__refresh_token_id = refresh_token_id
+    self.__version = version
   
   @property
   def id(self) -> str:
@@ -76,8 +76,18 @@ class UserEntity:
   
   @avatar.setter
   def avatar(self, avatar_url: Optional[str]):
+    if avatar_url != self.__avatar:
+      self.__avatar_variants = None
     self.__avatar = avatar_url
     self.__updated_at = datetime.now(timezone.utc)
+
+  @property
+  def avatar_variants(self) -> Optional[Dict[str, Dict[str, str]]]:
+    return self.__avatar_variants
+
+  @avatar_variants.setter
+  def avatar_variants(self, value: Optional[Dict[str, Dict[str, str]]]):
+    self.__avatar_variants = value
   
   @property
   def created_at(self) -> datetime:
@@ -88,21 +98,9 @@ class UserEntity:
     return self.__updated_at
   
   @property
-  def access_token_id(self) -> Optional[str]:
-    return self.__access_token_id
-  
-  @access_token_id.setter
-  def access_token_id(self, token_id: Optional[str]):
-    self.__access_token_id = token_id
-  
-  @property
-  def refresh_token_id(self) -> Optional[str]:
-    return self.__refresh_token_id
-  
-  @refresh_token_id.setter
-  def refresh_token_id(self, token_id: Optional[str]):
-    self.__refresh_token_id = token_id
-    
+  def version(self) -> int:
+    return self.__version
+
   def to_dict(self) -> dict:
     return {
       "id": self.id,
@@ -111,8 +109,8 @@ class UserEntity:
       "username": self.username,
       "password": self.password,
       "avatar": self.avatar,
-      "access_token_id": self.access_token_id,
-      "refresh_token_id": self.refresh_token_id,
+      "avatar_variants": self.avatar_variants,
       "created_at": self.created_at,
-      "updated_at": self.updated_at
+      "updated_at": self.updated_at,
+      "version": self.version
     }
\ No newline at end of file
@@ -0,0 +1,2 @@
+from .blog_events import BlogEvent, BlogCreatedEvent, BlogUpdatedEvent, BlogDeletedEvent
+from .registry import EVENT_TYPES, event_from_dict
\ No newline at end of file
@@ -0,0 +1,21 @@
+class BlogEvent:
+  name = "blog.event"
+
+  def __init__(self, blog_id: str, author_id: str):
+    self.blog_id = blog_id
+    self.author_id = author_id
+
+  def to_dict(self) -> dict:
+    return {
+      "blog_id": self.blog_id,
+      "author_id": self.author_id,
+    }
+
+class BlogCreatedEvent(BlogEvent):
+  name = "blog.created"
+
+class BlogUpdatedEvent(BlogEvent):
+  name = "blog.updated"
+
+class BlogDeletedEvent(BlogEvent):
+  name = "blog.deleted"
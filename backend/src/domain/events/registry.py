@@ -0,0 +1,13 @@
+from typing import Dict, Type
+from .blog_events import BlogEvent, BlogCreatedEvent, BlogUpdatedEvent, BlogDeletedEvent
+
+EVENT_TYPES: Dict[str, Type] = {
+  event_type.name: event_type
+  for event_type in (BlogCreatedEvent, BlogUpdatedEvent, BlogDeletedEvent)
+}
+
+def event_from_dict(name: str, payload: dict):
+  event_type = EVENT_TYPES.get(name)
+  if event_type is None:
+    raise ValueError(f"Unknown event type: '{name}'")
+  return event_type(**payload)
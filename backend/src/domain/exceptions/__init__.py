@@ -1,2 +1,8 @@
-from .common import InvalidDataException, NotFoundException, UnauthorizedException
+from .common import (
+  InvalidDataException,
+  NotFoundException,
+  UnauthorizedException,
+  ConflictException,
+  PreconditionFailedException
+)
 from .user_exceptions import UsernameExistsException
\ No newline at end of file
@@ -9,4 +9,13 @@ class NotFoundException(Exception):
 
 class UnauthorizedException(Exception):
   def __init__(self, message: str = "Unauthorized access."):
+    super().__init__(message)
+
+class ConflictException(Exception):
+  def __init__(self, entity_name: str, identifier: str):
+    message = f"{entity_name} with identifier '{identifier}' was modified concurrently, reload it and try again."
+    super().__init__(message)
+
+class PreconditionFailedException(Exception):
+  def __init__(self, message: str):
     super().__init__(message)
\ No newline at end of file
@@ -1,4 +1,6 @@
 from .name import Name, LastName, FirstName, Username
 from .password import Password
 from .content import Content
-from .title import Title
\ No newline at end of file
+from .title import Title
+from .tags import Tag, Tags
+from .text_patch import TextPatch
@@ -0,0 +1,33 @@
+import re
+from typing import Iterable
+
+from src.domain.exceptions import InvalidDataException
+
+TAG_PATTERN = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+MAX_TAG_LENGTH = 30
+MAX_TAGS = 10
+
+class Tag:
+  def __init__(
+    self,
+    value: str,
+  ):
+    value = (value or "").strip().lower()
+    if not value:
+      raise InvalidDataException("Tag cannot be empty.")
+    if len(value) > MAX_TAG_LENGTH:
+      raise InvalidDataException(f"Tag cannot exceed {MAX_TAG_LENGTH} characters.")
+    if not TAG_PATTERN.match(value):
+      raise InvalidDataException("Tag can only contain lowercase letters, digits and single hyphens.")
+    self.value = value
+
+class Tags:
+  def __init__(
+    self,
+    values: Iterable[str],
+  ):
+    # Normalized and deduplicated, in the order the author gave them
+    tags = list(dict.fromkeys(Tag(value).value for value in values or []))
+    if len(tags) > MAX_TAGS:
+      raise InvalidDataException(f"A blog cannot have more than {MAX_TAGS} tags.")
+    self.values = tags
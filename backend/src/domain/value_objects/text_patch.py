@@ -0,0 +1,44 @@
+import hashlib
+from typing import Iterable, Tuple
+
+from src.domain.exceptions import InvalidDataException
+
+MAX_OPERATIONS = 1000
+
+class TextPatch:
+  def __init__(
+    self,
+    operations: Iterable[Tuple[int, int, str]],
+  ):
+    # (offset, deleted length, inserted text), offsets count characters of the text being patched
+    operations = list(operations)
+    if not operations:
+      raise InvalidDataException("A patch needs at least one operation.")
+    if len(operations) > MAX_OPERATIONS:
+      raise InvalidDataException(f"A patch cannot have more than {MAX_OPERATIONS} operations.")
+
+    end = 0
+    for offset, delete, _ in operations:
+      if offset < 0 or delete < 0:
+        raise InvalidDataException("Patch offsets and lengths cannot be negative.")
+      if offset < end:
+        raise InvalidDataException("Patch operations must be ordered and cannot overlap.")
+      end = offset + delete
+    self.operations = operations
+
+  def apply(self, text: str) -> str:
+    if self.operations[-1][0] + self.operations[-1][1] > len(text):
+      raise InvalidDataException("Patch operations reach past the end of the content.")
+
+    parts = []
+    position = 0
+    for offset, delete, insert in self.operations:
+      parts.append(text[position:offset])
+      parts.append(insert)
+      position = offset + delete
+    parts.append(text[position:])
+    return "".join(parts)
+
+  @staticmethod
+  def hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
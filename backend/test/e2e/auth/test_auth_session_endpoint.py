@@ -0,0 +1,106 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.auth import purge_expired_sessions, token_cache
+from app.database.models import AuthSessionModel, UserModel
+
+
+LOGIN_DATA = {"username": "alicesmith", "password": "SecurePass.123"}
+
+
+async def count_sessions(db_session) -> int:
+  return (await db_session.execute(select(func.count()).select_from(AuthSessionModel))).scalar_one()
+
+
+class TestAuthSessionEndpoint:
+
+  @pytest.mark.asyncio
+  async def test_auth_traffic_does_not_write_users(self, client, create_existing_users, db_session):
+    login = await client.post("/v1/auth/login", data=LOGIN_DATA)
+    refresh = await client.post(
+      "/v1/auth/refresh",
+      headers={"Authorization": f"Bearer {login.json()['refresh_token']}"}
+    )
+    logout = await client.post(
+      "/v1/auth/logout",
+      headers={"Authorization": f"Bearer {refresh.json()['access_token']}"}
+    )
+
+    assert (login.status_code, refresh.status_code, logout.status_code) == (200, 200, 200)
+    user = (await db_session.execute(
+      select(UserModel).where(UserModel.id == "user1").execution_options(populate_existing=True)
+    )).scalar_one()
+    assert user.updated_at.replace(tzinfo=timezone.utc) == datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+  @pytest.mark.asyncio
+  async def test_concurrent_sessions_per_user(self, client, create_existing_users, db_session):
+    first = (await client.post("/v1/auth/login", data=LOGIN_DATA)).json()
+    second = (await client.post("/v1/auth/login", data=LOGIN_DATA)).json()
+
+    assert await count_sessions(db_session) == 2
+
+    await client.post("/v1/auth/logout", headers={"Authorization": f"Bearer {first['access_token']}"})
+
+    revoked = await client.get("/v1/auth/me", headers={"Authorization": f"Bearer {first['access_token']}"})
+    active = await client.get("/v1/auth/me", headers={"Authorization": f"Bearer {second['access_token']}"})
+    assert revoked.status_code == 401
+    assert active.status_code == 200
+
+
+  @pytest.mark.asyncio
+  async def test_refresh_rotates_tokens(self, client, create_existing_users):
+    login = (await client.post("/v1/auth/login", data=LOGIN_DATA)).json()
+
+    refreshed = await client.post("/v1/auth/refresh", headers={"Authorization": f"Bearer {login['refresh_token']}"})
+    old_access = await client.get("/v1/auth/me", headers={"Authorization": f"Bearer {login['access_token']}"})
+    new_access = await client.get("/v1/auth/me", headers={"Authorization": f"Bearer {refreshed.json()['access_token']}"})
+    reused = await client.post("/v1/auth/refresh", headers={"Authorization": f"Bearer {login['refresh_token']}"})
+
+    assert refreshed.status_code == 200
+    assert old_access.status_code == 401
+    assert new_access.status_code == 200
+    assert reused.status_code == 401
+
+
+  @pytest.mark.asyncio
+  async def test_logout_purges_cached_token(self, client, create_existing_users):
+    login = (await client.post("/v1/auth/login", data=LOGIN_DATA)).json()
+    headers = {"Authorization": f"Bearer {login['access_token']}"}
+
+    first = await client.get("/v1/auth/me", headers=headers)
+    hits = token_cache.hits
+    second = await client.get("/v1/auth/me", headers=headers)
+    assert (first.status_code, second.status_code) == (200, 200)
+    assert token_cache.hits == hits + 1
+
+    logout = await client.post("/v1/auth/logout", headers=headers)
+    assert logout.status_code == 200
+    assert token_cache.get(login["access_token"]) is None
+
+    after_logout = await client.get("/v1/auth/me", headers=headers)
+    assert after_logout.status_code == 401
+
+
+  @pytest.mark.asyncio
+  async def test_purge_expired_sessions_in_batches(self, create_existing_users, db_session):
+    now = datetime.now(timezone.utc)
+    db_session.add_all([
+      AuthSessionModel(
+        id=f"session-{i}",
+        user_id="user1",
+        access_token_id=f"access-{i}",
+        refresh_token_id=f"refresh-{i}",
+        expires_at=now - timedelta(hours=1) if i < 5 else now + timedelta(hours=1)
+      )
+      for i in range(7)
+    ])
+    await db_session.commit()
+
+    session_factory = async_sessionmaker(bind=db_session.bind, expire_on_commit=False, class_=AsyncSession)
+    purged = await purge_expired_sessions(session_factory, batch_size=2)
+
+    assert purged == 5
+    assert await count_sessions(db_session) == 2
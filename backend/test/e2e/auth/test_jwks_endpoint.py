@@ -0,0 +1,45 @@
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+from app.auth import create_key_ring
+from app.auth import token_service
+
+
+@pytest.fixture
+def key_ring(monkeypatch):
+  private_key = ed25519.Ed25519PrivateKey.generate()
+  pem = private_key.private_bytes(
+    serialization.Encoding.PEM,
+    serialization.PrivateFormat.PKCS8,
+    serialization.NoEncryption()
+  ).decode()
+  key_ring = create_key_ring({"2026-10": pem}, {}, "2026-10")
+  monkeypatch.setattr(token_service, "key_ring", key_ring)
+  return key_ring
+
+
+class TestJwksEndpoint:
+
+  @pytest.mark.asyncio
+  async def test_jwks_is_cacheable(self, client, key_ring):
+    response = await client.get("/.well-known/jwks.json")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/jwk-set+json"
+    assert response.headers["cache-control"].startswith("public, max-age=")
+    assert [key["kid"] for key in response.json()["keys"]] == ["2026-10"]
+
+    cached = await client.get("/.well-known/jwks.json", headers={"If-None-Match": response.headers["etag"]})
+    assert cached.status_code == 304
+
+
+  @pytest.mark.asyncio
+  async def test_login_issues_tokens_signed_with_active_key(self, client, create_existing_users, key_ring):
+    login = await client.post("/v1/auth/login", data={"username": "alicesmith", "password": "SecurePass.123"})
+    me = await client.get("/v1/auth/me", headers={"Authorization": f"Bearer {login.json()['access_token']}"})
+
+    assert login.status_code == 200
+    assert jwt.get_unverified_header(login.json()["access_token"])["kid"] == "2026-10"
+    assert me.status_code == 200
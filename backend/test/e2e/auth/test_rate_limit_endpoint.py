@@ -0,0 +1,78 @@
+import pytest
+
+from app.config import config
+from app.database.db import get_db
+from app.main import app
+
+
+class TestRateLimitEndpoint:
+
+  @pytest.mark.asyncio
+  async def test_login_is_limited_per_username(
+    self,
+    client,
+    create_existing_users,
+    monkeypatch
+  ):
+    monkeypatch.setattr(config, "RATE_LIMIT_LOGIN_PER_USERNAME", "2/minute")
+    login_data = {"username": "alicesmith", "password": "WrongPass.123"}
+
+    for _ in range(2):
+      response = await client.post("/v1/auth/login", data=login_data)
+      assert response.status_code == 401
+
+    response = await client.post("/v1/auth/login", data=login_data)
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) > 0
+
+    other_user = {"username": "bobjohnson", "password": "SecurePass.123"}
+    response = await client.post("/v1/auth/login", data=other_user)
+    assert response.status_code == 200
+
+
+  @pytest.mark.asyncio
+  async def test_rejected_login_does_not_open_a_session(
+    self,
+    client,
+    monkeypatch
+  ):
+    monkeypatch.setattr(config, "RATE_LIMIT_LOGIN_PER_IP", "1/minute")
+    opened_sessions = []
+    override_get_db = app.dependency_overrides[get_db]
+
+    async def counting_get_db():
+      opened_sessions.append(True)
+      async for session in override_get_db():
+        yield session
+
+    app.dependency_overrides[get_db] = counting_get_db
+    login_data = {"username": "nobody", "password": "WrongPass.123"}
+
+    first = await client.post("/v1/auth/login", data=login_data)
+    second = await client.post("/v1/auth/login", data=login_data)
+
+    assert first.status_code == 401
+    assert second.status_code == 429
+    assert len(opened_sessions) == 1
+
+
+  @pytest.mark.asyncio
+  async def test_register_is_limited_per_ip(
+    self,
+    client,
+    monkeypatch
+  ):
+    monkeypatch.setattr(config, "RATE_LIMIT_REGISTER_PER_IP", "1/minute")
+    payload = {
+      "first_name": "John",
+      "last_name": "Doe",
+      "username": "johndoe",
+      "password": "SecurePass.123"
+    }
+
+    first = await client.post("/v1/users/register", json=payload)
+    second = await client.post("/v1/users/register", json={**payload, "username": "janedoe"})
+
+    assert first.status_code == 201
+    assert second.status_code == 429
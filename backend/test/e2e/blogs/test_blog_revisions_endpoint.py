@@ -0,0 +1,153 @@
+import io
+import pytest
+from PIL import Image
+from sqlalchemy import select
+from app.config import config
+from app.database.models import BlogRevisionModel
+from app.main import app
+from app.storage import LocalImageStorage
+
+
+BASE_CONTENT = "\n".join(f"Line {i} of a blog that keeps being edited." for i in range(200))
+
+
+@pytest.fixture
+def image_storage(tmp_path):
+  previous = app.state.image_storage
+  app.state.image_storage = LocalImageStorage(root_dir=str(tmp_path), base_url="/media")
+  yield tmp_path
+  app.state.image_storage = previous
+
+
+@pytest.fixture
+async def edited_blog(authenticated_client, existing_users):
+  async def _edited_blog(edits: int):
+    response = await authenticated_client.post(
+      "/v1/blogs/",
+      json={"title": "Revisions of a blog", "content": BASE_CONTENT, "author_id": existing_users[0]["id"]}
+    )
+    assert response.status_code == 201
+    blog_id = response.json()["id"]
+
+    contents = [BASE_CONTENT]
+    for edit in range(1, edits + 1):
+      content = contents[-1].replace(f"Line {edit} of", f"Line {edit} (edit {edit}) of")
+      response = await authenticated_client.put(f"/v1/blogs/{blog_id}", json={"content": content})
+      assert response.status_code == 200
+      contents.append(content)
+    return blog_id, contents
+
+  return _edited_blog
+
+
+class TestBlogRevisionsEndpoint:
+
+  @pytest.mark.asyncio
+  async def test_list_revisions_newest_first(self, authenticated_client, edited_blog):
+    blog_id, contents = await edited_blog(3)
+
+    response = await authenticated_client.get(f"/v1/blogs/{blog_id}/revisions?limit=2")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 4
+    assert [revision["version"] for revision in data["items"]] == [4, 3]
+    assert data["items"][0]["content_length"] == len(contents[3])
+    assert "content" not in data["items"][0]
+
+
+  @pytest.mark.asyncio
+  async def test_get_every_revision(self, authenticated_client, edited_blog):
+    blog_id, contents = await edited_blog(3)
+
+    for version, content in enumerate(contents, start=1):
+      response = await authenticated_client.get(f"/v1/blogs/{blog_id}/revisions/{version}")
+
+      assert response.status_code == 200
+      assert response.json()["content"] == content
+
+
+  @pytest.mark.asyncio
+  async def test_revisions_are_deltas_between_keyframes(self, authenticated_client, edited_blog, db_session, monkeypatch):
+    monkeypatch.setattr(config, "BLOG_REVISION_KEYFRAME_INTERVAL", 3)
+    blog_id, contents = await edited_blog(6)
+
+    rows = (await db_session.scalars(
+      select(BlogRevisionModel).where(BlogRevisionModel.blog_id == blog_id).order_by(BlogRevisionModel.version)
+    )).all()
+
+    assert [row.is_keyframe for row in rows] == [True, False, False, True, False, False, True]
+    assert all(len(row.data) < len(rows[0].data) for row in rows if not row.is_keyframe)
+
+    response = await authenticated_client.get(f"/v1/blogs/{blog_id}/revisions/6")
+    assert response.json()["content"] == contents[5]
+
+
+  @pytest.mark.asyncio
+  async def test_history_of_a_blog_edited_before_revisions_starts_at_its_next_version(
+    self,
+    authenticated_client,
+    existing_blogs,
+    create_existing_blogs
+  ):
+    blog_id = existing_blogs[0]["id"]
+    await authenticated_client.put(f"/v1/blogs/{blog_id}", json={"content": "Rewritten content of the blog."})
+
+    listed = await authenticated_client.get(f"/v1/blogs/{blog_id}/revisions")
+    first = await authenticated_client.get(f"/v1/blogs/{blog_id}/revisions/1")
+    second = await authenticated_client.get(f"/v1/blogs/{blog_id}/revisions/2")
+
+    assert [revision["version"] for revision in listed.json()["items"]] == [2]
+    assert first.status_code == 404
+    assert second.json()["content"] == "Rewritten content of the blog."
+
+
+  @pytest.mark.asyncio
+  async def test_revisions_of_unknown_blog_not_found(self, client, existing_blogs, create_existing_blogs):
+    listed = await client.get("/v1/blogs/non-existent-id/revisions")
+    revision = await client.get("/v1/blogs/non-existent-id/revisions/1")
+    unrevised = await client.get(f"/v1/blogs/{existing_blogs[0]['id']}/revisions")
+
+    assert listed.status_code == 404
+    assert revision.status_code == 404
+    assert unrevised.status_code == 200
+    assert unrevised.json()["total"] == 0
+
+
+  @pytest.mark.asyncio
+  async def test_revisions_are_deleted_with_their_blog(self, authenticated_client, edited_blog):
+    blog_id, _ = await edited_blog(1)
+
+    await authenticated_client.delete(f"/v1/blogs/{blog_id}")
+    response = await authenticated_client.get(f"/v1/blogs/{blog_id}/revisions")
+
+    assert response.status_code == 404
+
+
+  @pytest.mark.asyncio
+  async def test_hero_image_upload_adds_a_revision(self, authenticated_client, edited_blog, image_storage):
+    blog_id, contents = await edited_blog(0)
+    image = io.BytesIO()
+    Image.new("RGB", (400, 200), color=(10, 120, 200)).save(image, format="PNG")
+
+    uploaded = await authenticated_client.put(
+      f"/v1/blogs/{blog_id}/hero-image",
+      content=image.getvalue(),
+      headers={"Content-Type": "image/png"}
+    )
+    assert uploaded.status_code == 200
+    contents.append(contents[-1])
+
+    edited = contents[-1].replace("Line 1 of", "Line 1 (after the image) of")
+    response = await authenticated_client.put(f"/v1/blogs/{blog_id}", json={"content": edited})
+    assert response.status_code == 200
+    contents.append(edited)
+
+    listed = await authenticated_client.get(f"/v1/blogs/{blog_id}/revisions")
+    assert [revision["version"] for revision in listed.json()["items"]] == [3, 2, 1]
+
+    for version, content in enumerate(contents, start=1):
+      response = await authenticated_client.get(f"/v1/blogs/{blog_id}/revisions/{version}")
+
+      assert response.status_code == 200
+      assert response.json()["content"] == content
@@ -0,0 +1,44 @@
+import asyncio
+import pytest
+from app.main import app
+
+
+async def wait_for_subscribers(count: int):
+  for _ in range(100):
+    if app.state.blog_stream_hub.subscriber_count == count:
+      return
+    await asyncio.sleep(0.01)
+  raise AssertionError(f"Expected {count} blog stream subscribers.")
+
+
+class TestBlogStreamEndpoint:
+
+  @pytest.mark.asyncio
+  async def test_stream_sends_committed_blog_events(self, client, existing_users, create_existing_users):
+    stream = asyncio.create_task(client.get("/v1/blogs/stream"))
+    await wait_for_subscribers(1)
+
+    created = await client.post(
+      "/v1/blogs/",
+      json={"title": "Streamed blog", "content": "Some content", "author_id": existing_users[0]["id"]}
+    )
+    await app.state.outbox_dispatcher.dispatch_pending()
+    await app.state.outbox_broadcaster.broadcast_pending()
+    app.state.blog_stream_hub.close_all()
+    response = await stream
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert "event: blog.created" in response.text
+    assert created.json()["id"] in response.text
+    assert app.state.blog_stream_hub.subscriber_count == 0
+
+
+  @pytest.mark.asyncio
+  async def test_stream_rejects_subscribers_past_the_cap(self, client, monkeypatch):
+    monkeypatch.setattr(app.state.blog_stream_hub, "max_subscribers", 0)
+
+    response = await client.get("/v1/blogs/stream")
+
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
@@ -91,4 +91,25 @@ class TestCreateBlogEndpoint:
 
     assert response.status_code == 400
     data = response.json()
-    assert re.search(error_regex, data["detail"])
\ No newline at end of file
+    assert re.search(error_regex, data["detail"])
+
+  @pytest.mark.asyncio
+  async def test_create_blog_renders_content_html(
+    self,
+    authenticated_client,
+    api_version
+  ):
+    response = await authenticated_client.post(f"/{api_version}/blogs/", json={
+      "title": "Markdown blog",
+      "content": "# Heading\n\n<script>alert(1)</script>",
+      "author_id": "user1"
+    })
+
+    assert response.status_code == 201
+    data = response.json()
+
+    assert "<h1>Heading</h1>" in data["content_html"]
+    assert "<script" not in data["content_html"]
+
+    fetched = await authenticated_client.get(f"/{api_version}/blogs/{data['id']}")
+    assert fetched.json()["content_html"] == data["content_html"]
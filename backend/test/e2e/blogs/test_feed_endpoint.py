@@ -0,0 +1,91 @@
+import pytest
+import xml.etree.ElementTree as ET
+
+from app.config import config
+from app.main import app
+
+
+class TestFeedEndpoint:
+
+  @pytest.mark.asyncio
+  async def test_get_feed_success(self, client, create_existing_blogs):
+    response = await client.get("/feed.xml")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/rss+xml")
+    assert response.headers["etag"]
+    assert "max-age" in response.headers["cache-control"]
+
+    channel = ET.fromstring(response.content).find("channel")
+    assert len(channel.findall("item")) == 15
+
+
+  @pytest.mark.asyncio
+  async def test_feed_self_link_ignores_the_request_host_and_query(self, client, create_existing_blogs):
+    await client.get("/feed.xml?x=<script>", headers={"Host": "evil.example"})
+
+    response = await client.get("/feed.xml")
+
+    links = ET.fromstring(response.content).find("channel").findall("{http://www.w3.org/2005/Atom}link")
+    assert [link.get("href") for link in links] == [f"{config.SITE_URL}/feed.xml"]
+    assert b"evil.example" not in response.content
+
+
+  @pytest.mark.asyncio
+  async def test_get_feed_not_modified(self, client, create_existing_blogs):
+    first = await client.get("/feed.xml")
+
+    response = await client.get("/feed.xml", headers={"If-None-Match": first.headers["etag"]})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == first.headers["etag"]
+
+
+  @pytest.mark.asyncio
+  async def test_feed_is_invalidated_by_new_blog(self, authenticated_client, create_existing_blogs):
+    first = await authenticated_client.get("/feed.xml")
+
+    response = await authenticated_client.post(
+      "/v1/blogs/",
+      json={"title": "Fresh Feed Entry", "content": "Brand new content.", "author_id": "user1"}
+    )
+    assert response.status_code == 201
+    await app.state.outbox_dispatcher.dispatch_pending()
+    await app.state.outbox_broadcaster.broadcast_pending()
+
+    second = await authenticated_client.get("/feed.xml", headers={"If-None-Match": first.headers["etag"]})
+
+    assert second.status_code == 200
+    assert second.headers["etag"] != first.headers["etag"]
+    assert b"Fresh Feed Entry" in second.content
+
+
+  @pytest.mark.asyncio
+  async def test_get_author_feed_success(self, client, create_existing_blogs):
+    response = await client.get("/v1/blogs/author/user1/feed.xml")
+
+    assert response.status_code == 200
+    channel = ET.fromstring(response.content).find("channel")
+    assert "Alice Smith" in channel.findtext("title")
+    assert len(channel.findall("item")) == 5
+
+
+  @pytest.mark.asyncio
+  async def test_get_author_feed_unknown_author(self, client, create_existing_blogs):
+    response = await client.get("/v1/blogs/author/unknown/feed.xml")
+
+    assert response.status_code == 404
+
+
+  @pytest.mark.asyncio
+  async def test_get_sitemap_success(self, client, create_existing_blogs):
+    response = await client.get("/sitemap.xml")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/xml")
+
+    namespace = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+    urls = ET.fromstring(response.content).findall("sm:url", namespace)
+    assert len(urls) == 16
+    assert all(url.find("sm:lastmod", namespace) is not None for url in urls[1:])
@@ -58,6 +58,70 @@ class TestGetBlogEndpoint:
     assert len(data["items"]) == expected_count
 
 
+  @pytest.mark.asyncio
+  @pytest.mark.parametrize(
+    "query, expected_titles",
+    [
+      ("tag=python", {"Async Python", "Python Tips"}),
+      ("tag=Python&tag=async", {"Async Python"}),
+      ("tag=async&tag=rust&tag_match=any", {"Async Python", "Rust Ownership"}),
+      ("tag=go", set()),
+    ]
+  )
+  async def test_get_blogs_by_tags_with_facets(
+    self,
+    client,
+    existing_users,
+    create_existing_users,
+    query,
+    expected_titles
+  ):
+    for title, tags in [("Async Python", ["Python", "async"]), ("Python Tips", ["python"]), ("Rust Ownership", ["rust"])]:
+      created = await client.post(
+        "/v1/blogs/",
+        json={"title": title, "content": "Content", "author_id": existing_users[0]["id"], "tags": tags}
+      )
+      assert created.status_code == 201
+
+    response = await client.get(f"/v1/blogs/?{query}")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == len(expected_titles)
+    assert {item["title"] for item in data["items"]} == expected_titles
+    assert data["facets"] == {"python": 2, "async": 1, "rust": 1}
+
+
+  @pytest.mark.asyncio
+  async def test_get_blogs_rejects_invalid_tag(self, client):
+    response = await client.get("/v1/blogs/?tag=not a tag")
+
+    assert response.status_code == 400
+
+
+  @pytest.mark.asyncio
+  @pytest.mark.parametrize(
+    "query, expected_total",
+    [
+      ("created_after=2024-01-01T00:00:00Z", 15),
+      ("created_after=2024-02-01T00:00:00Z", 0),
+      ("created_before=2024-01-01T00:00:00Z", 0),
+      ("created_after=2023-12-01T00:00:00Z&created_before=2024-02-01T00:00:00Z", 15),
+    ]
+  )
+  async def test_get_blogs_within_creation_bounds(
+    self,
+    client,
+    create_existing_blogs,
+    query,
+    expected_total
+  ):
+    response = await client.get(f"/v1/blogs/?{query}")
+
+    assert response.status_code == 200
+    assert response.json()["total"] == expected_total
+
+
   @pytest.mark.asyncio
   @pytest.mark.parametrize(
     "blog_id",
@@ -91,4 +155,19 @@ class TestGetBlogEndpoint:
     assert response.status_code == 404
     data = response.json()
 
-    assert data["detail"] == "Blog with id 'nonexistent-blog-id' not found."
\ No newline at end of file
+    assert data["detail"] == "Blog with id 'nonexistent-blog-id' not found."
+
+  @pytest.mark.asyncio
+  async def test_get_blog_by_id_counts_views(
+    self,
+    client,
+    create_existing_blogs
+  ):
+    first = await client.get("/v1/blogs/blog-1")
+    second = await client.get("/v1/blogs/blog-1")
+    listing = await client.get("/v1/blogs/?search=Test Blog 1&limit=100")
+    listed = next(item for item in listing.json()["items"] if item["id"] == "blog-1")
+
+    assert first.json()["views"] == 1
+    assert second.json()["views"] == 2
+    assert listed["views"] == 2
@@ -0,0 +1,102 @@
+import pytest
+from app.config import config
+from app.main import app
+from src.domain.events import BlogDeletedEvent
+
+
+@pytest.fixture
+def create_blogs(authenticated_client):
+  async def _create_blogs(author_id, count):
+    ids = []
+    for index in range(count):
+      response = await authenticated_client.post(
+        "/v1/blogs/",
+        json={"title": f"Blog number {index}", "content": f"Content {index}", "author_id": author_id}
+      )
+      assert response.status_code == 201
+      ids.append(response.json()["id"])
+    await app.state.outbox_dispatcher.dispatch_pending()
+    # Newest first
+    return ids[::-1]
+
+  return _create_blogs
+
+
+@pytest.fixture
+def celebrity_threshold(monkeypatch):
+  monkeypatch.setattr(config, "FEED_CELEBRITY_FOLLOWER_THRESHOLD", 1)
+  monkeypatch.setattr(app.state.timeline_fanout, "celebrity_threshold", 1)
+
+
+class TestHomeFeedEndpoint:
+
+  @pytest.mark.asyncio
+  async def test_feed_pages_through_followed_authors(self, authenticated_client, create_blogs):
+    await authenticated_client.put("/v1/users/user2/follow")
+    await authenticated_client.put("/v1/users/user3/follow")
+    ids = sorted(await create_blogs("user2", 3) + await create_blogs("user3", 2), reverse=True)
+    await create_blogs("user1", 1)
+
+    seen = []
+    cursor = None
+    while True:
+      response = await authenticated_client.get("/v1/feed", params={"limit": 2, **({"cursor": cursor} if cursor else {})})
+      assert response.status_code == 200
+      seen += [blog["id"] for blog in response.json()["items"]]
+      cursor = response.json().get("next_cursor")
+      if not cursor:
+        break
+
+    assert seen == ids
+
+
+  @pytest.mark.asyncio
+  async def test_following_backfills_recent_blogs(self, authenticated_client, create_blogs):
+    ids = await create_blogs("user2", 2)
+
+    await authenticated_client.put("/v1/users/user2/follow")
+    response = await authenticated_client.get("/v1/feed")
+
+    assert [blog["id"] for blog in response.json()["items"]] == ids
+
+
+  @pytest.mark.asyncio
+  async def test_unfollowing_and_deleting_leave_the_feed(self, authenticated_client, create_blogs):
+    await authenticated_client.put("/v1/users/user2/follow")
+    await authenticated_client.put("/v1/users/user3/follow")
+    await create_blogs("user2", 1)
+    user3_ids = await create_blogs("user3", 2)
+
+    await authenticated_client.delete("/v1/users/user2/follow")
+    # Only their author may delete user3's blogs, the event stands in for that deletion
+    await app.state.timeline_fanout.handle_blog_event(BlogDeletedEvent(user3_ids[0], "user3"))
+    response = await authenticated_client.get("/v1/feed")
+
+    assert [blog["id"] for blog in response.json()["items"]] == user3_ids[1:]
+
+
+  @pytest.mark.asyncio
+  async def test_celebrity_blogs_are_merged_when_read(self, authenticated_client, create_blogs, celebrity_threshold):
+    await authenticated_client.put("/v1/users/user2/follow")
+    await authenticated_client.put("/v1/users/user3/follow")
+    ids = sorted(await create_blogs("user2", 2) + await create_blogs("user3", 2), reverse=True)
+
+    first = await authenticated_client.get("/v1/feed", params={"limit": 3})
+    second = await authenticated_client.get("/v1/feed", params={"limit": 3, "cursor": first.json()["next_cursor"]})
+
+    assert [blog["id"] for blog in first.json()["items"] + second.json()["items"]] == ids
+    assert "next_cursor" not in second.json()
+
+
+  @pytest.mark.asyncio
+  async def test_invalid_cursor(self, authenticated_client):
+    response = await authenticated_client.get("/v1/feed", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+
+
+  @pytest.mark.asyncio
+  async def test_feed_requires_authentication(self, client):
+    response = await client.get("/v1/feed")
+
+    assert response.status_code == 401
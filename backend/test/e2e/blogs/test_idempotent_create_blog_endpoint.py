@@ -0,0 +1,30 @@
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from app.database.models import BlogModel
+
+
+class TestIdempotentCreateBlogEndpoint:
+  async def test_retried_create_blog_runs_once(
+    self,
+    api_version,
+    existing_users,
+    create_existing_users,
+    client: AsyncClient,
+    db_session
+  ):
+    payload = {
+      "title": "Posted Over A Flaky Network",
+      "content": "Sent twice, stored once.",
+      "author_id": existing_users[0]["id"]
+    }
+    headers = {"Idempotency-Key": "7f6c1d2e-create-blog"}
+
+    first = await client.post(f"/{api_version}/blogs/", json=payload, headers=headers)
+    retry = await client.post(f"/{api_version}/blogs/", json=payload, headers=headers)
+
+    assert (first.status_code, retry.status_code) == (201, 201)
+    assert retry.json()["id"] == first.json()["id"]
+    blogs = await db_session.execute(select(func.count()).select_from(BlogModel))
+    assert blogs.scalar_one() == 1
+
@@ -0,0 +1,158 @@
+import hashlib
+import pytest
+from app.main import app
+
+
+LONG_CONTENT = "\n".join(f"Paragraph {i} of a long draft that is saved every few seconds." for i in range(2000))
+
+
+def content_hash(content: str) -> str:
+  return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+@pytest.fixture
+async def long_blog(authenticated_client, existing_users):
+  response = await authenticated_client.post(
+    "/v1/blogs/",
+    json={"title": "A long autosaved draft", "content": LONG_CONTENT, "author_id": existing_users[0]["id"]}
+  )
+  assert response.status_code == 201
+  return response.json()
+
+
+class TestPatchBlogEndpoint:
+
+  @pytest.mark.asyncio
+  async def test_patch_blog_success(self, authenticated_client, long_blog):
+    offset = LONG_CONTENT.index("Paragraph 1000 of a long")
+    expected = LONG_CONTENT[:offset] + "# Paragraph 1000 of a short" + LONG_CONTENT[offset + len("Paragraph 1000 of a long"):]
+
+    response = await authenticated_client.patch(
+      f"/v1/blogs/{long_blog['id']}",
+      json={
+        "operations": [{"offset": offset, "insert": "# "}, {"offset": offset + 20, "delete": 4, "insert": "short"}],
+        "content_hash": content_hash(expected)
+      },
+      headers={"If-Match": '"1"'}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == '"2"'
+    assert response.json()["version"] == 2
+    assert response.json()["content_hash"] == content_hash(expected)
+    assert "content" not in response.json()
+
+    blog = (await authenticated_client.get(f"/v1/blogs/{long_blog['id']}")).json()
+    assert blog["content"] == expected
+    assert "<h1>Paragraph 1000 of a short" in blog["content_html"]
+
+    revision = await authenticated_client.get(f"/v1/blogs/{long_blog['id']}/revisions/2")
+    assert revision.json()["content"] == expected
+
+
+  @pytest.mark.asyncio
+  async def test_patch_blog_without_if_match_fails(self, authenticated_client, long_blog):
+    response = await authenticated_client.patch(
+      f"/v1/blogs/{long_blog['id']}",
+      json={"operations": [{"offset": 0, "insert": "x"}], "content_hash": content_hash("x" + LONG_CONTENT)}
+    )
+
+    assert response.status_code == 428
+
+
+  @pytest.mark.asyncio
+  async def test_patch_blog_of_stale_version_fails(self, authenticated_client, long_blog):
+    url = f"/v1/blogs/{long_blog['id']}"
+    first = await authenticated_client.patch(
+      url,
+      json={"operations": [{"offset": 0, "insert": "A "}], "content_hash": content_hash("A " + LONG_CONTENT)},
+      headers={"If-Match": '"1"'}
+    )
+    stale = await authenticated_client.patch(
+      url,
+      json={"operations": [{"offset": 0, "insert": "B "}], "content_hash": content_hash("B " + LONG_CONTENT)},
+      headers={"If-Match": '"1"'}
+    )
+
+    assert first.status_code == 200
+    assert stale.status_code == 412
+    assert (await authenticated_client.get(url)).json()["content"].startswith("A Paragraph 0")
+
+
+  @pytest.mark.asyncio
+  async def test_patch_blog_with_wrong_hash_fails(self, authenticated_client, long_blog):
+    url = f"/v1/blogs/{long_blog['id']}"
+    response = await authenticated_client.patch(
+      url,
+      json={"operations": [{"offset": 0, "insert": "x"}], "content_hash": content_hash(LONG_CONTENT)},
+      headers={"If-Match": '"1"'}
+    )
+
+    assert response.status_code == 400
+    assert (await authenticated_client.get(url)).json()["version"] == 1
+
+
+  @pytest.mark.asyncio
+  @pytest.mark.parametrize(
+    "operations",
+    [
+      [{"offset": len(LONG_CONTENT) + 1, "insert": "x"}],
+      [{"offset": 10, "delete": 5}, {"offset": 12, "insert": "x"}],
+    ]
+  )
+  async def test_patch_blog_with_invalid_operations_fails(self, authenticated_client, long_blog, operations):
+    response = await authenticated_client.patch(
+      f"/v1/blogs/{long_blog['id']}",
+      json={"operations": operations, "content_hash": content_hash(LONG_CONTENT)},
+      headers={"If-Match": '"1"'}
+    )
+
+    assert response.status_code == 400
+
+
+  @pytest.mark.asyncio
+  async def test_patch_blog_not_found(self, authenticated_client, create_existing_users):
+    response = await authenticated_client.patch(
+      "/v1/blogs/non-existent-id",
+      json={"operations": [{"offset": 0, "insert": "x"}], "content_hash": content_hash("x")},
+      headers={"If-Match": '"1"'}
+    )
+
+    assert response.status_code == 404
+
+
+  @pytest.mark.asyncio
+  async def test_patch_blog_with_trailing_slash(self, authenticated_client, long_blog):
+    response = await authenticated_client.patch(
+      f"/v1/blogs/{long_blog['id']}/",
+      json={"operations": [{"offset": 0, "insert": "A "}], "content_hash": content_hash("A " + LONG_CONTENT)},
+      headers={"If-Match": '"1"'}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["version"] == 2
+
+
+  @pytest.mark.asyncio
+  async def test_patch_blog_edited_while_rendering_conflicts(self, authenticated_client, long_blog, monkeypatch):
+    url = f"/v1/blogs/{long_blog['id']}"
+    render = app.state.markdown_renderer.render
+
+    async def render_after_concurrent_edit(content):
+      # Lands between the read of the patch and its write
+      edited = await authenticated_client.put(url, json={"title": "Edited meanwhile"})
+      assert edited.status_code == 200
+      return await render(content)
+
+    monkeypatch.setattr(app.state.markdown_renderer, "render", render_after_concurrent_edit)
+    response = await authenticated_client.patch(
+      url,
+      json={"operations": [{"offset": 0, "insert": "A "}], "content_hash": content_hash("A " + LONG_CONTENT)},
+      headers={"If-Match": '"1"'}
+    )
+    monkeypatch.undo()
+
+    assert response.status_code == 409
+    blog = (await authenticated_client.get(url)).json()
+    assert blog["title"] == "Edited meanwhile"
+    assert blog["content"] == LONG_CONTENT
@@ -0,0 +1,100 @@
+import pytest
+from app.main import app
+from app.related import RelatedBlogsIndexer
+
+
+BLOGS = [
+  ("Async Python", "Coroutines and the event loop in asyncio, awaiting tasks."),
+  ("Python tasks", "Scheduling asyncio tasks on the event loop."),
+  ("Rust ownership", "Borrowing, lifetimes and the borrow checker."),
+  ("Sourdough bread", "Feeding a starter and baking a crusty loaf."),
+  ("Tomato garden", "Pruning tomato plants and watering them in summer."),
+]
+
+
+@pytest.fixture
+async def create_blogs(client, existing_users, create_existing_users):
+  async def _create_blogs(blogs):
+    ids = []
+    for title, content in blogs:
+      response = await client.post(
+        "/v1/blogs/",
+        json={"title": title, "content": content, "author_id": existing_users[0]["id"]}
+      )
+      assert response.status_code == 201
+      ids.append(response.json()["id"])
+    return ids
+
+  return _create_blogs
+
+
+class TestRelatedBlogsEndpoint:
+
+  @pytest.mark.asyncio
+  async def test_get_related_blogs_after_rebuild(self, client, create_blogs):
+    ids = await create_blogs(BLOGS)
+    await app.state.related_blogs_indexer.rebuild()
+
+    response = await client.get(f"/v1/blogs/{ids[0]}/related")
+
+    assert response.status_code == 200
+    assert [blog["title"] for blog in response.json()] == ["Python tasks"]
+
+
+  @pytest.mark.asyncio
+  async def test_new_blogs_are_related_incrementally(self, client, create_blogs):
+    ids = await create_blogs(BLOGS)
+    await app.state.related_blogs_indexer.rebuild()
+
+    new_ids = await create_blogs([("Asyncio queues", "Producer and consumer tasks sharing an asyncio queue on the event loop.")])
+    await app.state.outbox_dispatcher.dispatch_pending()
+    await app.state.related_blogs_indexer.run()
+
+    new_related = await client.get(f"/v1/blogs/{new_ids[0]}/related?limit=2")
+    old_related = await client.get(f"/v1/blogs/{ids[1]}/related")
+
+    assert {blog["id"] for blog in new_related.json()} == {ids[0], ids[1]}
+    assert new_ids[0] in {blog["id"] for blog in old_related.json()}
+
+
+  @pytest.mark.asyncio
+  async def test_deleted_blogs_leave_related_lists(self, authenticated_client, create_blogs):
+    ids = await create_blogs(BLOGS)
+    await app.state.related_blogs_indexer.rebuild()
+
+    deleted = await authenticated_client.delete(f"/v1/blogs/{ids[1]}")
+    await app.state.outbox_dispatcher.dispatch_pending()
+    await app.state.related_blogs_indexer.run()
+    response = await authenticated_client.get(f"/v1/blogs/{ids[0]}/related")
+
+    assert deleted.status_code == 204
+    assert response.status_code == 200
+    assert ids[1] not in {blog["id"] for blog in response.json()}
+
+
+  @pytest.mark.asyncio
+  async def test_only_the_lease_holder_keeps_the_index(self, client, create_blogs):
+    ids = await create_blogs(BLOGS)
+    indexer = app.state.related_blogs_indexer
+    other = RelatedBlogsIndexer(session_factory=indexer.session_factory)
+    await app.state.outbox_dispatcher.dispatch_pending()
+    await indexer.run()
+
+    new_ids = await create_blogs([("Asyncio queues", "Producer and consumer tasks sharing an asyncio queue on the event loop.")])
+    await app.state.outbox_dispatcher.dispatch_pending()
+
+    assert await other.rebuild() == 0
+    assert await other.run() == 0
+    assert other.index is None
+
+    assert await indexer.run() == 1
+    related = await client.get(f"/v1/blogs/{ids[1]}/related")
+
+    assert new_ids[0] in {blog["id"] for blog in related.json()}
+
+
+  @pytest.mark.asyncio
+  async def test_get_related_blogs_of_unknown_blog(self, client):
+    response = await client.get("/v1/blogs/unknown-blog/related")
+
+    assert response.status_code == 404
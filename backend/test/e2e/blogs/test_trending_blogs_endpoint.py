@@ -0,0 +1,77 @@
+import pytest
+from app.main import app
+
+
+@pytest.fixture
+async def create_blogs(client, existing_users, create_existing_users):
+  async def _create_blogs(titles):
+    ids = []
+    for title in titles:
+      response = await client.post(
+        "/v1/blogs/",
+        json={"title": title, "content": f"Content of {title}", "author_id": existing_users[0]["id"]}
+      )
+      assert response.status_code == 201
+      ids.append(response.json()["id"])
+    return ids
+
+  return _create_blogs
+
+
+class TestTrendingBlogsEndpoint:
+
+  @pytest.mark.asyncio
+  async def test_most_viewed_blogs_trend_first(self, client, create_blogs):
+    ids = await create_blogs(["Quiet blog", "Popular blog", "Busy blog"])
+    for blog_id, views in zip(ids, [1, 5, 3]):
+      for _ in range(views):
+        assert (await client.get(f"/v1/blogs/{blog_id}")).status_code == 200
+    await app.state.trending_tracker.snapshot()
+
+    response = await client.get("/v1/blogs/trending?limit=2")
+
+    assert response.status_code == 200
+    assert [blog["title"] for blog in response.json()] == ["Popular blog", "Busy blog"]
+    assert response.json()[0]["score"] > response.json()[1]["score"]
+
+
+  @pytest.mark.asyncio
+  async def test_scores_of_other_workers_are_merged(self, client, create_blogs):
+    ids = await create_blogs(["First blog", "Second blog"])
+    tracker = app.state.trending_tracker
+    tracker.record(ids[0], weight=2.0)
+    await tracker.snapshot()
+
+    # A new tracker stands in for another worker sharing the same table
+    other = type(tracker)(session_factory=tracker.session_factory)
+    other.record(ids[1], weight=3.0)
+    await other.snapshot()
+    await tracker.snapshot()
+
+    response = await client.get("/v1/blogs/trending")
+
+    assert [blog["id"] for blog in response.json()] == [ids[1], ids[0]]
+
+
+  @pytest.mark.asyncio
+  async def test_deleted_blogs_stop_trending(self, authenticated_client, create_blogs):
+    ids = await create_blogs(["Gone blog", "Stays blog"])
+    for blog_id in ids:
+      await authenticated_client.get(f"/v1/blogs/{blog_id}")
+    await app.state.trending_tracker.snapshot()
+
+    deleted = await authenticated_client.delete(f"/v1/blogs/{ids[0]}")
+    await app.state.outbox_dispatcher.dispatch_pending()
+    await app.state.outbox_broadcaster.broadcast_pending()
+    response = await authenticated_client.get("/v1/blogs/trending")
+
+    assert deleted.status_code == 204
+    assert [blog["id"] for blog in response.json()] == [ids[1]]
+
+
+  @pytest.mark.asyncio
+  async def test_nothing_trends_before_a_snapshot(self, client):
+    response = await client.get("/v1/blogs/trending")
+
+    assert response.status_code == 200
+    assert response.json() == []
@@ -175,4 +175,42 @@ class TestUpdateBlogEndpoint:
     assert response.status_code == 401
     data = response.json()
 
-    assert data["detail"] == "You are not authorized to update this blog."
\ No newline at end of file
+    assert data["detail"] == "You are not authorized to update this blog."
+
+
+  @pytest.mark.asyncio
+  async def test_update_blog_with_if_match(
+    self,
+    authenticated_client,
+    api_version,
+    existing_blogs,
+    create_existing_blogs
+  ):
+    url = f"/{api_version}/blogs/{existing_blogs[0]['id']}"
+    etag = (await authenticated_client.get(url)).headers["etag"]
+
+    first = await authenticated_client.put(url, json={"title": "First Edit"}, headers={"If-Match": etag})
+    stale = await authenticated_client.put(url, json={"title": "Lost Edit"}, headers={"If-Match": etag})
+
+    assert first.status_code == 200
+    assert first.headers["etag"] == '"2"'
+    assert first.json()["version"] == 2
+    assert stale.status_code == 412
+    assert (await authenticated_client.get(url)).json()["title"] == "First Edit"
+
+
+  @pytest.mark.asyncio
+  async def test_update_blog_with_weak_if_match_fails(
+    self,
+    authenticated_client,
+    api_version,
+    existing_blogs,
+    create_existing_blogs
+  ):
+    response = await authenticated_client.put(
+      f"/{api_version}/blogs/{existing_blogs[0]['id']}",
+      json={"title": "Weak Edit"},
+      headers={"If-Match": 'W/"1"'}
+    )
+
+    assert response.status_code == 412
@@ -0,0 +1,137 @@
+import io
+import pytest
+from PIL import Image
+
+from app.main import app
+from app.repositories import BlogRepository
+from app.storage import LocalImageStorage
+from src.domain.exceptions import ConflictException
+
+
+@pytest.fixture
+def image_storage(tmp_path):
+  previous = app.state.image_storage
+  app.state.image_storage = LocalImageStorage(root_dir=str(tmp_path), base_url="/media")
+  yield tmp_path
+  app.state.image_storage = previous
+
+
+@pytest.fixture
+def png_bytes():
+  buffer = io.BytesIO()
+  Image.new("RGB", (1000, 500), color=(10, 120, 200)).save(buffer, format="PNG")
+  return buffer.getvalue()
+
+
+class TestUploadHeroImageEndpoint:
+
+  @pytest.mark.asyncio
+  async def test_upload_hero_image_success(
+    self,
+    authenticated_client,
+    create_existing_blogs,
+    image_storage,
+    png_bytes
+  ):
+    response = await authenticated_client.put(
+      "/v1/blogs/blog-1/hero-image",
+      content=png_bytes,
+      headers={"Content-Type": "image/png"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["hero_image"].startswith("/media/blogs/blog-1/")
+    assert data["hero_image"].endswith("/original.png")
+    assert set(data["hero_image_variants"]) == {"thumbnail", "card", "full"}
+
+    card_url = data["hero_image_variants"]["card"]["webp"]
+    assert (image_storage / card_url.removeprefix("/media/")).exists()
+
+    fetched = await authenticated_client.get("/v1/blogs/blog-1")
+    assert fetched.json()["hero_image_variants"] == data["hero_image_variants"]
+
+
+  @pytest.mark.asyncio
+  async def test_upload_hero_image_rejects_non_images(
+    self,
+    authenticated_client,
+    create_existing_blogs,
+    image_storage
+  ):
+    wrong_type = await authenticated_client.put(
+      "/v1/blogs/blog-1/hero-image",
+      content=b"hello",
+      headers={"Content-Type": "text/plain"}
+    )
+    not_an_image = await authenticated_client.put(
+      "/v1/blogs/blog-1/hero-image",
+      content=b"hello",
+      headers={"Content-Type": "image/png"}
+    )
+
+    assert wrong_type.status_code == 415
+    assert not_an_image.status_code == 400
+    assert not any(image_storage.iterdir())
+
+
+  @pytest.mark.asyncio
+  async def test_upload_hero_image_too_large(
+    self,
+    authenticated_client,
+    create_existing_blogs,
+    image_storage,
+    png_bytes,
+    monkeypatch
+  ):
+    monkeypatch.setattr("app.api.dependencies.dependencies.config.IMAGE_UPLOAD_MAX_BYTES", 100)
+
+    response = await authenticated_client.put(
+      "/v1/blogs/blog-1/hero-image",
+      content=png_bytes,
+      headers={"Content-Type": "image/png"}
+    )
+
+    assert response.status_code == 413
+
+
+  @pytest.mark.asyncio
+  async def test_upload_hero_image_not_author(
+    self,
+    authenticated_client,
+    create_existing_blogs,
+    image_storage,
+    png_bytes
+  ):
+    # blog-2 belongs to user2 while the client is logged in as user1
+    response = await authenticated_client.put(
+      "/v1/blogs/blog-2/hero-image",
+      content=png_bytes,
+      headers={"Content-Type": "image/png"}
+    )
+
+    assert response.status_code == 401
+
+
+  @pytest.mark.asyncio
+  async def test_upload_hero_image_removes_files_when_write_fails(
+    self,
+    authenticated_client,
+    create_existing_blogs,
+    image_storage,
+    png_bytes,
+    monkeypatch
+  ):
+    async def conflicting_update(self, blog_id, blog):
+      raise ConflictException("Blog", f"blog_id: {blog_id}")
+
+    monkeypatch.setattr(BlogRepository, "update_blog", conflicting_update)
+
+    response = await authenticated_client.put(
+      "/v1/blogs/blog-1/hero-image",
+      content=png_bytes,
+      headers={"Content-Type": "image/png"}
+    )
+
+    assert response.status_code == 409
+    assert not any(path.is_file() for path in image_storage.rglob("*"))
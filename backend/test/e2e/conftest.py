@@ -7,7 +7,11 @@ from typing import AsyncGenerator
 
 from app.database.db import Base, get_db
 from app.database.models import UserModel
-from app.services import PasswordHasher
+from app.auth import token_cache
+from app.config import config
+from app.events import OutboxDispatcher, OutboxBroadcaster
+from app.jobs import JobRunner, UserContentPurger
+from app.services import PasswordHasher, ViewCounter
 from app.main import app
 
 
@@ -87,6 +91,25 @@ async def client():
       yield session
 
   app.dependency_overrides[get_db] = override_get_db
+  await app.state.rate_limiter.reset()
+  await app.state.idempotency_store.reset()
+  app.state.view_counter = ViewCounter(session_factory=TestingSessionLocal)
+  # The event bus holds this tracker, so it is pointed at the test database rather than replaced
+  app.state.trending_tracker.session_factory = TestingSessionLocal
+  app.state.trending_tracker.apply_pending()
+  app.state.trending_tracker._scores.clear()
+  app.state.trending_tracker._top = []
+  app.state.feed_cache.clear()
+  app.state.related_blogs_indexer.session_factory = TestingSessionLocal
+  app.state.related_blogs_indexer.index = None
+  app.state.timeline_fanout.session_factory = TestingSessionLocal
+  token_cache.clear()
+  app.state.outbox_dispatcher = OutboxDispatcher(session_factory=TestingSessionLocal, event_bus=app.state.event_bus)
+  app.state.outbox_broadcaster = OutboxBroadcaster(session_factory=TestingSessionLocal, event_bus=app.state.broadcast_bus, cursor=0)
+  app.state.job_runner = JobRunner()
+  for queue_name, concurrency in config.JOB_QUEUE_CONCURRENCY.items():
+    app.state.job_runner.add_queue(queue_name, concurrency=concurrency)
+  app.state.user_content_purger = UserContentPurger(session_factory=TestingSessionLocal, pause_seconds=0)
 
   transport = ASGITransport(app=app)
 
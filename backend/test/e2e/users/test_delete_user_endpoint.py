@@ -1,4 +1,8 @@
 import pytest
+from sqlalchemy import func, select
+
+from app.database.models import BlogModel
+from app.main import app
 
 class TestDeleteUserEndpoint:
 
@@ -13,7 +17,8 @@ class TestDeleteUserEndpoint:
       f"/{api_version}/users/user1"
     )
 
-    assert response.status_code == 204
+    assert response.status_code == 202
+    assert response.json()["status"] == "completed"
 
     # Verify the user is actually deleted
     get_response = await authenticated_client.get(
@@ -37,4 +42,39 @@ class TestDeleteUserEndpoint:
 
     data = response.json()
 
-    assert data["detail"] == "User with identifier 'user_id: nonexistent' was not found."
\ No newline at end of file
+    assert data["detail"] == "User with identifier 'user_id: nonexistent' was not found."
+
+
+  @pytest.mark.asyncio
+  async def test_delete_user_with_blogs_runs_in_background(
+    self,
+    authenticated_client,
+    create_existing_users,
+    db_session,
+    api_version
+  ):
+    db_session.add_all([
+      BlogModel(id=f"blog-{i}", title=f"Blog {i}", content="Content.", author_id="user1")
+      for i in range(5)
+    ])
+    await db_session.commit()
+    app.state.user_content_purger.chunk_size = 2
+
+    response = await authenticated_client.delete(f"/{api_version}/users/user1")
+
+    assert response.status_code == 202
+    assert response.json()["status"] == "pending"
+    assert response.json()["blogs_total"] == 5
+
+    await app.state.job_runner.start()
+    await app.state.job_runner.stop()
+
+    progress = await authenticated_client.get(response.headers["location"])
+    assert progress.status_code == 200
+    assert progress.json()["status"] == "completed"
+    assert progress.json()["blogs_deleted"] == 5
+    assert progress.json()["progress"] == 1.0
+
+    remaining = await db_session.execute(select(func.count()).select_from(BlogModel))
+    assert remaining.scalar_one() == 0
+    assert (await authenticated_client.get(f"/{api_version}/users/user1")).status_code == 404
@@ -0,0 +1,59 @@
+import pytest
+
+
+class TestFollowEndpoint:
+
+  @pytest.mark.asyncio
+  async def test_follow_and_list_follows(self, authenticated_client, existing_users):
+    for user in existing_users[1:]:
+      response = await authenticated_client.put(f"/v1/users/{user['id']}/follow")
+      assert response.status_code == 204
+
+    following = await authenticated_client.get(f"/v1/users/{existing_users[0]['id']}/following")
+    followers = await authenticated_client.get(f"/v1/users/{existing_users[1]['id']}/followers")
+
+    assert following.json()["total"] == 2
+    assert {user["id"] for user in following.json()["items"]} == {"user2", "user3"}
+    assert [user["id"] for user in followers.json()["items"]] == ["user1"]
+    assert "password" not in followers.json()["items"][0]
+
+
+  @pytest.mark.asyncio
+  async def test_follow_twice_and_unfollow(self, authenticated_client):
+    await authenticated_client.put("/v1/users/user2/follow")
+    await authenticated_client.put("/v1/users/user2/follow")
+
+    assert (await authenticated_client.get("/v1/users/user2/followers")).json()["total"] == 1
+
+    response = await authenticated_client.delete("/v1/users/user2/follow")
+
+    assert response.status_code == 204
+    assert (await authenticated_client.get("/v1/users/user2/followers")).json()["total"] == 0
+
+
+  @pytest.mark.asyncio
+  async def test_cannot_follow_yourself(self, authenticated_client):
+    response = await authenticated_client.put("/v1/users/user1/follow")
+
+    assert response.status_code == 400
+
+
+  @pytest.mark.asyncio
+  async def test_follow_unknown_user(self, authenticated_client):
+    response = await authenticated_client.put("/v1/users/unknown-user/follow")
+
+    assert response.status_code == 404
+
+
+  @pytest.mark.asyncio
+  async def test_follow_requires_authentication(self, client, create_existing_users):
+    response = await client.put("/v1/users/user2/follow")
+
+    assert response.status_code == 401
+
+
+  @pytest.mark.asyncio
+  async def test_followers_of_unknown_user(self, client):
+    response = await client.get("/v1/users/unknown-user/followers")
+
+    assert response.status_code == 404
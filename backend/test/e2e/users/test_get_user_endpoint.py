@@ -133,4 +133,33 @@ class TestGetUserEndpoint:
     assert response.status_code == 404
     data = response.json()
 
-    assert data["detail"] == f"User with username '{non_existent_username}' not found."
\ No newline at end of file
+    assert data["detail"] == f"User with username '{non_existent_username}' not found."
+
+  @pytest.mark.asyncio
+  async def test_get_author_stats(
+    self,
+    authenticated_client,
+    api_version
+  ):
+    empty = await authenticated_client.get(f"/{api_version}/users/user1/stats")
+
+    assert empty.status_code == 200
+    assert empty.json() == {"author_id": "user1", "post_count": 0, "last_posted_at": None}
+
+    await authenticated_client.post(f"/{api_version}/blogs/", json={
+      "title": "My first blog",
+      "content": "Hello world.",
+      "author_id": "user1"
+    })
+    response = await authenticated_client.get(f"/{api_version}/users/user1/stats")
+
+    assert response.status_code == 200
+    assert response.json()["post_count"] == 1
+    assert response.json()["last_posted_at"] is not None
+
+
+  @pytest.mark.asyncio
+  async def test_get_author_stats_user_not_found(self, client, api_version):
+    response = await client.get(f"/{api_version}/users/nonexistent/stats")
+
+    assert response.status_code == 404
@@ -0,0 +1,23 @@
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from app.database.models import UserModel
+
+
+class TestIdempotentRegisterEndpoint:
+  async def test_retried_registration_replays_response(self, api_version, client: AsyncClient, db_session):
+    payload = {
+      "first_name": "John",
+      "last_name": "Doe",
+      "username": "johndoe",
+      "password": "SecurePass.123"
+    }
+    headers = {"Idempotency-Key": "7f6c1d2e-register"}
+
+    first = await client.post(f"/{api_version}/users/register", json=payload, headers=headers)
+    retry = await client.post(f"/{api_version}/users/register", json=payload, headers=headers)
+
+    assert (first.status_code, retry.status_code) == (201, 201)
+    assert retry.json() == first.json()
+    users = await db_session.execute(select(func.count()).select_from(UserModel))
+    assert users.scalar_one() == 1
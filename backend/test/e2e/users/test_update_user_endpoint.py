@@ -160,4 +160,23 @@ class TestUpdateUserEndpoint:
     assert response.status_code == 401
     data = response.json()
 
-    assert data["detail"] == "You are not authorized to update this user."
\ No newline at end of file
+    assert data["detail"] == "You are not authorized to update this user."
+
+  @pytest.mark.asyncio
+  async def test_update_user_is_persisted_and_versioned(
+    self,
+    authenticated_client,
+    create_existing_users,
+    api_version
+  ):
+    url = f"/{api_version}/users/user1"
+    etag = (await authenticated_client.get(url)).headers["etag"]
+
+    first = await authenticated_client.put(url, json={"first_name": "Arya"}, headers={"If-Match": etag})
+    stale = await authenticated_client.put(url, json={"first_name": "Sansa"}, headers={"If-Match": etag})
+    current = await authenticated_client.get(url)
+
+    assert first.status_code == 200
+    assert stale.status_code == 412
+    assert current.json()["first_name"] == "Arya"
+    assert current.headers["etag"] == '"2"'
@@ -0,0 +1,88 @@
+import io
+import pytest
+from PIL import Image
+
+from app.main import app
+from app.repositories import UserRepository
+from app.storage import LocalImageStorage
+from src.domain.exceptions import ConflictException
+
+
+@pytest.fixture
+def image_storage(tmp_path):
+  previous = app.state.image_storage
+  app.state.image_storage = LocalImageStorage(root_dir=str(tmp_path), base_url="/media")
+  yield tmp_path
+  app.state.image_storage = previous
+
+
+@pytest.fixture
+def jpeg_bytes():
+  buffer = io.BytesIO()
+  Image.new("RGB", (400, 400), color=(240, 200, 20)).save(buffer, format="JPEG")
+  return buffer.getvalue()
+
+
+class TestUploadAvatarEndpoint:
+
+  @pytest.mark.asyncio
+  async def test_upload_avatar_success(self, authenticated_client, image_storage, jpeg_bytes):
+    response = await authenticated_client.put(
+      "/v1/users/user1/avatar",
+      content=jpeg_bytes,
+      headers={"Content-Type": "image/jpeg"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["avatar"].endswith("/original.jpeg")
+    assert data["avatar_variants"]["thumbnail"]["webp"].startswith("/media/avatars/user1/")
+
+    fetched = await authenticated_client.get("/v1/users/user1")
+    assert fetched.json()["avatar_variants"] == data["avatar_variants"]
+
+
+  @pytest.mark.asyncio
+  async def test_upload_avatar_for_other_user(self, authenticated_client, image_storage, jpeg_bytes):
+    response = await authenticated_client.put(
+      "/v1/users/user2/avatar",
+      content=jpeg_bytes,
+      headers={"Content-Type": "image/jpeg"}
+    )
+
+    assert response.status_code == 401
+    assert not any(image_storage.iterdir())
+
+
+  @pytest.mark.asyncio
+  async def test_upload_avatar_unauthenticated(self, client, create_existing_users, jpeg_bytes):
+    response = await client.put(
+      "/v1/users/user1/avatar",
+      content=jpeg_bytes,
+      headers={"Content-Type": "image/jpeg"}
+    )
+
+    assert response.status_code == 401
+
+
+  @pytest.mark.asyncio
+  async def test_upload_avatar_removes_files_when_write_fails(
+    self,
+    authenticated_client,
+    image_storage,
+    jpeg_bytes,
+    monkeypatch
+  ):
+    async def conflicting_update(self, user_id, user):
+      raise ConflictException("User", f"user_id: {user_id}")
+
+    monkeypatch.setattr(UserRepository, "update_user", conflicting_update)
+
+    response = await authenticated_client.put(
+      "/v1/users/user1/avatar",
+      content=jpeg_bytes,
+      headers={"Content-Type": "image/jpeg"}
+    )
+
+    assert response.status_code == 409
+    assert not any(path.is_file() for path in image_storage.rglob("*"))
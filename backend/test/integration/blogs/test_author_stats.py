@@ -0,0 +1,120 @@
+import pytest
+from datetime import datetime, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.models import BlogModel
+from app.database.unit_of_work import UnitOfWork
+from app.repositories import AuthorStatsRepository
+from app.services import UuidGenerator
+from src.application.dto import CreateBlogDTO
+from src.application.use_cases.blogs import CreateBlogUseCase, DeleteBlogUseCase
+
+
+def _normalize(dt: datetime) -> datetime:
+  return dt.replace(tzinfo=None)
+
+
+class TestAuthorStats:
+
+  @pytest.mark.asyncio
+  async def test_create_blog_updates_stats(
+    self,
+    db_session: AsyncSession,
+    create_test_user
+  ):
+    test_user = await create_test_user()
+
+    for i in range(3):
+      use_case = CreateBlogUseCase(
+        unit_of_work=UnitOfWork(db_session),
+        id_generator=UuidGenerator()
+      )
+      created = await use_case.execute(CreateBlogDTO(
+        title=f"Blog title {i}",
+        content="Some content.",
+        author_id=test_user.id
+      ))
+
+    stats = await AuthorStatsRepository(db_session).get_stats(test_user.id)
+
+    assert stats.post_count == 3
+    assert _normalize(stats.last_posted_at) == _normalize(created.created_at)
+
+
+  @pytest.mark.asyncio
+  async def test_delete_blog_recomputes_last_posted_at(
+    self,
+    db_session: AsyncSession,
+    create_test_user
+  ):
+    test_user = await create_test_user()
+    db_session.add_all([
+      BlogModel(
+        id=blog_id,
+        title="Test Blog Title",
+        content="Content.",
+        author_id=test_user.id,
+        created_at=created_at
+      )
+      for blog_id, created_at in [
+        ("older-blog", datetime(2024, 1, 1, tzinfo=timezone.utc)),
+        ("newer-blog", datetime(2024, 6, 1, tzinfo=timezone.utc)),
+      ]
+    ])
+    await db_session.commit()
+
+    repository = AuthorStatsRepository(db_session)
+    await repository.rebuild()
+    await db_session.commit()
+
+    use_case = DeleteBlogUseCase(unit_of_work=UnitOfWork(db_session))
+    await use_case.execute(current_user=test_user, blog_id="newer-blog")
+
+    stats = await repository.get_stats(test_user.id)
+
+    assert stats.post_count == 1
+    assert _normalize(stats.last_posted_at) == datetime(2024, 1, 1)
+
+
+  @pytest.mark.asyncio
+  async def test_delete_last_blog_clears_last_posted_at(
+    self,
+    db_session: AsyncSession,
+    create_test_user,
+    create_test_blog
+  ):
+    test_user = await create_test_user()
+    await create_test_blog()
+
+    repository = AuthorStatsRepository(db_session)
+    await repository.rebuild()
+    await db_session.commit()
+
+    use_case = DeleteBlogUseCase(unit_of_work=UnitOfWork(db_session))
+    await use_case.execute(current_user=test_user, blog_id="test-blog-id")
+
+    stats = await repository.get_stats(test_user.id)
+
+    assert stats.post_count == 0
+    assert stats.last_posted_at is None
+
+
+  @pytest.mark.asyncio
+  async def test_rebuild_single_author(
+    self,
+    db_session: AsyncSession,
+    create_test_user,
+    create_test_blog
+  ):
+    await create_test_user()
+    await create_test_user(id="other-user-id", username="otheruser")
+    await create_test_blog(id="blog-1")
+    await create_test_blog(id="blog-2")
+    await create_test_blog(id="blog-3", author_id="other-user-id")
+
+    repository = AuthorStatsRepository(db_session)
+    rebuilt = await repository.rebuild("test-user-id")
+
+    assert rebuilt == 1
+    assert (await repository.get_stats("test-user-id")).post_count == 2
+    assert await repository.get_stats("other-user-id") is None
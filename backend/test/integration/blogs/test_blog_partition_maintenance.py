@@ -0,0 +1,45 @@
+import pytest
+from datetime import date
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.database.models import BlogViewModel
+from app.jobs import maintain_blog_partitions
+
+
+@pytest.fixture
+def session_factory(db_session: AsyncSession):
+  return async_sessionmaker(
+    bind=db_session.bind,
+    expire_on_commit=False,
+    class_=AsyncSession
+  )
+
+
+class TestMaintainBlogPartitions:
+
+  @pytest.mark.asyncio
+  async def test_purges_views_of_deleted_blogs(
+    self,
+    db_session: AsyncSession,
+    session_factory,
+    create_test_user,
+    create_test_blog
+  ):
+    test_user = await create_test_user()
+    test_blog = await create_test_blog(author_id=test_user.id)
+    blog_id = test_blog.id
+    db_session.add_all([
+      BlogViewModel(blog_id=blog_id, views=3),
+      BlogViewModel(blog_id="deleted-blog-id", views=5),
+    ])
+    await db_session.commit()
+
+    # SQLite has no partitions to create, only the view counts are maintained
+    created = await maintain_blog_partitions(session_factory, months_ahead=2, today=date(2026, 10, 19))
+
+    async with session_factory() as session:
+      remaining = (await session.execute(select(BlogViewModel.blog_id))).scalars().all()
+
+    assert created == 0
+    assert remaining == [blog_id]
@@ -0,0 +1,287 @@
+import asyncio
+import pytest
+from datetime import datetime, timezone
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.database.models import OutboxModel
+from app.database.unit_of_work import UnitOfWork
+from app.events import EventBus, OutboxBroadcaster, OutboxDispatcher, OutboxSignal
+from app.feeds import BlogStreamHub
+from app.main import create_app
+from app.services import UuidGenerator
+from src.application.dto import CreateBlogDTO
+from src.application.use_cases.blogs import CreateBlogUseCase
+from src.domain.events import BlogCreatedEvent, BlogDeletedEvent, BlogEvent
+from src.domain.exceptions import InvalidDataException
+
+
+@pytest.fixture
+def session_factory(db_session: AsyncSession):
+  return async_sessionmaker(
+    bind=db_session.bind,
+    expire_on_commit=False,
+    class_=AsyncSession
+  )
+
+
+@pytest.fixture
+def signal():
+  return OutboxSignal()
+
+
+@pytest.fixture
+def event_bus():
+  return EventBus()
+
+
+async def create_blog(db_session: AsyncSession, signal: OutboxSignal, author_id: str = "test-user-id"):
+  use_case = CreateBlogUseCase(
+    unit_of_work=UnitOfWork(db_session, signal=signal),
+    id_generator=UuidGenerator()
+  )
+  return await use_case.execute(CreateBlogDTO(
+    title="Outbox Blog",
+    content="Content that raises an event.",
+    author_id=author_id
+  ))
+
+
+async def outbox_rows(session_factory):
+  async with session_factory() as session:
+    return (await session.execute(select(OutboxModel).order_by(OutboxModel.id))).scalars().all()
+
+
+class TestOutbox:
+
+  @pytest.mark.asyncio
+  async def test_events_are_written_with_the_commit(
+    self,
+    db_session: AsyncSession,
+    session_factory,
+    signal: OutboxSignal,
+    create_test_user
+  ):
+    await create_test_user()
+    notifications = []
+    signal.listen(lambda: notifications.append(True))
+
+    blog = await create_blog(db_session, signal)
+
+    rows = await outbox_rows(session_factory)
+    assert [row.event_type for row in rows] == ["blog.created"]
+    assert rows[0].payload == {"blog_id": blog.id, "author_id": "test-user-id"}
+    assert notifications == [True]
+
+
+  @pytest.mark.asyncio
+  async def test_rolled_back_transaction_writes_no_events(
+    self,
+    db_session: AsyncSession,
+    session_factory,
+    signal: OutboxSignal
+  ):
+    with pytest.raises(InvalidDataException):
+      await create_blog(db_session, signal, author_id="missing-author")
+
+    assert await outbox_rows(session_factory) == []
+
+
+  @pytest.mark.asyncio
+  async def test_dispatcher_publishes_and_completes_events(
+    self,
+    db_session: AsyncSession,
+    session_factory,
+    signal: OutboxSignal,
+    event_bus: EventBus,
+    create_test_user
+  ):
+    await create_test_user()
+    received = []
+    event_bus.subscribe(BlogEvent, received.append)
+    blogs = [await create_blog(db_session, signal) for _ in range(3)]
+
+    dispatcher = OutboxDispatcher(session_factory=session_factory, event_bus=event_bus, batch_size=2)
+    dispatched = await dispatcher.dispatch_pending()
+
+    assert dispatched == 3
+    assert all(isinstance(event, BlogCreatedEvent) for event in received)
+    assert [event.blog_id for event in received] == [blog.id for blog in blogs]
+    assert all(row.dispatched_at is not None for row in await outbox_rows(session_factory))
+    assert await dispatcher.dispatch_pending() == 0
+
+
+  @pytest.mark.asyncio
+  async def test_dispatched_events_are_pruned_after_retention(
+    self,
+    db_session: AsyncSession,
+    session_factory,
+    signal: OutboxSignal,
+    event_bus: EventBus,
+    create_test_user
+  ):
+    await create_test_user()
+    await create_blog(db_session, signal)
+    dispatcher = OutboxDispatcher(session_factory=session_factory, event_bus=event_bus, retention_seconds=-1)
+
+    assert await dispatcher.prune_dispatched() == 0
+    await dispatcher.dispatch_pending()
+
+    assert await dispatcher.prune_dispatched() == 1
+    assert await outbox_rows(session_factory) == []
+
+
+  @pytest.mark.asyncio
+  async def test_every_worker_broadcasts_each_event(
+    self,
+    db_session: AsyncSession,
+    session_factory,
+    signal: OutboxSignal,
+    create_test_user
+  ):
+    await create_test_user()
+    workers = []
+    for _ in range(2):
+      event_bus, broadcast_bus, hub = EventBus(), EventBus(), BlogStreamHub()
+      broadcast_bus.subscribe(BlogEvent, hub.handle_blog_event)
+      dispatched = []
+      event_bus.subscribe(BlogEvent, dispatched.append)
+      workers.append((
+        OutboxDispatcher(session_factory=session_factory, event_bus=event_bus),
+        OutboxBroadcaster(session_factory=session_factory, event_bus=broadcast_bus),
+        hub.subscribe(),
+        dispatched
+      ))
+    for _, broadcaster, _, _ in workers:
+      await broadcaster.start()
+
+    try:
+      blog = await create_blog(db_session, signal)
+      for dispatcher, broadcaster, _, _ in workers:
+        await dispatcher.dispatch_pending()
+        await broadcaster.broadcast_pending()
+    finally:
+      for _, broadcaster, _, _ in workers:
+        await broadcaster.stop()
+
+    assert sum(len(dispatched) for _, _, _, dispatched in workers) == 1
+    for _, _, subscription, _ in workers:
+      stream = subscription.stream()
+      await anext(stream)
+      frame = await asyncio.wait_for(anext(stream), timeout=1.0)
+      assert b"event: blog.created" in frame
+      assert blog.id.encode() in frame
+
+
+  @pytest.mark.asyncio
+  async def test_broadcaster_waits_for_skipped_ids(self, session_factory, event_bus: EventBus):
+    received = []
+    event_bus.subscribe(BlogEvent, received.append)
+    broadcaster = OutboxBroadcaster(session_factory=session_factory, event_bus=event_bus, cursor=0)
+
+    async def add_event(message_id: int, blog_id: str) -> None:
+      async with session_factory() as session:
+        session.add(OutboxModel(
+          id=message_id,
+          event_type=BlogCreatedEvent.name,
+          payload={"blog_id": blog_id, "author_id": "author-1"},
+          attempts=0,
+          available_at=datetime.now(timezone.utc)
+        ))
+        await session.commit()
+
+    # Message 1 commits after message 2, which was broadcast first
+    await add_event(2, "blog-2")
+    await broadcaster.broadcast_pending()
+    await add_event(1, "blog-1")
+    await broadcaster.broadcast_pending()
+    await broadcaster.broadcast_pending()
+
+    assert [event.blog_id for event in received] == ["blog-2", "blog-1"]
+
+
+  @pytest.mark.asyncio
+  async def test_failed_events_are_retried_with_backoff(
+    self,
+    db_session: AsyncSession,
+    session_factory,
+    signal: OutboxSignal,
+    event_bus: EventBus,
+    create_test_user
+  ):
+    await create_test_user()
+    calls = []
+
+    def flaky_handler(event):
+      calls.append(event)
+      raise RuntimeError("search index unavailable")
+
+    event_bus.subscribe(BlogEvent, flaky_handler)
+    await create_blog(db_session, signal)
+
+    dispatcher = OutboxDispatcher(
+      session_factory=session_factory,
+      event_bus=event_bus,
+      retry_base_delay=60
+    )
+    await dispatcher.dispatch_pending()
+    await dispatcher.dispatch_pending()
+
+    rows = await outbox_rows(session_factory)
+    assert len(calls) == 1
+    assert rows[0].attempts == 1
+    assert rows[0].last_error == "search index unavailable"
+
+
+  @pytest.mark.asyncio
+  async def test_events_are_abandoned_after_max_attempts(
+    self,
+    db_session: AsyncSession,
+    session_factory,
+    signal: OutboxSignal,
+    event_bus: EventBus,
+    create_test_user
+  ):
+    await create_test_user()
+    calls = []
+
+    def failing_handler(event):
+      calls.append(event)
+      raise RuntimeError("boom")
+
+    event_bus.subscribe(BlogEvent, failing_handler)
+    await create_blog(db_session, signal)
+
+    dispatcher = OutboxDispatcher(
+      session_factory=session_factory,
+      event_bus=event_bus,
+      max_attempts=2,
+      retry_base_delay=0
+    )
+    for _ in range(4):
+      await dispatcher.dispatch_pending()
+
+    rows = await outbox_rows(session_factory)
+    assert len(calls) == 2
+    assert rows[0].attempts == 2
+
+
+  def test_each_app_has_its_own_event_bus(self):
+    apps = [create_app(), create_app()]
+    try:
+      first, second = (app.state for app in apps)
+      handlers = second.broadcast_bus._handlers[BlogEvent]
+
+      assert first.event_bus is not second.event_bus
+      assert first.broadcast_bus is not second.broadcast_bus
+      assert first.outbox_dispatcher.event_bus is first.event_bus
+      assert first.outbox_broadcaster.event_bus is first.broadcast_bus
+      assert second.feed_cache.handle_blog_event in handlers
+      assert first.feed_cache.handle_blog_event not in handlers
+      assert len(handlers) == len(first.broadcast_bus._handlers[BlogEvent])
+      assert second.trending_tracker.handle_blog_event in second.event_bus._handlers[BlogDeletedEvent]
+      assert BlogDeletedEvent not in second.broadcast_bus._handlers
+    finally:
+      for app in apps:
+        app.state.markdown_renderer.shutdown()
+        app.state.image_processor.shutdown()
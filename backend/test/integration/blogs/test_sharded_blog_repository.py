@@ -0,0 +1,222 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database.db import Base
+from app.database.models import BlogModel
+from app.database.sharding import ShardRouter
+from app.database.unit_of_work import UnitOfWork
+from app.repositories import ShardedBlogRepository, ShardedBlogViewRepository
+from app.services import UuidGenerator, ViewCounter
+from src.application.dto import CreateBlogDTO, UpdateBlogDTO
+from src.application.use_cases.blogs import CreateBlogUseCase, DeleteBlogUseCase, UpdateBlogUseCase
+from src.domain.entities import BlogEntity
+from src.domain.exceptions import UnauthorizedException
+
+SHARDS = ["shard-a", "shard-b", "shard-c"]
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+async def shard_router(tmp_path):
+  engines = {name: create_async_engine(f"sqlite+aiosqlite:///{tmp_path / f'{name}.db'}") for name in SHARDS}
+  for engine in engines.values():
+    async with engine.begin() as connection:
+      await connection.run_sync(Base.metadata.create_all)
+
+  yield ShardRouter({
+    name: async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+    for name, engine in engines.items()
+  })
+
+  for engine in engines.values():
+    await engine.dispose()
+
+
+@pytest.fixture
+def authors(shard_router: ShardRouter):
+  """One author per shard, keyed by the shard holding their blogs."""
+  found = {}
+  for i in range(1000):
+    found.setdefault(shard_router.shard_for(f"author-{i}"), f"author-{i}")
+    if len(found) == len(SHARDS):
+      return found
+  raise AssertionError("Could not find an author for every shard.")
+
+
+async def count_blogs(shard_router: ShardRouter, shard: str) -> int:
+  async with shard_router.session_factories[shard]() as session:
+    return await session.scalar(select(func.count()).select_from(BlogModel))
+
+
+async def seed_blogs(shard_router: ShardRouter, authors: dict, per_author: int) -> None:
+  async with shard_router.sessions() as shards:
+    repository = ShardedBlogRepository(shards)
+    for i in range(per_author * len(authors)):
+      author_id = list(authors.values())[i % len(authors)]
+      await repository.create_blog(BlogEntity(
+        id=f"blog-{i:02d}",
+        title=f"Blog {i}",
+        content="Content",
+        author_id=author_id,
+        created_at=START + timedelta(hours=i),
+        updated_at=START + timedelta(hours=i)
+      ))
+
+
+class TestShardedBlogRepository:
+
+  @pytest.mark.asyncio
+  async def test_blogs_are_stored_on_their_author_shard(self, db_session, shard_router, authors, create_test_user):
+    for shard, author_id in authors.items():
+      await create_test_user(id=author_id, username=author_id)
+    use_case = CreateBlogUseCase(UnitOfWork(db_session, shard_router=shard_router), UuidGenerator())
+
+    await use_case.execute(CreateBlogDTO(title="Hello", content="Content", author_id=authors["shard-b"]))
+
+    assert await count_blogs(shard_router, "shard-a") == 0
+    assert await count_blogs(shard_router, "shard-b") == 1
+    assert await count_blogs(shard_router, "shard-c") == 0
+    assert await db_session.scalar(select(func.count()).select_from(BlogModel)) == 0
+
+
+  @pytest.mark.asyncio
+  async def test_get_all_blogs_merges_shards_newest_first(self, shard_router, authors):
+    await seed_blogs(shard_router, authors, per_author=4)
+
+    async with shard_router.sessions() as shards:
+      repository = ShardedBlogRepository(shards)
+      first_page, total = await repository.get_all_blogs(skip=0, limit=5)
+      second_page, _ = await repository.get_all_blogs(skip=5, limit=5)
+      last_page, _ = await repository.get_all_blogs(skip=10, limit=5)
+      searched, searched_total = await repository.get_all_blogs(search="Blog 1")
+
+    assert total == 12
+    assert [blog.id for blog in first_page] == ["blog-11", "blog-10", "blog-09", "blog-08", "blog-07"]
+    assert [blog.id for blog in second_page] == ["blog-06", "blog-05", "blog-04", "blog-03", "blog-02"]
+    assert [blog.id for blog in last_page] == ["blog-01", "blog-00"]
+    assert searched_total == 3
+    assert [blog.id for blog in searched] == ["blog-11", "blog-10", "blog-01"]
+
+
+  @pytest.mark.asyncio
+  async def test_author_queries_and_streams(self, shard_router, authors):
+    await seed_blogs(shard_router, authors, per_author=3)
+    author_id = authors["shard-c"]
+
+    async with shard_router.sessions() as shards:
+      repository = ShardedBlogRepository(shards)
+      blogs, total = await repository.get_all_blogs_by_author(author_id)
+      count = await repository.count_blogs_by_author(author_id)
+      streamed = [blog.id async for blog in repository.stream_blogs(limit=4)]
+      streamed_by_author = [blog.id async for blog in repository.stream_blogs(author_id=author_id)]
+
+    assert total == count == 3
+    assert {blog.author_id for blog in blogs} == {author_id}
+    assert streamed == ["blog-08", "blog-07", "blog-06", "blog-05"]
+    assert sorted(streamed_by_author) == sorted(blog.id for blog in blogs)
+
+
+  @pytest.mark.asyncio
+  async def test_update_and_delete_through_the_unit_of_work(
+    self,
+    db_session,
+    shard_router,
+    authors,
+    create_test_user
+  ):
+    owner_id, other_id = authors["shard-a"], authors["shard-b"]
+    owner = await create_test_user(id=owner_id, username="owner")
+    other = await create_test_user(id=other_id, username="other")
+    await seed_blogs(shard_router, {"shard-a": owner_id}, per_author=2)
+
+    updated = await UpdateBlogUseCase(UnitOfWork(db_session, shard_router=shard_router)).execute(
+      current_user=owner,
+      blog_id="blog-00",
+      blog_data=UpdateBlogDTO(title="Updated title")
+    )
+    with pytest.raises(UnauthorizedException):
+      await DeleteBlogUseCase(UnitOfWork(db_session, shard_router=shard_router)).execute(other, "blog-01")
+    await DeleteBlogUseCase(UnitOfWork(db_session, shard_router=shard_router)).execute(owner, "blog-01")
+
+    async with shard_router.sessions() as shards:
+      repository = ShardedBlogRepository(shards)
+      kept = await repository.get_blog_by_id("blog-00")
+      deleted = await repository.get_blog_by_id("blog-01")
+
+    assert updated.title == "Updated title"
+    assert kept.title == "Updated title"
+    assert deleted is None
+    assert await count_blogs(shard_router, "shard-a") == 1
+
+
+  @pytest.mark.asyncio
+  async def test_views_are_counted_on_the_blog_shard(self, shard_router, authors):
+    await seed_blogs(shard_router, authors, per_author=1)
+
+    async with shard_router.sessions() as shards:
+      await ShardedBlogViewRepository(shards).increment_views({"blog-00": 2, "blog-01": 3, "missing": 4})
+
+    async with shard_router.sessions() as shards:
+      views = await ShardedBlogViewRepository(shards).get_views(["blog-00", "blog-01", "blog-02", "missing"])
+
+    assert views.get("blog-00") == 2
+    assert views.get("blog-01") == 3
+    assert views.get("blog-02", 0) == 0
+    assert views.get("missing", 0) == 0
+
+
+  @pytest.mark.asyncio
+  async def test_only_failed_shard_views_are_requeued(self, shard_router, authors):
+    await seed_blogs(shard_router, authors, per_author=1)
+    failing_shard = list(authors)[2]
+
+    def unavailable():
+      raise ConnectionError(f"{failing_shard} is down")
+
+    counter = ViewCounter(
+      session_factory=None,
+      shard_router=ShardRouter({**shard_router.session_factories, failing_shard: unavailable})
+    )
+    for blog_id in ["blog-00", "blog-01", "blog-02"]:
+      counter.record(blog_id)
+
+    flushed = await counter.flush()
+
+    assert flushed == 2
+    assert counter.pending("blog-00") == 0
+    assert counter.pending("blog-02") == 1
+
+    counter.shard_router = shard_router
+    await counter.flush()
+
+    async with shard_router.sessions() as shards:
+      views = await ShardedBlogViewRepository(shards).get_views(["blog-00", "blog-01", "blog-02"])
+
+    assert views == {"blog-00": 1, "blog-01": 1, "blog-02": 1}
+
+
+  @pytest.mark.asyncio
+  async def test_tag_counts_are_summed_over_shards(self, shard_router, authors):
+    async with shard_router.sessions() as shards:
+      repository = ShardedBlogRepository(shards)
+      for i, (author_id, tags) in enumerate(zip(authors.values(), [["python"], ["python", "rust"], ["go"]])):
+        await repository.create_blog(BlogEntity(
+          id=f"blog-{i:02d}",
+          title=f"Blog {i}",
+          content="Content",
+          author_id=author_id,
+          tags=tags
+        ))
+
+    async with shard_router.sessions() as shards:
+      repository = ShardedBlogRepository(shards)
+      top = await repository.get_tag_counts(limit=2)
+      selected = await repository.get_tag_counts(["python", "go"])
+      tagged, total = await repository.get_all_blogs(tags=["python"])
+
+    assert top == {"python": 2, "go": 1}
+    assert selected == {"python": 2, "go": 1}
+    assert total == 2
+    assert {blog.id for blog in tagged} == {"blog-00", "blog-01"}
@@ -0,0 +1,59 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.feeds import TimelineFanout
+from app.repositories import FollowRepository, TimelineRepository
+
+
+@pytest.fixture
+def session_factory(db_session: AsyncSession):
+  return async_sessionmaker(bind=db_session.bind, expire_on_commit=False, class_=AsyncSession)
+
+
+@pytest.fixture
+async def followers(db_session: AsyncSession, create_test_user):
+  await create_test_user()
+  ids = []
+  for index in range(5):
+    user = await create_test_user(id=f"follower-{index}", username=f"follower{index}")
+    await FollowRepository(db_session).follow(user.id, "test-user-id")
+    ids.append(user.id)
+  await db_session.commit()
+  return ids
+
+
+class TestTimelineFanout:
+
+  @pytest.mark.asyncio
+  async def test_blog_reaches_every_follower_in_batches(self, session_factory, db_session, followers, create_test_blog):
+    await create_test_blog(id="blog-1")
+    fanout = TimelineFanout(session_factory=session_factory, batch_size=2)
+
+    pushed = await fanout.fan_out("blog-1", "test-user-id")
+    # A retried event pushes the same entries again
+    await fanout.fan_out("blog-1", "test-user-id")
+
+    assert pushed == 5
+    for follower_id in followers:
+      assert [blog_id for blog_id, _ in await TimelineRepository(db_session).get_entries(follower_id)] == ["blog-1"]
+
+
+  @pytest.mark.asyncio
+  async def test_celebrity_blogs_are_not_fanned_out(self, session_factory, db_session, followers, create_test_blog):
+    await create_test_blog(id="blog-1")
+    fanout = TimelineFanout(session_factory=session_factory, celebrity_threshold=5)
+
+    assert await fanout.fan_out("blog-1", "test-user-id") == 0
+    assert await TimelineRepository(db_session).get_entries(followers[0]) == []
+
+
+  @pytest.mark.asyncio
+  async def test_timelines_keep_their_newest_entries(self, session_factory, db_session, followers, create_test_blog):
+    fanout = TimelineFanout(session_factory=session_factory, timeline_length=2)
+    for index in range(3):
+      await create_test_blog(id=f"blog-{index}")
+      await fanout.fan_out(f"blog-{index}", "test-user-id")
+
+    entries = await TimelineRepository(db_session).get_entries(followers[0])
+
+    assert [blog_id for blog_id, _ in entries] == ["blog-2", "blog-1"]
@@ -1,11 +1,12 @@
 import pytest
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Callable, Awaitable
 from app.database.models import BlogModel, UserModel
 from app.database.unit_of_work import UnitOfWork
 from src.application.dto import UpdateBlogDTO
 from src.application.use_cases.blogs import UpdateBlogUseCase
-from src.domain.exceptions import NotFoundException
+from src.domain.exceptions import NotFoundException, UnauthorizedException
 
 
 @pytest.fixture
@@ -142,4 +143,65 @@ class TestUpdateBlogUseCase:
         current_user=unauthorized_user,
         blog_id=blog_id,
         blog_data=update_dto
-      )
\ No newline at end of file
+      )
+
+  @pytest.mark.asyncio
+  async def test_update_blog_keeps_variants_of_unchanged_hero_image(
+    self,
+    db_session: AsyncSession,
+    update_blog_use_case: UpdateBlogUseCase,
+    create_test_user: Callable[..., Awaitable[UserModel]],
+    create_test_blog: Callable[..., Awaitable[BlogModel]]
+  ):
+    test_user = await create_test_user()
+    test_blog = await create_test_blog(author_id=test_user.id)
+    blog_id, hero_image = test_blog.id, test_blog.hero_image
+    variants = {"small": {"webp": "https://example.com/hero-small.webp"}}
+    await db_session.execute(
+      update(BlogModel).where(BlogModel.id == blog_id).values(hero_image_variants=variants)
+    )
+    await db_session.commit()
+
+    kept = await update_blog_use_case.execute(
+      current_user=test_user,
+      blog_id=blog_id,
+      blog_data=UpdateBlogDTO(title="Updated Blog Title", hero_image=hero_image)
+    )
+    replaced = await update_blog_use_case.execute(
+      current_user=test_user,
+      blog_id=blog_id,
+      blog_data=UpdateBlogDTO(hero_image="https://example.com/other-hero-image.png")
+    )
+
+    assert kept.hero_image_variants == variants
+    assert kept.version == 2
+    assert replaced.hero_image_variants is None
+    assert replaced.title == "Updated Blog Title"
+    assert replaced.version == 3
+
+
+  @pytest.mark.asyncio
+  async def test_update_blog_unauthorized_leaves_blog_untouched(
+    self,
+    db_session: AsyncSession,
+    update_blog_use_case: UpdateBlogUseCase,
+    create_test_user: Callable[..., Awaitable[UserModel]],
+    create_test_blog: Callable[..., Awaitable[BlogModel]]
+  ):
+    test_user = await create_test_user()
+    test_blog = await create_test_blog(author_id=test_user.id)
+    blog_id, original_title = test_blog.id, test_blog.title
+    other_user = await create_test_user(username="otheruser", id="other-user-id")
+
+    with pytest.raises(UnauthorizedException):
+      await update_blog_use_case.execute(
+        current_user=other_user,
+        blog_id=blog_id,
+        blog_data=UpdateBlogDTO(title="Hijacked Title")
+      )
+
+    title, version = (await db_session.execute(
+      select(BlogModel.title, BlogModel.version).where(BlogModel.id == blog_id)
+    )).one()
+    assert title == original_title
+    assert version == 1
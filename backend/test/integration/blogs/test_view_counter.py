@@ -0,0 +1,108 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.repositories import BlogViewRepository
+from app.services import ViewCounter
+
+
+@pytest.fixture
+def view_counter(db_session: AsyncSession) -> ViewCounter:
+  session_factory = async_sessionmaker(
+    bind=db_session.bind,
+    expire_on_commit=False,
+    class_=AsyncSession
+  )
+  return ViewCounter(session_factory=session_factory, max_pending=2)
+
+
+class TestViewCounter:
+
+  @pytest.mark.asyncio
+  async def test_flush_persists_buffered_views(
+    self,
+    view_counter: ViewCounter,
+    db_session: AsyncSession,
+    create_test_user,
+    create_test_blog
+  ):
+    await create_test_user()
+    await create_test_blog(id="blog-1")
+
+    for _ in range(3):
+      view_counter.record("blog-1")
+
+    assert view_counter.pending("blog-1") == 3
+
+    flushed = await view_counter.flush()
+    views = await BlogViewRepository(db_session).get_views(["blog-1"])
+
+    assert flushed == 1
+    assert views == {"blog-1": 3}
+    assert view_counter.pending("blog-1") == 0
+
+
+  @pytest.mark.asyncio
+  async def test_successive_flushes_are_accumulated(
+    self,
+    view_counter: ViewCounter,
+    db_session: AsyncSession,
+    create_test_user,
+    create_test_blog
+  ):
+    await create_test_user()
+    await create_test_blog(id="blog-1")
+
+    view_counter.record("blog-1")
+    await view_counter.flush()
+    view_counter.record("blog-1")
+    view_counter.record("blog-1")
+    await view_counter.flush()
+
+    views = await BlogViewRepository(db_session).get_views(["blog-1"])
+
+    assert views == {"blog-1": 3}
+
+
+  @pytest.mark.asyncio
+  async def test_views_of_unknown_blogs_are_ignored(
+    self,
+    view_counter: ViewCounter,
+    db_session: AsyncSession
+  ):
+    view_counter.record("missing-blog")
+
+    await view_counter.flush()
+    views = await BlogViewRepository(db_session).get_views(["missing-blog"])
+
+    assert views == {}
+
+
+  @pytest.mark.asyncio
+  async def test_pending_views_are_bounded(self, view_counter: ViewCounter):
+    for blog_id in ["blog-1", "blog-2", "blog-3", "blog-4"]:
+      view_counter.record(blog_id)
+    view_counter.record("blog-1")
+
+    assert view_counter.pending("blog-1") == 2
+    assert view_counter.pending("blog-3") == 0
+    assert view_counter.dropped == 2
+
+
+  @pytest.mark.asyncio
+  async def test_stop_flushes_remaining_views(
+    self,
+    view_counter: ViewCounter,
+    db_session: AsyncSession,
+    create_test_user,
+    create_test_blog
+  ):
+    await create_test_user()
+    await create_test_blog(id="blog-1")
+
+    await view_counter.start()
+    view_counter.record("blog-1")
+    await view_counter.stop()
+
+    views = await BlogViewRepository(db_session).get_views(["blog-1"])
+
+    assert views == {"blog-1": 1}
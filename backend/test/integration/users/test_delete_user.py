@@ -1,8 +1,11 @@
 import pytest
+from datetime import datetime, timezone
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.models import UserModel
+from app.database.models import TimelineEntryModel, UserModel
 from app.database.unit_of_work import UnitOfWork
+from app.services import UuidGenerator
 
 from src.application.use_cases.users import DeleteUserUseCase
 from src.domain.entities import UserEntity
@@ -11,7 +14,7 @@ from src.domain.entities import UserEntity
 @pytest.fixture
 def delete_user_use_case(db_session: AsyncSession) -> DeleteUserUseCase:
   unit_of_work = UnitOfWork(session=db_session)
-  return DeleteUserUseCase(unit_of_work=unit_of_work)
+  return DeleteUserUseCase(unit_of_work=unit_of_work, id_generator=UuidGenerator())
 
 
 class TestDeleteUserUseCase:
@@ -85,4 +88,29 @@ class TestDeleteUserUseCase:
         user_id=test_user.id
       )
 
-    assert "You are not authorized to delete this user." in str(exc_info.value)
\ No newline at end of file
+    assert "You are not authorized to delete this user." in str(exc_info.value)
+
+  @pytest.mark.asyncio
+  async def test_delete_user_without_blogs_removes_follows_and_timeline(
+    self,
+    db_session: AsyncSession,
+    create_test_user,
+    delete_user_use_case: DeleteUserUseCase
+  ):
+    test_user: UserEntity = await create_test_user()
+    followed: UserEntity = await create_test_user(id="followed-user", username="followeduser")
+    db_session.add(TimelineEntryModel(
+      user_id=test_user.id,
+      blog_id="blog-1",
+      author_id=followed.id,
+      created_at=datetime(2024, 1, 1, tzinfo=timezone.utc)
+    ))
+    await UnitOfWork(db_session).follows.follow(test_user.id, followed.id)
+    await db_session.commit()
+
+    await delete_user_use_case.execute(active_user=test_user, user_id=test_user.id)
+
+    follows = UnitOfWork(db_session).follows
+    entries = (await db_session.execute(select(func.count()).select_from(TimelineEntryModel))).scalar_one()
+    assert await follows.get_follower_count(followed.id) == 0
+    assert entries == 0
@@ -0,0 +1,212 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.database.models import BlogModel, OutboxModel, TimelineEntryModel, UserDeletionModel, UserModel
+from app.database.unit_of_work import UnitOfWork
+from app.jobs import UserContentPurger
+from app.services import UuidGenerator
+from src.application.use_cases.users import DeleteUserUseCase
+
+
+@pytest.fixture
+def session_factory(db_session: AsyncSession):
+  return async_sessionmaker(
+    bind=db_session.bind,
+    expire_on_commit=False,
+    class_=AsyncSession
+  )
+
+
+@pytest.fixture
+def purger(session_factory):
+  return UserContentPurger(session_factory=session_factory, chunk_size=3, pause_seconds=0)
+
+
+async def count(session_factory, model) -> int:
+  async with session_factory() as session:
+    return (await session.execute(select(func.count()).select_from(model))).scalar_one()
+
+
+async def request_deletion(db_session: AsyncSession, user):
+  use_case = DeleteUserUseCase(unit_of_work=UnitOfWork(db_session), id_generator=UuidGenerator())
+  return await use_case.execute(active_user=user, user_id=user.id)
+
+
+class TestUserContentPurger:
+
+  @pytest.mark.asyncio
+  async def test_purge_deletes_blogs_in_chunks_then_user(
+    self,
+    db_session: AsyncSession,
+    session_factory,
+    purger: UserContentPurger,
+    create_test_user
+  ):
+    user = await create_test_user()
+    other = await create_test_user(id="other-user", username="otheruser")
+    db_session.add_all(
+      [BlogModel(id=f"blog-{i}", title=f"Blog {i}", content="Content.", author_id=user.id) for i in range(7)]
+      + [BlogModel(id="kept", title="Kept", content="Content.", author_id=other.id)]
+    )
+    await db_session.commit()
+
+    deletion = await request_deletion(db_session, user)
+    assert deletion.status == "pending"
+    assert await count(session_factory, UserModel) == 2
+
+    await purger.purge(deletion.id)
+
+    async with session_factory() as session:
+      stored = await session.get(UserDeletionModel, deletion.id)
+      blog_ids = (await session.execute(select(BlogModel.id))).scalars().all()
+      events = (await session.execute(select(OutboxModel.event_type))).scalars().all()
+    assert (stored.status, stored.blogs_total, stored.blogs_deleted) == ("completed", 7, 7)
+    assert stored.completed_at is not None
+    assert blog_ids == ["kept"]
+    assert events.count("blog.deleted") == 7
+    assert await count(session_factory, UserModel) == 1
+
+
+  @pytest.mark.asyncio
+  async def test_resume_finishes_interrupted_deletions(
+    self,
+    db_session: AsyncSession,
+    session_factory,
+    purger: UserContentPurger,
+    create_test_user
+  ):
+    user = await create_test_user()
+    db_session.add_all([
+      BlogModel(id=f"blog-{i}", title=f"Blog {i}", content="Content.", author_id=user.id)
+      for i in range(4)
+    ])
+    await db_session.commit()
+    deletion = await request_deletion(db_session, user)
+
+    resumed = await purger.resume_pending()
+
+    assert resumed == 1
+    assert await count(session_factory, BlogModel) == 0
+    assert await purger.resume_pending() == 0
+
+
+  @pytest.mark.asyncio
+  async def test_leased_deletion_is_left_to_its_purge(
+    self,
+    db_session: AsyncSession,
+    session_factory,
+    purger: UserContentPurger,
+    create_test_user
+  ):
+    user = await create_test_user()
+    db_session.add_all([
+      BlogModel(id=f"blog-{i}", title=f"Blog {i}", content="Content.", author_id=user.id)
+      for i in range(4)
+    ])
+    await db_session.commit()
+    deletion = await request_deletion(db_session, user)
+
+    now = datetime.now(timezone.utc)
+    async with session_factory() as session:
+      claimed = await UnitOfWork(session).user_deletions.claim_deletion(
+        deletion.id, "other-purge", now, now + timedelta(minutes=1)
+      )
+      await session.commit()
+
+    await purger.resume_pending()
+    assert claimed is True
+    assert await count(session_factory, BlogModel) == 4
+
+    # The other purge died, its lease runs out and the next resume takes over
+    async with session_factory() as session:
+      await session.execute(
+        update(UserDeletionModel)
+        .where(UserDeletionModel.id == deletion.id)
+        .values(lease_until=now - timedelta(seconds=1))
+      )
+      await session.commit()
+
+    await purger.resume_pending()
+
+    async with session_factory() as session:
+      stored = await session.get(UserDeletionModel, deletion.id)
+      events = (await session.execute(select(OutboxModel.event_type))).scalars().all()
+    assert (stored.status, stored.blogs_deleted, stored.lease_owner) == ("completed", 4, None)
+    assert events.count("blog.deleted") == 4
+    assert await count(session_factory, UserModel) == 0
+
+
+  @pytest.mark.asyncio
+  async def test_repeated_request_reuses_pending_deletion(
+    self,
+    db_session: AsyncSession,
+    create_test_user
+  ):
+    user = await create_test_user()
+    db_session.add(BlogModel(id="blog-1", title="Blog 1", content="Content.", author_id=user.id))
+    await db_session.commit()
+
+    first = await request_deletion(db_session, user)
+    second = await request_deletion(db_session, user)
+
+    assert second.id == first.id
+
+
+  @pytest.mark.asyncio
+  async def test_purge_lowers_the_follower_counts_of_followed_users(
+    self,
+    db_session: AsyncSession,
+    session_factory,
+    purger: UserContentPurger,
+    create_test_user
+  ):
+    user = await create_test_user()
+    followed = await create_test_user(id="followed-user", username="followeduser")
+    other = await create_test_user(id="other-user", username="otheruser")
+    db_session.add(BlogModel(id="blog-1", title="Blog 1", content="Content.", author_id=user.id))
+    await db_session.commit()
+    async with session_factory() as session:
+      follows = UnitOfWork(session).follows
+      await follows.follow(user.id, followed.id)
+      await follows.follow(other.id, followed.id)
+      await session.commit()
+
+    deletion = await request_deletion(db_session, user)
+    await purger.purge(deletion.id)
+
+    async with session_factory() as session:
+      follows = UnitOfWork(session).follows
+      assert await follows.get_follower_count(followed.id) == 1
+      assert await follows.get_follower_ids(followed.id) == [other.id]
+
+
+  @pytest.mark.asyncio
+  async def test_purge_deletes_the_timeline_in_chunks(
+    self,
+    db_session: AsyncSession,
+    session_factory,
+    purger: UserContentPurger,
+    create_test_user
+  ):
+    user = await create_test_user()
+    other = await create_test_user(id="other-user", username="otheruser")
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    db_session.add(BlogModel(id="blog-1", title="Blog 1", content="Content.", author_id=user.id))
+    db_session.add_all(
+      [
+        TimelineEntryModel(user_id=user.id, blog_id=f"entry-{i}", author_id=other.id, created_at=created_at)
+        for i in range(8)
+      ]
+      + [TimelineEntryModel(user_id=other.id, blog_id="kept", author_id=other.id, created_at=created_at)]
+    )
+    await db_session.commit()
+
+    deletion = await request_deletion(db_session, user)
+    await purger.purge(deletion.id)
+
+    async with session_factory() as session:
+      owners = (await session.execute(select(TimelineEntryModel.user_id))).scalars().all()
+    assert owners == [other.id]
+    assert await count(session_factory, UserModel) == 1
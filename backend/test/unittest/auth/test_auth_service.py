@@ -3,7 +3,8 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock
 
 from app.auth import AuthService
-from src.domain.entities import UserEntity
+from src.domain.entities import UserEntity, AuthSessionEntity
+from src.domain.exceptions import UnauthorizedException
 
 
 @pytest.fixture
@@ -27,6 +28,39 @@ def user_repo(mocker):
   return repo
 
 
+@pytest.fixture
+def auth_session_repo(mocker):
+  sessions = {}
+  repo = mocker.Mock()
+
+  async def create_session(auth_session):
+    sessions[auth_session.id] = auth_session
+    return auth_session
+
+  async def rotate_tokens(session_id, refresh_token_id, new_access_token_id, new_refresh_token_id, expires_at):
+    current = sessions.get(session_id)
+    if not current or current.refresh_token_id != refresh_token_id:
+      return False
+    sessions[session_id] = AuthSessionEntity(
+      id=session_id,
+      user_id=current.user_id,
+      access_token_id=new_access_token_id,
+      refresh_token_id=new_refresh_token_id,
+      expires_at=expires_at
+    )
+    return True
+
+  async def delete_session(session_id):
+    return sessions.pop(session_id, None) is not None
+
+  repo.create_session = AsyncMock(side_effect=create_session)
+  repo.get_session = AsyncMock(side_effect=lambda session_id: sessions.get(session_id))
+  repo.rotate_tokens = AsyncMock(side_effect=rotate_tokens)
+  repo.delete_session = AsyncMock(side_effect=delete_session)
+  repo.sessions = sessions
+  return repo
+
+
 @pytest.fixture
 def auth_service():
   return AuthService()
@@ -41,8 +75,6 @@ def existing_user():
     username="johndoe",
     password="hashedpassword",
     avatar=None,
-    access_token_id=None,
-    refresh_token_id=None,
     created_at=datetime(2023,1,1,12,0,0,tzinfo=timezone.utc),
     updated_at=datetime(2023,1,1,12,0,0,tzinfo=timezone.utc)
   )
@@ -55,6 +87,7 @@ class TestAuthService:
     self,
     auth_service,
     user_repo,
+    auth_session_repo,
     password_hasher,
     existing_user,
     db_session,
@@ -67,6 +100,7 @@ class TestAuthService:
       session=db_session,
       id_generator=id_generator,
       user_repo=user_repo,
+      auth_session_repo=auth_session_repo,
       password_hasher=password_hasher,
       username=existing_user.username,
       password="plaintextpassword"
@@ -75,6 +109,8 @@ class TestAuthService:
     assert result.access_token is not None
     assert result.refresh_token is not None
     assert result.user.username == existing_user.username
+    assert len(auth_session_repo.sessions) == 1
+    user_repo.update_user.assert_not_awaited()
 
 
   @pytest.mark.asyncio
@@ -82,6 +118,7 @@ class TestAuthService:
     self,
     auth_service,
     user_repo,
+    auth_session_repo,
     password_hasher,
     db_session,
     id_generator
@@ -93,6 +130,7 @@ class TestAuthService:
         session=db_session,
         id_generator=id_generator,
         user_repo=user_repo,
+        auth_session_repo=auth_session_repo,
         password_hasher=password_hasher,
         username="nonexistent",
         password="plaintextpassword"
@@ -104,6 +142,7 @@ class TestAuthService:
     self,
     auth_service,
     user_repo,
+    auth_session_repo,
     password_hasher,
     existing_user,
     db_session,
@@ -117,6 +156,7 @@ class TestAuthService:
         session=db_session,
         id_generator=id_generator,
         user_repo=user_repo,
+        auth_session_repo=auth_session_repo,
         password_hasher=password_hasher,
         username=existing_user.username,
         password="wrongpassword"
@@ -129,6 +169,7 @@ class TestAuthService:
     auth_service,
     password_hasher,
     user_repo,
+    auth_session_repo,
     existing_user,
     db_session,
     id_generator
@@ -140,6 +181,7 @@ class TestAuthService:
       session=db_session,
       id_generator=id_generator,
       user_repo=user_repo,
+      auth_session_repo=auth_session_repo,
       password_hasher=password_hasher,
       username=existing_user.username,
       password="plaintextpassword"
@@ -151,6 +193,7 @@ class TestAuthService:
 
     result = await auth_service.get_current_user(
       user_repo=user_repo,
+      auth_session_repo=auth_session_repo,
       token=token
     )
 
@@ -161,11 +204,13 @@ class TestAuthService:
   async def test_get_current_user_invalid_token(
     self,
     auth_service,
-    user_repo
+    user_repo,
+    auth_session_repo
   ):
     with pytest.raises(Exception):
       await auth_service.get_current_user(
         user_repo=user_repo,
+        auth_session_repo=auth_session_repo,
         token="invalidtoken"
       )
 
@@ -176,6 +221,7 @@ class TestAuthService:
     auth_service,
     password_hasher,
     user_repo,
+    auth_session_repo,
     existing_user,
     db_session,
     id_generator
@@ -187,6 +233,7 @@ class TestAuthService:
       session=db_session,
       id_generator=id_generator,
       user_repo=user_repo,
+      auth_session_repo=auth_session_repo,
       password_hasher=password_hasher,
       username=existing_user.username,
       password="plaintextpassword"
@@ -201,6 +248,7 @@ class TestAuthService:
       session=db_session,
       id_generator=id_generator,
       user_repo=user_repo,
+      auth_session_repo=auth_session_repo,
       token=refresh_token
     )
 
@@ -213,10 +261,101 @@ class TestAuthService:
   async def test_refresh_access_token_invalid_token(
     self,
     auth_service,
-    user_repo
+    user_repo,
+    auth_session_repo
   ):
     with pytest.raises(Exception):
       await auth_service.refresh_access_token(
         user_repo=user_repo,
+        auth_session_repo=auth_session_repo,
         token="invalidtoken"
-      )
\ No newline at end of file
+      )
+
+
+  @pytest.mark.asyncio
+  async def test_reused_refresh_token_revokes_session(
+    self,
+    auth_service,
+    password_hasher,
+    user_repo,
+    auth_session_repo,
+    existing_user,
+    db_session,
+    id_generator
+  ):
+    user_repo.get_user_by_username.return_value = existing_user
+    user_repo.get_user_by_id.return_value = existing_user
+    password_hasher.verify.return_value = True
+
+    auth_result = await auth_service.authenticate_user(
+      session=db_session,
+      id_generator=id_generator,
+      user_repo=user_repo,
+      auth_session_repo=auth_session_repo,
+      password_hasher=password_hasher,
+      username=existing_user.username,
+      password="plaintextpassword"
+    )
+    refreshed = await auth_service.refresh_access_token(
+      session=db_session,
+      id_generator=id_generator,
+      user_repo=user_repo,
+      auth_session_repo=auth_session_repo,
+      token=auth_result.refresh_token
+    )
+
+    with pytest.raises(UnauthorizedException):
+      await auth_service.refresh_access_token(
+        session=db_session,
+        id_generator=id_generator,
+        user_repo=user_repo,
+        auth_session_repo=auth_session_repo,
+        token=auth_result.refresh_token
+      )
+
+    assert auth_session_repo.sessions == {}
+    with pytest.raises(UnauthorizedException):
+      await auth_service.get_current_user(
+        user_repo=user_repo,
+        auth_session_repo=auth_session_repo,
+        token=refreshed.access_token
+      )
+
+
+  @pytest.mark.asyncio
+  async def test_logout_ends_only_the_current_session(
+    self,
+    auth_service,
+    password_hasher,
+    user_repo,
+    auth_session_repo,
+    existing_user,
+    db_session,
+    id_generator
+  ):
+    user_repo.get_user_by_username.return_value = existing_user
+    user_repo.get_user_by_id.return_value = existing_user
+    password_hasher.verify.return_value = True
+    logins = [
+      await auth_service.authenticate_user(
+        session=db_session,
+        id_generator=id_generator,
+        user_repo=user_repo,
+        auth_session_repo=auth_session_repo,
+        password_hasher=password_hasher,
+        username=existing_user.username,
+        password="plaintextpassword"
+      )
+      for _ in range(2)
+    ]
+
+    await auth_service.logout_user(
+      session=db_session,
+      auth_session_repo=auth_session_repo,
+      token=logins[0].access_token
+    )
+
+    with pytest.raises(UnauthorizedException):
+      await auth_service.get_current_user(user_repo, auth_session_repo, logins[0].access_token)
+    user = await auth_service.get_current_user(user_repo, auth_session_repo, logins[1].access_token)
+    assert user.id == existing_user.id
@@ -0,0 +1,156 @@
+import json
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+from app.auth import TokenData, TokenService, TokenType, create_key_ring, token_cache
+from app.auth import token_service
+from app.config import config
+
+
+def private_pem(private_key) -> str:
+  return private_key.private_bytes(
+    serialization.Encoding.PEM,
+    serialization.PrivateFormat.PKCS8,
+    serialization.NoEncryption()
+  ).decode()
+
+
+def public_pem(private_key) -> str:
+  return private_key.public_key().public_bytes(
+    serialization.Encoding.PEM,
+    serialization.PublicFormat.SubjectPublicKeyInfo
+  ).decode()
+
+
+@pytest.fixture(scope="module")
+def rsa_key():
+  return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture(scope="module")
+def ed25519_key():
+  return ed25519.Ed25519PrivateKey.generate()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+  token_cache.clear()
+  yield
+  token_cache.clear()
+
+
+def use_key_ring(monkeypatch, key_ring):
+  monkeypatch.setattr(token_service, "key_ring", key_ring)
+
+
+class TestKeyRing:
+
+  def test_algorithm_follows_key_type(self, rsa_key, ed25519_key):
+    key_ring = create_key_ring({"rsa": private_pem(rsa_key), "ed": private_pem(ed25519_key)}, {}, "rsa")
+
+    assert key_ring.get("rsa").algorithm == "RS256"
+    assert key_ring.get("ed").algorithm == "EdDSA"
+    assert key_ring.signing_key.kid == "rsa"
+
+
+  def test_jwks_publishes_every_public_key(self, rsa_key, ed25519_key):
+    key_ring = create_key_ring({"new": private_pem(ed25519_key)}, {"old": public_pem(rsa_key)}, "new")
+
+    keys = {key["kid"]: key for key in json.loads(key_ring.jwks_document)["keys"]}
+
+    assert set(keys) == {"new", "old"}
+    assert keys["new"]["kty"] == "OKP" and keys["new"]["alg"] == "EdDSA"
+    assert keys["old"]["kty"] == "RSA" and keys["old"]["alg"] == "RS256"
+    assert all("d" not in key for key in keys.values())
+
+
+  def test_active_key_must_be_private(self, rsa_key):
+    with pytest.raises(ValueError):
+      create_key_ring({}, {"old": public_pem(rsa_key)}, "old")
+
+
+  def test_private_keys_need_an_active_key(self, rsa_key):
+    with pytest.raises(ValueError):
+      create_key_ring({"k1": private_pem(rsa_key)}, {})
+
+
+  def test_empty_key_ring_has_no_signing_key(self):
+    key_ring = create_key_ring({}, {})
+
+    assert key_ring.signing_key is None
+    assert key_ring.jwks_document == b'{"keys":[]}'
+
+
+class TestAsymmetricTokens:
+
+  @pytest.mark.parametrize("key_name", ["rsa_key", "ed25519_key"])
+  def test_token_is_signed_with_active_key(self, monkeypatch, request, key_name):
+    private_key = request.getfixturevalue(key_name)
+    use_key_ring(monkeypatch, create_key_ring({"k1": private_pem(private_key)}, {}, "k1"))
+
+    token = TokenService.create_token(TokenData(user_id="user1", token_id="token1"), TokenType.ACCESS)
+
+    assert jwt.get_unverified_header(token.token)["kid"] == "k1"
+    assert TokenService.verify_token(token.token).user_id == "user1"
+
+
+  def test_rotation_keeps_old_tokens_valid(self, monkeypatch, rsa_key, ed25519_key):
+    use_key_ring(monkeypatch, create_key_ring({"old": private_pem(rsa_key)}, {}, "old"))
+    old_token = TokenService.create_token(TokenData(user_id="user1", token_id="token1"), TokenType.ACCESS)
+
+    use_key_ring(monkeypatch, create_key_ring({"new": private_pem(ed25519_key)}, {"old": public_pem(rsa_key)}, "new"))
+    token_cache.clear()
+    new_token = TokenService.create_token(TokenData(user_id="user1", token_id="token2"), TokenType.ACCESS)
+
+    assert jwt.get_unverified_header(new_token.token)["kid"] == "new"
+    assert TokenService.verify_token(old_token.token).token_id == "token1"
+    assert TokenService.verify_token(new_token.token).token_id == "token2"
+
+
+  def test_unknown_kid_is_rejected(self, monkeypatch, rsa_key, ed25519_key):
+    use_key_ring(monkeypatch, create_key_ring({"retired": private_pem(rsa_key)}, {}, "retired"))
+    token = TokenService.create_token(TokenData(user_id="user1", token_id="token1"), TokenType.ACCESS)
+
+    use_key_ring(monkeypatch, create_key_ring({"current": private_pem(ed25519_key)}, {}, "current"))
+    token_cache.clear()
+
+    with pytest.raises(jwt.InvalidTokenError):
+      TokenService.verify_token(token.token)
+
+
+  def test_algorithm_is_pinned_to_the_key(self, monkeypatch, rsa_key):
+    use_key_ring(monkeypatch, create_key_ring({"k1": private_pem(rsa_key)}, {}, "k1"))
+    forged = jwt.encode(
+      {"user_id": "user1", "token_id": "token1", "exp": 9999999999},
+      "a-shared-secret-that-is-long-enough-for-hs256",
+      algorithm="HS256",
+      headers={"kid": "k1"}
+    )
+
+    with pytest.raises(jwt.InvalidTokenError):
+      TokenService.verify_token(forged)
+
+
+  def test_shared_secret_tokens_are_rejected_once_signing_is_asymmetric(self, monkeypatch, rsa_key):
+    use_key_ring(monkeypatch, create_key_ring({"k1": private_pem(rsa_key)}, {}, "k1"))
+    forged = jwt.encode(
+      {"user_id": "user1", "token_id": "token1", "exp": 9999999999},
+      config.SECRET_KEY,
+      algorithm=config.ALGORITHM
+    )
+
+    with pytest.raises(jwt.InvalidTokenError):
+      TokenService.verify_token(forged)
+
+
+  def test_shared_secret_tokens_are_accepted_without_an_active_key(self, monkeypatch, rsa_key):
+    use_key_ring(monkeypatch, create_key_ring({}, {"old": public_pem(rsa_key)}))
+    token = jwt.encode(
+      {"user_id": "user1", "token_id": "token1", "exp": 9999999999},
+      config.SECRET_KEY,
+      algorithm=config.ALGORITHM
+    )
+
+    assert TokenService.verify_token(token).user_id == "user1"
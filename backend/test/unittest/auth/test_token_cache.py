@@ -0,0 +1,97 @@
+import jwt
+import pytest
+
+from app.auth import TokenData, TokenService, TokenType, TokenVerificationCache, token_cache
+
+
+class FakeClock:
+  def __init__(self):
+    self.now = 1000.0
+
+  def __call__(self) -> float:
+    return self.now
+
+
+@pytest.fixture
+def clock():
+  return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+  return TokenVerificationCache(max_entries=2, clock=clock)
+
+
+class TestTokenVerificationCache:
+
+  def test_hit_after_put(self, cache):
+    data = TokenData(user_id="user1", token_id="token1")
+    cache.put("token-a", data, expires_at=2000.0)
+
+    assert cache.get("token-a") == data
+    assert cache.get("token-b") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hit_rate"] == 0.5
+
+
+  def test_entry_expires_exactly_at_exp(self, cache, clock):
+    cache.put("token-a", TokenData(user_id="user1", token_id="token1"), expires_at=1010.0)
+
+    clock.now = 1009.999
+    assert cache.get("token-a") is not None
+
+    clock.now = 1010.0
+    assert cache.get("token-a") is None
+    assert len(cache) == 0
+
+
+  def test_least_recently_used_entry_is_evicted(self, cache):
+    for token in ["token-a", "token-b"]:
+      cache.put(token, TokenData(user_id="user1", token_id=token), expires_at=2000.0)
+
+    cache.get("token-a")
+    cache.put("token-c", TokenData(user_id="user1", token_id="token-c"), expires_at=2000.0)
+
+    assert cache.get("token-b") is None
+    assert cache.get("token-a") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+  def test_disabled_cache_stores_nothing(self, clock):
+    cache = TokenVerificationCache(enabled=False, clock=clock)
+    cache.put("token-a", TokenData(user_id="user1", token_id="token1"), expires_at=2000.0)
+
+    assert cache.get("token-a") is None
+    assert len(cache) == 0
+
+
+class TestTokenServiceCaching:
+
+  @pytest.fixture(autouse=True)
+  def clear_cache(self):
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+
+  def test_verified_token_is_served_from_cache(self, mocker):
+    token = TokenService.create_token(TokenData(user_id="user1", token_id="token1"), TokenType.ACCESS)
+    TokenService.verify_token(token.token)
+
+    decode = mocker.patch("app.auth.token_service.jwt.decode")
+    verified = TokenService.verify_token(token.token)
+
+    decode.assert_not_called()
+    assert verified.user_id == "user1"
+
+
+  def test_forget_token_forces_full_verification(self, mocker):
+    token = TokenService.create_token(TokenData(user_id="user1", token_id="token1"), TokenType.ACCESS)
+    TokenService.verify_token(token.token)
+
+    TokenService.forget_token(token.token)
+    decode = mocker.spy(jwt, "decode")
+    TokenService.verify_token(token.token)
+
+    assert decode.call_count == 1
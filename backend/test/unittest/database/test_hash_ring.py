@@ -0,0 +1,65 @@
+import pytest
+from collections import Counter
+
+from app.database.sharding import HashRing, merge_sorted, merge_sorted_streams
+
+
+def _keys(count: int):
+  return [f"author-{i}" for i in range(count)]
+
+
+class TestHashRing:
+
+  def test_maps_a_key_to_the_same_node(self):
+    ring = HashRing(["shard-a", "shard-b", "shard-c"])
+    same_nodes = HashRing(["shard-c", "shard-a", "shard-b"])
+
+    assert all(ring.get_node(key) == same_nodes.get_node(key) for key in _keys(500))
+
+
+  def test_spreads_keys_across_nodes(self):
+    ring = HashRing(["shard-a", "shard-b", "shard-c"])
+
+    counts = Counter(ring.get_node(key) for key in _keys(3000))
+
+    assert set(counts) == {"shard-a", "shard-b", "shard-c"}
+    assert min(counts.values()) > 600
+
+
+  def test_adding_a_node_only_moves_keys_onto_it(self):
+    before = HashRing(["shard-a", "shard-b", "shard-c"])
+    after = HashRing(["shard-a", "shard-b", "shard-c", "shard-d"])
+
+    moved = [key for key in _keys(3000) if before.get_node(key) != after.get_node(key)]
+
+    assert all(after.get_node(key) == "shard-d" for key in moved)
+    assert 0 < len(moved) < 1200
+
+
+  def test_rejects_an_empty_ring(self):
+    with pytest.raises(ValueError):
+      HashRing([])
+
+
+class TestMergeSorted:
+
+  def test_merges_descending_lists(self):
+    merged = merge_sorted([[9, 4, 1], [8, 7], [], [6, 5, 2]], key=lambda value: value, reverse=True)
+
+    assert merged == [9, 8, 7, 6, 5, 4, 2, 1]
+
+
+  @pytest.mark.asyncio
+  async def test_merges_descending_streams_up_to_limit(self):
+    async def stream(values):
+      for value in values:
+        yield value
+
+    merged = merge_sorted_streams(
+      [stream([9, 4, 1]), stream([8, 7]), stream([6, 5, 2])],
+      key=lambda value: value,
+      reverse=True,
+      limit=5
+    )
+
+    assert [value async for value in merged] == [9, 8, 7, 6, 5]
@@ -0,0 +1,111 @@
+import asyncio
+import pytest
+
+from app.feeds import BlogStreamHub
+from app.feeds.blog_stream import HEARTBEAT, RESYNC
+from src.domain.events import BlogCreatedEvent, BlogUpdatedEvent, BlogDeletedEvent
+
+
+async def read(subscription, count, heartbeat_interval=5.0):
+  stream = subscription.stream(heartbeat_interval)
+  assert (await anext(stream)).startswith(b"retry:")
+  return [await asyncio.wait_for(anext(stream), timeout=1.0) for _ in range(count)]
+
+
+def event_name(chunk: bytes) -> str:
+  return next(line for line in chunk.decode().splitlines() if line.startswith("event: "))[len("event: "):]
+
+
+class TestBlogStreamHub:
+
+  @pytest.mark.asyncio
+  async def test_events_reach_every_subscriber_as_the_same_frame(self):
+    hub = BlogStreamHub()
+    first, second = hub.subscribe(), hub.subscribe()
+
+    hub.handle_blog_event(BlogCreatedEvent("blog-1", "author-1"))
+
+    [first_chunk], [second_chunk] = await read(first, 1), await read(second, 1)
+    assert first_chunk is second_chunk
+    assert event_name(first_chunk) == "blog.created"
+    assert b'data: {"blog_id":"blog-1","author_id":"author-1"}' in first_chunk
+
+
+  @pytest.mark.asyncio
+  async def test_pending_events_of_a_blog_are_coalesced(self):
+    hub = BlogStreamHub()
+    subscription = hub.subscribe()
+
+    hub.handle_blog_event(BlogCreatedEvent("blog-1", "author-1"))
+    hub.handle_blog_event(BlogUpdatedEvent("blog-1", "author-1"))
+    hub.handle_blog_event(BlogUpdatedEvent("blog-2", "author-1"))
+    hub.handle_blog_event(BlogUpdatedEvent("blog-2", "author-1"))
+    hub.handle_blog_event(BlogCreatedEvent("blog-3", "author-1"))
+    hub.handle_blog_event(BlogDeletedEvent("blog-3", "author-1"))
+    hub.handle_blog_event(BlogUpdatedEvent("blog-4", "author-1"))
+
+    chunks = await read(subscription, 3)
+
+    assert [event_name(chunk) for chunk in chunks] == ["blog.created", "blog.updated", "blog.updated"]
+    for chunk, blog_id in zip(chunks, [b"blog-1", b"blog-2", b"blog-4"]):
+      assert blog_id in chunk
+    # The coalesced create carries the id of the update it absorbed
+    assert chunks[0].split(b"\n")[0].endswith(b"-2")
+
+
+  @pytest.mark.asyncio
+  async def test_slow_subscriber_is_told_to_resync(self):
+    hub = BlogStreamHub(max_pending=2)
+    subscription = hub.subscribe()
+
+    for index in range(4):
+      hub.handle_blog_event(BlogCreatedEvent(f"blog-{index}", "author-1"))
+    hub.handle_blog_event(BlogCreatedEvent("blog-late", "author-1"))
+
+    assert await read(subscription, 1) == [RESYNC]
+
+
+  @pytest.mark.asyncio
+  async def test_reconnecting_client_gets_missed_events(self):
+    hub = BlogStreamHub()
+    first = hub.subscribe()
+    hub.handle_blog_event(BlogCreatedEvent("blog-1", "author-1"))
+    [seen] = await read(first, 1)
+    hub.handle_blog_event(BlogCreatedEvent("blog-2", "author-1"))
+
+    last_event_id = seen.decode().splitlines()[0][len("id: "):]
+    [replayed] = await read(hub.subscribe(last_event_id), 1)
+
+    assert b"blog-2" in replayed
+
+
+  @pytest.mark.asyncio
+  async def test_unknown_or_expired_event_id_resyncs(self):
+    hub = BlogStreamHub(replay_size=1)
+    hub.handle_blog_event(BlogCreatedEvent("blog-1", "author-1"))
+    hub.handle_blog_event(BlogCreatedEvent("blog-2", "author-1"))
+    hub.handle_blog_event(BlogCreatedEvent("blog-3", "author-1"))
+
+    assert await read(hub.subscribe("another-worker-1"), 1) == [RESYNC]
+    assert await read(hub.subscribe(f"{hub._epoch}-1"), 1) == [RESYNC]
+
+
+  @pytest.mark.asyncio
+  async def test_idle_stream_sends_heartbeats(self):
+    subscription = BlogStreamHub().subscribe()
+
+    assert await read(subscription, 2, heartbeat_interval=0.01) == [HEARTBEAT, HEARTBEAT]
+
+
+  @pytest.mark.asyncio
+  async def test_subscribers_are_capped_and_closed(self):
+    hub = BlogStreamHub(max_subscribers=1)
+    subscription = hub.subscribe()
+
+    assert hub.subscribe() is None
+
+    hub.close_all()
+    chunks = [chunk async for chunk in subscription.stream()]
+
+    assert len(chunks) == 1
+    assert hub.subscriber_count == 0
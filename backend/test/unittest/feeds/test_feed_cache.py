@@ -0,0 +1,148 @@
+import asyncio
+import pytest
+
+from app.events import EventBus
+from app.feeds import FeedCache, GLOBAL_FEED_KEY, SITEMAP_KEY, author_feed_key
+from src.domain.events import BlogCreatedEvent, BlogEvent
+
+
+class CountingRenderer:
+  def __init__(self, body: bytes = b"<rss/>"):
+    self.body = body
+    self.calls = 0
+
+  async def __call__(self) -> bytes:
+    self.calls += 1
+    await asyncio.sleep(0)
+    return self.body
+
+
+class TestFeedCache:
+
+  @pytest.mark.asyncio
+  async def test_second_request_is_served_from_cache(self):
+    cache = FeedCache()
+    render = CountingRenderer()
+
+    first, first_hit = await cache.get_or_render("feed", render)
+    second, second_hit = await cache.get_or_render("feed", render)
+
+    assert (first_hit, second_hit) == (False, True)
+    assert first is second
+    assert render.calls == 1
+
+
+  @pytest.mark.asyncio
+  async def test_concurrent_misses_render_once(self):
+    cache = FeedCache()
+    render = CountingRenderer()
+
+    results = await asyncio.gather(*[cache.get_or_render("feed", render) for _ in range(5)])
+
+    assert render.calls == 1
+    assert len({document.etag for document, _ in results}) == 1
+
+
+  @pytest.mark.asyncio
+  async def test_etag_changes_with_content(self):
+    cache = FeedCache()
+
+    first, _ = await cache.get_or_render("feed", CountingRenderer(b"one"))
+    cache.invalidate(["feed"])
+    second, _ = await cache.get_or_render("feed", CountingRenderer(b"two"))
+
+    assert first.etag != second.etag
+    assert first.etag.startswith('"') and first.etag.endswith('"')
+
+
+  @pytest.mark.asyncio
+  async def test_render_racing_with_invalidation_is_not_cached(self):
+    cache = FeedCache()
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_render() -> bytes:
+      started.set()
+      await release.wait()
+      return b"stale"
+
+    task = asyncio.create_task(cache.get_or_render("feed", slow_render))
+    await started.wait()
+    cache.invalidate(["feed"])
+    release.set()
+    stale, _ = await task
+
+    fresh, hit = await cache.get_or_render("feed", CountingRenderer(b"fresh"))
+
+    assert stale.body == b"stale"
+    assert hit is False
+    assert fresh.body == b"fresh"
+
+
+  @pytest.mark.asyncio
+  async def test_least_recently_used_documents_are_evicted(self):
+    cache = FeedCache(max_entries=2)
+    for key in ["a", "b"]:
+      await cache.get_or_render(key, CountingRenderer())
+
+    await cache.get_or_render("a", CountingRenderer())
+    await cache.get_or_render("c", CountingRenderer())
+
+    _, a_hit = await cache.get_or_render("a", CountingRenderer())
+    _, b_hit = await cache.get_or_render("b", CountingRenderer())
+    assert a_hit is True
+    assert b_hit is False
+
+
+  @pytest.mark.asyncio
+  async def test_documents_expire_after_max_age(self):
+    now = [1000.0]
+    cache = FeedCache(max_age_seconds=60, clock=lambda: now[0])
+    render = CountingRenderer()
+
+    await cache.get_or_render("feed", render)
+    now[0] += 59
+    _, fresh_hit = await cache.get_or_render("feed", render)
+    now[0] += 1
+    _, expired_hit = await cache.get_or_render("feed", render)
+
+    assert fresh_hit is True
+    assert expired_hit is False
+    assert render.calls == 2
+
+
+  @pytest.mark.asyncio
+  async def test_blog_event_invalidates_affected_documents(self):
+    cache = FeedCache()
+    bus = EventBus()
+    bus.subscribe(BlogEvent, cache.handle_blog_event)
+    keys = [GLOBAL_FEED_KEY, SITEMAP_KEY, author_feed_key("user1"), author_feed_key("user2")]
+    for key in keys:
+      await cache.get_or_render(key, CountingRenderer())
+
+    await bus.publish(BlogCreatedEvent(blog_id="blog-1", author_id="user1"))
+
+    hits = [(await cache.get_or_render(key, CountingRenderer()))[1] for key in keys]
+    assert hits == [False, False, False, True]
+
+
+class TestEventBus:
+
+  @pytest.mark.asyncio
+  async def test_failing_handler_does_not_stop_other_handlers(self):
+    bus = EventBus()
+    received = []
+
+    def failing_handler(event):
+      raise RuntimeError("boom")
+
+    async def recording_handler(event):
+      received.append(event)
+
+    bus.subscribe(BlogEvent, failing_handler)
+    bus.subscribe(BlogCreatedEvent, recording_handler)
+    event = BlogCreatedEvent(blog_id="blog-1", author_id="user1")
+
+    await bus.publish(event)
+
+    assert received == [event]
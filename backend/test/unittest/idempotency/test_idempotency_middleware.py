@@ -0,0 +1,127 @@
+import asyncio
+import pytest
+from httpx import AsyncClient, ASGITransport
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.idempotency import IdempotencyMiddleware, InMemoryIdempotencyStore, StoredResponse
+
+
+class FakeClock:
+  def __init__(self):
+    self.now = 0.0
+
+  def __call__(self) -> float:
+    return self.now
+
+
+@pytest.fixture
+def store():
+  return InMemoryIdempotencyStore(ttl_seconds=60, max_keys=10)
+
+
+@pytest.fixture
+def calls():
+  return {"count": 0, "release": None, "status": 201}
+
+
+@pytest.fixture
+async def client(store, calls):
+  async def create(request: Request):
+    calls["count"] += 1
+    if calls["release"] is not None:
+      await calls["release"].wait()
+    payload = await request.json()
+    return JSONResponse({"call": calls["count"], **payload}, status_code=calls["status"])
+
+  app = Starlette(routes=[Route("/items", create, methods=["POST"])])
+  middleware = IdempotencyMiddleware(app, store=store, wait_timeout_seconds=1)
+  async with AsyncClient(transport=ASGITransport(app=middleware), base_url="http://test") as client:
+    yield client
+
+
+class TestInMemoryIdempotencyStore:
+
+  @pytest.mark.asyncio
+  async def test_entries_expire_after_ttl(self):
+    clock = FakeClock()
+    store = InMemoryIdempotencyStore(ttl_seconds=10, clock=clock)
+    await store.put("key", StoredResponse("fingerprint", 201, [], b"{}"))
+
+    clock.now = 9.9
+    assert await store.get("key") is not None
+
+    clock.now = 10.0
+    assert await store.get("key") is None
+
+
+  @pytest.mark.asyncio
+  async def test_oldest_entries_are_evicted(self):
+    store = InMemoryIdempotencyStore(max_keys=2)
+    for key in ["a", "b", "c"]:
+      await store.put(key, StoredResponse("fingerprint", 201, [], b"{}"))
+
+    assert len(store) == 2
+    assert await store.get("a") is None
+
+
+class TestIdempotencyMiddleware:
+
+  @pytest.mark.asyncio
+  async def test_retry_replays_stored_response(self, client, calls):
+    headers = {"Idempotency-Key": "key-1"}
+
+    first = await client.post("/items", json={"name": "a"}, headers=headers)
+    retry = await client.post("/items", json={"name": "a"}, headers=headers)
+
+    assert calls["count"] == 1
+    assert (first.status_code, retry.status_code) == (201, 201)
+    assert retry.json() == first.json()
+    assert retry.headers["idempotent-replayed"] == "true"
+
+
+  @pytest.mark.asyncio
+  async def test_requests_without_key_are_not_deduplicated(self, client, calls):
+    await client.post("/items", json={"name": "a"})
+    await client.post("/items", json={"name": "a"})
+
+    assert calls["count"] == 2
+
+
+  @pytest.mark.asyncio
+  async def test_key_reused_with_different_body_is_rejected(self, client, calls):
+    await client.post("/items", json={"name": "a"}, headers={"Idempotency-Key": "key-1"})
+    response = await client.post("/items", json={"name": "b"}, headers={"Idempotency-Key": "key-1"})
+
+    assert response.status_code == 422
+    assert calls["count"] == 1
+
+
+  @pytest.mark.asyncio
+  async def test_concurrent_duplicates_wait_for_first_request(self, client, calls):
+    calls["release"] = asyncio.Event()
+    headers = {"Idempotency-Key": "key-1"}
+
+    first = asyncio.create_task(client.post("/items", json={"name": "a"}, headers=headers))
+    second = asyncio.create_task(client.post("/items", json={"name": "a"}, headers=headers))
+    await asyncio.sleep(0.05)
+    calls["release"].set()
+    responses = await asyncio.gather(first, second)
+
+    assert calls["count"] == 1
+    assert responses[0].json() == responses[1].json()
+
+
+  @pytest.mark.asyncio
+  async def test_server_errors_are_not_stored(self, client, calls):
+    calls["status"] = 503
+    headers = {"Idempotency-Key": "key-1"}
+
+    await client.post("/items", json={"name": "a"}, headers=headers)
+    calls["status"] = 201
+    retry = await client.post("/items", json={"name": "a"}, headers=headers)
+
+    assert calls["count"] == 2
+    assert retry.status_code == 201
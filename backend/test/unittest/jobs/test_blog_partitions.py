@@ -0,0 +1,54 @@
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock
+
+from app.jobs.blog_partitions import add_months, maintain_blog_partitions, monthly_partitions
+from app.repositories import BlogViewRepository
+
+
+class TestMonthlyPartitions:
+
+  def test_partitions_cover_consecutive_months_across_years(self):
+    partitions = monthly_partitions(date(2026, 11, 19), 3)
+
+    assert partitions == [
+      ("blogs_y2026m11", date(2026, 11, 1), date(2026, 12, 1)),
+      ("blogs_y2026m12", date(2026, 12, 1), date(2027, 1, 1)),
+      ("blogs_y2027m01", date(2027, 1, 1), date(2027, 2, 1)),
+    ]
+
+
+  def test_add_months_goes_backwards(self):
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+
+class TestMaintainBlogPartitions:
+
+  @pytest.mark.asyncio
+  async def test_months_stranded_in_default_are_moved_out_before_attaching(self, mocker):
+    session = mocker.MagicMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=None)
+    session.get_bind.return_value.dialect.name = "postgresql"
+    # The table is partitioned and none of the partitions exist yet
+    session.scalar = AsyncMock(side_effect=lambda stmt, params=None: "p" if "relkind" in str(stmt) else False)
+    session.scalars = AsyncMock(return_value=mocker.Mock(all=lambda: [date(2026, 6, 1)]))
+    session.execute = AsyncMock(return_value=mocker.Mock(rowcount=2))
+    session.commit = AsyncMock()
+    mocker.patch.object(BlogViewRepository, "delete_orphaned_views", AsyncMock(return_value=0))
+
+    created = await maintain_blog_partitions(lambda: session, months_ahead=1, today=date(2026, 10, 19))
+
+    statements = [str(call.args[0]) for call in session.execute.await_args_list]
+    assert created == 3
+    assert statements[:4] == [
+      "LOCK TABLE blogs_default IN ACCESS EXCLUSIVE MODE",
+      "CREATE TABLE blogs_y2026m06 (LIKE blogs INCLUDING DEFAULTS)",
+      "WITH moved AS (DELETE FROM blogs_default WHERE created_at >= :lower AND created_at < :upper RETURNING *)"
+      " INSERT INTO blogs_y2026m06 SELECT * FROM moved",
+      "ALTER TABLE blogs ATTACH PARTITION blogs_y2026m06 "
+      "FOR VALUES FROM ('2026-06-01 00:00:00+00') TO ('2026-07-01 00:00:00+00')",
+    ]
+    assert [statement.split()[2] for statement in statements if statement.startswith("CREATE")] == [
+      "blogs_y2026m06", "blogs_y2026m10", "blogs_y2026m11"
+    ]
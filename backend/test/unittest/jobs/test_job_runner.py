@@ -0,0 +1,141 @@
+import asyncio
+import pytest
+
+from app.jobs import JobRunner
+
+
+@pytest.fixture
+async def runner():
+  job_runner = JobRunner(drain_timeout=1.0)
+  job_runner.add_queue("default", concurrency=2)
+  job_runner.add_queue("small", concurrency=1, max_size=1)
+  yield job_runner
+  await job_runner.stop()
+
+
+class TestJobRunner:
+
+  @pytest.mark.asyncio
+  async def test_jobs_run_in_background(self, runner):
+    results = []
+
+    async def job(value, multiplier=1):
+      results.append(value * multiplier)
+
+    await runner.start()
+    assert runner.enqueue("default", job, 2, multiplier=3) is True
+    await runner.stop()
+
+    assert results == [6]
+    assert runner.stats()["default"]["completed"] == 1
+
+
+  @pytest.mark.asyncio
+  async def test_concurrency_is_limited_per_queue(self, runner):
+    running = 0
+    peak = 0
+
+    async def job():
+      nonlocal running, peak
+      running += 1
+      peak = max(peak, running)
+      await asyncio.sleep(0.01)
+      running -= 1
+
+    await runner.start()
+    for _ in range(6):
+      runner.enqueue("default", job)
+    await runner.stop()
+
+    assert peak == 2
+    assert runner.stats()["default"]["completed"] == 6
+
+
+  @pytest.mark.asyncio
+  async def test_failing_job_does_not_stop_the_worker(self, runner):
+    results = []
+
+    async def failing_job():
+      raise RuntimeError("boom")
+
+    async def job():
+      results.append("done")
+
+    await runner.start()
+    runner.enqueue("small", failing_job)
+    await asyncio.sleep(0)
+    runner.enqueue("small", job)
+    await runner.stop()
+
+    assert results == ["done"]
+    assert runner.stats()["small"] == {"queued": 0, "completed": 1, "failed": 1}
+
+
+  @pytest.mark.asyncio
+  async def test_full_queue_rejects_jobs(self, runner):
+    async def job():
+      pass
+
+    assert runner.enqueue("small", job) is True
+    assert runner.enqueue("small", job) is False
+
+
+  @pytest.mark.asyncio
+  async def test_unknown_queue_raises(self, runner):
+    async def job():
+      pass
+
+    with pytest.raises(ValueError):
+      runner.enqueue("missing", job)
+
+
+  @pytest.mark.asyncio
+  async def test_jobs_are_rejected_after_shutdown(self, runner):
+    async def job():
+      pass
+
+    await runner.start()
+    await runner.stop()
+
+    assert runner.enqueue("default", job) is False
+
+
+  @pytest.mark.asyncio
+  async def test_stop_cancels_jobs_after_drain_deadline(self):
+    runner = JobRunner(drain_timeout=0.05)
+    runner.add_queue("default", concurrency=1)
+    cancelled = asyncio.Event()
+
+    async def slow_job():
+      try:
+        await asyncio.sleep(10)
+      except asyncio.CancelledError:
+        cancelled.set()
+        raise
+
+    await runner.start()
+    runner.enqueue("default", slow_job)
+    await asyncio.sleep(0)
+    await asyncio.wait_for(runner.stop(), timeout=1)
+
+    assert cancelled.is_set()
+
+
+  @pytest.mark.asyncio
+  async def test_periodic_jobs_do_not_overlap(self, runner):
+    runs = 0
+    release = asyncio.Event()
+
+    async def periodic_job():
+      nonlocal runs
+      runs += 1
+      await release.wait()
+
+    runner.add_periodic("slow", periodic_job, interval=0.01)
+    await runner.start()
+    await asyncio.sleep(0.1)
+    assert runs == 1
+
+    release.set()
+    await asyncio.sleep(0.05)
+    assert runs > 1
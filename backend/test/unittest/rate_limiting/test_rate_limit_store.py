@@ -0,0 +1,107 @@
+import pytest
+
+from app.rate_limiting import (
+  InMemoryRateLimitStore,
+  RateLimiter,
+  RateLimitExceededException
+)
+
+
+class FakeClock:
+  def __init__(self):
+    self.now = 0.0
+
+  def __call__(self) -> float:
+    return self.now
+
+
+@pytest.fixture
+def clock():
+  return FakeClock()
+
+
+@pytest.fixture
+def store(clock):
+  return InMemoryRateLimitStore(max_keys=3, clock=clock)
+
+
+class TestInMemoryRateLimitStore:
+
+  @pytest.mark.asyncio
+  async def test_consume_until_bucket_is_empty(self, store):
+    results = [await store.consume("key", capacity=3, refill_per_second=1) for _ in range(4)]
+
+    assert [allowed for allowed, _ in results] == [True, True, True, False]
+    assert results[-1][1] == pytest.approx(1.0)
+
+
+  @pytest.mark.asyncio
+  async def test_bucket_refills_over_time(self, store, clock):
+    for _ in range(3):
+      await store.consume("key", capacity=3, refill_per_second=0.5)
+
+    clock.now = 1.0
+    allowed, retry_after = await store.consume("key", capacity=3, refill_per_second=0.5)
+    assert allowed is False
+    assert retry_after == pytest.approx(1.0)
+
+    clock.now = 2.0
+    allowed, _ = await store.consume("key", capacity=3, refill_per_second=0.5)
+    assert allowed is True
+
+
+  @pytest.mark.asyncio
+  async def test_refill_never_exceeds_capacity(self, store, clock):
+    await store.consume("key", capacity=2, refill_per_second=1)
+
+    clock.now = 1000.0
+    results = [await store.consume("key", capacity=2, refill_per_second=1) for _ in range(3)]
+
+    assert [allowed for allowed, _ in results] == [True, True, False]
+
+
+  @pytest.mark.asyncio
+  async def test_keys_are_isolated(self, store):
+    await store.consume("a", capacity=1, refill_per_second=1)
+
+    allowed_a, _ = await store.consume("a", capacity=1, refill_per_second=1)
+    allowed_b, _ = await store.consume("b", capacity=1, refill_per_second=1)
+
+    assert allowed_a is False
+    assert allowed_b is True
+
+
+  @pytest.mark.asyncio
+  async def test_least_recently_used_buckets_are_evicted(self, store):
+    for key in ["a", "b", "c"]:
+      await store.consume(key, capacity=1, refill_per_second=1)
+
+    await store.consume("a", capacity=1, refill_per_second=1)
+    await store.consume("d", capacity=1, refill_per_second=1)
+
+    assert len(store) == 3
+    allowed_b, _ = await store.consume("b", capacity=1, refill_per_second=1)
+    assert allowed_b is True
+
+
+class TestRateLimiter:
+
+  @pytest.mark.asyncio
+  async def test_hit_raises_when_limit_exceeded(self, store):
+    limiter = RateLimiter(store)
+
+    await limiter.hit("2/minute", "key")
+    await limiter.hit("2/minute", "key")
+
+    with pytest.raises(RateLimitExceededException) as exc_info:
+      await limiter.hit("2/minute", "key")
+
+    assert exc_info.value.retry_after == 30
+
+
+  @pytest.mark.asyncio
+  async def test_disabled_limiter_never_raises(self, store):
+    limiter = RateLimiter(store, enabled=False)
+
+    for _ in range(5):
+      await limiter.hit("1/minute", "key")
@@ -0,0 +1,78 @@
+from app.related import TfidfIndex, tokenize, term_counts
+
+
+DOCUMENTS = {
+  "python-async": ("Async Python", "Coroutines and the event loop in asyncio, awaiting tasks."),
+  "python-tasks": ("Python tasks", "Scheduling asyncio tasks on the event loop."),
+  "rust-borrow": ("Rust ownership", "Borrowing, lifetimes and the borrow checker."),
+  "rust-lifetimes": ("Rust lifetimes", "Lifetimes tell the borrow checker how long references live."),
+}
+
+
+def build_index(**kwargs) -> TfidfIndex:
+  return TfidfIndex.build(
+    ((blog_id, term_counts(title, content)) for blog_id, (title, content) in DOCUMENTS.items()),
+    max_document_frequency=kwargs.pop("max_document_frequency", 1.0),
+    **kwargs
+  )
+
+
+class TestTfidfIndex:
+
+  def test_tokenize_drops_stop_words_and_short_tokens(self):
+    assert tokenize("The Borrow-Checker, a friend of Rust 2024!") == ["borrow", "checker", "friend", "rust", "2024"]
+
+
+  def test_title_terms_weigh_more(self):
+    counts = term_counts("Rust", "rust and python", title_weight=3)
+
+    assert counts["rust"] == 4
+    assert counts["python"] == 1
+
+
+  def test_neighbours_rank_similar_blogs_first(self):
+    index = build_index()
+
+    neighbours = index.neighbours("python-async", k=3)
+
+    assert neighbours[0][0] == "python-tasks"
+    assert all(blog_id != "python-async" for blog_id, _ in neighbours)
+    assert [score for _, score in neighbours] == sorted((score for _, score in neighbours), reverse=True)
+    assert 0 < neighbours[0][1] <= 1
+
+
+  def test_neighbours_only_visit_blogs_sharing_a_term(self):
+    index = build_index()
+
+    assert {blog_id for blog_id, _ in index.neighbours("rust-borrow", k=5)} == {"rust-lifetimes"}
+
+
+  def test_common_terms_are_left_out(self):
+    index = build_index(max_document_frequency=0.4)
+
+    assert all("loop" not in vector and "rust" not in vector for vector in index.vectors.values())
+
+
+  def test_upsert_and_remove_keep_the_index_consistent(self):
+    index = build_index()
+
+    index.upsert("rust-async", term_counts("Async Rust", "Tokio runs tasks on an event loop, borrow checker included."))
+    assert "rust-async" in {blog_id for blog_id, _ in index.neighbours("python-tasks", k=5)}
+
+    index.upsert("rust-async", term_counts("Cooking", "Pasta recipes."))
+    assert "rust-async" not in {blog_id for blog_id, _ in index.neighbours("python-tasks", k=5)}
+
+    assert index.remove("rust-async")
+    assert not index.remove("rust-async")
+    assert "rust-async" not in index
+    assert index.document_frequency["pasta"] == 0
+    assert len(index) == 4
+
+
+  def test_neighbour_chunks_cover_every_blog(self):
+    index = build_index()
+
+    chunks = list(index.neighbour_chunks(k=2, chunk_size=3))
+
+    assert [len(chunk) for chunk in chunks] == [3, 1]
+    assert set().union(*chunks) == set(DOCUMENTS)
@@ -1,11 +1,11 @@
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .utils import _normalize_datetime
 from app.repositories import BlogRepository
 from src.domain.entities import BlogEntity
-from src.domain.exceptions import NotFoundException
+from src.domain.exceptions import NotFoundException, ConflictException
 
 
 class TestBlogRepository:
@@ -46,7 +46,7 @@ class TestBlogRepository:
         title=f"Blog {i}",
         content="Content",
         author_id="user123",
-        created_at=datetime(2024,1,1,tzinfo=timezone.utc),
+        created_at=datetime(2024,1,1,tzinfo=timezone.utc) + timedelta(hours=i),
         updated_at=datetime(2024,1,1,tzinfo=timezone.utc)
       )
       await repo.create_blog(blog)
@@ -55,14 +55,14 @@ class TestBlogRepository:
 
     assert total == 15
     assert len(blogs) == 10
-    assert blogs[0].id == "blog0"
-    assert blogs[9].id == "blog9"
+    assert blogs[0].id == "blog14"
+    assert blogs[9].id == "blog5"
 
     blogs_page_2, _ = await repo.get_all_blogs(skip=10, limit=10)
 
     assert len(blogs_page_2) == 5
-    assert blogs_page_2[0].id == "blog10"
-    assert blogs_page_2[4].id == "blog14"
+    assert blogs_page_2[0].id == "blog4"
+    assert blogs_page_2[4].id == "blog0"
 
     blogs_search, total_search = await repo.get_all_blogs(search="Blog 1")
 
@@ -70,6 +70,37 @@ class TestBlogRepository:
     assert len(blogs_search) == 6
 
 
+  @pytest.mark.asyncio
+  async def test_get_all_blogs_within_creation_bounds(self, db_session: AsyncSession):
+    repo = BlogRepository(db_session)
+
+    for month in range(1, 5):
+      await repo.create_blog(BlogEntity(
+        id=f"blog{month}",
+        title=f"Blog {month}",
+        content="Content",
+        author_id="user123",
+        created_at=datetime(2024, month, 15, tzinfo=timezone.utc),
+        updated_at=datetime(2024, month, 15, tzinfo=timezone.utc)
+      ))
+
+    blogs, total = await repo.get_all_blogs(
+      created_after=datetime(2024, 2, 1, tzinfo=timezone.utc),
+      created_before=datetime(2024, 4, 1, tzinfo=timezone.utc)
+    )
+    author_blogs, author_total = await repo.get_all_blogs_by_author(
+      "user123",
+      created_after=datetime(2024, 3, 1, tzinfo=timezone.utc)
+    )
+    streamed = [blog.id async for blog in repo.stream_blogs(created_before=datetime(2024, 2, 1, tzinfo=timezone.utc))]
+
+    assert total == 2
+    assert sorted(blog.id for blog in blogs) == ["blog2", "blog3"]
+    assert author_total == 2
+    assert sorted(blog.id for blog in author_blogs) == ["blog3", "blog4"]
+    assert streamed == ["blog1"]
+
+
   @pytest.mark.asyncio
   async def test_get_nonexistent_blog(self, db_session: AsyncSession):
     repo = BlogRepository(db_session)
@@ -98,6 +129,12 @@ class TestBlogRepository:
 
     assert total_user123 == 5
     assert len(blogs_user123) == 5
+    # Equal creation times fall back to the id, so pages never overlap
+    assert [blog.id for blog in blogs_user123] == ["blog4", "blog3", "blog2", "blog1", "blog0"]
+
+    page, _ = await repo.get_all_blogs_by_author("user123", skip=2, limit=2)
+
+    assert [blog.id for blog in page] == ["blog2", "blog1"]
 
     blogs_user456, total_user456 = await repo.get_all_blogs_by_author("user456")
 
@@ -163,6 +200,34 @@ class TestBlogRepository:
     assert retrieved.content == "Updated content"
 
 
+  @pytest.mark.asyncio
+  async def test_update_blog_increments_version_and_rejects_stale_writes(self, db_session: AsyncSession):
+    repo = BlogRepository(db_session)
+
+    blog = BlogEntity(
+      id="blog123",
+      title="Test Blog",
+      content="This is a test blog.",
+      author_id="user123"
+    )
+    await repo.create_blog(blog)
+
+    stale = await repo.get_blog_by_id("blog123")
+    stale.title = "Second Writer"
+    first = await repo.get_blog_by_id("blog123")
+    first.title = "First Writer"
+
+    updated = await repo.update_blog("blog123", first)
+    assert updated.version == 2
+
+    with pytest.raises(ConflictException):
+      await repo.update_blog("blog123", stale)
+
+    db_session.expire_all()
+    retrieved = await repo.get_blog_by_id("blog123")
+    assert (retrieved.title, retrieved.version) == ("First Writer", 2)
+
+
   @pytest.mark.asyncio
   async def test_update_nonexistent_blog(self, db_session: AsyncSession):
     repo = BlogRepository(db_session)
@@ -201,4 +266,57 @@ class TestBlogRepository:
     await repo.delete_blog("blog123")
 
     retrieved = await repo.get_blog_by_id("blog123")
-    assert retrieved is None
\ No newline at end of file
+    assert retrieved is None
+
+  @pytest.mark.asyncio
+  async def test_filter_blogs_by_tags(self, db_session: AsyncSession):
+    repo = BlogRepository(db_session)
+
+    for i, tags in enumerate([["python", "async"], ["python"], ["rust"]]):
+      await repo.create_blog(BlogEntity(
+        id=f"blog{i}",
+        title=f"Blog {i}",
+        content="Content",
+        author_id="user123",
+        tags=tags,
+        created_at=datetime(2024,1,1,tzinfo=timezone.utc) + timedelta(hours=i),
+        updated_at=datetime(2024,1,1,tzinfo=timezone.utc)
+      ))
+
+    all_tags, all_total = await repo.get_all_blogs(tags=["python", "async"])
+    any_tags, any_total = await repo.get_all_blogs(tags=["async", "rust"], match_all_tags=False)
+
+    assert all_total == 1
+    assert [blog.id for blog in all_tags] == ["blog0"]
+    assert all_tags[0].tags == ["python", "async"]
+    assert any_total == 2
+    assert [blog.id for blog in any_tags] == ["blog2", "blog0"]
+
+
+  @pytest.mark.asyncio
+  async def test_tag_counts_follow_writes(self, db_session: AsyncSession):
+    repo = BlogRepository(db_session)
+
+    for i, tags in enumerate([["python", "async"], ["python"], ["rust"]]):
+      await repo.create_blog(BlogEntity(
+        id=f"blog{i}",
+        title=f"Blog {i}",
+        content="Content",
+        author_id="user123",
+        tags=tags,
+        created_at=datetime(2024,1,1,tzinfo=timezone.utc),
+        updated_at=datetime(2024,1,1,tzinfo=timezone.utc)
+      ))
+
+    assert await repo.get_tag_counts() == {"python": 2, "async": 1, "rust": 1}
+
+    await repo.update_owned_blog("blog1", "user123", {"tags": ["rust", "async"]})
+    assert await repo.get_tag_counts() == {"python": 1, "async": 2, "rust": 2}
+
+    await repo.delete_owned_blog("blog0", "user123")
+    assert await repo.get_tag_counts() == {"rust": 2, "async": 1}
+    assert await repo.get_tag_counts(["rust", "python"]) == {"rust": 2}
+    assert await repo.get_tag_counts(limit=1) == {"rust": 2}
+
+    await repo.delete_blogs_by_author("user123", limit=10)
+    assert await repo.get_tag_counts() == {}
@@ -0,0 +1,39 @@
+from app.revisions import encode_delta, apply_delta, encode_full, decode_full
+
+
+LONG_TEXT = "".join(f"Paragraph {i}: the quick brown fox jumps over the lazy dog.\n" for i in range(500))
+
+
+class TestTextDelta:
+
+  def test_full_round_trip(self):
+    assert decode_full(encode_full(LONG_TEXT)) == LONG_TEXT
+
+
+  def test_small_edit_makes_a_small_delta(self):
+    target = LONG_TEXT.replace("Paragraph 250: the quick", "Paragraph 250: the very quick")
+
+    delta = encode_delta(LONG_TEXT, target)
+
+    assert apply_delta(LONG_TEXT, delta) == target
+    assert len(delta) < 64
+    assert len(delta) < len(encode_full(target)) // 10
+
+
+  def test_round_trip_of_inserted_and_removed_lines(self):
+    lines = LONG_TEXT.splitlines(keepends=True)
+    target = "New first line.\n" + "".join(lines[10:200]) + "Moved to the middle.\n" + "".join(lines[300:])
+
+    assert apply_delta(LONG_TEXT, encode_delta(LONG_TEXT, target)) == target
+
+
+  def test_round_trip_of_unicode_and_missing_trailing_newline(self):
+    base = "Café ☕ au lait\nnaïve résumé\n日本語のテキスト"
+    target = "Café ☕☕ au lait\nnaïve résumé 🚀\n日本語のテキストです"
+
+    assert apply_delta(base, encode_delta(base, target)) == target
+
+
+  def test_round_trip_from_and_to_empty_text(self):
+    assert apply_delta("", encode_delta("", "Hello")) == "Hello"
+    assert apply_delta("Hello", encode_delta("Hello", "")) == ""
@@ -0,0 +1,87 @@
+import os
+import pytest
+from PIL import Image
+
+from app.services import ImageProcessor
+from app.storage import LocalImageStorage
+from src.domain.exceptions import InvalidDataException
+
+
+@pytest.fixture(scope="module")
+def image_processor():
+  processor = ImageProcessor(max_workers=1, formats=["webp", "avif"], max_pixels=4_000_000)
+  yield processor
+  processor.shutdown()
+
+
+@pytest.fixture
+def png_path(tmp_path):
+  path = tmp_path / "source.png"
+  Image.new("RGB", (1200, 600), color=(200, 40, 40)).save(path, format="PNG")
+  return str(path)
+
+
+class TestImageProcessor:
+
+  @pytest.mark.asyncio
+  async def test_create_variants(self, image_processor, png_path, tmp_path):
+    output_dir = tmp_path / "variants"
+    output_dir.mkdir()
+
+    processed = await image_processor.create_variants(png_path, str(output_dir))
+
+    assert processed.format == "png"
+    assert processed.content_type == "image/png"
+    assert len(processed.variants) == 6
+
+    sizes = {(v.name, v.format): (v.width, v.height) for v in processed.variants}
+    assert sizes[("thumbnail", "webp")] == (320, 160)
+    assert sizes[("card", "avif")] == (800, 400)
+    # Variants are never upscaled
+    assert sizes[("full", "webp")] == (1200, 600)
+
+    for variant in processed.variants:
+      assert os.path.exists(variant.path)
+      with Image.open(variant.path) as image:
+        assert image.format == variant.format.upper()
+
+
+  @pytest.mark.asyncio
+  async def test_rejects_files_that_are_not_images(self, image_processor, tmp_path):
+    path = tmp_path / "not-an-image.png"
+    path.write_bytes(b"definitely not an image")
+
+    with pytest.raises(InvalidDataException):
+      await image_processor.create_variants(str(path), str(tmp_path))
+
+
+  @pytest.mark.asyncio
+  async def test_rejects_images_above_pixel_limit(self, image_processor, tmp_path):
+    path = tmp_path / "huge.png"
+    Image.new("L", (3000, 2000)).save(path, format="PNG")
+
+    with pytest.raises(InvalidDataException):
+      await image_processor.create_variants(str(path), str(tmp_path))
+
+
+class TestLocalImageStorage:
+
+  @pytest.mark.asyncio
+  async def test_save_and_delete(self, png_path, tmp_path):
+    storage = LocalImageStorage(root_dir=str(tmp_path / "media"), base_url="/media/")
+
+    url = await storage.save("blogs/blog-1/original.png", png_path, "image/png")
+
+    assert url == "/media/blogs/blog-1/original.png"
+    assert (tmp_path / "media" / "blogs" / "blog-1" / "original.png").exists()
+
+    await storage.delete(["blogs/blog-1/original.png", "blogs/blog-1/missing.png"])
+    assert not (tmp_path / "media" / "blogs" / "blog-1" / "original.png").exists()
+
+
+  @pytest.mark.asyncio
+  async def test_rejects_keys_outside_root(self, png_path, tmp_path):
+    storage = LocalImageStorage(root_dir=str(tmp_path / "media"), base_url="/media")
+
+    with pytest.raises(ValueError):
+      await storage.save("../escape.png", png_path, "image/png")
@@ -0,0 +1,56 @@
+import pytest
+
+from app.services import MarkdownRenderer
+
+
+@pytest.fixture
+def renderer():
+  renderer = MarkdownRenderer(cache_size=2, max_workers=1, inline_max_chars=10)
+  yield renderer
+  renderer.shutdown()
+
+
+class TestMarkdownRenderer:
+
+  @pytest.mark.asyncio
+  async def test_render_markdown(self, renderer):
+    html = await renderer.render("# Title\n\nSome **bold** text.")
+
+    assert "<h1>Title</h1>" in html
+    assert "<strong>bold</strong>" in html
+
+
+  @pytest.mark.asyncio
+  @pytest.mark.parametrize(
+    "content, forbidden",
+    [
+      ("<script>alert(1)</script>", "<script"),
+      ('<img src="x" onerror="alert(1)">', "onerror"),
+      ("[link](javascript:alert(1))", "javascript:"),
+    ]
+  )
+  async def test_render_sanitizes_html(self, renderer, content, forbidden):
+    html = await renderer.render(content)
+
+    assert forbidden not in html
+
+
+  @pytest.mark.asyncio
+  async def test_unchanged_content_is_not_rendered_again(self, renderer):
+    first = await renderer.render("Hello *world*")
+    second = await renderer.render("Hello *world*")
+
+    assert first == second
+    assert renderer.misses == 1
+    assert renderer.hits == 1
+
+
+  @pytest.mark.asyncio
+  async def test_cache_is_bounded(self, renderer):
+    for content in ["one", "two", "three"]:
+      await renderer.render(content)
+
+    await renderer.render("one")
+
+    assert renderer.misses == 4
+    assert renderer.hits == 0
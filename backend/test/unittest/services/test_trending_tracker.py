@@ -0,0 +1,83 @@
+import pytest
+
+from app.services import TrendingTracker
+
+
+class Clock:
+  def __init__(self, now: float = 1_000_000.0):
+    self.now = now
+
+  def __call__(self) -> float:
+    return self.now
+
+
+def make_tracker(clock: Clock, **kwargs) -> TrendingTracker:
+  return TrendingTracker(session_factory=lambda: None, half_life_seconds=100.0, clock=clock, **kwargs)
+
+
+class TestTrendingTracker:
+
+  def test_recent_engagement_outweighs_older_engagement(self):
+    clock = Clock()
+    tracker = make_tracker(clock)
+
+    for _ in range(3):
+      tracker.record("old")
+    clock.now += 200.0
+    for _ in range(2):
+      tracker.record("new")
+    tracker.apply_pending()
+
+    # Three views two half-lives ago are worth 0.75 views now
+    assert tracker._scores["new"] > tracker._scores["old"]
+    assert tracker._scores["old"] / tracker._scores["new"] == pytest.approx(0.375)
+
+
+  def test_moving_the_landmark_keeps_the_order(self):
+    clock = Clock()
+    tracker = make_tracker(clock)
+
+    tracker.record("a", weight=4.0)
+    clock.now += 100.0
+    tracker.record("b", weight=3.0)
+    tracker.apply_pending()
+    before = dict(tracker._scores)
+
+    tracker._move_landmark(clock.now)
+
+    assert tracker._scores["a"] == pytest.approx(2.0)
+    assert tracker._scores["b"] == pytest.approx(3.0)
+    assert tracker._scores["a"] / tracker._scores["b"] == pytest.approx(before["a"] / before["b"])
+
+
+  def test_landmark_moves_before_scores_overflow(self):
+    clock = Clock()
+    tracker = make_tracker(clock)
+
+    clock.now += 100.0 * 1_000
+    tracker.record("a")
+    tracker.apply_pending()
+
+    assert tracker._landmark == clock.now
+    assert tracker._scores["a"] == pytest.approx(1.0)
+
+
+  def test_tracked_blogs_are_pruned_to_the_heaviest(self):
+    clock = Clock()
+    tracker = make_tracker(clock, max_tracked=4)
+
+    for index in range(5):
+      tracker.record(f"blog-{index}", weight=float(index + 1))
+    tracker.apply_pending()
+
+    assert set(tracker._scores) == {"blog-3", "blog-4"}
+
+
+  def test_engagements_past_a_full_queue_are_dropped(self):
+    tracker = make_tracker(Clock(), queue_size=2)
+
+    for _ in range(5):
+      tracker.record("a")
+
+    assert tracker.apply_pending() == 2
+    assert tracker.dropped == 3
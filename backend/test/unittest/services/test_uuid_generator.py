@@ -0,0 +1,81 @@
+import pytest
+from uuid import UUID
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.database.models import BlogModel
+from app.database.types import NIL_UUID, UUIDString
+from app.services import UuidGenerator
+
+
+class FakeClock:
+  def __init__(self, now_ms: int):
+    self.now_ms = now_ms
+
+  def __call__(self) -> int:
+    return self.now_ms * 1_000_000
+
+
+class TestUuidGenerator:
+
+  def test_generates_version_7_uuids_with_the_timestamp(self):
+    generator = UuidGenerator(clock=FakeClock(1_760_000_000_000))
+
+    value = UUID(generator.generate())
+
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+    assert value.int >> 80 == 1_760_000_000_000
+
+
+  def test_ids_sort_in_generation_order(self):
+    clock = FakeClock(1_760_000_000_000)
+    generator = UuidGenerator(clock=clock)
+
+    ids = []
+    for step in range(3000):
+      if step % 1000 == 0:
+        clock.now_ms += 1
+      ids.append(generator.generate())
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
+  def test_clock_going_backwards_keeps_ordering(self):
+    clock = FakeClock(1_760_000_000_000)
+    generator = UuidGenerator(clock=clock)
+
+    first = generator.generate()
+    clock.now_ms -= 5
+    second = generator.generate()
+
+    assert first < second
+
+
+class TestUUIDString:
+
+  def test_postgresql_stores_native_uuid(self):
+    dialect = postgresql.dialect()
+
+    assert UUIDString().load_dialect_impl(dialect).compile(dialect=dialect) == "UUID"
+
+
+  def test_postgresql_rejects_invalid_ids_written_to_rows(self):
+    dialect = postgresql.dialect()
+    value = "0199f0a2-6c00-7abc-8def-0123456789ab"
+
+    assert UUIDString().process_bind_param(value, dialect) == value
+    with pytest.raises(ValueError):
+      UUIDString().process_bind_param("nonexistent-blog-id", dialect)
+
+
+  def test_postgresql_compares_invalid_ids_as_nil_uuid(self):
+    dialect = postgresql.dialect()
+    compared = (BlogModel.id == "nonexistent-blog-id").right
+
+    assert compared.type.process_bind_param(compared.value, dialect) == NIL_UUID
+
+
+  def test_other_databases_keep_ids_as_text(self):
+    assert UUIDString().process_bind_param("nonexistent-blog-id", sqlite.dialect()) == "nonexistent-blog-id"
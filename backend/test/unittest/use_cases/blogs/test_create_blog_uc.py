@@ -21,6 +21,12 @@ def unit_of_work(mocker):
   uow.users.get_user_by_id = AsyncMock()
   uow.blogs.create_blog = AsyncMock()
 
+  uow.author_stats = mocker.Mock()
+  uow.author_stats.record_post = AsyncMock()
+
+  uow.blog_revisions = mocker.Mock()
+  uow.blog_revisions.add_revision = AsyncMock()
+
   return uow
 
 
@@ -91,6 +97,11 @@ class TestCreateBlogUseCase:
     unit_of_work.users.get_user_by_id.assert_awaited_once_with(blog_data.author_id)
     id_generator.generate.assert_called_once()
     unit_of_work.blogs.create_blog.assert_awaited_once()
+    unit_of_work.author_stats.record_post.assert_awaited_once_with(
+      blog_data.author_id,
+      result.created_at
+    )
+    unit_of_work.blog_revisions.add_revision.assert_awaited_once()
 
 
   @pytest.mark.asyncio
@@ -163,4 +174,30 @@ class TestCreateBlogUseCase:
     with pytest.raises(InvalidDataException, match=error_regex):
       await create_blog_use_case.execute(blog_data)
 
-    unit_of_work.users.get_user_by_id.assert_awaited_once_with(blog_data.author_id)
\ No newline at end of file
+    unit_of_work.users.get_user_by_id.assert_awaited_once_with(blog_data.author_id)
+
+
+  @pytest.mark.asyncio
+  async def test_execute_renders_content_html(
+    self,
+    blog_data,
+    unit_of_work,
+    id_generator,
+    existing_user,
+    mocker
+  ):
+    markdown_renderer = mocker.Mock()
+    markdown_renderer.render = AsyncMock(return_value="<p>This is a test blog content.</p>")
+    use_case = CreateBlogUseCase(
+      unit_of_work=unit_of_work,
+      id_generator=id_generator,
+      markdown_renderer=markdown_renderer
+    )
+    unit_of_work.users.get_user_by_id.return_value = existing_user
+    id_generator.generate.return_value = "blog-123"
+    unit_of_work.blogs.create_blog.side_effect = lambda blog: blog
+
+    result = await use_case.execute(blog_data)
+
+    markdown_renderer.render.assert_awaited_once_with(blog_data.content)
+    assert result.content_html == "<p>This is a test blog content.</p>"
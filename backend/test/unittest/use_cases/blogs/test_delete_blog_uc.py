@@ -16,7 +16,13 @@ def unit_of_work(mocker):
 
   uow.blogs = mocker.Mock()
   uow.blogs.get_blog_by_id = AsyncMock()
-  uow.blogs.delete_blog = AsyncMock()
+  uow.blogs.delete_owned_blog = AsyncMock()
+
+  uow.author_stats = mocker.Mock()
+  uow.author_stats.record_deletion = AsyncMock()
+
+  uow.blog_revisions = mocker.Mock()
+  uow.blog_revisions.delete_blog = AsyncMock()
 
   return uow
 
@@ -52,17 +58,17 @@ class TestDeleteBlogUseCase:
   ):
     blog_id = "blog-123"
 
-    unit_of_work.blogs.get_blog_by_id.return_value = mocker.MagicMock(
-      author_id=existing_user.id
-    )
+    unit_of_work.blogs.delete_owned_blog.return_value = True
 
     await delete_blog_use_case.execute(
       current_user=existing_user,
       blog_id=blog_id
     )
 
-    unit_of_work.blogs.get_blog_by_id.assert_awaited_once_with(blog_id)
-    unit_of_work.blogs.delete_blog.assert_awaited_once_with(blog_id)
+    unit_of_work.blogs.get_blog_by_id.assert_not_called()
+    unit_of_work.blogs.delete_owned_blog.assert_awaited_once_with(blog_id, existing_user.id)
+    unit_of_work.author_stats.record_deletion.assert_awaited_once_with(existing_user.id)
+    unit_of_work.blog_revisions.delete_blog.assert_awaited_once_with(blog_id)
 
 
   @pytest.mark.asyncio
@@ -74,6 +80,7 @@ class TestDeleteBlogUseCase:
   ):
     blog_id = "nonexistent-blog"
 
+    unit_of_work.blogs.delete_owned_blog.return_value = False
     unit_of_work.blogs.get_blog_by_id.return_value = None
 
     with pytest.raises(NotFoundException) as exc_info:
@@ -84,8 +91,8 @@ class TestDeleteBlogUseCase:
 
     assert str(exc_info.value) == "Blog with identifier 'blog_id: nonexistent-blog' was not found."
 
-    unit_of_work.blogs.get_blog_by_id.assert_awaited_once_with(blog_id)
-    unit_of_work.blogs.delete_blog.assert_not_called()
+    unit_of_work.blogs.delete_owned_blog.assert_awaited_once_with(blog_id, existing_user.id)
+    unit_of_work.author_stats.record_deletion.assert_not_called()
 
 
   @pytest.mark.asyncio
@@ -98,6 +105,7 @@ class TestDeleteBlogUseCase:
   ):
     blog_id = "blog-123"
 
+    unit_of_work.blogs.delete_owned_blog.return_value = False
     unit_of_work.blogs.get_blog_by_id.return_value = mocker.MagicMock(
       author_id="different_user"
     )
@@ -110,5 +118,5 @@ class TestDeleteBlogUseCase:
 
     assert str(exc_info.value) == "You are not authorized to delete this blog."
 
-    unit_of_work.blogs.get_blog_by_id.assert_awaited_once_with(blog_id)
-    unit_of_work.blogs.delete_blog.assert_not_called()
\ No newline at end of file
+    unit_of_work.blogs.delete_owned_blog.assert_awaited_once_with(blog_id, existing_user.id)
+    unit_of_work.author_stats.record_deletion.assert_not_called()
\ No newline at end of file
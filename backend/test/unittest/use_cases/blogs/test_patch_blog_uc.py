@@ -0,0 +1,219 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+from src.application.dto import PatchBlogDTO, TextPatchOperationDTO
+from src.application.use_cases.blogs import PatchBlogUseCase
+from src.domain.entities import BlogEntity, UserEntity
+from src.domain.exceptions import (
+  NotFoundException,
+  UnauthorizedException,
+  PreconditionFailedException,
+  ConflictException,
+  InvalidDataException
+)
+from src.domain.value_objects import TextPatch
+
+
+@pytest.fixture
+def unit_of_work(mocker):
+  uow = mocker.MagicMock()
+
+  uow.__aenter__ = AsyncMock(return_value=uow)
+  uow.__aexit__ = AsyncMock(return_value=None)
+
+  uow.blogs = mocker.Mock()
+  uow.blogs.get_blog_by_id = AsyncMock()
+  uow.blogs.update_owned_blog = AsyncMock()
+
+  uow.blog_revisions = mocker.Mock()
+  uow.blog_revisions.add_revision = AsyncMock()
+
+  return uow
+
+
+@pytest.fixture
+def patch_blog_use_case(unit_of_work):
+  return PatchBlogUseCase(unit_of_work=unit_of_work)
+
+
+@pytest.fixture
+def blog_data():
+  return BlogEntity(
+    id="blog-123",
+    title="Original Title",
+    content="The quick brown fox jumps over the lazy dog.",
+    author_id="author-123",
+    created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    version=3
+  )
+
+
+@pytest.fixture
+def existing_user():
+  return UserEntity(
+    id="author-123",
+    first_name="Alice",
+    last_name="Smith",
+    username="alicesmith",
+    password="hashedpassword",
+    avatar=None,
+    created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc)
+  )
+
+
+def make_patch(operations, expected_content):
+  return PatchBlogDTO(
+    operations=[TextPatchOperationDTO(offset=offset, delete=delete, insert=insert) for offset, delete, insert in operations],
+    content_hash=TextPatch.hash(expected_content)
+  )
+
+
+def apply_changes(blog):
+  async def update_owned_blog(blog_id, author_id, changes, expected_version=None):
+    return BlogEntity(**{**blog.to_dict(), **changes, "version": blog.version + 1})
+  return update_owned_blog
+
+
+class TestPatchBlogUseCase:
+
+  @pytest.mark.asyncio
+  async def test_patch_blog_success(self, patch_blog_use_case, unit_of_work, blog_data, existing_user):
+    expected = "The quick red fox leaps over the lazy dog."
+    unit_of_work.blogs.get_blog_by_id.return_value = blog_data
+    unit_of_work.blogs.update_owned_blog.side_effect = apply_changes(blog_data)
+
+    result = await patch_blog_use_case.execute(
+      existing_user,
+      blog_data.id,
+      make_patch([(10, 5, "red"), (20, 5, "leaps")], expected),
+      expected_version=3
+    )
+
+    args = unit_of_work.blogs.update_owned_blog.await_args.args
+    assert args[0:2] == (blog_data.id, existing_user.id)
+    assert args[2]["content"] == expected
+    assert args[3] == 3
+    unit_of_work.blog_revisions.add_revision.assert_awaited_once()
+    unit_of_work.add_event.assert_called_once()
+
+    assert result.version == 4
+    assert result.content_length == len(expected)
+    assert result.content_hash == TextPatch.hash(expected)
+
+
+  @pytest.mark.asyncio
+  async def test_patch_blog_not_found(self, patch_blog_use_case, unit_of_work, existing_user):
+    unit_of_work.blogs.get_blog_by_id.return_value = None
+
+    with pytest.raises(NotFoundException):
+      await patch_blog_use_case.execute(existing_user, "missing", make_patch([(0, 0, "x")], "x"), expected_version=1)
+
+
+  @pytest.mark.asyncio
+  async def test_patch_blog_unauthorized(self, patch_blog_use_case, unit_of_work, blog_data, existing_user):
+    unit_of_work.blogs.get_blog_by_id.return_value = BlogEntity(**{**blog_data.to_dict(), "author_id": "someone-else"})
+
+    with pytest.raises(UnauthorizedException):
+      await patch_blog_use_case.execute(existing_user, blog_data.id, make_patch([(0, 0, "x")], "x"), expected_version=3)
+
+
+  @pytest.mark.asyncio
+  async def test_patch_blog_of_other_version_fails(self, patch_blog_use_case, unit_of_work, blog_data, existing_user):
+    unit_of_work.blogs.get_blog_by_id.return_value = blog_data
+
+    with pytest.raises(PreconditionFailedException):
+      await patch_blog_use_case.execute(existing_user, blog_data.id, make_patch([(0, 0, "x")], "x"), expected_version=2)
+
+    unit_of_work.blogs.update_owned_blog.assert_not_called()
+
+
+  @pytest.mark.asyncio
+  async def test_patch_blog_with_wrong_hash_fails(self, patch_blog_use_case, unit_of_work, blog_data, existing_user):
+    unit_of_work.blogs.get_blog_by_id.return_value = blog_data
+
+    with pytest.raises(InvalidDataException):
+      await patch_blog_use_case.execute(
+        existing_user,
+        blog_data.id,
+        make_patch([(0, 3, "A")], "A quick brown fox."),
+        expected_version=3
+      )
+
+    unit_of_work.blogs.update_owned_blog.assert_not_called()
+
+
+  @pytest.mark.asyncio
+  async def test_patch_blog_leaving_outer_whitespace_fails(self, patch_blog_use_case, unit_of_work, blog_data, existing_user):
+    unit_of_work.blogs.get_blog_by_id.return_value = blog_data
+    expected = blog_data.content + "\n"
+
+    with pytest.raises(InvalidDataException):
+      await patch_blog_use_case.execute(
+        existing_user,
+        blog_data.id,
+        make_patch([(len(blog_data.content), 0, "\n")], expected),
+        expected_version=3
+      )
+
+    unit_of_work.blogs.update_owned_blog.assert_not_called()
+
+
+  @pytest.mark.asyncio
+  async def test_patch_blog_renders_outside_the_transaction(self, unit_of_work, blog_data, existing_user):
+    events = []
+    unit_of_work.__aenter__.side_effect = lambda: events.append("begin") or unit_of_work
+    unit_of_work.__aexit__.side_effect = lambda *args: events.append("end")
+    unit_of_work.blogs.get_blog_by_id.return_value = blog_data
+    unit_of_work.blogs.update_owned_blog.side_effect = apply_changes(blog_data)
+    renderer = AsyncMock()
+    renderer.render.side_effect = lambda content: events.append("render") or f"<p>{content}</p>"
+    expected = "The quick brown fox jumps over the lazy cat."
+
+    await PatchBlogUseCase(unit_of_work=unit_of_work, markdown_renderer=renderer).execute(
+      existing_user,
+      blog_data.id,
+      make_patch([(40, 3, "cat")], expected),
+      expected_version=3
+    )
+
+    assert events == ["begin", "end", "render", "begin", "end"]
+    assert unit_of_work.blogs.update_owned_blog.await_args.args[2]["content_html"] == f"<p>{expected}</p>"
+
+
+  @pytest.mark.asyncio
+  async def test_patch_blog_written_concurrently_conflicts(self, patch_blog_use_case, unit_of_work, blog_data, existing_user):
+    unit_of_work.blogs.get_blog_by_id.return_value = blog_data
+    unit_of_work.blogs.update_owned_blog.return_value = None
+
+    with pytest.raises(ConflictException):
+      await patch_blog_use_case.execute(
+        existing_user,
+        blog_data.id,
+        make_patch([(0, 3, "A")], "A quick brown fox jumps over the lazy dog."),
+        expected_version=3
+      )
+
+    unit_of_work.blog_revisions.add_revision.assert_not_called()
+
+
+  @pytest.mark.parametrize(
+    "operations",
+    [
+      [],
+      [(-1, 0, "x")],
+      [(0, -1, "")],
+      [(5, 2, "x"), (6, 0, "y")],
+      [(5, 0, "x"), (2, 0, "y")],
+    ]
+  )
+  def test_invalid_patch_operations(self, operations):
+    with pytest.raises(InvalidDataException):
+      TextPatch(operations)
+
+
+  def test_patch_reaching_past_the_end_fails(self):
+    with pytest.raises(InvalidDataException):
+      TextPatch([(3, 5, "")]).apply("short")
@@ -5,7 +5,12 @@ from unittest.mock import AsyncMock
 from src.application.dto import UpdateBlogDTO
 from src.application.use_cases.blogs import UpdateBlogUseCase
 from src.domain.entities import BlogEntity, UserEntity
-from src.domain.exceptions import NotFoundException, UnauthorizedException
+from src.domain.exceptions import (
+  NotFoundException,
+  UnauthorizedException,
+  PreconditionFailedException,
+  InvalidDataException
+)
 
 
 @pytest.fixture
@@ -17,7 +22,10 @@ def unit_of_work(mocker):
 
   uow.blogs = mocker.Mock()
   uow.blogs.get_blog_by_id = AsyncMock()
-  uow.blogs.update_blog = AsyncMock()
+  uow.blogs.update_owned_blog = AsyncMock()
+
+  uow.blog_revisions = mocker.Mock()
+  uow.blog_revisions.add_revision = AsyncMock()
 
   return uow
 
@@ -56,6 +64,12 @@ def existing_user():
   )
 
 
+def apply_changes(blog):
+  async def update_owned_blog(blog_id, author_id, changes, expected_version=None):
+    return BlogEntity(**{**blog.to_dict(), **changes, "version": blog.version + 1})
+  return update_owned_blog
+
+
 class TestUpdateBlogUseCase:
 
   @pytest.mark.asyncio
@@ -79,15 +93,13 @@ class TestUpdateBlogUseCase:
     content,
     hero_image
   ):
-    unit_of_work.blogs.get_blog_by_id.return_value = blog_data
-
     update_data = UpdateBlogDTO(
       title=title,
       content=content,
       hero_image=hero_image
     )
 
-    unit_of_work.blogs.update_blog.side_effect = lambda blog_id, blog: blog
+    unit_of_work.blogs.update_owned_blog.side_effect = apply_changes(blog_data)
 
     result = await update_blog_use_case.execute(
       current_user=existing_user,
@@ -95,9 +107,12 @@ class TestUpdateBlogUseCase:
       blog_data=update_data
     )
 
-    unit_of_work.blogs.get_blog_by_id.assert_awaited_once_with(blog_data.id)
-    unit_of_work.blogs.update_blog.assert_awaited_once()
+    unit_of_work.blogs.get_blog_by_id.assert_not_called()
+    unit_of_work.blogs.update_owned_blog.assert_awaited_once()
+    assert unit_of_work.blogs.update_owned_blog.await_args.args[:2] == (blog_data.id, existing_user.id)
+    assert unit_of_work.blog_revisions.add_revision.await_args.args[0].version == blog_data.version + 1
 
+    assert result.version == blog_data.version + 1
     assert result.title == (title if title is not None else blog_data.title)
     assert result.content == (content if content is not None else blog_data.content)
     assert result.hero_image == (hero_image if hero_image is not None else blog_data.hero_image)
@@ -115,6 +130,7 @@ class TestUpdateBlogUseCase:
     blog_data,
     existing_user
   ):
+    unit_of_work.blogs.update_owned_blog.return_value = None
     unit_of_work.blogs.get_blog_by_id.return_value = None
 
     update_data = UpdateBlogDTO(
@@ -129,7 +145,6 @@ class TestUpdateBlogUseCase:
       )
 
     unit_of_work.blogs.get_blog_by_id.assert_awaited_once_with(blog_data.id)
-    unit_of_work.blogs.update_blog.assert_not_called()
 
     assert str(exc_info.value) == f"Blog with identifier 'blog_id: {blog_data.id}' was not found."
 
@@ -142,6 +157,7 @@ class TestUpdateBlogUseCase:
     blog_data,
     existing_user
   ):
+    unit_of_work.blogs.update_owned_blog.return_value = None
     unit_of_work.blogs.get_blog_by_id.return_value = blog_data
 
     update_data = UpdateBlogDTO(
@@ -165,6 +181,90 @@ class TestUpdateBlogUseCase:
       )
 
     unit_of_work.blogs.get_blog_by_id.assert_awaited_once_with(blog_data.id)
-    unit_of_work.blogs.update_blog.assert_not_called()
 
-    assert str(exc_info.value) == "You are not authorized to update this blog."
\ No newline at end of file
+    assert str(exc_info.value) == "You are not authorized to update this blog."
+
+
+  @pytest.mark.asyncio
+  async def test_update_blog_version_mismatch(
+    self,
+    update_blog_use_case,
+    unit_of_work,
+    blog_data,
+    existing_user
+  ):
+    unit_of_work.blogs.update_owned_blog.return_value = None
+    unit_of_work.blogs.get_blog_by_id.return_value = blog_data
+
+    with pytest.raises(PreconditionFailedException):
+      await update_blog_use_case.execute(
+        current_user=existing_user,
+        blog_id=blog_data.id,
+        blog_data=UpdateBlogDTO(title="Updated Title"),
+        expected_version=blog_data.version + 1
+      )
+
+    unit_of_work.blogs.update_owned_blog.assert_awaited_once_with(
+      blog_data.id,
+      existing_user.id,
+      {"title": "Updated Title"},
+      blog_data.version + 1
+    )
+
+
+  @pytest.mark.asyncio
+  async def test_update_blog_rejects_invalid_title_before_writing(
+    self,
+    update_blog_use_case,
+    unit_of_work,
+    blog_data,
+    existing_user
+  ):
+    with pytest.raises(InvalidDataException):
+      await update_blog_use_case.execute(
+        current_user=existing_user,
+        blog_id=blog_data.id,
+        blog_data=UpdateBlogDTO(title="Abc")
+      )
+
+    unit_of_work.__aenter__.assert_not_called()
+    unit_of_work.blogs.update_owned_blog.assert_not_called()
+
+
+  @pytest.mark.asyncio
+  @pytest.mark.parametrize(
+    "content, expected_renders",
+    [
+      ("Updated content.", 1),
+      (None, 0),
+    ]
+  )
+  async def test_update_blog_renders_submitted_content_only(
+    self,
+    unit_of_work,
+    blog_data,
+    existing_user,
+    mocker,
+    content,
+    expected_renders
+  ):
+    markdown_renderer = mocker.Mock()
+    markdown_renderer.render = AsyncMock(return_value="<p>Updated content.</p>")
+    use_case = UpdateBlogUseCase(
+      unit_of_work=unit_of_work,
+      markdown_renderer=markdown_renderer
+    )
+    blog_data.content_html = "<p>Original content.</p>"
+    unit_of_work.blogs.update_owned_blog.side_effect = apply_changes(blog_data)
+
+    result = await use_case.execute(
+      current_user=existing_user,
+      blog_id=blog_data.id,
+      blog_data=UpdateBlogDTO(title="Updated Title", content=content)
+    )
+
+    assert markdown_renderer.render.await_count == expected_renders
+    if expected_renders:
+      assert result.content_html == "<p>Updated content.</p>"
+    else:
+      assert result.content_html == "<p>Original content.</p>"
@@ -0,0 +1,158 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+from src.application.dto import ImageVariantDTO, ProcessedImageDTO
+from src.application.use_cases.blogs import UploadHeroImageUseCase
+from src.domain.entities import BlogEntity, UserEntity
+from src.domain.exceptions import NotFoundException, UnauthorizedException
+
+
+@pytest.fixture
+def unit_of_work(mocker):
+  uow = mocker.MagicMock()
+
+  uow.__aenter__ = AsyncMock(return_value=uow)
+  uow.__aexit__ = AsyncMock(return_value=None)
+
+  uow.blogs = mocker.Mock()
+  uow.blogs.get_blog_by_id = AsyncMock()
+  uow.blogs.update_blog = AsyncMock(side_effect=lambda blog_id, blog: blog)
+
+  uow.blog_revisions = mocker.Mock()
+  uow.blog_revisions.add_revision = AsyncMock()
+
+  return uow
+
+
+@pytest.fixture
+def image_processor(mocker):
+  processor = mocker.Mock()
+  processor.create_variants = AsyncMock(return_value=ProcessedImageDTO(
+    format="png",
+    content_type="image/png",
+    variants=[
+      ImageVariantDTO(name=name, format=fmt, path=f"/tmp/{name}.{fmt}", content_type=f"image/{fmt}", width=10, height=10)
+      for name in ["thumbnail", "card"]
+      for fmt in ["webp", "avif"]
+    ]
+  ))
+  return processor
+
+
+@pytest.fixture
+def image_storage(mocker):
+  storage = mocker.Mock()
+  storage.save = AsyncMock(side_effect=lambda key, path, content_type: f"https://cdn.test/{key}")
+  storage.delete = AsyncMock()
+  storage.key_for_url = lambda url: url.removeprefix("https://cdn.test/") if url.startswith("https://cdn.test/") else None
+  return storage
+
+
+@pytest.fixture
+def id_generator(mocker):
+  generator = mocker.Mock()
+  generator.generate.return_value = "upload-1"
+  return generator
+
+
+@pytest.fixture
+def job_queue(mocker):
+  queue = mocker.Mock()
+  queue.enqueue.return_value = True
+  return queue
+
+
+@pytest.fixture
+def use_case(unit_of_work, image_processor, image_storage, id_generator, job_queue):
+  return UploadHeroImageUseCase(
+    unit_of_work=unit_of_work,
+    image_processor=image_processor,
+    image_storage=image_storage,
+    id_generator=id_generator,
+    job_queue=job_queue
+  )
+
+
+@pytest.fixture
+def blog():
+  return BlogEntity(
+    id="blog-123",
+    title="Original Title",
+    content="Original content.",
+    author_id="author-123",
+    hero_image="http://example.com/original_hero.jpg",
+    created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc)
+  )
+
+
+def make_user(user_id: str) -> UserEntity:
+  return UserEntity(
+    id=user_id,
+    first_name="Alice",
+    last_name="Smith",
+    username="alicesmith",
+    password="hashedpassword"
+  )
+
+
+class TestUploadHeroImageUseCase:
+
+  @pytest.mark.asyncio
+  async def test_upload_hero_image_success(self, use_case, unit_of_work, image_storage, job_queue, blog):
+    unit_of_work.blogs.get_blog_by_id.return_value = blog
+
+    result = await use_case.execute(make_user("author-123"), "blog-123", "/tmp/upload")
+
+    assert result.hero_image == "https://cdn.test/blogs/blog-123/upload-1/original.png"
+    assert result.hero_image_variants == {
+      "thumbnail": {
+        "webp": "https://cdn.test/blogs/blog-123/upload-1/thumbnail.webp",
+        "avif": "https://cdn.test/blogs/blog-123/upload-1/thumbnail.avif"
+      },
+      "card": {
+        "webp": "https://cdn.test/blogs/blog-123/upload-1/card.webp",
+        "avif": "https://cdn.test/blogs/blog-123/upload-1/card.avif"
+      }
+    }
+    assert image_storage.save.await_count == 5
+    unit_of_work.add_event.assert_called_once()
+    # The previous hero image is not served by the storage, so nothing is discarded
+    job_queue.enqueue.assert_not_called()
+
+
+  @pytest.mark.asyncio
+  async def test_upload_hero_image_discards_replaced_files(self, use_case, unit_of_work, image_storage, job_queue, blog):
+    blog.hero_image = "https://cdn.test/blogs/blog-123/old/original.png"
+    blog.hero_image_variants = {"card": {"webp": "https://cdn.test/blogs/blog-123/old/card.webp"}}
+    unit_of_work.blogs.get_blog_by_id.return_value = blog
+
+    await use_case.execute(make_user("author-123"), "blog-123", "/tmp/upload")
+
+    job_queue.enqueue.assert_called_once_with(
+      "images",
+      image_storage.delete,
+      ["blogs/blog-123/old/original.png", "blogs/blog-123/old/card.webp"]
+    )
+
+
+  @pytest.mark.asyncio
+  async def test_upload_hero_image_blog_not_found(self, use_case, unit_of_work, image_processor):
+    unit_of_work.blogs.get_blog_by_id.return_value = None
+
+    with pytest.raises(NotFoundException):
+      await use_case.execute(make_user("author-123"), "missing", "/tmp/upload")
+
+    image_processor.create_variants.assert_not_awaited()
+
+
+  @pytest.mark.asyncio
+  async def test_upload_hero_image_not_author(self, use_case, unit_of_work, image_processor, blog):
+    unit_of_work.blogs.get_blog_by_id.return_value = blog
+
+    with pytest.raises(UnauthorizedException):
+      await use_case.execute(make_user("someone-else"), "blog-123", "/tmp/upload")
+
+    image_processor.create_variants.assert_not_awaited()
+    unit_of_work.blogs.update_blog.assert_not_awaited()
@@ -20,11 +20,48 @@ class TestDeleteUserUseCase:
     uow.users.get_user_by_id = AsyncMock()
     uow.users.delete_user = AsyncMock()
 
+    uow.blogs = mocker.Mock()
+    uow.blogs.count_blogs_by_author = AsyncMock(return_value=0)
+
+    uow.auth_sessions = mocker.Mock()
+    uow.auth_sessions.delete_user_sessions = AsyncMock()
+
+    uow.follows = mocker.Mock()
+    uow.follows.delete_followings = AsyncMock(return_value=0)
+
+    uow.timelines = mocker.Mock()
+    uow.timelines.delete_timeline = AsyncMock(return_value=0)
+
+    uow.user_deletions = mocker.Mock()
+    uow.user_deletions.get_pending_deletion_for_user = AsyncMock(return_value=None)
+    uow.user_deletions.create_deletion = AsyncMock(side_effect=lambda deletion: deletion)
+
     return uow
 
   @pytest.fixture
-  def use_case(self, uow):
-    return DeleteUserUseCase(unit_of_work=uow)
+  def id_generator(self, mocker):
+    generator = mocker.Mock()
+    generator.generate.return_value = "deletion123"
+    return generator
+
+  @pytest.fixture
+  def content_purger(self, mocker):
+    purger = mocker.Mock()
+    purger.purge = AsyncMock()
+    return purger
+
+  @pytest.fixture
+  def job_queue(self, mocker):
+    return mocker.Mock()
+
+  @pytest.fixture
+  def use_case(self, uow, id_generator, content_purger, job_queue):
+    return DeleteUserUseCase(
+      unit_of_work=uow,
+      id_generator=id_generator,
+      content_purger=content_purger,
+      job_queue=job_queue
+    )
 
   @pytest.fixture
   def existing_user(self):
@@ -45,12 +82,30 @@ class TestDeleteUserUseCase:
 
     uow.users.get_user_by_id.return_value = existing_user
 
-    await use_case.execute(
+    result = await use_case.execute(
       active_user=existing_user,
       user_id=user_id
     )
 
     uow.users.delete_user.assert_awaited_once_with(user_id)
+    uow.auth_sessions.delete_user_sessions.assert_awaited_once_with(user_id)
+    assert result.status == "completed"
+    assert result.progress == 1.0
+
+  @pytest.mark.asyncio
+  async def test_execute_with_blogs_enqueues_purge(self, use_case, uow, existing_user, content_purger, job_queue):
+    uow.users.get_user_by_id.return_value = existing_user
+    uow.blogs.count_blogs_by_author.return_value = 1200
+
+    result = await use_case.execute(
+      active_user=existing_user,
+      user_id="user123"
+    )
+
+    uow.users.delete_user.assert_not_awaited()
+    job_queue.enqueue.assert_called_once_with("default", content_purger.purge, "deletion123")
+    assert result.status == "pending"
+    assert (result.blogs_total, result.blogs_deleted) == (1200, 0)
 
   @pytest.mark.asyncio
   async def test_execute_user_not_found(self, use_case, uow):
@@ -8,7 +8,9 @@ from src.domain.entities import UserEntity
 from src.domain.exceptions import (
   NotFoundException,
   InvalidDataException,
-  UnauthorizedException
+  UnauthorizedException,
+  PreconditionFailedException,
+  ConflictException
 )
 
 TEST_DATA = [
@@ -64,7 +66,7 @@ class TestUpdateUserUseCase:
 
     uow.users.get_user_by_id = AsyncMock()
     uow.users.get_user_by_username = AsyncMock()
-    uow.users.update_user = AsyncMock()
+    uow.users.update_user_fields = AsyncMock()
 
     return uow
 
@@ -104,9 +106,11 @@ class TestUpdateUserUseCase:
     update_data,
     expected_result
   ):
-    uow.users.get_user_by_id.return_value = existing_user
+    async def update_user_fields(user_id, changes, expected_version=None):
+      return UserEntity(**{**existing_user.to_dict(), **changes, "updated_at": datetime.now(timezone.utc)})
+
     uow.users.get_user_by_username.return_value = None
-    uow.users.update_user.return_value = existing_user
+    uow.users.update_user_fields.side_effect = update_user_fields
 
     result = await use_case.execute(
       active_user=existing_user,
@@ -114,8 +118,9 @@ class TestUpdateUserUseCase:
       data=update_data
     )
 
-    uow.users.get_user_by_id.assert_awaited_once_with("user_id_123")
-    uow.users.update_user.assert_awaited_once()
+    uow.users.get_user_by_id.assert_not_called()
+    uow.users.update_user_fields.assert_awaited_once()
+    assert uow.users.update_user_fields.await_args.args[1] == update_data.model_dump(exclude_unset=True)
 
     assert result.id == expected_result.id
     assert result.first_name == expected_result.first_name
@@ -173,8 +178,8 @@ class TestUpdateUserUseCase:
         data=update_data
       )
 
-    uow.users.get_user_by_id.assert_awaited_once_with("user_id_123")
     uow.users.get_user_by_username.assert_awaited_once_with("existingusername")
+    uow.users.update_user_fields.assert_not_called()
 
   @pytest.mark.asyncio
   async def test_execute_unauthorized(
@@ -201,4 +206,48 @@ class TestUpdateUserUseCase:
         ),
         user_id="user_id_123",
         data=valid_update_data
-      )
\ No newline at end of file
+      )
+
+    uow.users.update_user_fields.assert_not_called()
+
+  @pytest.mark.asyncio
+  async def test_execute_stale_version(
+    self,
+    use_case,
+    uow,
+    existing_user,
+    valid_update_data
+  ):
+    uow.users.get_user_by_username.return_value = None
+    uow.users.update_user_fields.return_value = None
+    uow.users.get_user_by_id.return_value = UserEntity(**{**existing_user.to_dict(), "version": 2})
+
+    with pytest.raises(PreconditionFailedException):
+      await use_case.execute(
+        active_user=existing_user,
+        user_id="user_id_123",
+        data=valid_update_data,
+        expected_version=1
+      )
+
+    assert uow.users.update_user_fields.await_args.args[2] == 1
+
+  @pytest.mark.asyncio
+  async def test_execute_concurrent_update(
+    self,
+    use_case,
+    uow,
+    existing_user,
+    valid_update_data
+  ):
+    uow.users.get_user_by_username.return_value = None
+    uow.users.update_user_fields.return_value = None
+    uow.users.get_user_by_id.return_value = existing_user
+
+    with pytest.raises(ConflictException):
+      await use_case.execute(
+        active_user=existing_user,
+        user_id="user_id_123",
+        data=valid_update_data,
+        expected_version=existing_user.version
+      )